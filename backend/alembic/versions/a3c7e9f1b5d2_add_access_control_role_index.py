@@ -0,0 +1,25 @@
+"""add_access_control_role_index
+
+Revision ID: a3c7e9f1b5d2
+Revises: d6b1e8f3a5c9
+Create Date: 2026-01-20 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3c7e9f1b5d2'
+down_revision = 'd6b1e8f3a5c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add composite index for compiling a role's permission matrix"""
+    op.create_index('ix_access_control_ws_role', 'access_control', ['workspace_id', 'role'])
+
+
+def downgrade() -> None:
+    """Drop the permission matrix index"""
+    op.drop_index('ix_access_control_ws_role', table_name='access_control')
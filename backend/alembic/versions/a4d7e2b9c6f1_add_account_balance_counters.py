@@ -0,0 +1,60 @@
+"""add_account_balance_counters
+
+Revision ID: a4d7e2b9c6f1
+Revises: f2c8a5d1e9b3
+Create Date: 2026-01-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d7e2b9c6f1'
+down_revision = 'f2c8a5d1e9b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add balance counters to accounts and backfill them from invoices and payments"""
+    op.add_column('accounts', sa.Column('payable_outstanding', sa.Numeric(precision=15, scale=2), nullable=False, server_default='0'))
+    op.add_column('accounts', sa.Column('receivable_outstanding', sa.Numeric(precision=15, scale=2), nullable=False, server_default='0'))
+    op.add_column('accounts', sa.Column('last_invoice_date', sa.Date(), nullable=True))
+    op.add_column('accounts', sa.Column('last_payment_date', sa.Date(), nullable=True))
+
+    op.create_index('ix_accounts_ws_payable_outstanding', 'accounts', ['workspace_id', 'payable_outstanding'])
+    op.create_index('ix_accounts_ws_receivable_outstanding', 'accounts', ['workspace_id', 'receivable_outstanding'])
+
+    # Backfill (same values as AccountDAO.rebuild_balances)
+    op.execute("""
+        UPDATE accounts SET
+            payable_outstanding = COALESCE((
+                SELECT SUM(i.invoice_amount - i.paid_amount) FROM account_invoices i
+                WHERE i.account_id = accounts.id AND i.invoice_type = 'payable'
+            ), 0),
+            receivable_outstanding = COALESCE((
+                SELECT SUM(i.invoice_amount - i.paid_amount) FROM account_invoices i
+                WHERE i.account_id = accounts.id AND i.invoice_type = 'receivable'
+            ), 0),
+            last_invoice_date = (
+                SELECT MAX(i.invoice_date) FROM account_invoices i
+                WHERE i.account_id = accounts.id
+            ),
+            last_payment_date = (
+                SELECT MAX(p.payment_date) FROM invoice_payments p
+                JOIN account_invoices i ON i.id = p.invoice_id
+                WHERE i.account_id = accounts.id
+            )
+    """)
+
+
+def downgrade() -> None:
+    """Drop account balance counters"""
+    op.drop_index('ix_accounts_ws_receivable_outstanding', table_name='accounts')
+    op.drop_index('ix_accounts_ws_payable_outstanding', table_name='accounts')
+
+    op.drop_column('accounts', 'last_payment_date')
+    op.drop_column('accounts', 'last_invoice_date')
+    op.drop_column('accounts', 'receivable_outstanding')
+    op.drop_column('accounts', 'payable_outstanding')
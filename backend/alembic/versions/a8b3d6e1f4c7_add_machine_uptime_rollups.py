@@ -0,0 +1,108 @@
+"""add_machine_uptime_rollups
+
+Revision ID: a8b3d6e1f4c7
+Revises: f7a2c5d9e3b6
+Create Date: 2026-01-24 09:00:00.000000
+
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8b3d6e1f4c7'
+down_revision = 'f7a2c5d9e3b6'
+branch_labels = None
+depends_on = None
+
+
+STATE_COLUMNS = {
+    'RUNNING': 'running_seconds',
+    'IDLE': 'idle_seconds',
+    'OFF': 'off_seconds',
+    'MAINTENANCE': 'maintenance_seconds',
+}
+DOWN_STATES = {'OFF', 'MAINTENANCE'}
+TOTAL_COLUMNS = (*STATE_COLUMNS.values(), 'failure_count', 'repair_count')
+
+
+def _as_datetime(value):
+    """SQLite returns DATETIME columns of raw queries as strings."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def upgrade() -> None:
+    """Create machine_uptime_rollups table and backfill it from machine events"""
+    op.create_index(
+        'ix_machine_events_ws_machine_started', 'machine_events',
+        ['workspace_id', 'machine_id', 'started_at']
+    )
+
+    rollups = op.create_table(
+        'machine_uptime_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('machine_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        *[sa.Column(column, sa.Integer(), nullable=False, server_default='0')
+          for column in TOTAL_COLUMNS],
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['machine_id'], ['machines.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_machine_uptime_rollups_id', 'machine_uptime_rollups', ['id'])
+    op.create_index('ix_machine_uptime_rollups_workspace_id', 'machine_uptime_rollups', ['workspace_id'])
+    op.create_index(
+        'ix_machine_uptime_rollups_ws_day', 'machine_uptime_rollups',
+        ['workspace_id', 'day']
+    )
+    op.create_index(
+        'ix_machine_uptime_rollups_ws_machine_day', 'machine_uptime_rollups',
+        ['workspace_id', 'machine_id', 'day']
+    )
+
+    # Backfill from closed event intervals (same totals as MachineUptimeManager.rebuild)
+    events = op.get_bind().execute(sa.text("""
+        SELECT workspace_id, machine_id, event_type, started_at
+        FROM machine_events
+        ORDER BY machine_id, started_at, id
+    """))
+    totals = defaultdict(lambda: dict.fromkeys(TOTAL_COLUMNS, 0))
+    previous = None
+    for workspace_id, machine_id, event_type, started_at in events:
+        started_at = _as_datetime(started_at)
+        if previous is not None and previous[0] == machine_id:
+            _, previous_type, start = previous
+            while start < started_at:
+                next_day = datetime.combine(start.date(), datetime.min.time()) + timedelta(days=1)
+                segment_end = min(started_at, next_day)
+                totals[(workspace_id, machine_id, start.date())][STATE_COLUMNS[previous_type]] += (
+                    int((segment_end - start).total_seconds())
+                )
+                start = segment_end
+            was_down, is_down = previous_type in DOWN_STATES, event_type in DOWN_STATES
+            if was_down != is_down:
+                column = 'failure_count' if is_down else 'repair_count'
+                totals[(workspace_id, machine_id, started_at.date())][column] += 1
+        previous = (machine_id, event_type, started_at)
+
+    updated_at = datetime.utcnow()
+    rows = [
+        {'workspace_id': workspace_id, 'machine_id': machine_id, 'day': day, **row, 'updated_at': updated_at}
+        for (workspace_id, machine_id, day), row in sorted(totals.items())
+    ]
+    if rows:
+        op.bulk_insert(rollups, rows)
+
+
+def downgrade() -> None:
+    """Drop machine_uptime_rollups table"""
+    op.drop_index('ix_machine_uptime_rollups_ws_machine_day', table_name='machine_uptime_rollups')
+    op.drop_index('ix_machine_uptime_rollups_ws_day', table_name='machine_uptime_rollups')
+    op.drop_index('ix_machine_uptime_rollups_workspace_id', table_name='machine_uptime_rollups')
+    op.drop_index('ix_machine_uptime_rollups_id', table_name='machine_uptime_rollups')
+    op.drop_table('machine_uptime_rollups')
+    op.drop_index('ix_machine_events_ws_machine_started', table_name='machine_events')
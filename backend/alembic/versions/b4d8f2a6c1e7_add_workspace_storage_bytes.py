@@ -0,0 +1,56 @@
+"""add_workspace_storage_bytes
+
+Revision ID: b4d8f2a6c1e7
+Revises: a3c7e9f1b5d2
+Create Date: 2026-01-21 09:00:00.000000
+
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4d8f2a6c1e7'
+down_revision = 'a3c7e9f1b5d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add byte-exact storage counter and recount all usage counters"""
+    op.add_column(
+        'workspaces',
+        sa.Column('current_storage_bytes', sa.BigInteger(), nullable=False, server_default='0')
+    )
+
+    # Counters were never maintained before; start from actual usage
+    now = datetime.utcnow()
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    op.get_bind().execute(
+        sa.text("""
+            UPDATE workspaces SET
+                current_members_count = (SELECT COUNT(*) FROM workspace_members m
+                    WHERE m.workspace_id = workspaces.id AND m.status = 'active'),
+                current_factories_count = (SELECT COUNT(*) FROM factories f
+                    WHERE f.workspace_id = workspaces.id AND f.is_deleted = false),
+                current_machines_count = (SELECT COUNT(*) FROM machines mc
+                    WHERE mc.workspace_id = workspaces.id AND mc.is_deleted = false),
+                current_projects_count = (SELECT COUNT(*) FROM projects p
+                    WHERE p.workspace_id = workspaces.id AND p.is_deleted = false),
+                current_orders_this_month = (SELECT COUNT(*) FROM orders o
+                    WHERE o.workspace_id = workspaces.id AND o.created_at >= :month_start),
+                current_storage_bytes = (SELECT COALESCE(SUM(a.file_size), 0) FROM attachments a
+                    WHERE a.workspace_id = workspaces.id AND a.is_deleted = false),
+                last_usage_reset_at = :now
+        """),
+        {'month_start': month_start, 'now': now}
+    )
+    op.get_bind().execute(
+        sa.text("UPDATE workspaces SET current_storage_mb = (current_storage_bytes + 1048575) / 1048576")
+    )
+
+
+def downgrade() -> None:
+    """Drop the byte-exact storage counter"""
+    op.drop_column('workspaces', 'current_storage_bytes')
@@ -0,0 +1,51 @@
+"""add_ledger_archive_periods
+
+Revision ID: b7e4c2a91d03
+Revises: a1b2c3d4e5f6
+Create Date: 2026-01-05 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e4c2a91d03'
+down_revision = 'a1b2c3d4e5f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create ledger_archive_periods registry table"""
+    # Per-year archive tables (<ledger>_archive_<year>) are created on demand
+    # by the ledger archiver, not by migrations.
+    op.create_table(
+        'ledger_archive_periods',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('ledger_table', sa.String(length=100), nullable=False),
+        sa.Column('archive_table', sa.String(length=100), nullable=False),
+        sa.Column('period_year', sa.Integer(), nullable=False),
+        sa.Column('period_start', sa.DateTime(), nullable=False),
+        sa.Column('period_end', sa.DateTime(), nullable=False),
+        sa.Column('rows_archived', sa.Integer(), nullable=False),
+        sa.Column('checkpoints_created', sa.Integer(), nullable=False),
+        sa.Column('archived_by', sa.Integer(), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['archived_by'], ['profiles.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('workspace_id', 'ledger_table', 'period_year', name='uq_ledger_archive_period')
+    )
+    op.create_index('ix_ledger_archive_periods_id', 'ledger_archive_periods', ['id'])
+    op.create_index('ix_ledger_archive_periods_workspace_id', 'ledger_archive_periods', ['workspace_id'])
+    op.create_index('ix_ledger_archive_periods_ledger_table', 'ledger_archive_periods', ['ledger_table'])
+
+
+def downgrade() -> None:
+    """Drop ledger_archive_periods registry table"""
+    op.drop_index('ix_ledger_archive_periods_ledger_table', table_name='ledger_archive_periods')
+    op.drop_index('ix_ledger_archive_periods_workspace_id', table_name='ledger_archive_periods')
+    op.drop_index('ix_ledger_archive_periods_id', table_name='ledger_archive_periods')
+    op.drop_table('ledger_archive_periods')
@@ -0,0 +1,35 @@
+"""add_financial_audit_log_composite_indexes
+
+Revision ID: b8e3f1c5d7a2
+Revises: a4d7e2b9c6f1
+Create Date: 2026-01-17 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8e3f1c5d7a2'
+down_revision = 'a4d7e2b9c6f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add composite financial audit log indexes for the search endpoint"""
+    # Every search filters on workspace_id plus optional equality columns and
+    # pages by (performed_at, id) DESC; the trailing id serves the keyset.
+    op.create_index('ix_financial_audit_logs_ws_at', 'financial_audit_logs', ['workspace_id', 'performed_at', 'id'])
+    op.create_index('ix_financial_audit_logs_ws_entity_at', 'financial_audit_logs', ['workspace_id', 'entity_type', 'entity_id', 'performed_at', 'id'])
+    op.create_index('ix_financial_audit_logs_ws_related_at', 'financial_audit_logs', ['workspace_id', 'related_entity_type', 'related_entity_id', 'performed_at', 'id'])
+    op.create_index('ix_financial_audit_logs_ws_performer_at', 'financial_audit_logs', ['workspace_id', 'performed_by', 'performed_at', 'id'])
+    op.create_index('ix_financial_audit_logs_ws_action_at', 'financial_audit_logs', ['workspace_id', 'action_type', 'performed_at', 'id'])
+
+
+def downgrade() -> None:
+    """Drop composite financial audit log indexes"""
+    op.drop_index('ix_financial_audit_logs_ws_action_at', table_name='financial_audit_logs')
+    op.drop_index('ix_financial_audit_logs_ws_performer_at', table_name='financial_audit_logs')
+    op.drop_index('ix_financial_audit_logs_ws_related_at', table_name='financial_audit_logs')
+    op.drop_index('ix_financial_audit_logs_ws_entity_at', table_name='financial_audit_logs')
+    op.drop_index('ix_financial_audit_logs_ws_at', table_name='financial_audit_logs')
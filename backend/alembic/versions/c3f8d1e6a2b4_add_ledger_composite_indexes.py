@@ -0,0 +1,102 @@
+"""add_ledger_composite_indexes
+
+Revision ID: c3f8d1e6a2b4
+Revises: b7e4c2a91d03
+Create Date: 2026-01-06 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f8d1e6a2b4'
+down_revision = 'b7e4c2a91d03'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add composite ledger indexes matching the ledger DAO query shapes"""
+    # Every ledger query filters on workspace_id plus one or two equality
+    # columns and orders by performed_at DESC (id DESC as tiebreaker).
+    # Ascending (.., performed_at, id) indexes serve that order with a
+    # backward index scan on both SQLite and PostgreSQL.
+
+    # storage_item_ledger
+    op.create_index('ix_storage_item_ledger_ws_factory_item_at', 'storage_item_ledger', ['workspace_id', 'factory_id', 'item_id', 'performed_at', 'id'])
+    op.create_index('ix_storage_item_ledger_ws_type_at', 'storage_item_ledger', ['workspace_id', 'transaction_type', 'performed_at'])
+    op.create_index('ix_storage_item_ledger_ws_order_at', 'storage_item_ledger', ['workspace_id', 'order_id', 'performed_at'])
+    op.create_index('ix_storage_item_ledger_ws_at', 'storage_item_ledger', ['workspace_id', 'performed_at'])
+    op.create_index('ix_storage_item_ledger_ws_performer_at', 'storage_item_ledger', ['workspace_id', 'performed_by', 'performed_at'])
+
+    # damaged_item_ledger
+    op.create_index('ix_damaged_item_ledger_ws_factory_item_at', 'damaged_item_ledger', ['workspace_id', 'factory_id', 'item_id', 'performed_at', 'id'])
+    op.create_index('ix_damaged_item_ledger_ws_type_at', 'damaged_item_ledger', ['workspace_id', 'transaction_type', 'performed_at'])
+    op.create_index('ix_damaged_item_ledger_ws_order_at', 'damaged_item_ledger', ['workspace_id', 'order_id', 'performed_at'])
+    op.create_index('ix_damaged_item_ledger_ws_at', 'damaged_item_ledger', ['workspace_id', 'performed_at'])
+    op.create_index('ix_damaged_item_ledger_ws_performer_at', 'damaged_item_ledger', ['workspace_id', 'performed_by', 'performed_at'])
+
+    # machine_item_ledger
+    op.create_index('ix_machine_item_ledger_ws_machine_item_at', 'machine_item_ledger', ['workspace_id', 'machine_id', 'item_id', 'performed_at', 'id'])
+    op.create_index('ix_machine_item_ledger_ws_machine_at', 'machine_item_ledger', ['workspace_id', 'machine_id', 'performed_at'])
+    op.create_index('ix_machine_item_ledger_ws_machine_type_at', 'machine_item_ledger', ['workspace_id', 'machine_id', 'transaction_type', 'performed_at'])
+    op.create_index('ix_machine_item_ledger_ws_type_at', 'machine_item_ledger', ['workspace_id', 'transaction_type', 'performed_at'])
+    op.create_index('ix_machine_item_ledger_ws_order_at', 'machine_item_ledger', ['workspace_id', 'order_id', 'performed_at'])
+    op.create_index('ix_machine_item_ledger_ws_at', 'machine_item_ledger', ['workspace_id', 'performed_at'])
+    op.create_index('ix_machine_item_ledger_ws_performer_at', 'machine_item_ledger', ['workspace_id', 'performed_by', 'performed_at'])
+
+    # project_component_item_ledger
+    op.create_index('ix_project_component_item_ledger_ws_component_item_at', 'project_component_item_ledger', ['workspace_id', 'project_component_id', 'item_id', 'performed_at', 'id'])
+    op.create_index('ix_project_component_item_ledger_ws_component_at', 'project_component_item_ledger', ['workspace_id', 'project_component_id', 'performed_at'])
+    op.create_index('ix_project_component_item_ledger_ws_component_type_at', 'project_component_item_ledger', ['workspace_id', 'project_component_id', 'transaction_type', 'performed_at'])
+    op.create_index('ix_project_component_item_ledger_ws_type_at', 'project_component_item_ledger', ['workspace_id', 'transaction_type', 'performed_at'])
+    op.create_index('ix_project_component_item_ledger_ws_order_at', 'project_component_item_ledger', ['workspace_id', 'order_id', 'performed_at'])
+    op.create_index('ix_project_component_item_ledger_ws_at', 'project_component_item_ledger', ['workspace_id', 'performed_at'])
+    op.create_index('ix_project_component_item_ledger_ws_performer_at', 'project_component_item_ledger', ['workspace_id', 'performed_by', 'performed_at'])
+
+    # inventory_ledger
+    op.create_index('ix_inventory_ledger_ws_type_factory_item_at', 'inventory_ledger', ['workspace_id', 'inventory_type', 'factory_id', 'item_id', 'performed_at', 'id'])
+    op.create_index('ix_inventory_ledger_ws_type_at', 'inventory_ledger', ['workspace_id', 'transaction_type', 'performed_at'])
+    op.create_index('ix_inventory_ledger_ws_at', 'inventory_ledger', ['workspace_id', 'performed_at'])
+    op.create_index('ix_inventory_ledger_ws_performer_at', 'inventory_ledger', ['workspace_id', 'performed_by', 'performed_at'])
+
+
+def downgrade() -> None:
+    """Drop composite ledger indexes"""
+    # storage_item_ledger
+    op.drop_index('ix_storage_item_ledger_ws_factory_item_at', table_name='storage_item_ledger')
+    op.drop_index('ix_storage_item_ledger_ws_type_at', table_name='storage_item_ledger')
+    op.drop_index('ix_storage_item_ledger_ws_order_at', table_name='storage_item_ledger')
+    op.drop_index('ix_storage_item_ledger_ws_at', table_name='storage_item_ledger')
+    op.drop_index('ix_storage_item_ledger_ws_performer_at', table_name='storage_item_ledger')
+
+    # damaged_item_ledger
+    op.drop_index('ix_damaged_item_ledger_ws_factory_item_at', table_name='damaged_item_ledger')
+    op.drop_index('ix_damaged_item_ledger_ws_type_at', table_name='damaged_item_ledger')
+    op.drop_index('ix_damaged_item_ledger_ws_order_at', table_name='damaged_item_ledger')
+    op.drop_index('ix_damaged_item_ledger_ws_at', table_name='damaged_item_ledger')
+    op.drop_index('ix_damaged_item_ledger_ws_performer_at', table_name='damaged_item_ledger')
+
+    # machine_item_ledger
+    op.drop_index('ix_machine_item_ledger_ws_machine_item_at', table_name='machine_item_ledger')
+    op.drop_index('ix_machine_item_ledger_ws_machine_at', table_name='machine_item_ledger')
+    op.drop_index('ix_machine_item_ledger_ws_machine_type_at', table_name='machine_item_ledger')
+    op.drop_index('ix_machine_item_ledger_ws_type_at', table_name='machine_item_ledger')
+    op.drop_index('ix_machine_item_ledger_ws_order_at', table_name='machine_item_ledger')
+    op.drop_index('ix_machine_item_ledger_ws_at', table_name='machine_item_ledger')
+    op.drop_index('ix_machine_item_ledger_ws_performer_at', table_name='machine_item_ledger')
+
+    # project_component_item_ledger
+    op.drop_index('ix_project_component_item_ledger_ws_component_item_at', table_name='project_component_item_ledger')
+    op.drop_index('ix_project_component_item_ledger_ws_component_at', table_name='project_component_item_ledger')
+    op.drop_index('ix_project_component_item_ledger_ws_component_type_at', table_name='project_component_item_ledger')
+    op.drop_index('ix_project_component_item_ledger_ws_type_at', table_name='project_component_item_ledger')
+    op.drop_index('ix_project_component_item_ledger_ws_order_at', table_name='project_component_item_ledger')
+    op.drop_index('ix_project_component_item_ledger_ws_at', table_name='project_component_item_ledger')
+    op.drop_index('ix_project_component_item_ledger_ws_performer_at', table_name='project_component_item_ledger')
+
+    # inventory_ledger
+    op.drop_index('ix_inventory_ledger_ws_type_factory_item_at', table_name='inventory_ledger')
+    op.drop_index('ix_inventory_ledger_ws_type_at', table_name='inventory_ledger')
+    op.drop_index('ix_inventory_ledger_ws_at', table_name='inventory_ledger')
+    op.drop_index('ix_inventory_ledger_ws_performer_at', table_name='inventory_ledger')
@@ -0,0 +1,55 @@
+"""add_stock_reservations
+
+Revision ID: c5e9a3b7d1f4
+Revises: b4d8f2a6c1e7
+Create Date: 2026-01-22 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e9a3b7d1f4'
+down_revision = 'b4d8f2a6c1e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create stock_reservations table"""
+    op.create_table(
+        'stock_reservations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('factory_id', sa.Integer(), nullable=False),
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('batch_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('resolved_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['batch_id'], ['production_batches.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by'], ['profiles.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['factory_id'], ['factories.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['item_id'], ['items.id'], ondelete='RESTRICT'),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_stock_reservations_id', 'stock_reservations', ['id'])
+    op.create_index('ix_stock_reservations_workspace_id', 'stock_reservations', ['workspace_id'])
+    op.create_index('ix_stock_reservations_batch_id', 'stock_reservations', ['batch_id'])
+    op.create_index(
+        'ix_stock_reservations_ws_factory_item_status', 'stock_reservations',
+        ['workspace_id', 'factory_id', 'item_id', 'status']
+    )
+
+
+def downgrade() -> None:
+    """Drop stock_reservations table"""
+    op.drop_index('ix_stock_reservations_ws_factory_item_status', table_name='stock_reservations')
+    op.drop_index('ix_stock_reservations_batch_id', table_name='stock_reservations')
+    op.drop_index('ix_stock_reservations_workspace_id', table_name='stock_reservations')
+    op.drop_index('ix_stock_reservations_id', table_name='stock_reservations')
+    op.drop_table('stock_reservations')
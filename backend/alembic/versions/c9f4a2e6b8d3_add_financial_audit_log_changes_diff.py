@@ -0,0 +1,47 @@
+"""add_financial_audit_log_changes_diff
+
+Revision ID: c9f4a2e6b8d3
+Revises: b8e3f1c5d7a2
+Create Date: 2026-01-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.audit_diff import unpack_changes
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9f4a2e6b8d3'
+down_revision = 'b8e3f1c5d7a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add compact changes_diff column to financial audit logs"""
+    # Existing rows keep their full changes JSON until
+    # compact_financial_audit_logs.py rewrites them
+    op.add_column('financial_audit_logs', sa.Column('changes_diff', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Expand compacted diffs back into changes JSON and drop changes_diff"""
+    audit_logs = sa.table(
+        'financial_audit_logs',
+        sa.column('id', sa.Integer),
+        sa.column('changes', sa.JSON),
+        sa.column('changes_diff', sa.LargeBinary),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.select(audit_logs.c.id, audit_logs.c.changes_diff).where(audit_logs.c.changes_diff.isnot(None))
+    ).all()
+    for row in rows:
+        bind.execute(
+            audit_logs.update()
+            .where(audit_logs.c.id == row.id)
+            .values(changes=unpack_changes(row.changes_diff))
+        )
+
+    op.drop_column('financial_audit_logs', 'changes_diff')
@@ -0,0 +1,82 @@
+"""add_ledger_drift_tables
+
+Revision ID: d5a9e3f7b1c8
+Revises: c3f8d1e6a2b4
+Create Date: 2026-01-12 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5a9e3f7b1c8'
+down_revision = 'c3f8d1e6a2b4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create ledger_drifts and ledger_drift_scan_states tables"""
+    op.create_table(
+        'ledger_drifts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('ledger_table', sa.String(length=100), nullable=False),
+        sa.Column('location_id', sa.Integer(), nullable=False),
+        sa.Column('inventory_type', sa.String(length=50), nullable=True),
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('drift_type', sa.String(length=50), nullable=False),
+        sa.Column('ledger_entry_id', sa.Integer(), nullable=True),
+        sa.Column('expected_qty', sa.Integer(), nullable=False),
+        sa.Column('actual_qty', sa.Integer(), nullable=True),
+        sa.Column('discrepancy', sa.Integer(), nullable=False),
+        sa.Column('is_resolved', sa.Boolean(), nullable=False),
+        sa.Column('detected_at', sa.DateTime(), nullable=False),
+        sa.Column('last_checked_at', sa.DateTime(), nullable=False),
+        sa.Column('resolved_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['item_id'], ['items.id']),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_ledger_drifts_id', 'ledger_drifts', ['id'])
+    op.create_index('ix_ledger_drifts_workspace_id', 'ledger_drifts', ['workspace_id'])
+    op.create_index('ix_ledger_drifts_item_id', 'ledger_drifts', ['item_id'])
+    op.create_index(
+        'ix_ledger_drifts_ws_ledger_resolved', 'ledger_drifts',
+        ['workspace_id', 'ledger_table', 'is_resolved']
+    )
+
+    op.create_table(
+        'ledger_drift_scan_states',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('ledger_table', sa.String(length=100), nullable=False),
+        sa.Column('last_ledger_id', sa.Integer(), nullable=False),
+        sa.Column('last_run_at', sa.DateTime(), nullable=True),
+        sa.Column('last_run_duration_ms', sa.Integer(), nullable=False),
+        sa.Column('last_run_rows_scanned', sa.Integer(), nullable=False),
+        sa.Column('last_run_keys_checked', sa.Integer(), nullable=False),
+        sa.Column('last_run_drifts_found', sa.Integer(), nullable=False),
+        sa.Column('run_count', sa.Integer(), nullable=False),
+        sa.Column('total_rows_scanned', sa.Integer(), nullable=False),
+        sa.Column('total_drifts_found', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('workspace_id', 'ledger_table', name='uq_ledger_drift_scan_state')
+    )
+    op.create_index('ix_ledger_drift_scan_states_id', 'ledger_drift_scan_states', ['id'])
+    op.create_index('ix_ledger_drift_scan_states_workspace_id', 'ledger_drift_scan_states', ['workspace_id'])
+
+
+def downgrade() -> None:
+    """Drop ledger drift tables"""
+    op.drop_index('ix_ledger_drift_scan_states_workspace_id', table_name='ledger_drift_scan_states')
+    op.drop_index('ix_ledger_drift_scan_states_id', table_name='ledger_drift_scan_states')
+    op.drop_table('ledger_drift_scan_states')
+
+    op.drop_index('ix_ledger_drifts_ws_ledger_resolved', table_name='ledger_drifts')
+    op.drop_index('ix_ledger_drifts_item_id', table_name='ledger_drifts')
+    op.drop_index('ix_ledger_drifts_workspace_id', table_name='ledger_drifts')
+    op.drop_index('ix_ledger_drifts_id', table_name='ledger_drifts')
+    op.drop_table('ledger_drifts')
@@ -0,0 +1,86 @@
+"""add_account_period_summaries
+
+Revision ID: d6b1e8f3a5c9
+Revises: c9f4a2e6b8d3
+Create Date: 2026-01-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd6b1e8f3a5c9'
+down_revision = 'c9f4a2e6b8d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create account_period_summaries table and backfill it from invoices and payments"""
+    op.create_table(
+        'account_period_summaries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('period', sa.Date(), nullable=False),
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('invoice_type', sa.String(length=20), nullable=False),
+        sa.Column('factory_id', sa.Integer(), nullable=True),
+        sa.Column('invoiced_amount', sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column('invoice_count', sa.Integer(), nullable=False),
+        sa.Column('paid_amount', sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column('payment_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['factory_id'], ['factories.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_account_period_summaries_id', 'account_period_summaries', ['id'])
+    op.create_index('ix_account_period_summaries_workspace_id', 'account_period_summaries', ['workspace_id'])
+    op.create_index('ix_account_period_summaries_ws_period', 'account_period_summaries', ['workspace_id', 'period'])
+    op.create_index(
+        'ix_account_period_summaries_ws_account_period', 'account_period_summaries',
+        ['workspace_id', 'account_id', 'period', 'invoice_type', 'factory_id']
+    )
+
+    # Backfill (same rows as AccountPeriodSummaryDAO.rebuild)
+    if op.get_bind().dialect.name == 'sqlite':
+        invoice_month = "date(i.invoice_date, 'start of month')"
+        payment_month = "date(p.payment_date, 'start of month')"
+    else:
+        invoice_month = "CAST(date_trunc('month', i.invoice_date) AS date)"
+        payment_month = "CAST(date_trunc('month', p.payment_date) AS date)"
+
+    op.execute(f"""
+        INSERT INTO account_period_summaries (
+            workspace_id, period, account_id, invoice_type, factory_id,
+            invoiced_amount, invoice_count, paid_amount, payment_count, updated_at
+        )
+        SELECT workspace_id, period, account_id, invoice_type, factory_id,
+               SUM(invoiced_amount), SUM(invoice_count), SUM(paid_amount), SUM(payment_count),
+               CURRENT_TIMESTAMP
+        FROM (
+            SELECT i.workspace_id, {invoice_month} AS period, i.account_id, i.invoice_type,
+                   o.factory_id, i.invoice_amount AS invoiced_amount, 1 AS invoice_count,
+                   0 AS paid_amount, 0 AS payment_count
+            FROM account_invoices i
+            LEFT JOIN orders o ON o.id = i.order_id
+            UNION ALL
+            SELECT p.workspace_id, {payment_month} AS period, i.account_id, i.invoice_type,
+                   o.factory_id, 0, 0, p.payment_amount, 1
+            FROM invoice_payments p
+            JOIN account_invoices i ON i.id = p.invoice_id
+            LEFT JOIN orders o ON o.id = i.order_id
+        ) entries
+        GROUP BY workspace_id, period, account_id, invoice_type, factory_id
+    """)
+
+
+def downgrade() -> None:
+    """Drop account_period_summaries table"""
+    op.drop_index('ix_account_period_summaries_ws_account_period', table_name='account_period_summaries')
+    op.drop_index('ix_account_period_summaries_ws_period', table_name='account_period_summaries')
+    op.drop_index('ix_account_period_summaries_workspace_id', table_name='account_period_summaries')
+    op.drop_index('ix_account_period_summaries_id', table_name='account_period_summaries')
+    op.drop_table('account_period_summaries')
@@ -0,0 +1,51 @@
+"""add_project_cost_rollups
+
+Revision ID: e1b7c4d9f2a6
+Revises: d5a9e3f7b1c8
+Create Date: 2026-01-14 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1b7c4d9f2a6'
+down_revision = 'd5a9e3f7b1c8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create project_cost_rollups table"""
+    # Rollups of existing projects are built from the source tables on first use.
+    op.create_table(
+        'project_cost_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('project_component_id', sa.Integer(), nullable=True),
+        sa.Column('item_cost', sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column('misc_cost', sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column('work_order_cost', sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column('maintenance_cost', sa.Numeric(precision=15, scale=2), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['project_component_id'], ['project_components.id']),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id']),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_project_cost_rollups_id', 'project_cost_rollups', ['id'])
+    op.create_index('ix_project_cost_rollups_workspace_id', 'project_cost_rollups', ['workspace_id'])
+    op.create_index(
+        'ix_project_cost_rollups_ws_project_component', 'project_cost_rollups',
+        ['workspace_id', 'project_id', 'project_component_id']
+    )
+
+
+def downgrade() -> None:
+    """Drop project_cost_rollups table"""
+    op.drop_index('ix_project_cost_rollups_ws_project_component', table_name='project_cost_rollups')
+    op.drop_index('ix_project_cost_rollups_workspace_id', table_name='project_cost_rollups')
+    op.drop_index('ix_project_cost_rollups_id', table_name='project_cost_rollups')
+    op.drop_table('project_cost_rollups')
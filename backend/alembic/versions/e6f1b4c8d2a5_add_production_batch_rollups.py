@@ -0,0 +1,112 @@
+"""add_production_batch_rollups
+
+Revision ID: e6f1b4c8d2a5
+Revises: c5e9a3b7d1f4
+Create Date: 2026-01-23 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6f1b4c8d2a5'
+down_revision = 'c5e9a3b7d1f4'
+branch_labels = None
+depends_on = None
+
+
+TOTAL_COLUMNS = (
+    'batch_count', 'expected_output_quantity', 'actual_output_quantity',
+    'timed_output_quantity', 'duration_minutes', 'input_quantity', 'waste_quantity',
+    'efficiency_count',
+    'variance_lt_neg10', 'variance_neg10_neg5', 'variance_neg5_0',
+    'variance_0_5', 'variance_5_10', 'variance_gte_10',
+)
+
+
+def upgrade() -> None:
+    """Create production_batch_rollups table and backfill it from completed batches"""
+    op.create_table(
+        'production_batch_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('batch_date', sa.Date(), nullable=False),
+        sa.Column('production_line_id', sa.Integer(), nullable=False),
+        sa.Column('formula_id', sa.Integer(), nullable=True),
+        sa.Column('shift', sa.String(length=20), nullable=True),
+        *[sa.Column(column, sa.Integer(), nullable=False, server_default='0')
+          for column in TOTAL_COLUMNS[:7]],
+        sa.Column('efficiency_sum', sa.Numeric(precision=15, scale=2), nullable=False, server_default='0'),
+        sa.Column('efficiency_sq_sum', sa.Numeric(precision=20, scale=4), nullable=False, server_default='0'),
+        *[sa.Column(column, sa.Integer(), nullable=False, server_default='0')
+          for column in TOTAL_COLUMNS[7:]],
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['formula_id'], ['production_formulas.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['production_line_id'], ['production_lines.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_production_batch_rollups_id', 'production_batch_rollups', ['id'])
+    op.create_index('ix_production_batch_rollups_workspace_id', 'production_batch_rollups', ['workspace_id'])
+    op.create_index(
+        'ix_production_batch_rollups_ws_date', 'production_batch_rollups',
+        ['workspace_id', 'batch_date']
+    )
+    op.create_index(
+        'ix_production_batch_rollups_ws_key', 'production_batch_rollups',
+        ['workspace_id', 'batch_date', 'production_line_id', 'formula_id', 'shift']
+    )
+
+    # Backfill from completed batches (same totals as ProductionBatchRollupDAO.rebuild)
+    variance = "b.output_variance_percentage"
+    op.execute(f"""
+        INSERT INTO production_batch_rollups (
+            workspace_id, batch_date, production_line_id, formula_id, shift,
+            batch_count, expected_output_quantity, actual_output_quantity,
+            timed_output_quantity, duration_minutes, input_quantity, waste_quantity,
+            efficiency_sum, efficiency_sq_sum, efficiency_count,
+            variance_lt_neg10, variance_neg10_neg5, variance_neg5_0,
+            variance_0_5, variance_5_10, variance_gte_10, updated_at
+        )
+        SELECT b.workspace_id, b.batch_date, b.production_line_id, b.formula_id, b.shift,
+               COUNT(b.id),
+               SUM(COALESCE(b.expected_output_quantity, 0)),
+               SUM(COALESCE(b.actual_output_quantity, 0)),
+               SUM(CASE WHEN b.actual_duration_minutes IS NOT NULL
+                        THEN COALESCE(b.actual_output_quantity, 0) ELSE 0 END),
+               SUM(COALESCE(b.actual_duration_minutes, 0)),
+               SUM(COALESCE(i.input_quantity, 0)),
+               SUM(COALESCE(i.waste_quantity, 0)),
+               SUM(COALESCE(b.efficiency_percentage, 0)),
+               SUM(COALESCE(b.efficiency_percentage * b.efficiency_percentage, 0)),
+               COUNT(b.efficiency_percentage),
+               SUM(CASE WHEN {variance} < -10 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN {variance} >= -10 AND {variance} < -5 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN {variance} >= -5 AND {variance} < 0 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN {variance} >= 0 AND {variance} < 5 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN {variance} >= 5 AND {variance} < 10 THEN 1 ELSE 0 END),
+               SUM(CASE WHEN {variance} >= 10 THEN 1 ELSE 0 END),
+               CURRENT_TIMESTAMP
+        FROM production_batches b
+        LEFT JOIN (
+            SELECT batch_id,
+                   SUM(CASE WHEN item_role = 'input'
+                            THEN COALESCE(actual_quantity, expected_quantity, 0) ELSE 0 END) AS input_quantity,
+                   SUM(CASE WHEN item_role = 'waste'
+                            THEN COALESCE(actual_quantity, expected_quantity, 0) ELSE 0 END) AS waste_quantity
+            FROM production_batch_items
+            GROUP BY batch_id
+        ) i ON i.batch_id = b.id
+        WHERE b.status = 'completed'
+        GROUP BY b.workspace_id, b.batch_date, b.production_line_id, b.formula_id, b.shift
+    """)
+
+
+def downgrade() -> None:
+    """Drop production_batch_rollups table"""
+    op.drop_index('ix_production_batch_rollups_ws_key', table_name='production_batch_rollups')
+    op.drop_index('ix_production_batch_rollups_ws_date', table_name='production_batch_rollups')
+    op.drop_index('ix_production_batch_rollups_workspace_id', table_name='production_batch_rollups')
+    op.drop_index('ix_production_batch_rollups_id', table_name='production_batch_rollups')
+    op.drop_table('production_batch_rollups')
@@ -0,0 +1,27 @@
+"""add_account_invoice_aging_index
+
+Revision ID: f2c8a5d1e9b3
+Revises: e1b7c4d9f2a6
+Create Date: 2026-01-15 09:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c8a5d1e9b3'
+down_revision = 'e1b7c4d9f2a6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add composite index for the aging report and unpaid/overdue invoice queries"""
+    # All three filter on workspace_id + outstanding payment_status and
+    # read or order by due_date
+    op.create_index('ix_account_invoices_ws_status_due', 'account_invoices', ['workspace_id', 'payment_status', 'due_date'])
+
+
+def downgrade() -> None:
+    """Drop the aging index"""
+    op.drop_index('ix_account_invoices_ws_status_due', table_name='account_invoices')
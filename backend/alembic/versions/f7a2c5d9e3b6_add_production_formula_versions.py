@@ -0,0 +1,61 @@
+"""add_production_formula_versions
+
+Revision ID: f7a2c5d9e3b6
+Revises: e6f1b4c8d2a5
+Create Date: 2026-01-23 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7a2c5d9e3b6'
+down_revision = 'e6f1b4c8d2a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create production_formula_versions table and link batches to it"""
+    op.create_table(
+        'production_formula_versions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('workspace_id', sa.Integer(), nullable=False),
+        sa.Column('formula_id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('base_output_quantity', sa.Integer(), nullable=False),
+        sa.Column('estimated_duration_minutes', sa.Integer(), nullable=True),
+        sa.Column('recipe', sa.JSON(), nullable=False),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['created_by'], ['profiles.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['formula_id'], ['production_formulas.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('formula_id', 'version', name='uq_production_formula_versions_formula_version')
+    )
+    op.create_index('ix_production_formula_versions_id', 'production_formula_versions', ['id'])
+    op.create_index('ix_production_formula_versions_workspace_id', 'production_formula_versions', ['workspace_id'])
+    op.create_index('ix_production_formula_versions_formula_id', 'production_formula_versions', ['formula_id'])
+
+    # Existing batches keep formula_version_id NULL (started before snapshots)
+    op.add_column(
+        'production_batches',
+        sa.Column(
+            'formula_version_id', sa.Integer(),
+            sa.ForeignKey('production_formula_versions.id', ondelete='SET NULL'),
+            nullable=True
+        )
+    )
+    op.create_index('ix_production_batches_formula_version_id', 'production_batches', ['formula_version_id'])
+
+
+def downgrade() -> None:
+    """Drop formula_version_id and production_formula_versions table"""
+    op.drop_index('ix_production_batches_formula_version_id', table_name='production_batches')
+    op.drop_column('production_batches', 'formula_version_id')
+    op.drop_index('ix_production_formula_versions_formula_id', table_name='production_formula_versions')
+    op.drop_index('ix_production_formula_versions_workspace_id', table_name='production_formula_versions')
+    op.drop_index('ix_production_formula_versions_id', table_name='production_formula_versions')
+    op.drop_table('production_formula_versions')
@@ -1,13 +1,20 @@
 """Access control endpoints"""
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db, get_current_active_user
+from app.core.deps import get_db, get_current_active_user, get_current_workspace, get_current_permissions
+from app.managers.access_control_manager import PermissionMatrix
 from app.models.profile import Profile
+from app.models.workspace import Workspace
 from app.models.enums import RoleEnum, AccessControlTypeEnum
-from app.schemas.access_control import AccessControlCreate, AccessControlUpdate, AccessControlResponse
-from app.dao.access_control import access_control_dao
+from app.schemas.access_control import (
+    AccessControlCreate,
+    AccessControlUpdate,
+    AccessControlResponse,
+    PermissionsResponse,
+)
+from app.services.access_control_service import access_control_service
 
 
 router = APIRouter()
@@ -20,40 +27,57 @@ def get_access_controls(
     role: RoleEnum = Query(None),
     access_type: AccessControlTypeEnum = Query(None),
     db: Session = Depends(get_db),
-    current_user: Profile = Depends(get_current_active_user)
+    current_user: Profile = Depends(get_current_active_user),
+    workspace: Workspace = Depends(get_current_workspace)
 ):
     """Get all access controls, optionally filtered by role or type"""
-    if role:
-        controls = access_control_dao.get_by_role(db, role=role, skip=skip, limit=limit)
-    elif access_type:
-        controls = access_control_dao.get_by_type(db, access_type=access_type, skip=skip, limit=limit)
-    else:
-        controls = access_control_dao.get_multi(db, skip=skip, limit=limit)
-    return controls
+    return access_control_service.get_access_controls(
+        db,
+        workspace_id=workspace.id,
+        role=role,
+        access_type=access_type,
+        skip=skip,
+        limit=limit
+    )
+
+
+@router.get("/me", response_model=PermissionsResponse)
+def get_my_permissions(
+    permissions: PermissionMatrix = Depends(get_current_permissions)
+):
+    """
+    Get the current user's allowed pages, features and order statuses
+
+    Served from the cached permission matrix of the user's role.
+    """
+    return PermissionsResponse(
+        role=permissions.role,
+        pages=permissions.targets(AccessControlTypeEnum.PAGE),
+        features=permissions.targets(AccessControlTypeEnum.FEATURE),
+        order_statuses=permissions.targets(AccessControlTypeEnum.MANAGE_ORDER_STATUS),
+    )
 
 
 @router.get("/{control_id}", response_model=AccessControlResponse)
 def get_access_control(
     control_id: int,
     db: Session = Depends(get_db),
-    current_user: Profile = Depends(get_current_active_user)
+    current_user: Profile = Depends(get_current_active_user),
+    workspace: Workspace = Depends(get_current_workspace)
 ):
     """Get access control by ID"""
-    control = access_control_dao.get(db, id=control_id)
-    if not control:
-        raise HTTPException(status_code=404, detail="Access control not found")
-    return control
+    return access_control_service.get_access_control(db, control_id, workspace.id)
 
 
 @router.post("/", response_model=AccessControlResponse, status_code=201)
 def create_access_control(
     control_in: AccessControlCreate,
     db: Session = Depends(get_db),
-    current_user: Profile = Depends(get_current_active_user)
+    current_user: Profile = Depends(get_current_active_user),
+    workspace: Workspace = Depends(get_current_workspace)
 ):
     """Create new access control"""
-    control = access_control_dao.create(db, obj_in=control_in)
-    return control
+    return access_control_service.create_access_control(db, control_in, workspace.id)
 
 
 @router.put("/{control_id}", response_model=AccessControlResponse)
@@ -61,24 +85,19 @@ def update_access_control(
     control_id: int,
     control_in: AccessControlUpdate,
     db: Session = Depends(get_db),
-    current_user: Profile = Depends(get_current_active_user)
+    current_user: Profile = Depends(get_current_active_user),
+    workspace: Workspace = Depends(get_current_workspace)
 ):
     """Update access control"""
-    control = access_control_dao.get(db, id=control_id)
-    if not control:
-        raise HTTPException(status_code=404, detail="Access control not found")
-    control = access_control_dao.update(db, db_obj=control, obj_in=control_in)
-    return control
+    return access_control_service.update_access_control(db, control_id, control_in, workspace.id)
 
 
 @router.delete("/{control_id}", status_code=204)
 def delete_access_control(
     control_id: int,
     db: Session = Depends(get_db),
-    current_user: Profile = Depends(get_current_active_user)
+    current_user: Profile = Depends(get_current_active_user),
+    workspace: Workspace = Depends(get_current_workspace)
 ):
     """Delete access control"""
-    control = access_control_dao.get(db, id=control_id)
-    if not control:
-        raise HTTPException(status_code=404, detail="Access control not found")
-    access_control_dao.remove(db, id=control_id)
+    access_control_service.delete_access_control(db, control_id, workspace.id)
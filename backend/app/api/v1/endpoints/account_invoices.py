@@ -3,7 +3,8 @@ Account Invoice API endpoints
 
 Provides operations for managing account invoices (payables and receivables).
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
+from datetime import date
 from fastapi import APIRouter, Depends, status, Query
 from sqlalchemy.orm import Session
 
@@ -11,6 +12,8 @@ from app.core.deps import get_db, get_current_active_user, get_current_workspace
 from app.models.profile import Profile
 from app.models.workspace import Workspace
 from app.schemas.account_invoice import AccountInvoiceCreate, AccountInvoiceUpdate, AccountInvoiceResponse
+from app.schemas.account_aging import AgingReportResponse
+from app.schemas.account_period_summary import PeriodSummaryResponse
 from app.services.account_invoice_service import account_invoice_service
 
 
@@ -46,6 +49,83 @@ def get_invoices(
     return invoices
 
 
+@router.get(
+    "/aging",
+    response_model=AgingReportResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get receivable/payable aging",
+    description="Outstanding balances per account and invoice type in 0-30/31-60/61-90/90+ days past due buckets"
+)
+def get_aging_report(
+    as_of: Optional[date] = Query(None, description="Age invoices as of this date (defaults to today)"),
+    invoice_type: Optional[str] = Query(None, pattern=r'^(payable|receivable)$', description="Filter by type (payable/receivable)"),
+    account_id: Optional[int] = Query(None, description="Filter by account ID"),
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db)
+):
+    """Get the aging report for the workspace"""
+    return account_invoice_service.get_aging_report(
+        db,
+        workspace_id=workspace.id,
+        as_of=as_of,
+        invoice_type=invoice_type,
+        account_id=account_id
+    )
+
+
+@router.get(
+    "/period-summary",
+    response_model=PeriodSummaryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get monthly invoiced vs paid summary",
+    description="Invoiced and paid totals per month and invoice type, grouped by account, account tag or factory"
+)
+def get_period_summary(
+    start_period: Optional[date] = Query(None, description="First month (defaults to 11 months before end_period)"),
+    end_period: Optional[date] = Query(None, description="Last month (defaults to the current month)"),
+    group_by: str = Query('type', pattern=r'^(type|account|tag|factory)$', description="Group rows by type/account/tag/factory"),
+    invoice_type: Optional[str] = Query(None, pattern=r'^(payable|receivable)$', description="Filter by type (payable/receivable)"),
+    account_id: Optional[int] = Query(None, description="Filter by account ID"),
+    tag_id: Optional[int] = Query(None, description="Filter by account tag ID"),
+    factory_id: Optional[int] = Query(None, description="Filter by factory ID"),
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db)
+):
+    """Get the monthly summary for the workspace"""
+    if end_period is None:
+        end_period = date.today()
+    if start_period is None:
+        months = end_period.year * 12 + end_period.month - 1 - 11
+        start_period = date(months // 12, months % 12 + 1, 1)
+    return account_invoice_service.get_period_summary(
+        db,
+        workspace_id=workspace.id,
+        start_period=start_period,
+        end_period=end_period,
+        group_by=group_by,
+        invoice_type=invoice_type,
+        account_id=account_id,
+        tag_id=tag_id,
+        factory_id=factory_id
+    )
+
+
+@router.post(
+    "/period-summary/rebuild",
+    response_model=Dict[str, int],
+    status_code=status.HTTP_200_OK,
+    summary="Rebuild monthly summary",
+    description="Recompute the monthly invoiced/paid summary of the workspace from invoices and payments."
+)
+def rebuild_period_summary(
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Rebuild the materialized monthly summary of the workspace"""
+    return account_invoice_service.rebuild_period_summaries(db, workspace_id=workspace.id)
+
+
 @router.get(
     "/{invoice_id}",
     response_model=AccountInvoiceResponse,
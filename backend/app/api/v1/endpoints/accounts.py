@@ -4,7 +4,8 @@ Account endpoints
 Provides CRUD operations for accounts (unified entity for suppliers, clients, utilities, payroll).
 Accounts can be tagged as suppliers, clients, utilities, or payroll entities.
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
+from decimal import Decimal
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
@@ -34,16 +35,43 @@ def get_accounts(
     limit: int = Query(100, le=100, description="Maximum number of records to return"),
     search: Optional[str] = Query(None, description="Search by account name"),
     tag_code: Optional[str] = Query(None, description="Filter by tag code (e.g. supplier, client, vendor)"),
+    min_payable_outstanding: Optional[Decimal] = Query(None, ge=0, description="Only accounts we owe at least this much"),
+    min_receivable_outstanding: Optional[Decimal] = Query(None, ge=0, description="Only accounts owing us at least this much"),
+    sort_by: Optional[str] = Query(
+        None,
+        pattern=r'^(name|payable_outstanding|receivable_outstanding|last_invoice_date|last_payment_date)$',
+        description="Sort by name or a balance column"
+    ),
+    sort_desc: bool = Query(False, description="Sort descending"),
     workspace: Workspace = Depends(get_current_workspace),
     db: Session = Depends(get_db)
 ):
     """Get all accounts with their tags included"""
     accounts = account_service.get_accounts_with_tags(
-        db, workspace_id=workspace.id, search=search, tag_code=tag_code, skip=skip, limit=limit
+        db, workspace_id=workspace.id, search=search, tag_code=tag_code,
+        min_payable_outstanding=min_payable_outstanding,
+        min_receivable_outstanding=min_receivable_outstanding,
+        sort_by=sort_by, sort_desc=sort_desc, skip=skip, limit=limit
     )
     return accounts
 
 
+@router.post(
+    "/balances/rebuild",
+    response_model=Dict[str, int],
+    status_code=status.HTTP_200_OK,
+    summary="Rebuild account balances",
+    description="Recompute payable/receivable outstanding and last invoice/payment dates of every account from invoices and payments."
+)
+def rebuild_account_balances(
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Rebuild the denormalized balance counters of all accounts in the workspace"""
+    return account_service.rebuild_balances(db, workspace_id=workspace.id)
+
+
 @router.get(
     "/{account_id}",
     response_model=AccountWithTagsResponse,
@@ -7,7 +7,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db, get_current_workspace, get_current_active_user
+from app.core.deps import get_db, get_current_workspace, get_current_active_user, require_quota
 from app.models.workspace import Workspace
 from app.models.profile import Profile
 from app.schemas.factory import FactoryCreate, FactoryUpdate, FactoryResponse
@@ -68,7 +68,8 @@ def get_factory(
     response_model=FactoryResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create new factory",
-    description="Create a new factory location"
+    description="Create a new factory location",
+    dependencies=[Depends(require_quota("factories"))]
 )
 def create_factory(
     factory_in: FactoryCreate,
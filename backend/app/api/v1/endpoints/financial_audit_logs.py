@@ -1,5 +1,7 @@
 """Financial audit log API endpoints"""
-from typing import List, Optional
+import base64
+import binascii
+from typing import List, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from datetime import datetime
@@ -7,15 +9,111 @@ from datetime import datetime
 from app.core.deps import get_db, get_current_active_user, get_current_workspace
 from app.models.profile import Profile
 from app.models.workspace import Workspace
+from app.models.financial_audit_log import FinancialAuditLog
 from app.dao.financial_audit_log import financial_audit_log_dao
-from app.schemas.financial_audit_log import FinancialAuditLogResponse
+from app.schemas.financial_audit_log import FinancialAuditLogResponse, FinancialAuditLogSearchResponse
 
 router = APIRouter()
 
+INCLUDE_CHANGES_DESCRIPTION = "Return each entry's changes (decoded from the stored diff)"
+
+
+def _response_items(logs: List[FinancialAuditLog], include_changes: bool) -> list:
+    """Response items for audit logs, leaving out the changes unless requested."""
+    if include_changes:
+        return logs
+    # Build items from the loaded columns only, so the deferred change
+    # payloads are neither loaded nor decoded
+    return [
+        {field: getattr(log, field) for field in FinancialAuditLogResponse.model_fields if field != 'changes'}
+        for log in logs
+    ]
+
+
+def _encode_cursor(performed_at: datetime, log_id: int) -> str:
+    """Encode the (performed_at, id) of a page's last row as an opaque cursor."""
+    raw = f"{performed_at.isoformat()}|{log_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor made by _encode_cursor (400 if malformed)."""
+    try:
+        performed_at, log_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(performed_at), int(log_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+@router.get("/search", response_model=FinancialAuditLogSearchResponse)
+def search_audit_logs(
+    entity_type: Optional[str] = Query(default=None, description="Entity type ('account', 'invoice', 'payment')"),
+    entity_id: Optional[int] = Query(default=None),
+    related_entity_type: Optional[str] = Query(default=None),
+    related_entity_id: Optional[int] = Query(default=None),
+    action_type: Optional[str] = Query(default=None),
+    performed_by: Optional[int] = Query(default=None, description="User ID who performed the action"),
+    start_date: Optional[datetime] = Query(default=None, description="Start datetime (inclusive)"),
+    end_date: Optional[datetime] = Query(default=None, description="End datetime (inclusive)"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page"),
+    limit: int = Query(default=100, ge=1, le=200),
+    include_count: bool = Query(default=True, description="Estimate the number of matches (first page only)"),
+    include_changes: bool = Query(default=False, description=INCLUDE_CHANGES_DESCRIPTION),
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db),
+    current_user: Profile = Depends(get_current_active_user)
+):
+    """
+    Search audit logs combining any of the filters.
+
+    Results are newest first. Follow `next_cursor` to page through them;
+    the match count is estimated on the first page only.
+
+    Returns:
+        One page of audit logs, the next page cursor and the count estimate
+    """
+    filters = dict(
+        entity_type=entity_type,
+        entity_id=entity_id,
+        related_entity_type=related_entity_type,
+        related_entity_id=related_entity_id,
+        action_type=action_type,
+        performed_by=performed_by,
+        start_date=start_date,
+        end_date=end_date
+    )
+    logs, has_more = financial_audit_log_dao.search(
+        db,
+        workspace_id=workspace.id,
+        before=_decode_cursor(cursor) if cursor else None,
+        limit=limit,
+        include_changes=include_changes,
+        **filters
+    )
+
+    count_estimate = count_is_exact = None
+    if include_count and not cursor:
+        count_estimate, count_is_exact = financial_audit_log_dao.count_estimate(
+            db, workspace_id=workspace.id, **filters
+        )
+
+    next_cursor = _encode_cursor(logs[-1].performed_at, logs[-1].id) if has_more else None
+
+    return {
+        'items': _response_items(logs, include_changes),
+        'next_cursor': next_cursor,
+        'count_estimate': count_estimate,
+        'count_is_exact': count_is_exact,
+    }
+
 
 @router.get("/", response_model=List[FinancialAuditLogResponse])
 def get_recent_audit_logs(
     limit: int = Query(default=50, le=200, description="Maximum number of records to return"),
+    include_changes: bool = Query(default=True, description=INCLUDE_CHANGES_DESCRIPTION),
     workspace: Workspace = Depends(get_current_workspace),
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_active_user)
@@ -28,9 +126,10 @@ def get_recent_audit_logs(
     logs = financial_audit_log_dao.get_recent_logs(
         db,
         workspace_id=workspace.id,
-        limit=limit
+        limit=limit,
+        include_changes=include_changes
     )
-    return logs
+    return _response_items(logs, include_changes)
 
 
 @router.get("/entity/{entity_type}/{entity_id}", response_model=List[FinancialAuditLogResponse])
@@ -39,6 +138,7 @@ def get_entity_audit_logs(
     entity_id: int,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, le=200),
+    include_changes: bool = Query(default=True, description=INCLUDE_CHANGES_DESCRIPTION),
     workspace: Workspace = Depends(get_current_workspace),
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_active_user)
@@ -51,6 +151,7 @@ def get_entity_audit_logs(
         entity_id: Entity ID
         skip: Number of records to skip
         limit: Maximum number of records to return
+        include_changes: Also return each entry's changes
 
     Returns:
         List of audit logs for the entity
@@ -61,9 +162,10 @@ def get_entity_audit_logs(
         entity_id=entity_id,
         workspace_id=workspace.id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        include_changes=include_changes
     )
-    return logs
+    return _response_items(logs, include_changes)
 
 
 @router.get("/related/{entity_type}/{entity_id}", response_model=List[FinancialAuditLogResponse])
@@ -72,6 +174,7 @@ def get_related_audit_logs(
     entity_id: int,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, le=200),
+    include_changes: bool = Query(default=True, description=INCLUDE_CHANGES_DESCRIPTION),
     workspace: Workspace = Depends(get_current_workspace),
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_active_user)
@@ -89,6 +192,7 @@ def get_related_audit_logs(
         entity_id: Entity ID
         skip: Number of records to skip
         limit: Maximum number of records to return
+        include_changes: Also return each entry's changes
 
     Returns:
         List of all related audit logs
@@ -99,9 +203,10 @@ def get_related_audit_logs(
         entity_id=entity_id,
         workspace_id=workspace.id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        include_changes=include_changes
     )
-    return logs
+    return _response_items(logs, include_changes)
 
 
 @router.get("/action/{action_type}", response_model=List[FinancialAuditLogResponse])
@@ -109,6 +214,7 @@ def get_audit_logs_by_action(
     action_type: str,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, le=200),
+    include_changes: bool = Query(default=True, description=INCLUDE_CHANGES_DESCRIPTION),
     workspace: Workspace = Depends(get_current_workspace),
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_active_user)
@@ -120,6 +226,7 @@ def get_audit_logs_by_action(
         action_type: Action type ('created', 'updated', 'deleted', 'status_changed', etc.)
         skip: Number of records to skip
         limit: Maximum number of records to return
+        include_changes: Also return each entry's changes
 
     Returns:
         List of audit logs with matching action type
@@ -129,9 +236,10 @@ def get_audit_logs_by_action(
         action_type=action_type,
         workspace_id=workspace.id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        include_changes=include_changes
     )
-    return logs
+    return _response_items(logs, include_changes)
 
 
 @router.get("/user/{user_id}", response_model=List[FinancialAuditLogResponse])
@@ -139,6 +247,7 @@ def get_user_audit_logs(
     user_id: int,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, le=200),
+    include_changes: bool = Query(default=True, description=INCLUDE_CHANGES_DESCRIPTION),
     workspace: Workspace = Depends(get_current_workspace),
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_active_user)
@@ -150,6 +259,7 @@ def get_user_audit_logs(
         user_id: User ID who performed the action
         skip: Number of records to skip
         limit: Maximum number of records to return
+        include_changes: Also return each entry's changes
 
     Returns:
         List of audit logs performed by the user
@@ -159,9 +269,10 @@ def get_user_audit_logs(
         user_id=user_id,
         workspace_id=workspace.id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        include_changes=include_changes
     )
-    return logs
+    return _response_items(logs, include_changes)
 
 
 @router.get("/date-range", response_model=List[FinancialAuditLogResponse])
@@ -170,6 +281,7 @@ def get_audit_logs_by_date_range(
     end_date: datetime = Query(..., description="End datetime (inclusive)"),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, le=200),
+    include_changes: bool = Query(default=True, description=INCLUDE_CHANGES_DESCRIPTION),
     workspace: Workspace = Depends(get_current_workspace),
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_active_user)
@@ -182,6 +294,7 @@ def get_audit_logs_by_date_range(
         end_date: End datetime (inclusive)
         skip: Number of records to skip
         limit: Maximum number of records to return
+        include_changes: Also return each entry's changes
 
     Returns:
         List of audit logs in the date range
@@ -192,6 +305,7 @@ def get_audit_logs_by_date_range(
         end_date=end_date,
         workspace_id=workspace.id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        include_changes=include_changes
     )
-    return logs
+    return _response_items(logs, include_changes)
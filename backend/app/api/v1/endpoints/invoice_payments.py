@@ -10,7 +10,10 @@ from sqlalchemy.orm import Session
 from app.core.deps import get_db, get_current_active_user, get_current_workspace
 from app.models.profile import Profile
 from app.models.workspace import Workspace
-from app.schemas.invoice_payment import InvoicePaymentCreate, InvoicePaymentUpdate, InvoicePaymentResponse
+from app.schemas.invoice_payment import (
+    InvoicePaymentCreate, InvoicePaymentUpdate, InvoicePaymentResponse,
+    InvoicePaymentBatchCreate, InvoicePaymentBatchResponse
+)
 from app.services.invoice_payment_service import invoice_payment_service
 
 
@@ -42,6 +45,28 @@ def get_payments_by_invoice(
     return payments
 
 
+@router.post(
+    "/batch",
+    response_model=InvoicePaymentBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create batch payment",
+    description="Apply one remittance across many invoices. All allocations are validated first; either all payments are recorded or none."
+)
+def create_batch_payment(
+    batch_in: InvoicePaymentBatchCreate,
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Settle many invoices from one remittance"""
+    return invoice_payment_service.create_batch_payment(
+        db,
+        batch_in=batch_in,
+        workspace_id=workspace.id,
+        user_id=current_user.id
+    )
+
+
 @router.get(
     "/{payment_id}",
     response_model=InvoicePaymentResponse,
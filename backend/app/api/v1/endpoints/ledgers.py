@@ -8,10 +8,11 @@ Provides read-only access to all 5 ledger types:
 - Project Component Item Ledger
 - Inventory Ledger (Finished Goods)
 
-Also provides reconciliation and cross-ledger reporting endpoints.
+Also provides reconciliation, cross-ledger reporting, archival and drift
+detection endpoints.
 """
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, Query, status, Path
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status, Path
 from sqlalchemy.orm import Session
 from datetime import datetime
 
@@ -23,7 +24,10 @@ from app.schemas.machine_item_ledger import MachineItemLedgerResponse
 from app.schemas.damaged_item_ledger import DamagedItemLedgerResponse
 from app.schemas.project_component_item_ledger import ProjectComponentItemLedgerResponse
 from app.schemas.inventory_ledger import InventoryLedgerResponse
-from app.schemas.response import ActionResponse
+from app.schemas.ledger_archive_period import LedgerArchivePeriodResponse
+from app.schemas.ledger_drift import LedgerDriftResponse
+from app.schemas.ledger_drift_scan_state import LedgerDriftScanStateResponse
+from app.schemas.response import ActionResponse, info_message
 from app.services.ledger_service import ledger_service
 
 
@@ -566,3 +570,164 @@ def get_transactions_by_order(
         workspace_id=workspace.id
     )
     return transactions
+
+
+
+# ============================================================================
+# LEDGER ARCHIVAL ENDPOINTS
+# ============================================================================
+
+@router.post(
+    "/archive",
+    response_model=ActionResponse[Dict[str, Any]],
+    status_code=status.HTTP_200_OK,
+    summary="Archive closed ledger years",
+    description="""
+    Move ledger entries up to and including a closed year out of the hot
+    ledger tables into per-year archive tables.
+
+    One opening balance entry per item is left behind so balances and
+    reconciliation keep working. Date-range queries that reach into an
+    archived year include the archived entries automatically.
+
+    Only the workspace owner can archive (403 otherwise).
+    """
+)
+def archive_closed_periods(
+    through_year: int = Query(..., ge=2000, description="Last year to archive (must be closed)"),
+    db: Session = Depends(get_db),
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user)
+):
+    """
+    Archive closed ledger years.
+
+    Returns per-ledger counts of archived entries and checkpoints + messages.
+    """
+    # Archiving moves and deletes ledger history; restrict it to the owner
+    if workspace.owner_user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Only workspace owner can archive ledger periods")
+
+    result, messages = ledger_service.archive_closed_periods(
+        db=db,
+        workspace_id=workspace.id,
+        through_year=through_year,
+        current_user=current_user
+    )
+
+    return ActionResponse(data=result, messages=messages)
+
+
+@router.get(
+    "/archive/periods",
+    response_model=List[LedgerArchivePeriodResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get archived ledger periods",
+    description="List ledger years that have been moved to archive tables"
+)
+def get_archive_periods(
+    ledger_table: Optional[str] = Query(None, description="Ledger table filter (e.g. storage_item_ledger)"),
+    skip: int = Query(0, ge=0, description="Pagination offset"),
+    limit: int = Query(100, le=100, description="Pagination limit"),
+    db: Session = Depends(get_db),
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user)
+):
+    """
+    Get archived ledger periods (newest year first).
+    """
+    periods = ledger_service.get_archive_periods(
+        db=db,
+        workspace_id=workspace.id,
+        ledger_table=ledger_table,
+        skip=skip,
+        limit=limit
+    )
+    return periods
+
+
+# ============================================================================
+# DRIFT DETECTION ENDPOINTS
+# ============================================================================
+
+@router.post(
+    "/drift/scan",
+    response_model=ActionResponse[Optional[Dict[str, Any]]],
+    status_code=status.HTTP_200_OK,
+    summary="Scan ledgers for snapshot drift",
+    description="""
+    Compare ledger balances with the storage_items, machine_items,
+    damaged_items and inventory snapshots.
+
+    Only ledger entries added since the previous scan are read. Discrepancies
+    are recorded and can be listed with GET /ledgers/drift. Pass
+    background=true to run the scan after the response is sent.
+    """
+)
+def run_drift_scan(
+    background_tasks: BackgroundTasks,
+    background: bool = Query(False, description="Run the scan as a background task"),
+    db: Session = Depends(get_db),
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user)
+):
+    """
+    Run the ledger drift scanner for the current workspace.
+
+    Returns per-ledger scan metrics + messages (no data when run in background).
+    """
+    if background:
+        background_tasks.add_task(ledger_service.run_drift_scan_job, workspace.id)
+        return ActionResponse(data=None, messages=[info_message("Ledger drift scan started")])
+
+    result, messages = ledger_service.run_drift_scan(db=db, workspace_id=workspace.id)
+    return ActionResponse(data=result, messages=messages)
+
+
+@router.get(
+    "/drift",
+    response_model=List[LedgerDriftResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get ledger drifts",
+    description="List discrepancies found by the drift scanner (unresolved only by default)"
+)
+def get_drifts(
+    ledger_table: Optional[str] = Query(None, description="Ledger table filter (e.g. storage_item_ledger)"),
+    drift_type: Optional[str] = Query(None, description="snapshot_mismatch, snapshot_missing or chain_break"),
+    include_resolved: bool = Query(False, description="Include resolved drifts"),
+    skip: int = Query(0, ge=0, description="Pagination offset"),
+    limit: int = Query(100, le=100, description="Pagination limit"),
+    db: Session = Depends(get_db),
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user)
+):
+    """
+    Get ledger drifts (newest first).
+    """
+    return ledger_service.get_drifts(
+        db=db,
+        workspace_id=workspace.id,
+        ledger_table=ledger_table,
+        drift_type=drift_type,
+        include_resolved=include_resolved,
+        skip=skip,
+        limit=limit
+    )
+
+
+@router.get(
+    "/drift/metrics",
+    response_model=List[LedgerDriftScanStateResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Get drift scanner metrics",
+    description="High-water mark, last run and cumulative metrics per ledger"
+)
+def get_drift_scan_metrics(
+    db: Session = Depends(get_db),
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user)
+):
+    """
+    Get drift scanner metrics for every scanned ledger.
+    """
+    return ledger_service.get_drift_scan_metrics(db=db, workspace_id=workspace.id)
@@ -16,6 +16,7 @@ from app.schemas.machine_maintenance_log import (
     MachineMaintenanceLogUpdate,
     MachineMaintenanceLogResponse,
 )
+from app.schemas.maintenance_plan import MaintenanceDueListResponse
 from app.services.machine_maintenance_log_service import machine_maintenance_log_service
 
 
@@ -45,6 +46,33 @@ def list_maintenance_logs(
     )
 
 
+@router.get(
+    "/due",
+    response_model=MaintenanceDueListResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get maintenance due-list",
+    description="""
+    Machines due for maintenance within the next `days` days, plus overdue
+    ones, earliest first. A machine is due at the earliest of:
+    - calendar: last maintenance + average days between maintenances
+    - running_hours: running hours since the last maintenance reach the
+      average between maintenances (projected at the last 30 days' rate)
+    - parts: the same for parts consumed on the machine
+    A next_maintenance_schedule set on the machine after its last
+    maintenance takes precedence. Averages use the last 5 intervals.
+    """
+)
+def get_maintenance_due_list(
+    days: int = Query(7, ge=0, le=365, description="Horizon in days from today"),
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db)
+):
+    """Get machines due for maintenance"""
+    return machine_maintenance_log_service.get_due_list(
+        db, workspace_id=workspace.id, days=days
+    )
+
+
 @router.get(
     "/{log_id}",
     response_model=MachineMaintenanceLogResponse,
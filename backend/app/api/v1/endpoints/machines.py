@@ -3,16 +3,18 @@ Machine API endpoints
 
 Provides operations for managing machines and machine events (status changes).
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db, get_current_workspace, get_current_active_user
+from app.core.deps import get_db, get_current_workspace, get_current_active_user, require_quota
 from app.models.workspace import Workspace
 from app.models.profile import Profile
 from app.models.enums import MachineEventTypeEnum
 from app.schemas.machine import MachineCreate, MachineUpdate, MachineResponse
 from app.schemas.machine_event import MachineEventCreate, MachineEventResponse
+from app.schemas.machine_uptime import MachineStateInterval, MachineUptimeResponse
 from app.services.machine_service import machine_service
 
 
@@ -46,6 +48,61 @@ def get_machines(
     )
 
 
+@router.get(
+    "/uptime",
+    response_model=MachineUptimeResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get machine uptime",
+    description="""
+    Uptime (RUNNING), downtime (OFF + MAINTENANCE), idle time, MTBF and
+    MTTR per machine, factory section, factory or in total over a window.
+    Failures are changes from RUNNING/IDLE to OFF/MAINTENANCE, repairs the
+    changes back. Times are UTC; time after now is not counted.
+
+    Whole days are served from a daily rollup maintained as machine events
+    are created; windows starting and ending at midnight need no event scan.
+    """,
+)
+def get_machine_uptime(
+    start: Optional[datetime] = Query(None, description="Window start (defaults to 7 days before end)"),
+    end: Optional[datetime] = Query(None, description="Window end, exclusive (defaults to now)"),
+    group_by: str = Query('machine', pattern=r'^(machine|section|factory|total)$', description="Group rows by machine/section/factory/total"),
+    factory_id: Optional[int] = Query(None, description="Filter by factory ID"),
+    factory_section_id: Optional[int] = Query(None, description="Filter by factory section ID"),
+    machine_id: Optional[int] = Query(None, description="Filter by machine ID"),
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db)
+):
+    """Get machine uptime for the workspace"""
+    if end is None:
+        end = datetime.utcnow()
+    if start is None:
+        start = end - timedelta(days=7)
+    return machine_service.get_uptime(
+        db, workspace_id=workspace.id,
+        start=start, end=end, group_by=group_by,
+        factory_id=factory_id,
+        factory_section_id=factory_section_id,
+        machine_id=machine_id
+    )
+
+
+@router.post(
+    "/uptime/rebuild",
+    response_model=Dict[str, int],
+    status_code=status.HTTP_200_OK,
+    summary="Rebuild machine uptime",
+    description="Recompute the daily machine uptime rollup of the workspace from machine events."
+)
+def rebuild_machine_uptime(
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """Rebuild the machine uptime rollup of the workspace"""
+    return machine_service.rebuild_uptime(db, workspace_id=workspace.id)
+
+
 @router.get(
     "/{machine_id}",
     response_model=MachineResponse,
@@ -65,7 +122,8 @@ def get_machine(
     "/",
     response_model=MachineResponse,
     status_code=status.HTTP_201_CREATED,
-    summary="Create new machine"
+    summary="Create new machine",
+    dependencies=[Depends(require_quota("machines"))]
 )
 def create_machine(
     machine_in: MachineCreate,
@@ -167,6 +225,31 @@ def get_machine_events(
     )
 
 
+@router.get(
+    "/{machine_id}/intervals",
+    response_model=List[MachineStateInterval],
+    status_code=status.HTTP_200_OK,
+    summary="Get machine state intervals",
+    description="Time spent in each state between consecutive events, clipped to the window (UTC)"
+)
+def get_machine_intervals(
+    machine_id: int,
+    start: Optional[datetime] = Query(None, description="Window start (defaults to 7 days before end)"),
+    end: Optional[datetime] = Query(None, description="Window end, exclusive (defaults to now)"),
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db)
+):
+    """Get state intervals of a specific machine"""
+    if end is None:
+        end = datetime.utcnow()
+    if start is None:
+        start = end - timedelta(days=7)
+    return machine_service.get_machine_intervals(
+        db, machine_id=machine_id, workspace_id=workspace.id,
+        start=start, end=end
+    )
+
+
 @router.get(
     "/{machine_id}/events/latest",
     response_model=MachineEventResponse,
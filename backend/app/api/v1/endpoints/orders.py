@@ -3,7 +3,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db, get_current_active_user
+from app.core.deps import get_db, get_current_active_user, require_quota
 from app.models.profile import Profile
 from app.schemas.order import OrderCreate, OrderUpdate, OrderResponse
 from app.services.order_service import order_service
@@ -62,7 +62,8 @@ def get_order(
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.post("/", response_model=OrderResponse, status_code=201)
+@router.post("/", response_model=OrderResponse, status_code=201,
+             dependencies=[Depends(require_quota("orders_per_month"))])
 def create_order(
     order_in: OrderCreate,
     db: Session = Depends(get_db),
@@ -6,7 +6,8 @@ Batches track actual production runs with expected vs actual variance analysis.
 Supports both formula-driven (with auto-calculated expected values) and
 simple mode (manual tracking).
 """
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Dict, List, Optional
 from fastapi import APIRouter, Depends, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
@@ -24,6 +25,13 @@ from app.schemas.production_batch_item import (
     ProductionBatchItemUpdate,
     ProductionBatchItemResponse,
 )
+from app.schemas.production_batch_rollup import ProductionAnalyticsResponse
+from app.schemas.production_schedule import RescheduleRequest, ScheduleRequest, ScheduleResponse
+from app.schemas.stock_reservation import (
+    AvailabilityRequest,
+    AvailabilityResponse,
+    StockReservationResponse,
+)
 from app.services.production_batch_service import production_batch_service
 
 
@@ -36,7 +44,7 @@ class StartBatchRequest(BaseModel):
     """Request body for starting a batch"""
     target_output_quantity: Optional[int] = Field(
         None, gt=0,
-        description="Target output quantity. If omitted, uses sum of formula's product items."
+        description="Target output quantity. If omitted, uses the batch's expected output quantity, else sum of formula's product items."
     )
 
 
@@ -89,6 +97,124 @@ def get_batches(
     )
 
 
+@router.post(
+    "/availability",
+    response_model=AvailabilityResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Check stock availability for candidate batches",
+    description="""
+    Answer "can we produce this?" for many candidate batches at once.
+    Each candidate is a draft batch (batch_id) or a formula run on a
+    factory or production line with an optional target output quantity.
+
+    Available stock = storage items + STORAGE inventory - active reservations.
+    With cumulative=true, candidates that fit use up stock for the ones after
+    them (in request order). Nothing is reserved.
+    """,
+)
+def check_availability(
+    availability_in: AvailabilityRequest,
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db),
+):
+    """Check stock availability for candidate batches"""
+    return {
+        'results': production_batch_service.check_availability(
+            db, availability_in, workspace_id=workspace.id
+        )
+    }
+
+
+@router.get(
+    "/analytics",
+    response_model=ProductionAnalyticsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get production analytics",
+    description="""
+    OEE-style aggregates of completed batches per day, week or month,
+    grouped by production line, formula, shift or in total: average
+    efficiency and its spread, rank within the period and change vs the
+    previous period, output variance distribution, throughput per hour,
+    scrap ratio (waste-role items) and yield.
+
+    Served from a daily rollup maintained when batches complete.
+    """,
+)
+def get_production_analytics(
+    start_date: Optional[date] = Query(None, description="First batch date (defaults to 90 days before end_date)"),
+    end_date: Optional[date] = Query(None, description="Last batch date (defaults to today)"),
+    period: str = Query('month', pattern=r'^(day|week|month)$', description="Bucket rows by day/week/month"),
+    group_by: str = Query('line', pattern=r'^(line|formula|shift|total)$', description="Group rows by line/formula/shift/total"),
+    production_line_id: Optional[int] = Query(None, description="Filter by production line ID"),
+    formula_id: Optional[int] = Query(None, description="Filter by formula ID"),
+    shift: Optional[str] = Query(None, description="Filter by shift"),
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db),
+):
+    """Get production analytics for the workspace"""
+    if end_date is None:
+        end_date = date.today()
+    if start_date is None:
+        start_date = end_date - timedelta(days=90)
+    return production_batch_service.get_analytics(
+        db,
+        workspace_id=workspace.id,
+        start_date=start_date,
+        end_date=end_date,
+        period=period,
+        group_by=group_by,
+        production_line_id=production_line_id,
+        formula_id=formula_id,
+        shift=shift
+    )
+
+
+@router.post(
+    "/analytics/rebuild",
+    response_model=Dict[str, int],
+    status_code=status.HTTP_200_OK,
+    summary="Rebuild production analytics",
+    description="Recompute the daily production rollup of the workspace from completed batches.",
+)
+def rebuild_production_analytics(
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """Rebuild the production analytics rollup of the workspace"""
+    return production_batch_service.rebuild_analytics(db, workspace_id=workspace.id)
+
+
+@router.post(
+    "/schedule",
+    response_model=ScheduleResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Schedule draft batches on lines and shifts",
+    description="""
+    Finite-capacity schedule of the workspace's draft batches over a
+    horizon of days split into shifts. Batches are taken by earliest
+    batch_date, then longest duration, and each is placed on the line of
+    its factory where it finishes first. Lines whose machine is stopped or
+    deleted are skipped, and a machine's next maintenance date has no
+    capacity. Durations come from expected_duration_minutes, else the
+    formula estimate scaled to the expected output.
+
+    A batch never starts before its batch_date (and shift, when it names
+    one of the requested shifts). With apply=true the scheduled line,
+    batch_date and shift are saved, so they become the batches' earliest
+    start for later runs.
+    """,
+)
+def build_schedule(
+    schedule_in: ScheduleRequest,
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """Schedule draft batches"""
+    return production_batch_service.build_schedule(db, schedule_in, workspace_id=workspace.id)
+
+
 @router.get(
     "/{batch_id}",
     response_model=ProductionBatchResponse,
@@ -185,12 +311,15 @@ def delete_batch(
     - Calculates expected input/output quantities based on target_output_quantity
     - Creates batch items from formula items with scaled expected quantities
     - Sets expected_duration_minutes from formula
+    - Reserves the formula inputs in the line's factory (400 if any input
+      lacks available stock; nothing is started or reserved)
 
     If no formula (simple mode):
     - Just transitions to in_progress status
 
     Optionally provide target_output_quantity to scale the formula.
-    If omitted, uses the formula's base output_quantity.
+    If omitted, uses the batch's expected_output_quantity, else the
+    formula's base output_quantity.
     """,
 )
 def start_batch(
@@ -222,6 +351,7 @@ def start_batch(
     - efficiency_percentage (actual / expected * 100)
 
     Also calculates per-item variance for batch items that have actual_quantity set.
+    The batch's stock reservations are marked consumed.
     """,
 )
 def complete_batch(
@@ -245,7 +375,10 @@ def complete_batch(
     response_model=ProductionBatchResponse,
     status_code=status.HTTP_200_OK,
     summary="Cancel production batch",
-    description="Cancel a draft or in-progress batch. Provide optional cancellation notes.",
+    description="""
+    Cancel a draft or in-progress batch. Provide optional cancellation notes.
+    The batch's stock reservations are released.
+    """,
 )
 def cancel_batch(
     batch_id: int,
@@ -261,6 +394,50 @@ def cancel_batch(
     )
 
 
+@router.post(
+    "/{batch_id}/reschedule",
+    response_model=ScheduleResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Reschedule after a batch changed",
+    description="""
+    Update the last schedule of the workspace after this batch changed
+    (line, date, duration, status). Batches placed before it keep their
+    slot; only the rest of its factory is placed again. changed_batch_ids
+    lists the batches whose placement moved. Builds a full schedule with
+    default settings when no recent schedule exists.
+    """,
+)
+def reschedule_batch(
+    batch_id: int,
+    reschedule_in: RescheduleRequest,
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """Incrementally reschedule after a batch changed"""
+    return production_batch_service.reschedule_batch(
+        db, batch_id, reschedule_in, workspace_id=workspace.id
+    )
+
+
+@router.get(
+    "/{batch_id}/reservations",
+    response_model=List[StockReservationResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List batch stock reservations",
+    description="Get the stock reservations (active, consumed, released) of a production batch.",
+)
+def get_batch_reservations(
+    batch_id: int,
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db),
+):
+    """Get stock reservations of a batch"""
+    return production_batch_service.get_batch_reservations(
+        db, batch_id, workspace_id=workspace.id
+    )
+
+
 # ─── Batch Item Endpoints ───────────────────────────────────────────
 
 
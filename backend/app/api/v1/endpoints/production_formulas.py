@@ -17,6 +17,8 @@ from app.schemas.production_formula import (
     ProductionFormulaUpdate,
     ProductionFormulaResponse,
 )
+from app.schemas.mrp import MRPRequest, MRPResponse
+from app.schemas.production_formula_version import ProductionFormulaVersionResponse
 from app.schemas.production_formula_item import (
     ProductionFormulaItemCreate,
     ProductionFormulaItemUpdate,
@@ -58,6 +60,28 @@ def get_formulas(
     )
 
 
+@router.post(
+    "/mrp",
+    response_model=MRPResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Run MRP for planned batches",
+    description="""
+    Explode planned batches through all formula levels and net the
+    requirements against storage and STORAGE inventory per factory.
+    Net requirements of items made by another formula are planned as
+    production; the rest are returned as shortages. Nothing is saved.
+    Fails with 400 if the explosion runs into a formula cycle.
+    """,
+)
+def run_mrp(
+    mrp_in: MRPRequest,
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db),
+):
+    """Run material requirements planning"""
+    return production_formula_service.run_mrp(db, mrp_in, workspace_id=workspace.id)
+
+
 @router.get(
     "/{formula_id}",
     response_model=ProductionFormulaResponse,
@@ -136,6 +160,28 @@ def delete_formula(
     production_formula_service.delete_formula(db, formula_id, workspace.id)
 
 
+@router.get(
+    "/{formula_id}/versions",
+    response_model=List[ProductionFormulaVersionResponse],
+    status_code=status.HTTP_200_OK,
+    summary="List formula versions",
+    description="""
+    Get the immutable recipe snapshots of a production formula, newest first.
+    A snapshot is taken the first time a batch starts with a formula version;
+    batches keep the snapshot they were started with (formula_version_id).
+    """,
+)
+def get_formula_versions(
+    formula_id: int,
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db),
+):
+    """Get the recipe snapshots of a formula"""
+    return production_formula_service.get_formula_versions(
+        db, formula_id, workspace_id=workspace.id
+    )
+
+
 # ─── Formula Item Endpoints ─────────────────────────────────────────
 
 
@@ -3,10 +3,11 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db, get_current_active_user, get_current_workspace
+from app.core.deps import get_db, get_current_active_user, get_current_workspace, require_quota
 from app.models.profile import Profile
 from app.models.workspace import Workspace
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.schemas.project_cost_rollup import ProjectCostSummaryResponse
 from app.services.project_service import project_service
 
 
@@ -61,12 +62,33 @@ def get_project(
     return project
 
 
+@router.get(
+    "/{project_id}/cost-summary",
+    response_model=ProjectCostSummaryResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get project cost summary",
+    description="Item, miscellaneous, work order and maintenance costs for the project and each component"
+)
+def get_project_cost_summary(
+    project_id: int,
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db)
+):
+    """Get the project cost tree from the materialized cost rollups"""
+    return project_service.get_cost_summary(
+        db,
+        project_id=project_id,
+        workspace_id=workspace.id
+    )
+
+
 @router.post(
     "",
     response_model=ProjectResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create new project",
-    description="Create a new project"
+    description="Create a new project",
+    dependencies=[Depends(require_quota("projects"))]
 )
 def create_project(
     project_in: ProjectCreate,
@@ -9,7 +9,9 @@ from app.models.profile import Profile
 from app.schemas.purchase_order import (
     PurchaseOrderCreate, PurchaseOrderUpdate, PurchaseOrderResponse,
     PurchaseOrderItemCreate, PurchaseOrderItemUpdate, PurchaseOrderItemResponse,
+    PurchaseOrderGenerate, PurchaseOrderGenerateResponse,
 )
+from app.schemas.replenishment import ReplenishmentResponse
 from app.services.purchase_order_service import purchase_order_service
 
 
@@ -38,6 +40,41 @@ def list_purchase_orders(
     )
 
 
+@router.get(
+    "/replenishment",
+    response_model=ReplenishmentResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get spare-part shortages and suggested purchase orders",
+    description="""
+    Reorder points per factory and item from the daily consumption (storage
+    and machine ledgers) of the last `window_days` days:
+    - safety_stock = z(service_level) * daily std dev * sqrt(lead_time_days)
+    - reorder_point = daily rate * lead_time_days + safety_stock
+    An item is short when on hand + on order - machine shortfall (req_qty
+    not met on machines) is at or below its reorder point. Suggested
+    quantities order up to the reorder point plus `cover_days` of
+    consumption, grouped into one suggested order per factory storage.
+    Results are cached for 5 minutes; pass refresh=true to recompute.
+    """
+)
+def get_replenishment(
+    window_days: int = Query(90, ge=7, le=730, description="Days of consumption history"),
+    lead_time_days: int = Query(14, ge=0, le=365, description="Days between ordering and receiving"),
+    service_level: float = Query(0.95, ge=0.5, le=0.999, description="Probability of no stock-out during the lead time"),
+    cover_days: int = Query(30, ge=0, le=365, description="Days of consumption ordered above the reorder point"),
+    factory_id: Optional[int] = Query(None),
+    refresh: bool = Query(False, description="Recompute instead of using the cached plan"),
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db)
+):
+    return purchase_order_service.get_replenishment(
+        db, workspace_id=workspace.id,
+        window_days=window_days, lead_time_days=lead_time_days,
+        service_level=service_level, cover_days=cover_days,
+        factory_id=factory_id, refresh=refresh
+    )
+
+
 @router.get(
     "/{po_id}",
     response_model=PurchaseOrderResponse,
@@ -70,6 +107,31 @@ def create_purchase_order(
     )
 
 
+@router.post(
+    "/generate",
+    response_model=PurchaseOrderGenerateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Generate purchase orders from shortages",
+    description="""
+    Create one purchase order per supplier account and destination for a
+    list of item shortages (e.g. the suggested orders of GET /replenishment).
+    Supplier and unit price default to the item's latest purchase (purchase
+    order lines and payable invoiced orders). Items never bought use
+    default_account_id at price 0, or are returned as unassigned.
+    """
+)
+def generate_purchase_orders(
+    generate_in: PurchaseOrderGenerate,
+    workspace: Workspace = Depends(get_current_workspace),
+    current_user: Profile = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    return purchase_order_service.generate_purchase_orders(
+        db, generate_in=generate_in,
+        workspace_id=workspace.id, user_id=current_user.id
+    )
+
+
 @router.put(
     "/{po_id}",
     response_model=PurchaseOrderResponse,
@@ -32,6 +32,10 @@ class Settings(BaseSettings):
             return [i.strip() for i in v.split(",")]
         return v
 
+    # Financial audit log: buffer events per transaction and write them
+    # with one multi-row insert at commit (False = insert each event immediately)
+    FINANCIAL_AUDIT_BUFFERED: bool = True
+
     # Environment
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
@@ -1,7 +1,7 @@
 """
 FastAPI dependencies for dependency injection
 """
-from typing import Generator, Optional
+from typing import Callable, Generator, Optional
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -11,6 +11,9 @@ from app.models.profile import Profile
 from app.models.workspace import Workspace
 from app.dao.workspace import workspace_dao
 from app.dao.workspace_member import workspace_member_dao
+from app.managers.access_control_manager import access_control_manager, PermissionMatrix
+from app.managers.quota_manager import quota_manager
+from app.models.enums import AccessControlTypeEnum
 
 
 security = HTTPBearer()
@@ -166,3 +169,77 @@ def get_current_workspace(
         )
     
     return workspace
+
+
+def get_current_permissions(
+    workspace: Workspace = Depends(get_current_workspace),
+    db: Session = Depends(get_db),
+    current_user: Profile = Depends(get_current_active_user)
+) -> PermissionMatrix:
+    """
+    Get compiled permissions of the current user's role in the current workspace
+
+    Args:
+        workspace: Current workspace
+        db: Database session
+        current_user: Current authenticated user
+
+    Returns:
+        Cached permission matrix (checks are set lookups, no DB queries)
+    """
+    member = workspace_member_dao.get_by_workspace_and_user(
+        db, workspace_id=workspace.id, user_id=current_user.id
+    )
+    return access_control_manager.get_matrix(db, workspace.id, member.role)
+
+
+def require_permission(access_type: AccessControlTypeEnum, target: str) -> Callable[..., PermissionMatrix]:
+    """
+    Dependency factory enforcing one permission
+
+    Usage:
+        @router.delete("/{order_id}", dependencies=[Depends(require_permission(AccessControlTypeEnum.FEATURE, "order_delete"))])
+
+    Args:
+        access_type: Permission type (page, manage-order-status, feature)
+        target: Page name, order status or feature key
+
+    Returns:
+        Dependency that returns the permission matrix or raises 403
+    """
+    def check_permission(
+        permissions: PermissionMatrix = Depends(get_current_permissions)
+    ) -> PermissionMatrix:
+        if not permissions.allows(access_type, target):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Role '{permissions.role}' does not have {access_type.value} access to '{target}'"
+            )
+        return permissions
+
+    return check_permission
+
+
+def require_quota(quota: str, amount: int = 1) -> Callable[..., Workspace]:
+    """
+    Dependency factory rejecting creates over the subscription plan limit
+
+    Reads the workspace's maintained usage counter and its plan limit, no
+    row counting.
+
+    Usage:
+        @router.post("/", dependencies=[Depends(require_quota("factories"))])
+
+    Args:
+        quota: Quota name ('members', 'factories', 'machines', 'projects',
+            'orders_per_month', 'storage_mb')
+        amount: Units the request adds
+
+    Returns:
+        Dependency that returns the workspace or raises QuotaExceededError (403)
+    """
+    def check_quota(workspace: Workspace = Depends(get_current_workspace)) -> Workspace:
+        quota_manager.ensure_quota(workspace, quota, amount)
+        return workspace
+
+    return check_quota
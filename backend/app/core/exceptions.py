@@ -105,6 +105,18 @@ class BusinessRuleError(APIException):
         )
 
 
+class QuotaExceededError(APIException):
+    """403 - Subscription plan limit reached"""
+    def __init__(self, detail: str, errors: Optional[List[dict]] = None):
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            error_type="quota_exceeded",
+            title="Subscription Limit Reached",
+            detail=detail,
+            errors=errors
+        )
+
+
 class RateLimitError(APIException):
     """429 - Too many requests"""
     def __init__(self, detail: str = "Rate limit exceeded. Please try again later."):
@@ -1,5 +1,5 @@
 """DAO operations for AccessControl model (workspace-scoped RBAC)"""
-from typing import List
+from typing import List, Tuple
 from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
 from app.models.access_control import AccessControl
@@ -76,5 +76,33 @@ class DAOAccessControl(BaseDAO[AccessControl, AccessControlCreate, AccessControl
             .all()
         )
 
+    def get_permission_pairs(
+        self, db: Session, *, workspace_id: int, role: RoleEnum
+    ) -> List[Tuple[str, str]]:
+        """
+        Get (type, target) of every rule of a role (SECURITY-CRITICAL: workspace-filtered)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            role: Role to filter by
+
+        Returns:
+            List of (type value, target) tuples, used to compile a permission matrix
+
+        Note:
+            Selects only the two columns instead of loading ORM objects and is
+            served by ix_access_control_ws_role.
+        """
+        rows = (
+            db.query(AccessControl.type, AccessControl.target)
+            .filter(
+                AccessControl.workspace_id == workspace_id,  # SECURITY: CRITICAL filter
+                AccessControl.role == role
+            )
+            .all()
+        )
+        return [(access_type.value, target) for access_type, target in rows]
+
 
 access_control_dao = DAOAccessControl(AccessControl)
@@ -1,13 +1,28 @@
 """Account DAO operations"""
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import case, func, or_, select, update
+from typing import Iterable, List, Optional
+from datetime import date
+from decimal import Decimal
 from app.dao.base import BaseDAO
 from app.models.account import Account
+from app.models.account_invoice import AccountInvoice
+from app.models.invoice_payment import InvoicePayment
 from app.models.account_tag_assignment import AccountTagAssignment
 from app.models.account_tag import AccountTag
 from app.schemas.account import AccountCreate, AccountUpdate
 
 
+# Account list sort options -> column
+BALANCE_SORT_COLUMNS = {
+    'name': Account.name,
+    'payable_outstanding': Account.payable_outstanding,
+    'receivable_outstanding': Account.receivable_outstanding,
+    'last_invoice_date': Account.last_invoice_date,
+    'last_payment_date': Account.last_payment_date,
+}
+
+
 class AccountDAO(BaseDAO[Account, AccountCreate, AccountUpdate]):
     """DAO operations for Account model"""
 
@@ -98,6 +113,10 @@ class AccountDAO(BaseDAO[Account, AccountCreate, AccountUpdate]):
         workspace_id: int,
         name: Optional[str] = None,
         tag_code: Optional[str] = None,
+        min_payable_outstanding: Optional[Decimal] = None,
+        min_receivable_outstanding: Optional[Decimal] = None,
+        sort_by: Optional[str] = None,
+        sort_desc: bool = False,
         skip: int = 0,
         limit: int = 100
     ) -> List[Account]:
@@ -109,6 +128,10 @@ class AccountDAO(BaseDAO[Account, AccountCreate, AccountUpdate]):
             workspace_id: Workspace ID to filter by
             name: Optional search query for account name
             tag_code: Optional tag_code to filter (e.g. 'supplier', 'client', 'vendor')
+            min_payable_outstanding: Only accounts we owe at least this much
+            min_receivable_outstanding: Only accounts owing us at least this much
+            sort_by: Optional BALANCE_SORT_COLUMNS key
+            sort_desc: Sort descending
             skip: Number of records to skip
             limit: Maximum number of records to return
 
@@ -134,6 +157,15 @@ class AccountDAO(BaseDAO[Account, AccountCreate, AccountUpdate]):
                 )
             )
 
+        if min_payable_outstanding is not None:
+            query = query.filter(Account.payable_outstanding >= min_payable_outstanding)
+        if min_receivable_outstanding is not None:
+            query = query.filter(Account.receivable_outstanding >= min_receivable_outstanding)
+
+        if sort_by:
+            column = BALANCE_SORT_COLUMNS[sort_by]
+            query = query.order_by(column.desc() if sort_desc else column, Account.id)
+
         return query.offset(skip).limit(limit).distinct().all()
 
     def get_accounts_with_invoices_enabled(
@@ -165,4 +197,131 @@ class AccountDAO(BaseDAO[Account, AccountCreate, AccountUpdate]):
         )
 
 
+    def apply_balance_changes(
+        self,
+        db: Session,
+        *,
+        workspace_id: int,
+        account_id: int,
+        payable_delta: Decimal = Decimal('0.00'),
+        receivable_delta: Decimal = Decimal('0.00'),
+        invoice_date: Optional[date] = None,
+        payment_date: Optional[date] = None,
+        refresh_dates: bool = False
+    ) -> bool:
+        """
+        Atomically update an account's balance counters (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            account_id: Account ID
+            payable_delta: Amount to add to payable_outstanding
+            receivable_delta: Amount to add to receivable_outstanding
+            invoice_date: New invoice date (kept if later than last_invoice_date)
+            payment_date: New payment date (kept if later than last_payment_date)
+            refresh_dates: Recompute both dates from the account's invoices and
+                payments (after deletes or date changes)
+
+        Returns:
+            True if the account exists and was updated
+
+        Note:
+            Uses a single UPDATE ... SET col = col + delta, so concurrent
+            invoice and payment writes never overwrite each other's totals.
+        """
+        values = {}
+        if payable_delta:
+            values['payable_outstanding'] = Account.payable_outstanding + payable_delta
+        if receivable_delta:
+            values['receivable_outstanding'] = Account.receivable_outstanding + receivable_delta
+
+        if refresh_dates:
+            values['last_invoice_date'] = self._last_invoice_date(Account.id)
+            values['last_payment_date'] = self._last_payment_date(Account.id)
+        else:
+            if invoice_date is not None:
+                values['last_invoice_date'] = self._later_date(Account.last_invoice_date, invoice_date)
+            if payment_date is not None:
+                values['last_payment_date'] = self._later_date(Account.last_payment_date, payment_date)
+
+        if not values:
+            return False
+
+        result = db.execute(
+            update(Account)
+            .where(Account.workspace_id == workspace_id, Account.id == account_id)
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    def rebuild_balances(
+        self, db: Session, *, workspace_id: int, account_ids: Optional[Iterable[int]] = None
+    ) -> int:
+        """
+        Recompute balance counters from invoices and payments (SECURITY-CRITICAL)
+
+        One UPDATE with correlated subqueries over account_invoices and
+        invoice_payments.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            account_ids: Only these accounts (optional, default all)
+
+        Returns:
+            Number of accounts updated
+        """
+        def outstanding(invoice_type: str):
+            return (
+                select(func.coalesce(func.sum(AccountInvoice.invoice_amount - AccountInvoice.paid_amount), 0))
+                .where(
+                    AccountInvoice.account_id == Account.id,
+                    AccountInvoice.invoice_type == invoice_type
+                )
+                .scalar_subquery()
+            )
+
+        statement = (
+            update(Account)
+            .where(Account.workspace_id == workspace_id)
+            .values(
+                payable_outstanding=outstanding('payable'),
+                receivable_outstanding=outstanding('receivable'),
+                last_invoice_date=self._last_invoice_date(Account.id),
+                last_payment_date=self._last_payment_date(Account.id),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if account_ids is not None:
+            statement = statement.where(Account.id.in_(list(account_ids)))
+
+        return db.execute(statement).rowcount
+
+    def _last_invoice_date(self, account_id):
+        """Scalar subquery: latest invoice date of an account"""
+        return (
+            select(func.max(AccountInvoice.invoice_date))
+            .where(AccountInvoice.account_id == account_id)
+            .scalar_subquery()
+        )
+
+    def _last_payment_date(self, account_id):
+        """Scalar subquery: latest payment date over an account's invoices"""
+        return (
+            select(func.max(InvoicePayment.payment_date))
+            .join(AccountInvoice, AccountInvoice.id == InvoicePayment.invoice_id)
+            .where(AccountInvoice.account_id == account_id)
+            .scalar_subquery()
+        )
+
+    def _later_date(self, column, value: date):
+        """SQL expression: the later of a nullable date column and value"""
+        return case(
+            (or_(column.is_(None), column < value), value),
+            else_=column
+        )
+
+
 account_dao = AccountDAO(Account)
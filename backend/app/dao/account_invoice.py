@@ -1,13 +1,28 @@
 """Account invoice DAO operations"""
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import date
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import and_, case, func, update
+from typing import Any, Dict, Iterable, List, Optional
+from datetime import date, timedelta
 from decimal import Decimal
 from app.dao.base import BaseDAO
+from app.models.account import Account
 from app.models.account_invoice import AccountInvoice
 from app.schemas.account_invoice import AccountInvoiceCreate, AccountInvoiceUpdate
 
 
+# Payment statuses of invoices that still have a balance to collect/pay
+OUTSTANDING_STATUSES = ('unpaid', 'partial', 'overdue')
+
+# Aging buckets: (label, min days past due, max days past due or None)
+AGING_BUCKETS = (
+    ('days_0_30', None, 30),
+    ('days_31_60', 31, 60),
+    ('days_61_90', 61, 90),
+    ('days_over_90', 91, None),
+)
+
+
 class AccountInvoiceDAO(BaseDAO[AccountInvoice, AccountInvoiceCreate, AccountInvoiceUpdate]):
     """DAO operations for AccountInvoice model"""
 
@@ -137,7 +152,7 @@ class AccountInvoiceDAO(BaseDAO[AccountInvoice, AccountInvoiceCreate, AccountInv
             db.query(AccountInvoice)
             .filter(
                 AccountInvoice.workspace_id == workspace_id,
-                AccountInvoice.payment_status.in_(['unpaid', 'partial', 'overdue'])
+                AccountInvoice.payment_status.in_(OUTSTANDING_STATUSES)
             )
             .order_by(AccountInvoice.due_date)
             .offset(skip)
@@ -173,6 +188,72 @@ class AccountInvoiceDAO(BaseDAO[AccountInvoice, AccountInvoiceCreate, AccountInv
             .all()
         )
 
+    def get_aging_summary(
+        self, db: Session, *, workspace_id: int, as_of: date,
+        account_ids: Optional[Iterable[int]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get outstanding balances per account and invoice type, split into aging buckets (SECURITY-CRITICAL)
+
+        One grouped query over account_invoices. An invoice ages from its
+        due date (invoice date if it has none); invoices not yet due count
+        in the 0-30 bucket. Invoices dated after as_of are left out.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            as_of: Date to age invoices at
+            account_ids: Only these accounts (optional)
+
+        Returns:
+            One dict per (account, invoice type) with account_id, account_name,
+            invoice_type, invoice_count, oldest_due_date, the AGING_BUCKETS
+            amounts and total_outstanding
+        """
+        outstanding = AccountInvoice.invoice_amount - AccountInvoice.paid_amount
+        aged_from = func.coalesce(AccountInvoice.due_date, AccountInvoice.invoice_date)
+
+        # Compare dates against bucket boundaries instead of doing date
+        # arithmetic in SQL, which differs between SQLite and PostgreSQL
+        buckets = []
+        for label, min_days, max_days in AGING_BUCKETS:
+            conditions = []
+            if min_days is not None:
+                conditions.append(aged_from <= as_of - timedelta(days=min_days))
+            if max_days is not None:
+                conditions.append(aged_from > as_of - timedelta(days=max_days + 1))
+            buckets.append(
+                func.sum(case((and_(*conditions), outstanding), else_=0)).label(label)
+            )
+
+        query = (
+            db.query(
+                AccountInvoice.account_id,
+                Account.name.label('account_name'),
+                AccountInvoice.invoice_type,
+                func.count(AccountInvoice.id).label('invoice_count'),
+                func.min(aged_from).label('oldest_due_date'),
+                *buckets,
+                func.sum(outstanding).label('total_outstanding'),
+            )
+            .join(Account, Account.id == AccountInvoice.account_id)
+            .filter(
+                AccountInvoice.workspace_id == workspace_id,
+                AccountInvoice.payment_status.in_(OUTSTANDING_STATUSES),
+                AccountInvoice.invoice_date <= as_of,
+                outstanding > 0
+            )
+        )
+        if account_ids is not None:
+            query = query.filter(AccountInvoice.account_id.in_(list(account_ids)))
+
+        rows = (
+            query
+            .group_by(AccountInvoice.account_id, Account.name, AccountInvoice.invoice_type)
+            .all()
+        )
+        return [dict(row._mapping) for row in rows]
+
     def update_paid_amount(
         self, db: Session, *, invoice_id: int, workspace_id: int, additional_payment: Decimal
     ) -> AccountInvoice:
@@ -201,6 +282,94 @@ class AccountInvoiceDAO(BaseDAO[AccountInvoice, AccountInvoiceCreate, AccountInv
             db.flush()
         return invoice
 
+    def get_by_ids_for_update(
+        self, db: Session, *, ids: Iterable[int], workspace_id: int
+    ) -> List[AccountInvoice]:
+        """
+        Load and row-lock many invoices in one query (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            ids: Invoice IDs
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            Invoices found in the workspace, ordered by id
+
+        Note:
+            SELECT ... FOR UPDATE on PostgreSQL (ignored by SQLite, which
+            locks the whole database on write). Rows are locked in id order
+            so concurrent batches cannot deadlock each other.
+        """
+        return (
+            db.query(AccountInvoice)
+            .filter(
+                AccountInvoice.workspace_id == workspace_id,
+                AccountInvoice.id.in_(list(ids))
+            )
+            .order_by(AccountInvoice.id)
+            .with_for_update()
+            .all()
+        )
+
+    def apply_payments(
+        self, db: Session, *, invoices: List[AccountInvoice], workspace_id: int,
+        amounts: Dict[int, Decimal]
+    ) -> None:
+        """
+        Add payments to many invoices with one UPDATE statement (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            invoices: Invoices being paid (loaded in this session)
+            workspace_id: Workspace ID to filter by
+            amounts: {invoice_id: amount to add to paid_amount}
+
+        Note:
+            paid_amount = paid_amount + CASE id ... END, and payment_status is
+            derived from the new amount the same way as update_paid_amount.
+            The loaded invoices get the new values without another SELECT.
+        """
+        if not amounts:
+            return
+
+        added = case(
+            *[(AccountInvoice.id == invoice_id, amount) for invoice_id, amount in amounts.items()],
+            else_=0
+        )
+        new_paid = AccountInvoice.paid_amount + added
+        db.execute(
+            update(AccountInvoice)
+            .where(
+                AccountInvoice.workspace_id == workspace_id,
+                AccountInvoice.id.in_(list(amounts))
+            )
+            .values(
+                paid_amount=new_paid,
+                payment_status=case(
+                    (new_paid >= AccountInvoice.invoice_amount, 'paid'),
+                    (new_paid > 0, 'partial'),
+                    else_=AccountInvoice.payment_status
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        # Mirror the UPDATE on the loaded objects as their committed state
+        for invoice in invoices:
+            amount = amounts.get(invoice.id)
+            if amount is None:
+                continue
+            paid_amount = invoice.paid_amount + amount
+            if paid_amount >= invoice.invoice_amount:
+                payment_status = 'paid'
+            elif paid_amount > 0:
+                payment_status = 'partial'
+            else:
+                payment_status = invoice.payment_status
+            set_committed_value(invoice, 'paid_amount', paid_amount)
+            set_committed_value(invoice, 'payment_status', payment_status)
+
     def get_invoices_with_payments_enabled(
         self, db: Session, *, workspace_id: int, skip: int = 0, limit: int = 100
     ) -> List[AccountInvoice]:
@@ -0,0 +1,253 @@
+"""Account period summary DAO operations"""
+from sqlalchemy.orm import Session
+from sqlalchemy import Date, and_, cast, delete, func, insert, literal, select, union_all, update
+from typing import Any, Dict, List, Optional
+from decimal import Decimal
+from datetime import date, datetime
+from app.dao.base import BaseDAO
+from app.models.account import Account
+from app.models.account_invoice import AccountInvoice
+from app.models.account_period_summary import AccountPeriodSummary
+from app.models.account_tag import AccountTag
+from app.models.account_tag_assignment import AccountTagAssignment
+from app.models.factory import Factory
+from app.models.invoice_payment import InvoicePayment
+from app.models.order import Order
+from app.schemas.account_period_summary import AccountPeriodSummaryCreate, AccountPeriodSummaryUpdate
+
+
+# Total columns maintained on every summary row
+SUMMARY_COLUMNS = ('invoiced_amount', 'invoice_count', 'paid_amount', 'payment_count')
+
+# Key columns of a summary row (besides workspace_id)
+KEY_COLUMNS = ('period', 'account_id', 'invoice_type', 'factory_id')
+
+# Report grouping options
+GROUP_BY_OPTIONS = ('type', 'account', 'tag', 'factory')
+
+
+def month_start(db: Session, column):
+    """SQL expression for the first day of the month of a date column."""
+    if db.get_bind().dialect.name == 'sqlite':
+        return func.date(column, 'start of month')
+    return cast(func.date_trunc('month', column), Date)
+
+
+class AccountPeriodSummaryDAO(BaseDAO[AccountPeriodSummary, AccountPeriodSummaryCreate, AccountPeriodSummaryUpdate]):
+    """DAO operations for AccountPeriodSummary model"""
+
+    def _scope(self, workspace_id: int, key: Dict[str, Any]):
+        """Filter for the rows of one (period, account, invoice type, factory) key"""
+        factory_filter = (
+            AccountPeriodSummary.factory_id.is_(None)
+            if key['factory_id'] is None
+            else AccountPeriodSummary.factory_id == key['factory_id']
+        )
+        return and_(
+            AccountPeriodSummary.workspace_id == workspace_id,
+            AccountPeriodSummary.account_id == key['account_id'],
+            AccountPeriodSummary.period == key['period'],
+            AccountPeriodSummary.invoice_type == key['invoice_type'],
+            factory_filter
+        )
+
+    def add_totals(
+        self, db: Session, *, workspace_id: int, key: Dict[str, Any], deltas: Dict[str, Any]
+    ) -> bool:
+        """
+        Atomically add deltas to the summary row of one key (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            key: {'period', 'account_id', 'invoice_type', 'factory_id'}
+            deltas: {summary column: amount to add}
+
+        Returns:
+            True if a row for the key exists and was updated, False otherwise
+
+        Note:
+            Uses a single UPDATE ... SET col = col + delta. Only the oldest row
+            of the key is updated, so if two transactions both created a row
+            for a new key, later deltas are still applied exactly once.
+        """
+        first_row = (
+            select(func.min(AccountPeriodSummary.id))
+            .where(self._scope(workspace_id, key))
+            .scalar_subquery()
+        )
+        values = {
+            column: getattr(AccountPeriodSummary, column) + delta
+            for column, delta in deltas.items()
+        }
+        values['updated_at'] = datetime.utcnow()
+        result = db.execute(
+            update(AccountPeriodSummary)
+            .where(AccountPeriodSummary.id == first_row)
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    def get_summary(
+        self,
+        db: Session,
+        *,
+        workspace_id: int,
+        start_period: date,
+        end_period: date,
+        group_by: str = 'type',
+        invoice_type: Optional[str] = None,
+        account_id: Optional[int] = None,
+        tag_id: Optional[int] = None,
+        factory_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get monthly totals grouped by invoice type and one dimension (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            start_period: First month (first day of the month, inclusive)
+            end_period: Last month (first day of the month, inclusive)
+            group_by: 'type' (totals only), 'account', 'tag' or 'factory'
+            invoice_type: Only 'payable' or 'receivable' (optional)
+            account_id: Only this account (optional)
+            tag_id: Only accounts with this tag (optional)
+            factory_id: Only this factory (optional)
+
+        Returns:
+            Dicts with period, invoice_type, group_id, group_name and totals,
+            ordered by period and group
+
+        Note:
+            With group_by='tag', an account with several tags counts towards
+            each of them, and accounts without tags form a group_id None row.
+        """
+        group_columns = []
+        query = db.query(AccountPeriodSummary.period, AccountPeriodSummary.invoice_type)
+
+        if group_by == 'account':
+            group_columns = [Account.id, Account.name]
+            query = query.join(Account, Account.id == AccountPeriodSummary.account_id)
+        elif group_by == 'tag':
+            group_columns = [AccountTag.id, AccountTag.name]
+            query = (
+                query.outerjoin(
+                    AccountTagAssignment,
+                    and_(
+                        AccountTagAssignment.account_id == AccountPeriodSummary.account_id,
+                        AccountTagAssignment.workspace_id == workspace_id
+                    )
+                )
+                .outerjoin(AccountTag, AccountTag.id == AccountTagAssignment.tag_id)
+            )
+        elif group_by == 'factory':
+            group_columns = [Factory.id, Factory.name]
+            query = query.outerjoin(Factory, Factory.id == AccountPeriodSummary.factory_id)
+
+        if group_columns:
+            query = query.add_columns(group_columns[0].label('group_id'), group_columns[1].label('group_name'))
+        else:
+            query = query.add_columns(literal(None).label('group_id'), literal(None).label('group_name'))
+
+        query = query.add_columns(
+            *[func.sum(getattr(AccountPeriodSummary, column)).label(column) for column in SUMMARY_COLUMNS]
+        ).filter(
+            AccountPeriodSummary.workspace_id == workspace_id,
+            AccountPeriodSummary.period >= start_period,
+            AccountPeriodSummary.period <= end_period
+        )
+
+        if invoice_type:
+            query = query.filter(AccountPeriodSummary.invoice_type == invoice_type)
+        if account_id:
+            query = query.filter(AccountPeriodSummary.account_id == account_id)
+        if factory_id:
+            query = query.filter(AccountPeriodSummary.factory_id == factory_id)
+        if tag_id:
+            tagged_accounts = select(AccountTagAssignment.account_id).where(
+                AccountTagAssignment.workspace_id == workspace_id,
+                AccountTagAssignment.tag_id == tag_id
+            )
+            query = query.filter(AccountPeriodSummary.account_id.in_(tagged_accounts))
+
+        rows = (
+            query
+            .group_by(AccountPeriodSummary.period, AccountPeriodSummary.invoice_type, *group_columns)
+            .order_by(AccountPeriodSummary.period, AccountPeriodSummary.invoice_type, *group_columns)
+            .all()
+        )
+        return [dict(row._mapping) for row in rows]
+
+    def rebuild(self, db: Session, *, workspace_id: int) -> int:
+        """
+        Recompute all summary rows of a workspace from invoices and payments (SECURITY-CRITICAL)
+
+        Deletes the workspace's rows and inserts them again with one
+        INSERT ... SELECT grouping invoices and payments together.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+
+        Returns:
+            Number of summary rows written
+        """
+        db.execute(
+            delete(AccountPeriodSummary)
+            .where(AccountPeriodSummary.workspace_id == workspace_id)
+            .execution_options(synchronize_session=False)
+        )
+
+        zero = literal(Decimal('0.00'))
+        invoiced = (
+            select(
+                month_start(db, AccountInvoice.invoice_date).label('period'),
+                AccountInvoice.account_id.label('account_id'),
+                AccountInvoice.invoice_type.label('invoice_type'),
+                Order.factory_id.label('factory_id'),
+                AccountInvoice.invoice_amount.label('invoiced_amount'),
+                literal(1).label('invoice_count'),
+                zero.label('paid_amount'),
+                literal(0).label('payment_count'),
+            )
+            .select_from(AccountInvoice)
+            .outerjoin(Order, Order.id == AccountInvoice.order_id)
+            .where(AccountInvoice.workspace_id == workspace_id)
+        )
+        paid = (
+            select(
+                month_start(db, InvoicePayment.payment_date).label('period'),
+                AccountInvoice.account_id.label('account_id'),
+                AccountInvoice.invoice_type.label('invoice_type'),
+                Order.factory_id.label('factory_id'),
+                zero.label('invoiced_amount'),
+                literal(0).label('invoice_count'),
+                InvoicePayment.payment_amount.label('paid_amount'),
+                literal(1).label('payment_count'),
+            )
+            .select_from(InvoicePayment)
+            .join(AccountInvoice, AccountInvoice.id == InvoicePayment.invoice_id)
+            .outerjoin(Order, Order.id == AccountInvoice.order_id)
+            .where(InvoicePayment.workspace_id == workspace_id)
+        )
+        entries = union_all(invoiced, paid).subquery()
+        grouped = (
+            select(
+                literal(workspace_id),
+                *[entries.c[column] for column in KEY_COLUMNS],
+                *[func.sum(entries.c[column]) for column in SUMMARY_COLUMNS],
+                literal(datetime.utcnow()),
+            )
+            .group_by(*[entries.c[column] for column in KEY_COLUMNS])
+        )
+        result = db.execute(
+            insert(AccountPeriodSummary).from_select(
+                ['workspace_id', *KEY_COLUMNS, *SUMMARY_COLUMNS, 'updated_at'], grouped
+            )
+        )
+        return result.rowcount
+
+
+account_period_summary_dao = AccountPeriodSummaryDAO(AccountPeriodSummary)
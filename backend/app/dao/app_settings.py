@@ -4,7 +4,7 @@ SECURITY NOTICE:
 This DAO handles workspace-scoped data. All query methods MUST filter by workspace_id
 to prevent unauthorized cross-workspace data access.
 """
-from typing import Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from app.dao.base import BaseDAO
@@ -36,5 +36,23 @@ class DAOAppSettings(BaseDAO[AppSettings, AppSettingsCreate, AppSettingsUpdate])
             )
         ).first()
 
+    def get_reference_rows(self, db: Session, *, workspace_id: int) -> List[Tuple[str, bool]]:
+        """
+        Get (name, enabled) of all settings in workspace (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            List of (name, enabled) tuples for the reference-data cache
+        """
+        return [
+            tuple(row)
+            for row in db.query(AppSettings.name, AppSettings.enabled)
+            .filter(AppSettings.workspace_id == workspace_id)  # SECURITY: workspace isolation
+            .all()
+        ]
+
 
 app_settings_dao = DAOAppSettings(AppSettings)
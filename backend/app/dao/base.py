@@ -1,6 +1,7 @@
 """Base DAO (Data Access Object) operations"""
-from typing import Generic, TypeVar, Type, List, Optional, Any, Dict
+from typing import Generic, TypeVar, Type, List, Optional, Any, Dict, Sequence, Tuple
 from pydantic import BaseModel
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.orm import Session
 from app.db.base_class import Base
 
@@ -82,6 +83,48 @@ class BaseDAO(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.flush()  # Flush to get ID, but don't commit
         return db_obj
 
+    def create_many(self, db: Session, *, objs_in: List[Dict[str, Any]]) -> int:
+        """
+        Insert many records in one bulk statement (does NOT commit)
+
+        Args:
+            db: Database session
+            objs_in: List of dicts with creation data (same keys in every dict)
+
+        Returns:
+            Number of records inserted
+
+        Note:
+            Uses a single executemany INSERT instead of one flush per row.
+            Returned rows are not loaded into the session.
+        """
+        if not objs_in:
+            return 0
+        db.execute(insert(self.model), objs_in)
+        return len(objs_in)
+
+    def create_many_returning(self, db: Session, *, objs_in: List[Dict[str, Any]]) -> List[ModelType]:
+        """
+        Insert many records in one bulk statement and return them (does NOT commit)
+
+        Args:
+            db: Database session
+            objs_in: List of dicts with creation data (same keys in every dict)
+
+        Returns:
+            Created model instances (with ids and server defaults). The order
+            is NOT guaranteed to match objs_in - match rows up by their values.
+
+        Note:
+            Uses INSERT ... RETURNING, batched into multi-row statements by
+            SQLAlchemy's insertmanyvalues, so ids come back without a flush
+            per row. (Requesting input order makes SQLite fall back to one
+            statement per row.)
+        """
+        if not objs_in:
+            return []
+        return list(db.scalars(insert(self.model).returning(self.model), objs_in))
+
     def update(
         self,
         db: Session,
@@ -215,3 +258,76 @@ class BaseDAO(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.add(db_obj)
         db.flush()  # Flush to get ID, but don't commit
         return db_obj
+
+    def get_by_keys(
+        self, db: Session, *, workspace_id: int,
+        key_columns: Sequence[str], keys: Sequence[Tuple[Any, ...]]
+    ) -> List[ModelType]:
+        """
+        Get all records matching a set of composite keys in one query (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            key_columns: Column names forming the key, e.g. ('factory_id', 'item_id')
+            keys: Key tuples in key_columns order
+
+        Returns:
+            List of matching model instances (including soft-deleted ones)
+        """
+        if not keys:
+            return []
+        columns = [getattr(self.model, name) for name in key_columns]
+        return (
+            db.query(self.model)
+            .filter(
+                self.model.workspace_id == workspace_id,
+                tuple_(*columns).in_(list(keys))
+            )
+            .all()
+        )
+
+    def get_latest_by_keys(
+        self, db: Session, *, workspace_id: int,
+        key_columns: Sequence[str], keys: Sequence[Tuple[Any, ...]],
+        max_id: Optional[int] = None
+    ) -> List[ModelType]:
+        """
+        Get the newest ledger entry per composite key in one query (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            key_columns: Column names forming the key, e.g. ('factory_id', 'item_id')
+            keys: Key tuples in key_columns order
+            max_id: Only consider entries with id up to this (optional)
+
+        Returns:
+            List of latest entries (at most one per key)
+
+        Note:
+            Only valid for ledger models (ordered by performed_at, then id).
+        """
+        if not keys:
+            return []
+        columns = [getattr(self.model, name) for name in key_columns]
+        conditions = [self.model.workspace_id == workspace_id, tuple_(*columns).in_(list(keys))]
+        if max_id is not None:
+            conditions.append(self.model.id <= max_id)
+        ranked = (
+            select(
+                self.model.id,
+                func.row_number().over(
+                    partition_by=columns,
+                    order_by=(self.model.performed_at.desc(), self.model.id.desc())
+                ).label('row_rank')
+            )
+            .where(*conditions)
+            .subquery()
+        )
+        return (
+            db.query(self.model)
+            .join(ranked, ranked.c.id == self.model.id)
+            .filter(ranked.c.row_rank == 1)
+            .all()
+        )
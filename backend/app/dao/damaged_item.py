@@ -1,5 +1,5 @@
 """DAO operations"""
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
 from app.models.damaged_item import DamagedItem
@@ -36,5 +36,30 @@ class DAODamagedItem(BaseDAO[DamagedItem, DamagedItemCreate, DamagedItemUpdate])
             .all()
         )
 
+    def get_by_factory_and_item(
+        self, db: Session, *, factory_id: int, item_id: int, workspace_id: int
+    ) -> Optional[DamagedItem]:
+        """
+        Get damaged item by factory and item ID (SECURITY-CRITICAL: workspace-filtered)
+
+        Args:
+            db: Database session
+            factory_id: Factory ID
+            item_id: Item ID
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            Damaged item if found in workspace, None otherwise
+        """
+        return (
+            db.query(DamagedItem)
+            .filter(
+                DamagedItem.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                DamagedItem.factory_id == factory_id,
+                DamagedItem.item_id == item_id
+            )
+            .first()
+        )
+
 
 damaged_item_dao = DAODamagedItem(DamagedItem)
@@ -4,6 +4,7 @@ from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 from app.dao.base import BaseDAO
+from app.dao.ledger_archive_period import ledger_archive_period_dao
 from app.models.damaged_item_ledger import DamagedItemLedger
 from app.schemas.damaged_item_ledger import DamagedItemLedgerCreate, DamagedItemLedgerUpdate
 
@@ -36,7 +37,7 @@ class DamagedItemLedgerDAO(BaseDAO[DamagedItemLedger, DamagedItemLedgerCreate, D
                 DamagedItemLedger.factory_id == factory_id,
                 DamagedItemLedger.item_id == item_id
             )
-            .order_by(DamagedItemLedger.performed_at.desc())
+            .order_by(DamagedItemLedger.performed_at.desc(), DamagedItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -65,7 +66,7 @@ class DamagedItemLedgerDAO(BaseDAO[DamagedItemLedger, DamagedItemLedgerCreate, D
                 DamagedItemLedger.workspace_id == workspace_id,
                 DamagedItemLedger.transaction_type == transaction_type
             )
-            .order_by(DamagedItemLedger.performed_at.desc())
+            .order_by(DamagedItemLedger.performed_at.desc(), DamagedItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -91,7 +92,7 @@ class DamagedItemLedgerDAO(BaseDAO[DamagedItemLedger, DamagedItemLedgerCreate, D
                 DamagedItemLedger.workspace_id == workspace_id,
                 DamagedItemLedger.order_id == order_id
             )
-            .order_by(DamagedItemLedger.performed_at)
+            .order_by(DamagedItemLedger.performed_at, DamagedItemLedger.id)
             .all()
         )
 
@@ -112,7 +113,21 @@ class DamagedItemLedgerDAO(BaseDAO[DamagedItemLedger, DamagedItemLedgerCreate, D
 
         Returns:
             List of ledger entries in date range
+
+        Note:
+            Archived years that overlap the range are UNIONed in transparently.
         """
+        archive_tables = ledger_archive_period_dao.get_archive_tables(
+            db, model=DamagedItemLedger, workspace_id=workspace_id,
+            start_date=start_date, end_date=end_date
+        )
+        if archive_tables:
+            return ledger_archive_period_dao.query_with_archives(
+                db, model=DamagedItemLedger, archive_tables=archive_tables,
+                filters={'workspace_id': workspace_id},
+                start_date=start_date, end_date=end_date, skip=skip, limit=limit
+            )
+
         return (
             db.query(DamagedItemLedger)
             .filter(
@@ -120,7 +135,7 @@ class DamagedItemLedgerDAO(BaseDAO[DamagedItemLedger, DamagedItemLedgerCreate, D
                 DamagedItemLedger.performed_at >= start_date,
                 DamagedItemLedger.performed_at <= end_date
             )
-            .order_by(DamagedItemLedger.performed_at.desc())
+            .order_by(DamagedItemLedger.performed_at.desc(), DamagedItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -155,7 +170,36 @@ class DamagedItemLedgerDAO(BaseDAO[DamagedItemLedger, DamagedItemLedgerCreate, D
         if end_date:
             query = query.filter(DamagedItemLedger.performed_at <= end_date)
 
-        return query.order_by(DamagedItemLedger.performed_at.desc()).all()
+        return query.order_by(DamagedItemLedger.performed_at.desc(), DamagedItemLedger.id.desc()).all()
+
+    def get_by_performer(
+        self, db: Session, *, performed_by: int, workspace_id: int,
+        skip: int = 0, limit: int = 100
+    ) -> List[DamagedItemLedger]:
+        """
+        Get ledger entries by performer (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            performed_by: User ID who performed transactions
+            workspace_id: Workspace ID to filter by
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of ledger entries
+        """
+        return (
+            db.query(DamagedItemLedger)
+            .filter(
+                DamagedItemLedger.workspace_id == workspace_id,
+                DamagedItemLedger.performed_by == performed_by
+            )
+            .order_by(DamagedItemLedger.performed_at.desc(), DamagedItemLedger.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
     def calculate_balance(
         self, db: Session, *, factory_id: int, item_id: int, workspace_id: int
@@ -179,7 +223,7 @@ class DamagedItemLedgerDAO(BaseDAO[DamagedItemLedger, DamagedItemLedgerCreate, D
                 DamagedItemLedger.factory_id == factory_id,
                 DamagedItemLedger.item_id == item_id
             )
-            .order_by(DamagedItemLedger.performed_at.desc())
+            .order_by(DamagedItemLedger.performed_at.desc(), DamagedItemLedger.id.desc())
             .first()
         )
 
@@ -209,7 +253,7 @@ class DamagedItemLedgerDAO(BaseDAO[DamagedItemLedger, DamagedItemLedgerCreate, D
                 DamagedItemLedger.factory_id == factory_id,
                 DamagedItemLedger.item_id == item_id
             )
-            .order_by(DamagedItemLedger.performed_at.desc())
+            .order_by(DamagedItemLedger.performed_at.desc(), DamagedItemLedger.id.desc())
             .first()
         )
 
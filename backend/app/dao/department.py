@@ -4,7 +4,7 @@ SECURITY NOTICE:
 This DAO handles workspace-scoped data. All inherited BaseDAO methods automatically
 filter by workspace_id via get_by_workspace() and get_by_id_and_workspace().
 """
-from typing import List
+from typing import List, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
@@ -49,6 +49,29 @@ class DAODepartment(BaseDAO[Department, DepartmentCreate, DepartmentUpdate]):
             .all()
         )
 
+    def get_reference_rows(self, db: Session, *, workspace_id: int) -> List[Tuple[int, str]]:
+        """
+        Get (id, name) of all active, non-deleted departments (SECURITY-CRITICAL: workspace-filtered)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            List of (id, name) tuples ordered by name, for the reference-data cache
+        """
+        return [
+            tuple(row)
+            for row in db.query(Department.id, Department.name)
+            .filter(
+                Department.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                Department.is_active == True,
+                Department.is_deleted == False
+            )
+            .order_by(Department.name)
+            .all()
+        ]
+
     def soft_delete(
         self, db: Session, *, db_obj: Department, deleted_by: int
     ) -> Department:
@@ -1,13 +1,18 @@
 """Financial audit log DAO operations"""
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
-from typing import List, Optional
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import or_, and_, insert, func, update, cast, null, Text
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from app.dao.base import BaseDAO
 from app.models.financial_audit_log import FinancialAuditLog
 from pydantic import BaseModel
 
 
+# search() counts matching rows only up to this many; beyond it the count
+# is reported as a lower bound instead of scanning the whole match set
+COUNT_ESTIMATE_CAP = 10000
+
+
 class FinancialAuditLogCreate(BaseModel):
     """Schema for creating audit log entries"""
     entity_type: str
@@ -24,6 +29,175 @@ class FinancialAuditLogCreate(BaseModel):
 class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, BaseModel]):
     """DAO operations for FinancialAuditLog model"""
 
+    def create_batch(self, db: Session, *, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert many audit rows with one multi-row INSERT (does NOT commit)
+
+        Args:
+            db: Database session
+            rows: Audit row dicts (same keys in every dict)
+
+        Returns:
+            Number of rows inserted
+
+        Note:
+            render_nulls keeps rows with None in different columns (e.g. no
+            related entity) in the same INSERT batch instead of splitting
+            the batch per combination of non-None columns.
+        """
+        if not rows:
+            return 0
+        db.execute(insert(FinancialAuditLog).execution_options(render_nulls=True), rows)
+        return len(rows)
+
+    def search(
+        self,
+        db: Session,
+        *,
+        workspace_id: int,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        related_entity_type: Optional[str] = None,
+        related_entity_id: Optional[int] = None,
+        action_type: Optional[str] = None,
+        performed_by: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        before: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+        include_changes: bool = True
+    ) -> Tuple[List[FinancialAuditLog], bool]:
+        """
+        Search audit logs with any combination of filters (SECURITY-CRITICAL)
+
+        Results are ordered newest first (performed_at DESC, id DESC) and
+        paginated by keyset: pass the (performed_at, id) of the last row of
+        the previous page as `before`. Unlike OFFSET, later pages cost the
+        same as the first one.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            entity_type: Entity type ('account', 'invoice', 'payment') (optional)
+            entity_id: Entity ID (optional)
+            related_entity_type: Related entity type (optional)
+            related_entity_id: Related entity ID (optional)
+            action_type: Action type (optional)
+            performed_by: User ID who performed the action (optional)
+            start_date: Start datetime, inclusive (optional)
+            end_date: End datetime, inclusive (optional)
+            before: (performed_at, id) keyset cursor (optional)
+            limit: Maximum number of records to return
+            include_changes: Load the change payloads (False skips reading them)
+
+        Returns:
+            (audit logs, whether more rows follow the last one)
+        """
+        query = self._search_query(
+            db,
+            workspace_id=workspace_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            related_entity_type=related_entity_type,
+            related_entity_id=related_entity_id,
+            action_type=action_type,
+            performed_by=performed_by,
+            start_date=start_date,
+            end_date=end_date
+        )
+        query = query.options(*self._change_loading(include_changes))
+        if before is not None:
+            before_at, before_id = before
+            query = query.filter(
+                or_(
+                    FinancialAuditLog.performed_at < before_at,
+                    and_(
+                        FinancialAuditLog.performed_at == before_at,
+                        FinancialAuditLog.id < before_id
+                    )
+                )
+            )
+
+        # One extra row tells whether there is a next page
+        logs = (
+            query
+            .order_by(FinancialAuditLog.performed_at.desc(), FinancialAuditLog.id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+        return logs[:limit], len(logs) > limit
+
+    def count_estimate(
+        self,
+        db: Session,
+        *,
+        workspace_id: int,
+        cap: int = COUNT_ESTIMATE_CAP,
+        **filters: Any
+    ) -> Tuple[int, bool]:
+        """
+        Count audit logs matching search() filters, up to `cap` (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            cap: Stop counting after this many rows
+            **filters: Same filters as search() (without cursor/limit)
+
+        Returns:
+            (count, is_exact) - when more than `cap` rows match, returns
+            (cap, False) so the count never scans the full match set
+
+        Note:
+            The count does not depend on the page cursor, so clients only
+            need it with the first page.
+        """
+        matching = (
+            self._search_query(db, workspace_id=workspace_id, **filters)
+            .with_entities(FinancialAuditLog.id)
+            .limit(cap + 1)
+            .subquery()
+        )
+        count = db.query(func.count()).select_from(matching).scalar() or 0
+        if count > cap:
+            return cap, False
+        return count, True
+
+    def _search_query(
+        self,
+        db: Session,
+        *,
+        workspace_id: int,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        related_entity_type: Optional[str] = None,
+        related_entity_id: Optional[int] = None,
+        action_type: Optional[str] = None,
+        performed_by: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ):
+        """Build the filtered (unordered) search query; only given filters are applied."""
+        query = db.query(FinancialAuditLog).filter(FinancialAuditLog.workspace_id == workspace_id)
+
+        equality_filters = (
+            (FinancialAuditLog.entity_type, entity_type),
+            (FinancialAuditLog.entity_id, entity_id),
+            (FinancialAuditLog.related_entity_type, related_entity_type),
+            (FinancialAuditLog.related_entity_id, related_entity_id),
+            (FinancialAuditLog.action_type, action_type),
+            (FinancialAuditLog.performed_by, performed_by),
+        )
+        for column, value in equality_filters:
+            if value is not None:
+                query = query.filter(column == value)
+
+        if start_date is not None:
+            query = query.filter(FinancialAuditLog.performed_at >= start_date)
+        if end_date is not None:
+            query = query.filter(FinancialAuditLog.performed_at <= end_date)
+        return query
+
     def get_by_entity(
         self,
         db: Session,
@@ -32,7 +206,8 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
         entity_id: int,
         workspace_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        include_changes: bool = True
     ) -> List[FinancialAuditLog]:
         """
         Get all audit logs for a specific entity (SECURITY-CRITICAL)
@@ -44,12 +219,14 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
             workspace_id: Workspace ID to filter by
             skip: Number of records to skip
             limit: Maximum number of records to return
+            include_changes: Load the change payloads (False skips reading them)
 
         Returns:
             List of audit logs for the entity
         """
         return (
             db.query(FinancialAuditLog)
+            .options(*self._change_loading(include_changes))
             .filter(
                 FinancialAuditLog.workspace_id == workspace_id,
                 FinancialAuditLog.entity_type == entity_type,
@@ -69,7 +246,8 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
         entity_id: int,
         workspace_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        include_changes: bool = True
     ) -> List[FinancialAuditLog]:
         """
         Get all audit logs related to an entity (direct and related) (SECURITY-CRITICAL)
@@ -86,12 +264,14 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
             workspace_id: Workspace ID to filter by
             skip: Number of records to skip
             limit: Maximum number of records to return
+            include_changes: Load the change payloads (False skips reading them)
 
         Returns:
             List of all related audit logs
         """
         return (
             db.query(FinancialAuditLog)
+            .options(*self._change_loading(include_changes))
             .filter(
                 FinancialAuditLog.workspace_id == workspace_id,
                 or_(
@@ -118,7 +298,8 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
         action_type: str,
         workspace_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        include_changes: bool = True
     ) -> List[FinancialAuditLog]:
         """
         Get audit logs by action type (SECURITY-CRITICAL)
@@ -129,12 +310,14 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
             workspace_id: Workspace ID to filter by
             skip: Number of records to skip
             limit: Maximum number of records to return
+            include_changes: Load the change payloads (False skips reading them)
 
         Returns:
             List of audit logs with matching action type
         """
         return (
             db.query(FinancialAuditLog)
+            .options(*self._change_loading(include_changes))
             .filter(
                 FinancialAuditLog.workspace_id == workspace_id,
                 FinancialAuditLog.action_type == action_type
@@ -152,7 +335,8 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
         user_id: int,
         workspace_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        include_changes: bool = True
     ) -> List[FinancialAuditLog]:
         """
         Get audit logs by user (SECURITY-CRITICAL)
@@ -163,12 +347,14 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
             workspace_id: Workspace ID to filter by
             skip: Number of records to skip
             limit: Maximum number of records to return
+            include_changes: Load the change payloads (False skips reading them)
 
         Returns:
             List of audit logs performed by the user
         """
         return (
             db.query(FinancialAuditLog)
+            .options(*self._change_loading(include_changes))
             .filter(
                 FinancialAuditLog.workspace_id == workspace_id,
                 FinancialAuditLog.performed_by == user_id
@@ -187,7 +373,8 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
         end_date: datetime,
         workspace_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        include_changes: bool = True
     ) -> List[FinancialAuditLog]:
         """
         Get audit logs within a date range (SECURITY-CRITICAL)
@@ -199,12 +386,14 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
             workspace_id: Workspace ID to filter by
             skip: Number of records to skip
             limit: Maximum number of records to return
+            include_changes: Load the change payloads (False skips reading them)
 
         Returns:
             List of audit logs in the date range
         """
         return (
             db.query(FinancialAuditLog)
+            .options(*self._change_loading(include_changes))
             .filter(
                 FinancialAuditLog.workspace_id == workspace_id,
                 FinancialAuditLog.performed_at >= start_date,
@@ -221,7 +410,8 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
         db: Session,
         *,
         workspace_id: int,
-        limit: int = 50
+        limit: int = 50,
+        include_changes: bool = True
     ) -> List[FinancialAuditLog]:
         """
         Get recent audit logs for a workspace (SECURITY-CRITICAL)
@@ -230,18 +420,104 @@ class FinancialAuditLogDAO(BaseDAO[FinancialAuditLog, FinancialAuditLogCreate, B
             db: Database session
             workspace_id: Workspace ID to filter by
             limit: Maximum number of records to return
+            include_changes: Load the change payloads (False skips reading them)
 
         Returns:
             List of recent audit logs
         """
         return (
             db.query(FinancialAuditLog)
+            .options(*self._change_loading(include_changes))
             .filter(FinancialAuditLog.workspace_id == workspace_id)
             .order_by(FinancialAuditLog.performed_at.desc())
             .limit(limit)
             .all()
         )
 
+    def _change_loading(self, include_changes: bool) -> list:
+        """Loader options that skip the change payload columns unless they are wanted."""
+        if include_changes:
+            return []
+        return [defer(FinancialAuditLog.changes), defer(FinancialAuditLog.changes_diff)]
+
+    def get_uncompacted(
+        self,
+        db: Session,
+        *,
+        after_id: int = 0,
+        limit: int = 1000
+    ) -> List[Tuple[int, Optional[dict]]]:
+        """
+        Get (id, changes) of rows still storing full legacy changes JSON
+
+        Used by compact_financial_audit_logs.py; not workspace scoped.
+
+        Args:
+            db: Database session
+            after_id: Only rows with a greater id (keyset over the table)
+            limit: Maximum number of rows to return
+
+        Returns:
+            (id, changes) tuples ordered by id
+        """
+        return [
+            (row.id, row.changes)
+            for row in (
+                db.query(FinancialAuditLog.id, FinancialAuditLog.changes)
+                .filter(
+                    FinancialAuditLog.id > after_id,
+                    FinancialAuditLog.changes.isnot(None),
+                    FinancialAuditLog.changes_diff.is_(None)
+                )
+                .order_by(FinancialAuditLog.id)
+                .limit(limit)
+                .all()
+            )
+        ]
+
+    def set_compacted(self, db: Session, *, diffs: Dict[int, Optional[bytes]]) -> int:
+        """
+        Store packed diffs and clear the legacy changes JSON (does NOT commit)
+
+        Args:
+            db: Database session
+            diffs: {audit log id: packed diff (None if the row had no changes)}
+
+        Returns:
+            Number of rows updated
+        """
+        if not diffs:
+            return 0
+        packed = [{'id': log_id, 'changes_diff': diff} for log_id, diff in diffs.items() if diff is not None]
+        if packed:
+            # ORM bulk UPDATE by primary key (one executemany)
+            db.execute(update(FinancialAuditLog), packed)
+        # null() is SQL NULL; a Python None would be stored as JSON 'null'
+        db.query(FinancialAuditLog).filter(
+            FinancialAuditLog.id.in_(list(diffs))
+        ).update({FinancialAuditLog.changes: null()}, synchronize_session=False)
+        return len(diffs)
+
+    def get_changes_storage(self, db: Session) -> Dict[str, int]:
+        """
+        Measure bytes used by change payloads over the whole table
+
+        Returns:
+            {'rows', 'legacy_rows', 'changes_bytes', 'changes_diff_bytes'}
+        """
+        row = db.query(
+            func.count(FinancialAuditLog.id),
+            func.count(FinancialAuditLog.changes),
+            func.coalesce(func.sum(func.length(cast(FinancialAuditLog.changes, Text))), 0),
+            func.coalesce(func.sum(func.length(FinancialAuditLog.changes_diff)), 0),
+        ).one()
+        return {
+            'rows': int(row[0]),
+            'legacy_rows': int(row[1]),
+            'changes_bytes': int(row[2]),
+            'changes_diff_bytes': int(row[3]),
+        }
+
 
 # Singleton instance
 financial_audit_log_dao = FinancialAuditLogDAO(FinancialAuditLog)
@@ -2,9 +2,9 @@
 
 SECURITY: All queries MUST filter by workspace_id.
 """
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func
 from app.dao.base import BaseDAO
 from app.models.inventory import Inventory
 from app.models.enums import InventoryTypeEnum
@@ -53,6 +53,16 @@ class InventoryDAO(BaseDAO[Inventory, InventoryCreate, InventoryUpdate]):
             Inventory.is_deleted == False,
         ).first()
 
+    def get_by_factory_and_item(
+        self, db: Session, *, factory_id: int, item_id: int, workspace_id: int,
+        inventory_type: InventoryTypeEnum = InventoryTypeEnum.STORAGE
+    ) -> Optional[Inventory]:
+        """Get the STORAGE (or given type) record for a factory/item."""
+        return self.get_by_factory_item_type(
+            db, factory_id=factory_id, item_id=item_id,
+            inventory_type=inventory_type, workspace_id=workspace_id
+        )
+
     def get_by_item(
         self, db: Session, *, item_id: int, workspace_id: int,
         inventory_type: Optional[InventoryTypeEnum] = None
@@ -67,6 +77,26 @@ class InventoryDAO(BaseDAO[Inventory, InventoryCreate, InventoryUpdate]):
             query = query.filter(Inventory.inventory_type == inventory_type)
         return query.all()
 
+    def get_quantities(
+        self, db: Session, *, workspace_id: int,
+        factory_ids: Iterable[int], item_ids: Iterable[int],
+        inventory_type: InventoryTypeEnum = InventoryTypeEnum.STORAGE
+    ) -> Dict[Tuple[int, int], int]:
+        """Get quantities of one type for many factory/item pairs in one grouped query."""
+        factory_ids, item_ids = list(factory_ids), list(item_ids)
+        if not factory_ids or not item_ids:
+            return {}
+        rows = db.query(
+            Inventory.factory_id, Inventory.item_id, func.sum(Inventory.qty)
+        ).filter(
+            Inventory.workspace_id == workspace_id,
+            Inventory.inventory_type == inventory_type,
+            Inventory.is_deleted == False,
+            Inventory.factory_id.in_(factory_ids),
+            Inventory.item_id.in_(item_ids),
+        ).group_by(Inventory.factory_id, Inventory.item_id).all()
+        return {(factory_id, item_id): int(qty or 0) for factory_id, item_id, qty in rows}
+
     def soft_delete(self, db: Session, *, db_obj: Inventory, deleted_by: int) -> Inventory:
         """Soft delete."""
         from sqlalchemy.sql import func
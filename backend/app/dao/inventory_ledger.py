@@ -2,10 +2,13 @@
 
 SECURITY: All queries MUST filter by workspace_id.
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from datetime import datetime
+from decimal import Decimal
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 from app.dao.base import BaseDAO
+from app.dao.ledger_archive_period import ledger_archive_period_dao
 from app.models.inventory_ledger import InventoryLedger
 from app.models.enums import InventoryTypeEnum
 from app.schemas.inventory_ledger import InventoryLedgerCreate, InventoryLedgerUpdate
@@ -31,7 +34,7 @@ class InventoryLedgerDAO(BaseDAO[InventoryLedger, InventoryLedgerCreate, Invento
             query = query.filter(InventoryLedger.factory_id == factory_id)
         if item_id:
             query = query.filter(InventoryLedger.item_id == item_id)
-        return query.order_by(desc(InventoryLedger.performed_at)).offset(skip).limit(limit).all()
+        return query.order_by(desc(InventoryLedger.performed_at), desc(InventoryLedger.id)).offset(skip).limit(limit).all()
 
     def get_by_id_and_workspace(
         self, db: Session, *, id: int, workspace_id: int
@@ -42,5 +45,104 @@ class InventoryLedgerDAO(BaseDAO[InventoryLedger, InventoryLedgerCreate, Invento
             InventoryLedger.workspace_id == workspace_id,
         ).first()
 
+    def get_by_date_range(
+        self, db: Session, *, workspace_id: int, start_date: datetime, end_date: datetime,
+        skip: int = 0, limit: int = 100
+    ) -> List[InventoryLedger]:
+        """Get ledger entries within date range (inclusive), newest first.
+
+        Archived years that overlap the range are UNIONed in transparently.
+        """
+        archive_tables = ledger_archive_period_dao.get_archive_tables(
+            db, model=InventoryLedger, workspace_id=workspace_id,
+            start_date=start_date, end_date=end_date
+        )
+        if archive_tables:
+            return ledger_archive_period_dao.query_with_archives(
+                db, model=InventoryLedger, archive_tables=archive_tables,
+                filters={'workspace_id': workspace_id},
+                start_date=start_date, end_date=end_date, skip=skip, limit=limit
+            )
+        return db.query(InventoryLedger).filter(
+            InventoryLedger.workspace_id == workspace_id,
+            InventoryLedger.performed_at >= start_date,
+            InventoryLedger.performed_at <= end_date,
+        ).order_by(desc(InventoryLedger.performed_at), desc(InventoryLedger.id)).offset(skip).limit(limit).all()
+
+    def get_by_factory_and_item(
+        self, db: Session, *, factory_id: int, item_id: int, workspace_id: int,
+        inventory_type: InventoryTypeEnum = InventoryTypeEnum.STORAGE,
+        skip: int = 0, limit: int = 100
+    ) -> List[InventoryLedger]:
+        """Get ledger entries for one inventory type/factory/item, newest first."""
+        return db.query(InventoryLedger).filter(
+            InventoryLedger.workspace_id == workspace_id,
+            InventoryLedger.inventory_type == inventory_type,
+            InventoryLedger.factory_id == factory_id,
+            InventoryLedger.item_id == item_id,
+        ).order_by(desc(InventoryLedger.performed_at), desc(InventoryLedger.id)).offset(skip).limit(limit).all()
+
+    def get_by_transaction_type(
+        self, db: Session, *, transaction_type: str, workspace_id: int,
+        skip: int = 0, limit: int = 100
+    ) -> List[InventoryLedger]:
+        """Get ledger entries by transaction type, newest first."""
+        return db.query(InventoryLedger).filter(
+            InventoryLedger.workspace_id == workspace_id,
+            InventoryLedger.transaction_type == transaction_type,
+        ).order_by(desc(InventoryLedger.performed_at), desc(InventoryLedger.id)).offset(skip).limit(limit).all()
+
+    def get_by_performer(
+        self, db: Session, *, performed_by: int, workspace_id: int,
+        skip: int = 0, limit: int = 100
+    ) -> List[InventoryLedger]:
+        """Get ledger entries performed by a user, newest first."""
+        return db.query(InventoryLedger).filter(
+            InventoryLedger.workspace_id == workspace_id,
+            InventoryLedger.performed_by == performed_by,
+        ).order_by(desc(InventoryLedger.performed_at), desc(InventoryLedger.id)).offset(skip).limit(limit).all()
+
+    def get_by_order(
+        self, db: Session, *, order_id: int, workspace_id: int
+    ) -> List[InventoryLedger]:
+        """Get ledger entries sourced from an order, oldest first.
+
+        The inventory ledger has no order_id column; order-sourced entries
+        carry source_type='order' and source_id=<order id>.
+        """
+        return db.query(InventoryLedger).filter(
+            InventoryLedger.workspace_id == workspace_id,
+            InventoryLedger.source_type == 'order',
+            InventoryLedger.source_id == order_id,
+        ).order_by(InventoryLedger.performed_at, InventoryLedger.id).all()
+
+    def get_latest_entry(
+        self, db: Session, *, factory_id: int, item_id: int, workspace_id: int,
+        inventory_type: InventoryTypeEnum = InventoryTypeEnum.STORAGE
+    ) -> Optional[InventoryLedger]:
+        """Get the most recent ledger entry for an inventory type/factory/item."""
+        return db.query(InventoryLedger).filter(
+            InventoryLedger.workspace_id == workspace_id,
+            InventoryLedger.inventory_type == inventory_type,
+            InventoryLedger.factory_id == factory_id,
+            InventoryLedger.item_id == item_id,
+        ).order_by(desc(InventoryLedger.performed_at), desc(InventoryLedger.id)).first()
+
+    def calculate_balance(
+        self, db: Session, *, factory_id: int, item_id: int, workspace_id: int,
+        inventory_type: InventoryTypeEnum = InventoryTypeEnum.STORAGE
+    ) -> Tuple[int, Decimal]:
+        """Calculate current (quantity, total_value) from the latest ledger entry.
+
+        The inventory ledger stores no value columns, so value is qty_after * avg_price_after.
+        """
+        entry = self.get_latest_entry(
+            db, factory_id=factory_id, item_id=item_id,
+            workspace_id=workspace_id, inventory_type=inventory_type
+        )
+        if entry:
+            return (entry.qty_after, Decimal(entry.qty_after) * (entry.avg_price_after or Decimal('0.00')))
+        return (0, Decimal('0.00'))
+
 
 inventory_ledger_dao = InventoryLedgerDAO(InventoryLedger)
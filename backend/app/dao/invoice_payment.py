@@ -1,7 +1,7 @@
 """Invoice payment DAO operations"""
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date, timedelta
 from decimal import Decimal
 from app.dao.base import BaseDAO
@@ -124,6 +124,30 @@ class InvoicePaymentDAO(BaseDAO[InvoicePayment, InvoicePaymentCreate, InvoicePay
         )
         return result if result else Decimal('0.00')
 
+    def get_dates_and_amounts(
+        self, db: Session, *, invoice_id: int, workspace_id: int
+    ) -> List[Tuple[date, Decimal]]:
+        """
+        Get (payment_date, payment_amount) of every payment of an invoice (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            invoice_id: Invoice ID
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            List of (payment_date, payment_amount) tuples
+        """
+        rows = (
+            db.query(InvoicePayment.payment_date, InvoicePayment.payment_amount)
+            .filter(
+                InvoicePayment.workspace_id == workspace_id,
+                InvoicePayment.invoice_id == invoice_id
+            )
+            .all()
+        )
+        return [(row.payment_date, row.payment_amount) for row in rows]
+
     def get_recent_payments(
         self, db: Session, *, workspace_id: int, days: int = 30, limit: int = 50
     ) -> List[InvoicePayment]:
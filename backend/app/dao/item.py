@@ -1,6 +1,6 @@
 """Item DAO operations (renamed from Part)"""
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from app.dao.base import BaseDAO
 from app.models.item import Item
 from app.schemas.item import ItemCreate, ItemUpdate
@@ -86,5 +86,31 @@ class ItemDAO(BaseDAO[Item, ItemCreate, ItemUpdate]):
             .all()
         )
 
+    def get_by_ids_in_workspace(
+        self, db: Session, *, workspace_id: int, ids: Iterable[int]
+    ) -> List[Item]:
+        """
+        Get many items by ID within workspace in one query (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            ids: Item IDs
+
+        Returns:
+            Items found in the workspace (missing IDs are skipped)
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        return (
+            db.query(Item)
+            .filter(
+                Item.workspace_id == workspace_id,
+                Item.id.in_(ids)
+            )
+            .all()
+        )
+
 
 item_dao = ItemDAO(Item)
@@ -0,0 +1,233 @@
+"""Ledger archive period DAO operations
+
+Also owns the per-year archive tables that closed ledger periods are moved
+into, and builds the UNION queries ledger DAOs use when a date range
+reaches into archived years.
+"""
+import hashlib
+from sqlalchemy.orm import Session
+from sqlalchemy import Column, Index, MetaData, Table, select, union_all
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from app.dao.base import BaseDAO
+from app.models.ledger_archive_period import LedgerArchivePeriod
+from app.schemas.ledger_archive_period import LedgerArchivePeriodCreate, LedgerArchivePeriodUpdate
+
+
+# Transaction type of the checkpoint rows left behind in the hot ledger tables
+OPENING_BALANCE = 'opening_balance'
+
+# Archive tables are kept out of Base.metadata so create_all() and Alembic
+# autogenerate never touch them; they are created on demand by the archiver.
+archive_metadata = MetaData()
+
+# PostgreSQL truncates identifiers longer than this
+MAX_IDENTIFIER_LENGTH = 63
+
+
+def _archive_index_name(table_name: str) -> str:
+    """Index name for an archive table, shortened with a hash to fit PostgreSQL's limit."""
+    name = f"ix_{table_name}_ws_at"
+    if len(name) <= MAX_IDENTIFIER_LENGTH:
+        return name
+    digest = hashlib.sha1(table_name.encode()).hexdigest()[:8]
+    prefix = f"ix_{table_name}"[:MAX_IDENTIFIER_LENGTH - len(digest) - len("__ws_at")]
+    return f"{prefix}_{digest}_ws_at"
+
+
+class LedgerArchivePeriodDAO(BaseDAO[LedgerArchivePeriod, LedgerArchivePeriodCreate, LedgerArchivePeriodUpdate]):
+    """DAO operations for LedgerArchivePeriod model and ledger archive tables"""
+
+    def get_by_workspace(
+        self, db: Session, *, workspace_id: int, ledger_table: Optional[str] = None,
+        skip: int = 0, limit: int = 100
+    ) -> List[LedgerArchivePeriod]:
+        """
+        Get archived periods for a workspace (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            ledger_table: Optional ledger table name filter
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of archived periods (newest year first)
+        """
+        query = db.query(LedgerArchivePeriod).filter(
+            LedgerArchivePeriod.workspace_id == workspace_id
+        )
+        if ledger_table:
+            query = query.filter(LedgerArchivePeriod.ledger_table == ledger_table)
+        return (
+            query.order_by(LedgerArchivePeriod.period_year.desc(), LedgerArchivePeriod.ledger_table)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def get_period(
+        self, db: Session, *, workspace_id: int, ledger_table: str, period_year: int
+    ) -> Optional[LedgerArchivePeriod]:
+        """
+        Get the archive registry row for one ledger/year (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            ledger_table: Ledger table name
+            period_year: Archived year
+
+        Returns:
+            Archive period or None
+        """
+        return (
+            db.query(LedgerArchivePeriod)
+            .filter(
+                LedgerArchivePeriod.workspace_id == workspace_id,
+                LedgerArchivePeriod.ledger_table == ledger_table,
+                LedgerArchivePeriod.period_year == period_year
+            )
+            .first()
+        )
+
+    def get_archive_tables(
+        self, db: Session, *, model: Any, workspace_id: int,
+        start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> List[Table]:
+        """
+        Get the archive tables a date range needs for a ledger (SECURITY-CRITICAL)
+
+        Only periods that overlap [start_date, end_date] are returned, so a
+        query over recent (hot) data never touches the archive.
+
+        Args:
+            db: Database session
+            model: Ledger model class (e.g. StorageItemLedger)
+            workspace_id: Workspace ID to filter by
+            start_date: Range start (inclusive), None for unbounded
+            end_date: Range end (inclusive), None for unbounded
+
+        Returns:
+            List of archive Table objects (empty if the range is fully hot)
+        """
+        query = db.query(LedgerArchivePeriod.archive_table).filter(
+            LedgerArchivePeriod.workspace_id == workspace_id,
+            LedgerArchivePeriod.ledger_table == model.__tablename__
+        )
+        if start_date is not None:
+            query = query.filter(LedgerArchivePeriod.period_end > start_date)
+        if end_date is not None:
+            query = query.filter(LedgerArchivePeriod.period_start <= end_date)
+
+        table_names = sorted({row.archive_table for row in query.all()})
+        return [self.get_archive_table(model, name) for name in table_names]
+
+    def get_archive_table(self, model: Any, table_name: str) -> Table:
+        """
+        Get the Table object for an archive table (no DB access)
+
+        Archive tables mirror the ledger's columns without foreign keys, so
+        archived rows survive deletes of the entities they reference.
+
+        Args:
+            model: Ledger model class the archive mirrors
+            table_name: Archive table name
+
+        Returns:
+            Archive Table object
+        """
+        if table_name in archive_metadata.tables:
+            return archive_metadata.tables[table_name]
+
+        columns = [
+            Column(
+                column.name,
+                column.type,
+                primary_key=column.primary_key,
+                autoincrement=False,
+                nullable=column.nullable
+            )
+            for column in model.__table__.columns
+        ]
+        return Table(
+            table_name,
+            archive_metadata,
+            *columns,
+            Index(_archive_index_name(table_name), "workspace_id", "performed_at")
+        )
+
+    def get_or_create_archive_table(self, db: Session, *, model: Any, period_year: int) -> Table:
+        """
+        Get the archive table for a ledger/year, creating it if missing (does NOT commit)
+
+        Args:
+            db: Database session
+            model: Ledger model class
+            period_year: Archived year
+
+        Returns:
+            Archive Table object
+        """
+        table = self.get_archive_table(model, f"{model.__tablename__}_archive_{period_year}")
+        table.create(bind=db.connection(), checkfirst=True)
+        return table
+
+    def query_with_archives(
+        self, db: Session, *, model: Any, archive_tables: List[Table],
+        filters: Dict[str, Any], start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None, skip: int = 0, limit: Optional[int] = 100
+    ) -> List[Any]:
+        """
+        Query a ledger and its archive tables as one result set (SECURITY-CRITICAL)
+
+        Hot and archived rows are combined with UNION ALL and returned as
+        model instances, newest first. Opening-balance checkpoints are
+        dropped from the hot side because the archived rows they summarise
+        are part of the result.
+
+        Args:
+            db: Database session
+            model: Ledger model class
+            archive_tables: Archive tables to include (from get_archive_tables)
+            filters: Equality filters by column name; MUST include workspace_id
+            start_date: Range start (inclusive), None for unbounded
+            end_date: Range end (inclusive), None for unbounded
+            skip: Number of records to skip
+            limit: Maximum number of records to return (None for all)
+
+        Returns:
+            List of ledger entries (model instances, read-only)
+        """
+        column_names = [column.name for column in model.__table__.columns]
+
+        def _select(table: Table, exclude_checkpoints: bool):
+            stmt = select(*[table.c[name] for name in column_names]).where(
+                *[table.c[name] == value for name, value in filters.items()]
+            )
+            if start_date is not None:
+                stmt = stmt.where(table.c.performed_at >= start_date)
+            if end_date is not None:
+                stmt = stmt.where(table.c.performed_at <= end_date)
+            if exclude_checkpoints:
+                stmt = stmt.where(table.c.transaction_type != OPENING_BALANCE)
+            return stmt
+
+        combined = union_all(
+            _select(model.__table__, True),
+            *[_select(table, False) for table in archive_tables]
+        ).subquery()
+
+        stmt = (
+            select(combined)
+            .order_by(combined.c.performed_at.desc(), combined.c.id.desc())
+            .offset(skip)
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return db.query(model).from_statement(stmt).all()
+
+
+ledger_archive_period_dao = LedgerArchivePeriodDAO(LedgerArchivePeriod)
@@ -0,0 +1,71 @@
+"""Ledger drift DAO operations"""
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.dao.base import BaseDAO
+from app.models.ledger_drift import LedgerDrift
+from app.schemas.ledger_drift import LedgerDriftCreate, LedgerDriftUpdate
+
+
+class LedgerDriftDAO(BaseDAO[LedgerDrift, LedgerDriftCreate, LedgerDriftUpdate]):
+    """DAO operations for LedgerDrift model"""
+
+    def get_by_workspace(
+        self, db: Session, *, workspace_id: int, ledger_table: Optional[str] = None,
+        drift_type: Optional[str] = None, include_resolved: bool = False,
+        skip: int = 0, limit: int = 100
+    ) -> List[LedgerDrift]:
+        """
+        Get drifts for a workspace with optional filters (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            ledger_table: Optional ledger table name filter
+            drift_type: Optional drift type filter
+            include_resolved: Also return resolved drifts
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of drifts (newest first)
+        """
+        query = db.query(LedgerDrift).filter(LedgerDrift.workspace_id == workspace_id)
+        if ledger_table:
+            query = query.filter(LedgerDrift.ledger_table == ledger_table)
+        if drift_type:
+            query = query.filter(LedgerDrift.drift_type == drift_type)
+        if not include_resolved:
+            query = query.filter(LedgerDrift.is_resolved == False)
+        return (
+            query.order_by(LedgerDrift.detected_at.desc(), LedgerDrift.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def get_open_by_ledger(
+        self, db: Session, *, workspace_id: int, ledger_table: str
+    ) -> List[LedgerDrift]:
+        """
+        Get all unresolved drifts of one ledger (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            ledger_table: Ledger table name
+
+        Returns:
+            List of unresolved drifts
+        """
+        return (
+            db.query(LedgerDrift)
+            .filter(
+                LedgerDrift.workspace_id == workspace_id,
+                LedgerDrift.ledger_table == ledger_table,
+                LedgerDrift.is_resolved == False
+            )
+            .all()
+        )
+
+
+ledger_drift_dao = LedgerDriftDAO(LedgerDrift)
@@ -0,0 +1,60 @@
+"""Ledger drift scan state DAO operations"""
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.dao.base import BaseDAO
+from app.models.ledger_drift_scan_state import LedgerDriftScanState
+from app.schemas.ledger_drift_scan_state import LedgerDriftScanStateCreate, LedgerDriftScanStateUpdate
+
+
+class LedgerDriftScanStateDAO(BaseDAO[LedgerDriftScanState, LedgerDriftScanStateCreate, LedgerDriftScanStateUpdate]):
+    """DAO operations for LedgerDriftScanState model"""
+
+    def get_by_workspace(
+        self, db: Session, *, workspace_id: int, skip: int = 0, limit: int = 100
+    ) -> List[LedgerDriftScanState]:
+        """
+        Get scanner state for every ledger of a workspace (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of scanner states ordered by ledger table
+        """
+        return (
+            db.query(LedgerDriftScanState)
+            .filter(LedgerDriftScanState.workspace_id == workspace_id)
+            .order_by(LedgerDriftScanState.ledger_table)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def get_by_ledger(
+        self, db: Session, *, workspace_id: int, ledger_table: str
+    ) -> Optional[LedgerDriftScanState]:
+        """
+        Get scanner state for one ledger (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            ledger_table: Ledger table name
+
+        Returns:
+            Scanner state or None if the ledger was never scanned
+        """
+        return (
+            db.query(LedgerDriftScanState)
+            .filter(
+                LedgerDriftScanState.workspace_id == workspace_id,
+                LedgerDriftScanState.ledger_table == ledger_table
+            )
+            .first()
+        )
+
+
+ledger_drift_scan_state_dao = LedgerDriftScanStateDAO(LedgerDriftScanState)
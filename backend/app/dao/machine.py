@@ -1,5 +1,5 @@
 """DAO operations for Machine model (workspace-scoped)"""
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from datetime import datetime
 from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
@@ -54,6 +54,23 @@ class DAOMachine(BaseDAO[Machine, MachineCreate, MachineUpdate]):
             .offset(skip).limit(limit).all()
         )
 
+    def get_planning_rows(
+        self, db: Session, *, workspace_id: int, machine_ids: Optional[Sequence[int]] = None
+    ) -> List[tuple]:
+        """
+        Get (id, name, factory_section_id, next_maintenance_schedule) of all
+        non-deleted machines (SECURITY-CRITICAL: workspace-filtered)
+        """
+        query = db.query(
+            Machine.id, Machine.name, Machine.factory_section_id, Machine.next_maintenance_schedule
+        ).filter(
+            Machine.workspace_id == workspace_id,
+            Machine.is_deleted == False
+        )
+        if machine_ids is not None:
+            query = query.filter(Machine.id.in_(machine_ids))
+        return [tuple(row) for row in query.order_by(Machine.id)]
+
     def soft_delete(
         self, db: Session, *, db_obj: Machine, deleted_by: int
     ) -> Machine:
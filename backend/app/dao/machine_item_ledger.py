@@ -1,9 +1,11 @@
 """Machine item ledger DAO operations"""
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import func
+from typing import List, Optional, Sequence
 from datetime import datetime
 from decimal import Decimal
 from app.dao.base import BaseDAO
+from app.dao.ledger_archive_period import ledger_archive_period_dao
 from app.models.machine_item_ledger import MachineItemLedger
 from app.schemas.machine_item_ledger import MachineItemLedgerCreate, MachineItemLedgerUpdate
 
@@ -36,7 +38,7 @@ class MachineItemLedgerDAO(BaseDAO[MachineItemLedger, MachineItemLedgerCreate, M
                 MachineItemLedger.machine_id == machine_id,
                 MachineItemLedger.item_id == item_id
             )
-            .order_by(MachineItemLedger.performed_at.desc())
+            .order_by(MachineItemLedger.performed_at.desc(), MachineItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -65,7 +67,7 @@ class MachineItemLedgerDAO(BaseDAO[MachineItemLedger, MachineItemLedgerCreate, M
                 MachineItemLedger.workspace_id == workspace_id,
                 MachineItemLedger.transaction_type == transaction_type
             )
-            .order_by(MachineItemLedger.performed_at.desc())
+            .order_by(MachineItemLedger.performed_at.desc(), MachineItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -91,7 +93,7 @@ class MachineItemLedgerDAO(BaseDAO[MachineItemLedger, MachineItemLedgerCreate, M
                 MachineItemLedger.workspace_id == workspace_id,
                 MachineItemLedger.order_id == order_id
             )
-            .order_by(MachineItemLedger.performed_at)
+            .order_by(MachineItemLedger.performed_at, MachineItemLedger.id)
             .all()
         )
 
@@ -112,7 +114,21 @@ class MachineItemLedgerDAO(BaseDAO[MachineItemLedger, MachineItemLedgerCreate, M
 
         Returns:
             List of ledger entries in date range
+
+        Note:
+            Archived years that overlap the range are UNIONed in transparently.
         """
+        archive_tables = ledger_archive_period_dao.get_archive_tables(
+            db, model=MachineItemLedger, workspace_id=workspace_id,
+            start_date=start_date, end_date=end_date
+        )
+        if archive_tables:
+            return ledger_archive_period_dao.query_with_archives(
+                db, model=MachineItemLedger, archive_tables=archive_tables,
+                filters={'workspace_id': workspace_id},
+                start_date=start_date, end_date=end_date, skip=skip, limit=limit
+            )
+
         return (
             db.query(MachineItemLedger)
             .filter(
@@ -120,7 +136,7 @@ class MachineItemLedgerDAO(BaseDAO[MachineItemLedger, MachineItemLedgerCreate, M
                 MachineItemLedger.performed_at >= start_date,
                 MachineItemLedger.performed_at <= end_date
             )
-            .order_by(MachineItemLedger.performed_at.desc())
+            .order_by(MachineItemLedger.performed_at.desc(), MachineItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -149,7 +165,7 @@ class MachineItemLedgerDAO(BaseDAO[MachineItemLedger, MachineItemLedgerCreate, M
                 MachineItemLedger.workspace_id == workspace_id,
                 MachineItemLedger.machine_id == machine_id
             )
-            .order_by(MachineItemLedger.performed_at.desc())
+            .order_by(MachineItemLedger.performed_at.desc(), MachineItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -171,7 +187,25 @@ class MachineItemLedgerDAO(BaseDAO[MachineItemLedger, MachineItemLedgerCreate, M
 
         Returns:
             List of consumption ledger entries
+
+        Note:
+            Archived years that overlap the range are UNIONed in transparently.
         """
+        archive_tables = ledger_archive_period_dao.get_archive_tables(
+            db, model=MachineItemLedger, workspace_id=workspace_id,
+            start_date=start_date, end_date=end_date
+        )
+        if archive_tables:
+            return ledger_archive_period_dao.query_with_archives(
+                db, model=MachineItemLedger, archive_tables=archive_tables,
+                filters={
+                    'workspace_id': workspace_id,
+                    'machine_id': machine_id,
+                    'transaction_type': 'consumption'
+                },
+                start_date=start_date, end_date=end_date, limit=None
+            )
+
         query = db.query(MachineItemLedger).filter(
             MachineItemLedger.workspace_id == workspace_id,
             MachineItemLedger.machine_id == machine_id,
@@ -183,7 +217,71 @@ class MachineItemLedgerDAO(BaseDAO[MachineItemLedger, MachineItemLedgerCreate, M
         if end_date:
             query = query.filter(MachineItemLedger.performed_at <= end_date)
 
-        return query.order_by(MachineItemLedger.performed_at.desc()).all()
+        return query.order_by(MachineItemLedger.performed_at.desc(), MachineItemLedger.id.desc()).all()
+
+    def get_daily_consumption(
+        self, db: Session, *, workspace_id: int, start_date: datetime,
+        machine_ids: Optional[Sequence[int]] = None
+    ) -> List[tuple]:
+        """
+        Get consumed part quantities per machine and day (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            start_date: Earliest performed_at (inclusive)
+            machine_ids: Restrict to these machines (optional)
+
+        Returns:
+            (machine_id, day, quantity) tuples ordered by machine and day.
+            day is a date (an ISO string on SQLite).
+
+        Note:
+            Reads the live ledger only; archived years are not included.
+        """
+        day = func.date(MachineItemLedger.performed_at)
+        query = db.query(
+            MachineItemLedger.machine_id, day, func.sum(MachineItemLedger.quantity)
+        ).filter(
+            MachineItemLedger.workspace_id == workspace_id,
+            MachineItemLedger.transaction_type == 'consumption',
+            MachineItemLedger.performed_at >= start_date
+        )
+        if machine_ids is not None:
+            query = query.filter(MachineItemLedger.machine_id.in_(machine_ids))
+        return [
+            tuple(row) for row in
+            query.group_by(MachineItemLedger.machine_id, day).order_by(MachineItemLedger.machine_id, day)
+        ]
+
+    def get_by_performer(
+        self, db: Session, *, performed_by: int, workspace_id: int,
+        skip: int = 0, limit: int = 100
+    ) -> List[MachineItemLedger]:
+        """
+        Get ledger entries by performer (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            performed_by: User ID who performed transactions
+            workspace_id: Workspace ID to filter by
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of ledger entries
+        """
+        return (
+            db.query(MachineItemLedger)
+            .filter(
+                MachineItemLedger.workspace_id == workspace_id,
+                MachineItemLedger.performed_by == performed_by
+            )
+            .order_by(MachineItemLedger.performed_at.desc(), MachineItemLedger.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
     def calculate_balance(
         self, db: Session, *, machine_id: int, item_id: int, workspace_id: int
@@ -207,7 +305,7 @@ class MachineItemLedgerDAO(BaseDAO[MachineItemLedger, MachineItemLedgerCreate, M
                 MachineItemLedger.machine_id == machine_id,
                 MachineItemLedger.item_id == item_id
             )
-            .order_by(MachineItemLedger.performed_at.desc())
+            .order_by(MachineItemLedger.performed_at.desc(), MachineItemLedger.id.desc())
             .first()
         )
 
@@ -237,7 +335,7 @@ class MachineItemLedgerDAO(BaseDAO[MachineItemLedger, MachineItemLedgerCreate, M
                 MachineItemLedger.machine_id == machine_id,
                 MachineItemLedger.item_id == item_id
             )
-            .order_by(MachineItemLedger.performed_at.desc())
+            .order_by(MachineItemLedger.performed_at.desc(), MachineItemLedger.id.desc())
             .first()
         )
 
@@ -3,7 +3,8 @@
 SECURITY NOTICE:
 This DAO handles workspace-scoped data. All query methods MUST filter by workspace_id.
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
+from datetime import date
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 from app.dao.base import BaseDAO
@@ -43,6 +44,29 @@ class MachineMaintenanceLogDAO(BaseDAO[MachineMaintenanceLog, MachineMaintenance
             MachineMaintenanceLog.is_deleted == False,
         ).order_by(desc(MachineMaintenanceLog.maintenance_date)).offset(skip).limit(limit).all()
 
+    def get_history_dates(
+        self, db: Session, *, workspace_id: int, machine_ids: Optional[Sequence[int]] = None
+    ) -> List[Tuple[int, date]]:
+        """
+        Get the distinct maintenance dates of every machine (SECURITY-CRITICAL: workspace-filtered)
+
+        Returns:
+            (machine_id, maintenance_date) tuples of non-deleted logs, ordered
+            by machine and date
+        """
+        query = db.query(
+            MachineMaintenanceLog.machine_id, MachineMaintenanceLog.maintenance_date
+        ).filter(
+            MachineMaintenanceLog.workspace_id == workspace_id,
+            MachineMaintenanceLog.is_deleted == False,
+        )
+        if machine_ids is not None:
+            query = query.filter(MachineMaintenanceLog.machine_id.in_(machine_ids))
+        return [
+            tuple(row) for row in
+            query.distinct().order_by(MachineMaintenanceLog.machine_id, MachineMaintenanceLog.maintenance_date)
+        ]
+
     def get_by_type(
         self, db: Session, maintenance_type: MaintenanceTypeEnum, *, workspace_id: int, skip: int = 0, limit: int = 100
     ) -> List[MachineMaintenanceLog]:
@@ -0,0 +1,326 @@
+"""Machine uptime rollup DAO operations"""
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, delete, func, or_, select, update
+from typing import Any, Dict, List, Optional, Sequence
+from datetime import date, datetime
+from app.dao.base import BaseDAO
+from app.models.enums import MachineEventTypeEnum
+from app.models.factory import Factory
+from app.models.factory_section import FactorySection
+from app.models.machine import Machine
+from app.models.machine_event import MachineEvent
+from app.models.machine_uptime_rollup import MachineUptimeRollup
+from app.schemas.machine_uptime import MachineUptimeRollupCreate, MachineUptimeRollupUpdate
+
+
+# Rollup column holding the time spent in each machine state
+STATE_COLUMNS = {
+    MachineEventTypeEnum.RUNNING: 'running_seconds',
+    MachineEventTypeEnum.IDLE: 'idle_seconds',
+    MachineEventTypeEnum.OFF: 'off_seconds',
+    MachineEventTypeEnum.MAINTENANCE: 'maintenance_seconds',
+}
+
+# States counted as downtime (the others are up)
+DOWN_STATES = frozenset({MachineEventTypeEnum.OFF, MachineEventTypeEnum.MAINTENANCE})
+
+# Total columns maintained on every rollup row
+ROLLUP_COLUMNS = (*STATE_COLUMNS.values(), 'failure_count', 'repair_count')
+
+# Report options
+GROUP_BY_OPTIONS = ('machine', 'section', 'factory', 'total')
+
+
+class MachineUptimeRollupDAO(BaseDAO[MachineUptimeRollup, MachineUptimeRollupCreate, MachineUptimeRollupUpdate]):
+    """DAO operations for MachineUptimeRollup model"""
+
+    def add_totals(
+        self, db: Session, *, workspace_id: int, machine_id: int, day: date, deltas: Dict[str, int]
+    ) -> bool:
+        """
+        Atomically add deltas to the rollup row of one machine and day (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            machine_id: Machine ID
+            day: Day of the row
+            deltas: {rollup column: amount to add}
+
+        Returns:
+            True if a row for the key exists and was updated, False otherwise
+
+        Note:
+            Uses a single UPDATE ... SET col = col + delta on the oldest row
+            of the key (see AccountPeriodSummaryDAO.add_totals).
+        """
+        first_row = (
+            select(func.min(MachineUptimeRollup.id))
+            .where(
+                MachineUptimeRollup.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                MachineUptimeRollup.machine_id == machine_id,
+                MachineUptimeRollup.day == day
+            )
+            .scalar_subquery()
+        )
+        values = {
+            column: getattr(MachineUptimeRollup, column) + delta
+            for column, delta in deltas.items()
+        }
+        values['updated_at'] = datetime.utcnow()
+        result = db.execute(
+            update(MachineUptimeRollup)
+            .where(MachineUptimeRollup.id == first_row)
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    def get_fleet_totals(
+        self,
+        db: Session,
+        *,
+        workspace_id: int,
+        start_date: date,
+        end_date: date,
+        factory_id: Optional[int] = None,
+        factory_section_id: Optional[int] = None,
+        machine_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get every machine with its rolled-up totals and current state (SECURITY-CRITICAL)
+
+        One query: machines joined to their section and factory, the summed
+        rollup rows of [start_date, end_date) and their latest event.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            start_date: First rollup day (inclusive)
+            end_date: Last rollup day (exclusive; equal to start_date for none)
+            factory_id / factory_section_id / machine_id: Optional filters
+
+        Returns:
+            Dicts with machine_id, machine_name, section_id, section_name,
+            factory_id, factory_name, the summed ROLLUP_COLUMNS (0 without
+            rows), latest_event_type and latest_started_at (None without
+            events), for non-deleted machines ordered by machine ID
+        """
+        latest_started = (
+            select(
+                MachineEvent.machine_id.label('machine_id'),
+                func.max(MachineEvent.started_at).label('started_at')
+            )
+            .where(MachineEvent.workspace_id == workspace_id)  # SECURITY: workspace isolation
+            .group_by(MachineEvent.machine_id)
+            .subquery()
+        )
+        latest_id = (
+            select(
+                MachineEvent.machine_id.label('machine_id'),
+                func.max(MachineEvent.id).label('event_id')
+            )
+            .join(latest_started, and_(
+                latest_started.c.machine_id == MachineEvent.machine_id,
+                latest_started.c.started_at == MachineEvent.started_at
+            ))
+            .where(MachineEvent.workspace_id == workspace_id)  # SECURITY: workspace isolation
+            .group_by(MachineEvent.machine_id)
+            .subquery()
+        )
+        latest_event = aliased(MachineEvent)
+
+        group_columns = [
+            Machine.id.label('machine_id'),
+            Machine.name.label('machine_name'),
+            FactorySection.id.label('section_id'),
+            FactorySection.name.label('section_name'),
+            Factory.id.label('factory_id'),
+            Factory.name.label('factory_name'),
+            latest_event.event_type.label('latest_event_type'),
+            latest_event.started_at.label('latest_started_at'),
+        ]
+        query = db.query(
+            *group_columns,
+            *[
+                func.coalesce(func.sum(getattr(MachineUptimeRollup, column)), 0).label(column)
+                for column in ROLLUP_COLUMNS
+            ]
+        ).join(
+            FactorySection, FactorySection.id == Machine.factory_section_id
+        ).join(
+            Factory, Factory.id == FactorySection.factory_id
+        ).outerjoin(
+            MachineUptimeRollup, and_(
+                MachineUptimeRollup.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                MachineUptimeRollup.machine_id == Machine.id,
+                MachineUptimeRollup.day >= start_date,
+                MachineUptimeRollup.day < end_date
+            )
+        ).outerjoin(
+            latest_id, latest_id.c.machine_id == Machine.id
+        ).outerjoin(
+            latest_event, latest_event.id == latest_id.c.event_id
+        ).filter(
+            Machine.workspace_id == workspace_id,  # SECURITY: workspace isolation
+            Machine.is_deleted == False
+        )
+        if factory_id:
+            query = query.filter(FactorySection.factory_id == factory_id)
+        if factory_section_id:
+            query = query.filter(Machine.factory_section_id == factory_section_id)
+        if machine_id:
+            query = query.filter(Machine.id == machine_id)
+
+        rows = query.group_by(*[column.element for column in group_columns]).order_by(Machine.id)
+        return [dict(row._mapping) for row in rows]
+
+    def get_event_streams(
+        self,
+        db: Session,
+        *,
+        workspace_id: int,
+        start: datetime,
+        end: datetime,
+        machine_ids: Optional[Sequence[int]] = None
+    ) -> List[tuple]:
+        """
+        Get the events that define machine states in [start, end) (SECURITY-CRITICAL)
+
+        Returns every event starting in the window plus, per machine, the
+        last event before it (the state the window opens in) and the first
+        event after it (where the last state in the window ends).
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            start: Window start (inclusive)
+            end: Window end (exclusive)
+            machine_ids: Restrict to these machines (optional)
+
+        Returns:
+            (machine_id, event_type, started_at) tuples ordered by machine
+            and time
+        """
+        prior = (
+            select(
+                MachineEvent.machine_id.label('machine_id'),
+                func.max(MachineEvent.started_at).label('started_at')
+            )
+            .where(
+                MachineEvent.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                MachineEvent.started_at < start
+            )
+        )
+        following = (
+            select(
+                MachineEvent.machine_id.label('machine_id'),
+                func.min(MachineEvent.started_at).label('started_at')
+            )
+            .where(
+                MachineEvent.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                MachineEvent.started_at >= end
+            )
+        )
+        if machine_ids is not None:
+            prior = prior.where(MachineEvent.machine_id.in_(machine_ids))
+            following = following.where(MachineEvent.machine_id.in_(machine_ids))
+        prior = prior.group_by(MachineEvent.machine_id).subquery()
+        following = following.group_by(MachineEvent.machine_id).subquery()
+
+        query = db.query(
+            MachineEvent.machine_id, MachineEvent.event_type, MachineEvent.started_at
+        ).outerjoin(
+            prior, prior.c.machine_id == MachineEvent.machine_id
+        ).outerjoin(
+            following, following.c.machine_id == MachineEvent.machine_id
+        ).filter(
+            MachineEvent.workspace_id == workspace_id,  # SECURITY: workspace isolation
+            MachineEvent.started_at >= func.coalesce(prior.c.started_at, start),
+            or_(MachineEvent.started_at < end, MachineEvent.started_at == following.c.started_at)
+        )
+        if machine_ids is not None:
+            query = query.filter(MachineEvent.machine_id.in_(machine_ids))
+        return [
+            tuple(row) for row in
+            query.order_by(MachineEvent.machine_id, MachineEvent.started_at, MachineEvent.id)
+        ]
+
+    def get_workspace_events(self, db: Session, *, workspace_id: int):
+        """
+        Stream all events of a workspace ordered by machine and time (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            Iterator of (machine_id, event_type, started_at) rows
+        """
+        return db.query(
+            MachineEvent.machine_id, MachineEvent.event_type, MachineEvent.started_at
+        ).filter(
+            MachineEvent.workspace_id == workspace_id  # SECURITY: workspace isolation
+        ).order_by(
+            MachineEvent.machine_id, MachineEvent.started_at, MachineEvent.id
+        ).yield_per(1000)
+
+    def get_daily_running(
+        self,
+        db: Session,
+        *,
+        workspace_id: int,
+        start_date: date,
+        machine_ids: Optional[Sequence[int]] = None
+    ) -> List[tuple]:
+        """
+        Get running seconds per machine and day from start_date on (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            start_date: First day (inclusive)
+            machine_ids: Restrict to these machines (optional)
+
+        Returns:
+            (machine_id, day, running_seconds) tuples of days with running
+            time, ordered by machine and day
+        """
+        query = db.query(
+            MachineUptimeRollup.machine_id,
+            MachineUptimeRollup.day,
+            func.sum(MachineUptimeRollup.running_seconds)
+        ).filter(
+            MachineUptimeRollup.workspace_id == workspace_id,  # SECURITY: workspace isolation
+            MachineUptimeRollup.day >= start_date,
+            MachineUptimeRollup.running_seconds > 0
+        )
+        if machine_ids is not None:
+            query = query.filter(MachineUptimeRollup.machine_id.in_(machine_ids))
+        return [
+            tuple(row) for row in
+            query.group_by(MachineUptimeRollup.machine_id, MachineUptimeRollup.day)
+            .order_by(MachineUptimeRollup.machine_id, MachineUptimeRollup.day)
+        ]
+
+    def rebuild(self, db: Session, *, workspace_id: int, rows: List[Dict[str, Any]]) -> int:
+        """
+        Replace all rollup rows of a workspace (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+            rows: New rollup rows (same keys in every dict)
+
+        Returns:
+            Number of rollup rows written
+        """
+        db.execute(
+            delete(MachineUptimeRollup)
+            .where(MachineUptimeRollup.workspace_id == workspace_id)
+            .execution_options(synchronize_session=False)
+        )
+        return self.create_many(db, objs_in=rows)
+
+
+machine_uptime_rollup_dao = MachineUptimeRollupDAO(MachineUptimeRollup)
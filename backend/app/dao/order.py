@@ -1,5 +1,5 @@
 """Order DAO operations (workspace-scoped)"""
-from typing import List
+from typing import Dict, Iterable, List
 from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
 from app.models.order import Order
@@ -74,5 +74,32 @@ class DAOOrder(BaseDAO[Order, OrderCreate, OrderUpdate]):
             .all()
         )
 
+    def get_factory_ids(
+        self, db: Session, *, ids: Iterable[int], workspace_id: int
+    ) -> Dict[int, int]:
+        """
+        Get the factory of many orders in one query (SECURITY-CRITICAL: workspace-filtered)
+
+        Args:
+            db: Database session
+            ids: Order IDs
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            {order_id: factory_id} for orders found in the workspace
+        """
+        ids = set(ids)
+        if not ids:
+            return {}
+        rows = (
+            db.query(Order.id, Order.factory_id)
+            .filter(
+                Order.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                Order.id.in_(ids)
+            )
+            .all()
+        )
+        return {row.id: row.factory_id for row in rows}
+
 
 order_dao = DAOOrder(Order)
@@ -4,7 +4,7 @@ SECURITY NOTICE:
 This DAO handles workspace-scoped data. All query methods MUST filter by workspace_id
 to prevent unauthorized cross-workspace data access.
 """
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
 from app.models.order_workflow import OrderWorkflow
@@ -37,5 +37,25 @@ class DAOOrderWorkflow(BaseDAO[OrderWorkflow, OrderWorkflowCreate, OrderWorkflow
             .first()
         )
 
+    def get_reference_rows(self, db: Session, *, workspace_id: int) -> List[Tuple[str, List[int], Any]]:
+        """
+        Get (type, status_sequence, allowed_reverts_json) of all workflows (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            List of tuples for compiling the cached workflow graphs
+        """
+        return [
+            tuple(row)
+            for row in db.query(
+                OrderWorkflow.type, OrderWorkflow.status_sequence, OrderWorkflow.allowed_reverts_json
+            )
+            .filter(OrderWorkflow.workspace_id == workspace_id)  # SECURITY: workspace isolation
+            .all()
+        ]
+
 
 order_workflow_dao = DAOOrderWorkflow(OrderWorkflow)
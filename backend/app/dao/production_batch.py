@@ -1,10 +1,12 @@
 """Production Batch DAO operations"""
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from datetime import date, datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, update
 from app.dao.base import BaseDAO
 from app.models.production_batch import ProductionBatch
+from app.models.production_formula import ProductionFormula
+from app.models.production_line import ProductionLine
 from app.schemas.production_batch import ProductionBatchCreate, ProductionBatchUpdate
 
 
@@ -229,6 +231,106 @@ class ProductionBatchDAO(BaseDAO[ProductionBatch, ProductionBatchCreate, Product
             .all()
         )
 
+    def get_planned_rows(
+        self, db: Session, *, workspace_id: int, factory_id: Optional[int] = None
+    ) -> List[Tuple[int, int, int, int]]:
+        """
+        Get draft batches as plain planning rows (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            factory_id: Only batches on lines of this factory (optional)
+
+        Returns:
+            List of (batch_id, formula_id, factory_id, expected_output_quantity)
+            tuples for draft batches with a formula
+        """
+        query = (
+            db.query(
+                ProductionBatch.id,
+                ProductionBatch.formula_id,
+                ProductionLine.factory_id,
+                ProductionBatch.expected_output_quantity
+            )
+            .join(ProductionLine, ProductionLine.id == ProductionBatch.production_line_id)
+            .filter(
+                ProductionBatch.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                ProductionBatch.status == 'draft',
+                ProductionBatch.formula_id.isnot(None)
+            )
+        )
+        if factory_id is not None:
+            query = query.filter(ProductionLine.factory_id == factory_id)
+        return query.order_by(ProductionBatch.batch_date, ProductionBatch.id).all()
+
+    def get_schedule_rows(
+        self,
+        db: Session,
+        *,
+        workspace_id: int,
+        factory_id: Optional[int] = None,
+        batch_ids: Optional[Iterable[int]] = None
+    ) -> List[Tuple]:
+        """
+        Get draft batches as plain scheduling rows (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            factory_id: Only batches on lines of this factory (optional)
+            batch_ids: Only these batches (optional)
+
+        Returns:
+            List of (batch_id, production_line_id, factory_id, formula_id,
+            batch_date, shift, expected_output_quantity,
+            expected_duration_minutes, formula estimated_duration_minutes)
+        """
+        query = (
+            db.query(
+                ProductionBatch.id,
+                ProductionBatch.production_line_id,
+                ProductionLine.factory_id,
+                ProductionBatch.formula_id,
+                ProductionBatch.batch_date,
+                ProductionBatch.shift,
+                ProductionBatch.expected_output_quantity,
+                ProductionBatch.expected_duration_minutes,
+                ProductionFormula.estimated_duration_minutes
+            )
+            .join(ProductionLine, ProductionLine.id == ProductionBatch.production_line_id)
+            .outerjoin(ProductionFormula, ProductionFormula.id == ProductionBatch.formula_id)
+            .filter(
+                ProductionBatch.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                ProductionBatch.status == 'draft'
+            )
+        )
+        if factory_id is not None:
+            query = query.filter(ProductionLine.factory_id == factory_id)
+        if batch_ids is not None:
+            query = query.filter(ProductionBatch.id.in_(list(batch_ids)))
+        return query.all()
+
+    def set_schedule(
+        self, db: Session, *, assignments: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Write scheduled line, date and shift of many batches (does NOT commit)
+
+        Args:
+            db: Database session
+            assignments: [{'id', 'production_line_id', 'batch_date', 'shift'}]
+                for batches loaded with get_schedule_rows (workspace-checked)
+
+        Returns:
+            Number of batches updated
+        """
+        if not assignments:
+            return 0
+        # ORM bulk UPDATE by primary key (one executemany)
+        db.execute(update(ProductionBatch), assignments)
+        return len(assignments)
+
     def get_by_id_and_workspace(
         self, db: Session, *, id: int, workspace_id: int
     ) -> Optional[ProductionBatch]:
@@ -0,0 +1,274 @@
+"""Production batch rollup DAO operations"""
+from sqlalchemy.orm import Session
+from sqlalchemy import Date, Float, and_, case, cast, delete, func, insert, literal, select, update
+from typing import Any, Dict, List, Optional
+from datetime import date, datetime
+from app.dao.base import BaseDAO
+from app.models.production_batch import ProductionBatch
+from app.models.production_batch_item import ProductionBatchItem
+from app.models.production_batch_rollup import ProductionBatchRollup
+from app.models.production_formula import ProductionFormula
+from app.models.production_line import ProductionLine
+from app.schemas.production_batch_rollup import ProductionBatchRollupCreate, ProductionBatchRollupUpdate
+
+
+# Total columns maintained on every rollup row
+ROLLUP_COLUMNS = (
+    'batch_count', 'expected_output_quantity', 'actual_output_quantity',
+    'timed_output_quantity', 'duration_minutes', 'input_quantity', 'waste_quantity',
+    'efficiency_sum', 'efficiency_sq_sum', 'efficiency_count',
+    'variance_lt_neg10', 'variance_neg10_neg5', 'variance_neg5_0',
+    'variance_0_5', 'variance_5_10', 'variance_gte_10',
+)
+
+# Key columns of a rollup row (besides workspace_id)
+KEY_COLUMNS = ('batch_date', 'production_line_id', 'formula_id', 'shift')
+
+# Variance bucket columns with their [lower, upper) output_variance_percentage bounds
+VARIANCE_BUCKETS = (
+    ('variance_lt_neg10', None, -10),
+    ('variance_neg10_neg5', -10, -5),
+    ('variance_neg5_0', -5, 0),
+    ('variance_0_5', 0, 5),
+    ('variance_5_10', 5, 10),
+    ('variance_gte_10', 10, None),
+)
+
+# Report options
+PERIOD_OPTIONS = ('day', 'week', 'month')
+GROUP_BY_OPTIONS = ('line', 'formula', 'shift', 'total')
+
+
+def period_start(db: Session, column, period: str):
+    """SQL expression for the first day of the day/week (Monday)/month of a date column."""
+    if period == 'day':
+        return column
+    if db.get_bind().dialect.name == 'sqlite':
+        if period == 'week':
+            return func.date(column, 'weekday 0', '-6 days')
+        return func.date(column, 'start of month')
+    return cast(func.date_trunc(period, column), Date)
+
+
+class ProductionBatchRollupDAO(BaseDAO[ProductionBatchRollup, ProductionBatchRollupCreate, ProductionBatchRollupUpdate]):
+    """DAO operations for ProductionBatchRollup model"""
+
+    def _scope(self, workspace_id: int, key: Dict[str, Any]):
+        """Filter for the rows of one (date, line, formula, shift) key"""
+        conditions = [
+            ProductionBatchRollup.workspace_id == workspace_id,
+            ProductionBatchRollup.batch_date == key['batch_date'],
+            ProductionBatchRollup.production_line_id == key['production_line_id'],
+        ]
+        for name in ('formula_id', 'shift'):
+            column = getattr(ProductionBatchRollup, name)
+            conditions.append(column.is_(None) if key[name] is None else column == key[name])
+        return and_(*conditions)
+
+    def add_totals(
+        self, db: Session, *, workspace_id: int, key: Dict[str, Any], deltas: Dict[str, Any]
+    ) -> bool:
+        """
+        Atomically add deltas to the rollup row of one key (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            key: {'batch_date', 'production_line_id', 'formula_id', 'shift'}
+            deltas: {rollup column: amount to add}
+
+        Returns:
+            True if a row for the key exists and was updated, False otherwise
+
+        Note:
+            Uses a single UPDATE ... SET col = col + delta on the oldest row
+            of the key (see AccountPeriodSummaryDAO.add_totals).
+        """
+        first_row = (
+            select(func.min(ProductionBatchRollup.id))
+            .where(self._scope(workspace_id, key))
+            .scalar_subquery()
+        )
+        values = {
+            column: getattr(ProductionBatchRollup, column) + delta
+            for column, delta in deltas.items()
+        }
+        values['updated_at'] = datetime.utcnow()
+        result = db.execute(
+            update(ProductionBatchRollup)
+            .where(ProductionBatchRollup.id == first_row)
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    def get_analytics(
+        self,
+        db: Session,
+        *,
+        workspace_id: int,
+        start_date: date,
+        end_date: date,
+        period: str = 'month',
+        group_by: str = 'line',
+        production_line_id: Optional[int] = None,
+        formula_id: Optional[int] = None,
+        shift: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get rollup totals per period and group, ranked with window functions (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            start_date: First batch date (inclusive)
+            end_date: Last batch date (inclusive)
+            period: 'day', 'week' or 'month'
+            group_by: 'line', 'formula', 'shift' or 'total'
+            production_line_id / formula_id / shift: Optional filters
+
+        Returns:
+            Dicts with period, group_id, group_name, the summed ROLLUP_COLUMNS,
+            avg_efficiency, efficiency_rank (1 = best group in the period) and
+            previous_avg_efficiency (same group, previous period), ordered by
+            period and group
+        """
+        period_column = period_start(db, ProductionBatchRollup.batch_date, period).label('period')
+        query = db.query(period_column)
+
+        if group_by == 'line':
+            group_columns = [ProductionLine.id, ProductionLine.name]
+            query = query.join(ProductionLine, ProductionLine.id == ProductionBatchRollup.production_line_id)
+        elif group_by == 'formula':
+            group_columns = [ProductionFormula.id, ProductionFormula.name]
+            query = query.outerjoin(ProductionFormula, ProductionFormula.id == ProductionBatchRollup.formula_id)
+        elif group_by == 'shift':
+            group_columns = [ProductionBatchRollup.shift]
+        else:
+            group_columns = []
+
+        if group_by == 'shift':
+            query = query.add_columns(literal(None).label('group_id'), ProductionBatchRollup.shift.label('group_name'))
+        elif group_columns:
+            query = query.add_columns(group_columns[0].label('group_id'), group_columns[1].label('group_name'))
+        else:
+            query = query.add_columns(literal(None).label('group_id'), literal(None).label('group_name'))
+
+        query = query.add_columns(
+            *[func.sum(getattr(ProductionBatchRollup, column)).label(column) for column in ROLLUP_COLUMNS]
+        ).filter(
+            ProductionBatchRollup.workspace_id == workspace_id,  # SECURITY: workspace isolation
+            ProductionBatchRollup.batch_date >= start_date,
+            ProductionBatchRollup.batch_date <= end_date
+        )
+        if production_line_id:
+            query = query.filter(ProductionBatchRollup.production_line_id == production_line_id)
+        if formula_id:
+            query = query.filter(ProductionBatchRollup.formula_id == formula_id)
+        if shift:
+            query = query.filter(ProductionBatchRollup.shift == shift)
+
+        grouped = query.group_by(period_column, *group_columns).subquery()
+
+        avg_efficiency = (
+            cast(grouped.c.efficiency_sum, Float) / func.nullif(grouped.c.efficiency_count, 0)
+        )
+        ranked = select(
+            grouped,
+            avg_efficiency.label('avg_efficiency'),
+            func.rank().over(
+                partition_by=grouped.c.period,
+                order_by=avg_efficiency.desc()
+            ).label('efficiency_rank'),
+            func.lag(avg_efficiency).over(
+                partition_by=[grouped.c.group_id, grouped.c.group_name],
+                order_by=grouped.c.period
+            ).label('previous_avg_efficiency'),
+        ).order_by(grouped.c.period, grouped.c.group_name, grouped.c.group_id)
+
+        return [dict(row._mapping) for row in db.execute(ranked)]
+
+    def rebuild(self, db: Session, *, workspace_id: int) -> int:
+        """
+        Recompute all rollup rows of a workspace from completed batches (SECURITY-CRITICAL)
+
+        Deletes the workspace's rows and inserts them again with one
+        INSERT ... SELECT over batches joined to their per-batch item totals.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+
+        Returns:
+            Number of rollup rows written
+        """
+        db.execute(
+            delete(ProductionBatchRollup)
+            .where(ProductionBatchRollup.workspace_id == workspace_id)
+            .execution_options(synchronize_session=False)
+        )
+
+        item_quantity = func.coalesce(
+            ProductionBatchItem.actual_quantity, ProductionBatchItem.expected_quantity, 0
+        )
+        items = (
+            select(
+                ProductionBatchItem.batch_id.label('batch_id'),
+                func.sum(case((ProductionBatchItem.item_role == 'input', item_quantity), else_=0)).label('input_quantity'),
+                func.sum(case((ProductionBatchItem.item_role == 'waste', item_quantity), else_=0)).label('waste_quantity'),
+            )
+            .where(ProductionBatchItem.workspace_id == workspace_id)
+            .group_by(ProductionBatchItem.batch_id)
+            .subquery()
+        )
+
+        efficiency = ProductionBatch.efficiency_percentage
+        variance = ProductionBatch.output_variance_percentage
+        timed = ProductionBatch.actual_duration_minutes.isnot(None)
+        totals = {
+            'batch_count': func.count(ProductionBatch.id),
+            'expected_output_quantity': func.sum(func.coalesce(ProductionBatch.expected_output_quantity, 0)),
+            'actual_output_quantity': func.sum(func.coalesce(ProductionBatch.actual_output_quantity, 0)),
+            'timed_output_quantity': func.sum(
+                case((timed, func.coalesce(ProductionBatch.actual_output_quantity, 0)), else_=0)
+            ),
+            'duration_minutes': func.sum(func.coalesce(ProductionBatch.actual_duration_minutes, 0)),
+            'input_quantity': func.sum(func.coalesce(items.c.input_quantity, 0)),
+            'waste_quantity': func.sum(func.coalesce(items.c.waste_quantity, 0)),
+            'efficiency_sum': func.sum(func.coalesce(efficiency, 0)),
+            'efficiency_sq_sum': func.sum(func.coalesce(efficiency * efficiency, 0)),
+            'efficiency_count': func.count(efficiency),
+        }
+        for column, lower, upper in VARIANCE_BUCKETS:
+            conditions = [variance.isnot(None)]
+            if lower is not None:
+                conditions.append(variance >= lower)
+            if upper is not None:
+                conditions.append(variance < upper)
+            totals[column] = func.sum(case((and_(*conditions), 1), else_=0))
+
+        key_columns = [getattr(ProductionBatch, column) for column in KEY_COLUMNS]
+        grouped = (
+            select(
+                literal(workspace_id),
+                *key_columns,
+                *[totals[column] for column in ROLLUP_COLUMNS],
+                literal(datetime.utcnow()),
+            )
+            .select_from(ProductionBatch)
+            .outerjoin(items, items.c.batch_id == ProductionBatch.id)
+            .where(
+                ProductionBatch.workspace_id == workspace_id,
+                ProductionBatch.status == 'completed'
+            )
+            .group_by(*key_columns)
+        )
+        result = db.execute(
+            insert(ProductionBatchRollup).from_select(
+                ['workspace_id', *KEY_COLUMNS, *ROLLUP_COLUMNS, 'updated_at'], grouped
+            )
+        )
+        return result.rowcount
+
+
+production_batch_rollup_dao = ProductionBatchRollupDAO(ProductionBatchRollup)
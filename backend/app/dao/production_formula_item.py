@@ -1,7 +1,8 @@
 """Production Formula Item DAO operations"""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
+from app.models.production_formula import ProductionFormula
 from app.models.production_formula_item import ProductionFormulaItem
 from app.schemas.production_formula_item import ProductionFormulaItemCreate, ProductionFormulaItemUpdate
 
@@ -155,5 +156,41 @@ class ProductionFormulaItemDAO(BaseDAO[ProductionFormulaItem, ProductionFormulaI
             .first()
         )
 
+    def get_graph_rows(
+        self, db: Session, *, workspace_id: int
+    ) -> List[Tuple[int, bool, int, int, str, int, bool]]:
+        """
+        Get the items of all active formulas in one query (SECURITY-CRITICAL)
+
+        Used to build the workspace's formula dependency graph (MRP).
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            List of (formula_id, is_default, version, item_id, item_role,
+            quantity, is_optional) tuples
+        """
+        return (
+            db.query(
+                ProductionFormulaItem.formula_id,
+                ProductionFormula.is_default,
+                ProductionFormula.version,
+                ProductionFormulaItem.item_id,
+                ProductionFormulaItem.item_role,
+                ProductionFormulaItem.quantity,
+                ProductionFormulaItem.is_optional
+            )
+            .join(ProductionFormula, ProductionFormula.id == ProductionFormulaItem.formula_id)
+            .filter(
+                ProductionFormulaItem.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                ProductionFormula.workspace_id == workspace_id,
+                ProductionFormula.is_active == True
+            )
+            .order_by(ProductionFormulaItem.formula_id, ProductionFormulaItem.id)
+            .all()
+        )
+
 
 production_formula_item_dao = ProductionFormulaItemDAO(ProductionFormulaItem)
@@ -0,0 +1,92 @@
+"""Production Formula Version DAO operations"""
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.dao.base import BaseDAO
+from app.models.production_formula_version import ProductionFormulaVersion
+from app.schemas.production_formula_version import (
+    ProductionFormulaVersionCreate, ProductionFormulaVersionUpdate
+)
+
+
+class ProductionFormulaVersionDAO(BaseDAO[ProductionFormulaVersion, ProductionFormulaVersionCreate, ProductionFormulaVersionUpdate]):
+    """
+    DAO operations for ProductionFormulaVersion model.
+    All methods enforce workspace isolation for security.
+    """
+
+    def get_by_formula_version(
+        self, db: Session, *, formula_id: int, version: int, workspace_id: int
+    ) -> Optional[ProductionFormulaVersion]:
+        """
+        Get the snapshot of a formula at one version (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            formula_id: Formula ID
+            version: Formula version number
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            Production formula version or None
+        """
+        return (
+            db.query(ProductionFormulaVersion)
+            .filter(
+                ProductionFormulaVersion.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                ProductionFormulaVersion.formula_id == formula_id,
+                ProductionFormulaVersion.version == version
+            )
+            .first()
+        )
+
+    def get_by_formula(
+        self, db: Session, *, formula_id: int, workspace_id: int
+    ) -> List[ProductionFormulaVersion]:
+        """
+        Get all snapshots of a formula (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            formula_id: Formula ID
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            List of production formula versions, newest first
+        """
+        return (
+            db.query(ProductionFormulaVersion)
+            .filter(
+                ProductionFormulaVersion.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                ProductionFormulaVersion.formula_id == formula_id
+            )
+            .order_by(ProductionFormulaVersion.version.desc())
+            .all()
+        )
+
+    def exists(
+        self, db: Session, *, formula_id: int, version: int, workspace_id: int
+    ) -> bool:
+        """
+        Check whether a formula version has a snapshot (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            formula_id: Formula ID
+            version: Formula version number
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            True if the snapshot exists
+        """
+        return (
+            db.query(ProductionFormulaVersion.id)
+            .filter(
+                ProductionFormulaVersion.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                ProductionFormulaVersion.formula_id == formula_id,
+                ProductionFormulaVersion.version == version
+            )
+            .first()
+        ) is not None
+
+
+production_formula_version_dao = ProductionFormulaVersionDAO(ProductionFormulaVersion)
@@ -1,7 +1,8 @@
 """Production Line DAO operations"""
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
+from app.models.machine import Machine
 from app.models.production_line import ProductionLine
 from app.schemas.production_line import ProductionLineCreate, ProductionLineUpdate
 
@@ -133,6 +134,41 @@ class ProductionLineDAO(BaseDAO[ProductionLine, ProductionLineCreate, Production
             .all()
         )
 
+    def get_schedule_rows(
+        self, db: Session, *, workspace_id: int, factory_ids: Optional[Iterable[int]] = None
+    ) -> List[Tuple]:
+        """
+        Get active lines with their machine's availability (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            factory_ids: Only lines of these factories (optional)
+
+        Returns:
+            List of (line_id, factory_id, machine_id, is_running,
+            next_maintenance_schedule, machine is_deleted) ordered by line ID;
+            machine columns are None for standalone lines
+        """
+        query = (
+            db.query(
+                ProductionLine.id,
+                ProductionLine.factory_id,
+                ProductionLine.machine_id,
+                Machine.is_running,
+                Machine.next_maintenance_schedule,
+                Machine.is_deleted
+            )
+            .outerjoin(Machine, Machine.id == ProductionLine.machine_id)
+            .filter(
+                ProductionLine.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                ProductionLine.is_active == True
+            )
+        )
+        if factory_ids is not None:
+            query = query.filter(ProductionLine.factory_id.in_(list(factory_ids)))
+        return query.order_by(ProductionLine.id).all()
+
     def get_by_id_and_workspace(
         self, db: Session, *, id: int, workspace_id: int
     ) -> Optional[ProductionLine]:
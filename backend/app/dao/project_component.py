@@ -1,5 +1,5 @@
 """DAO operations"""
-from typing import List
+from typing import Dict, Iterable, List
 from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
 from app.models.project_component import ProjectComponent
@@ -36,5 +36,31 @@ class DAOProjectComponent(BaseDAO[ProjectComponent, ProjectComponentCreate, Proj
             .all()
         )
 
+    def get_project_ids(
+        self, db: Session, *, ids: Iterable[int], workspace_id: int
+    ) -> Dict[int, int]:
+        """
+        Map component IDs to their project IDs in one query (SECURITY-CRITICAL: workspace-filtered)
+
+        Args:
+            db: Database session
+            ids: Project component IDs
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            {component ID: project ID} for the components found in the workspace
+        """
+        ids = set(ids)
+        if not ids:
+            return {}
+        return dict(
+            db.query(ProjectComponent.id, ProjectComponent.project_id)
+            .filter(
+                ProjectComponent.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                ProjectComponent.id.in_(ids)
+            )
+            .all()
+        )
+
 
 project_component_dao = DAOProjectComponent(ProjectComponent)
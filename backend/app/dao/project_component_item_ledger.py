@@ -4,6 +4,7 @@ from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal
 from app.dao.base import BaseDAO
+from app.dao.ledger_archive_period import ledger_archive_period_dao
 from app.models.project_component_item_ledger import ProjectComponentItemLedger
 from app.schemas.project_component_item_ledger import ProjectComponentItemLedgerCreate, ProjectComponentItemLedgerUpdate
 
@@ -36,7 +37,7 @@ class ProjectComponentItemLedgerDAO(BaseDAO[ProjectComponentItemLedger, ProjectC
                 ProjectComponentItemLedger.project_component_id == project_component_id,
                 ProjectComponentItemLedger.item_id == item_id
             )
-            .order_by(ProjectComponentItemLedger.performed_at.desc())
+            .order_by(ProjectComponentItemLedger.performed_at.desc(), ProjectComponentItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -65,7 +66,7 @@ class ProjectComponentItemLedgerDAO(BaseDAO[ProjectComponentItemLedger, ProjectC
                 ProjectComponentItemLedger.workspace_id == workspace_id,
                 ProjectComponentItemLedger.project_component_id == project_component_id
             )
-            .order_by(ProjectComponentItemLedger.performed_at.desc())
+            .order_by(ProjectComponentItemLedger.performed_at.desc(), ProjectComponentItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -94,7 +95,7 @@ class ProjectComponentItemLedgerDAO(BaseDAO[ProjectComponentItemLedger, ProjectC
                 ProjectComponentItemLedger.workspace_id == workspace_id,
                 ProjectComponentItemLedger.transaction_type == transaction_type
             )
-            .order_by(ProjectComponentItemLedger.performed_at.desc())
+            .order_by(ProjectComponentItemLedger.performed_at.desc(), ProjectComponentItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -120,7 +121,7 @@ class ProjectComponentItemLedgerDAO(BaseDAO[ProjectComponentItemLedger, ProjectC
                 ProjectComponentItemLedger.workspace_id == workspace_id,
                 ProjectComponentItemLedger.order_id == order_id
             )
-            .order_by(ProjectComponentItemLedger.performed_at)
+            .order_by(ProjectComponentItemLedger.performed_at, ProjectComponentItemLedger.id)
             .all()
         )
 
@@ -141,7 +142,21 @@ class ProjectComponentItemLedgerDAO(BaseDAO[ProjectComponentItemLedger, ProjectC
 
         Returns:
             List of ledger entries in date range
+
+        Note:
+            Archived years that overlap the range are UNIONed in transparently.
         """
+        archive_tables = ledger_archive_period_dao.get_archive_tables(
+            db, model=ProjectComponentItemLedger, workspace_id=workspace_id,
+            start_date=start_date, end_date=end_date
+        )
+        if archive_tables:
+            return ledger_archive_period_dao.query_with_archives(
+                db, model=ProjectComponentItemLedger, archive_tables=archive_tables,
+                filters={'workspace_id': workspace_id},
+                start_date=start_date, end_date=end_date, skip=skip, limit=limit
+            )
+
         return (
             db.query(ProjectComponentItemLedger)
             .filter(
@@ -149,7 +164,7 @@ class ProjectComponentItemLedgerDAO(BaseDAO[ProjectComponentItemLedger, ProjectC
                 ProjectComponentItemLedger.performed_at >= start_date,
                 ProjectComponentItemLedger.performed_at <= end_date
             )
-            .order_by(ProjectComponentItemLedger.performed_at.desc())
+            .order_by(ProjectComponentItemLedger.performed_at.desc(), ProjectComponentItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -171,7 +186,25 @@ class ProjectComponentItemLedgerDAO(BaseDAO[ProjectComponentItemLedger, ProjectC
 
         Returns:
             List of consumption ledger entries
+
+        Note:
+            Archived years that overlap the range are UNIONed in transparently.
         """
+        archive_tables = ledger_archive_period_dao.get_archive_tables(
+            db, model=ProjectComponentItemLedger, workspace_id=workspace_id,
+            start_date=start_date, end_date=end_date
+        )
+        if archive_tables:
+            return ledger_archive_period_dao.query_with_archives(
+                db, model=ProjectComponentItemLedger, archive_tables=archive_tables,
+                filters={
+                    'workspace_id': workspace_id,
+                    'project_component_id': project_component_id,
+                    'transaction_type': 'consumption'
+                },
+                start_date=start_date, end_date=end_date, limit=None
+            )
+
         query = db.query(ProjectComponentItemLedger).filter(
             ProjectComponentItemLedger.workspace_id == workspace_id,
             ProjectComponentItemLedger.project_component_id == project_component_id,
@@ -183,7 +216,36 @@ class ProjectComponentItemLedgerDAO(BaseDAO[ProjectComponentItemLedger, ProjectC
         if end_date:
             query = query.filter(ProjectComponentItemLedger.performed_at <= end_date)
 
-        return query.order_by(ProjectComponentItemLedger.performed_at.desc()).all()
+        return query.order_by(ProjectComponentItemLedger.performed_at.desc(), ProjectComponentItemLedger.id.desc()).all()
+
+    def get_by_performer(
+        self, db: Session, *, performed_by: int, workspace_id: int,
+        skip: int = 0, limit: int = 100
+    ) -> List[ProjectComponentItemLedger]:
+        """
+        Get ledger entries by performer (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            performed_by: User ID who performed transactions
+            workspace_id: Workspace ID to filter by
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of ledger entries
+        """
+        return (
+            db.query(ProjectComponentItemLedger)
+            .filter(
+                ProjectComponentItemLedger.workspace_id == workspace_id,
+                ProjectComponentItemLedger.performed_by == performed_by
+            )
+            .order_by(ProjectComponentItemLedger.performed_at.desc(), ProjectComponentItemLedger.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
 
     def calculate_balance(
         self, db: Session, *, project_component_id: int, item_id: int, workspace_id: int
@@ -207,7 +269,7 @@ class ProjectComponentItemLedgerDAO(BaseDAO[ProjectComponentItemLedger, ProjectC
                 ProjectComponentItemLedger.project_component_id == project_component_id,
                 ProjectComponentItemLedger.item_id == item_id
             )
-            .order_by(ProjectComponentItemLedger.performed_at.desc())
+            .order_by(ProjectComponentItemLedger.performed_at.desc(), ProjectComponentItemLedger.id.desc())
             .first()
         )
 
@@ -237,7 +299,7 @@ class ProjectComponentItemLedgerDAO(BaseDAO[ProjectComponentItemLedger, ProjectC
                 ProjectComponentItemLedger.project_component_id == project_component_id,
                 ProjectComponentItemLedger.item_id == item_id
             )
-            .order_by(ProjectComponentItemLedger.performed_at.desc())
+            .order_by(ProjectComponentItemLedger.performed_at.desc(), ProjectComponentItemLedger.id.desc())
             .first()
         )
 
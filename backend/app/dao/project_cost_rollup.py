@@ -0,0 +1,172 @@
+"""Project cost rollup DAO operations"""
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, delete, update
+from typing import Any, Dict, List, Optional
+from decimal import Decimal
+from datetime import datetime
+from app.dao.base import BaseDAO
+from app.models.project import Project
+from app.models.project_component import ProjectComponent
+from app.models.project_cost_rollup import ProjectCostRollup
+from app.schemas.project_cost_rollup import ProjectCostRollupCreate, ProjectCostRollupUpdate
+
+
+# Cost columns maintained on every rollup row
+COST_COLUMNS = ('item_cost', 'misc_cost', 'work_order_cost', 'maintenance_cost')
+
+
+class ProjectCostRollupDAO(BaseDAO[ProjectCostRollup, ProjectCostRollupCreate, ProjectCostRollupUpdate]):
+    """DAO operations for ProjectCostRollup model"""
+
+    def _scope(self, workspace_id: int, project_id: int, project_component_id: Optional[int]):
+        """Filter for one rollup row (component row, or project row if component is None)"""
+        component_filter = (
+            ProjectCostRollup.project_component_id.is_(None)
+            if project_component_id is None
+            else ProjectCostRollup.project_component_id == project_component_id
+        )
+        return and_(
+            ProjectCostRollup.workspace_id == workspace_id,
+            ProjectCostRollup.project_id == project_id,
+            component_filter
+        )
+
+    def get_rollup(
+        self, db: Session, *, workspace_id: int, project_id: int,
+        project_component_id: Optional[int] = None
+    ) -> Optional[ProjectCostRollup]:
+        """
+        Get the rollup row of a component, or the project row (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            project_id: Project ID
+            project_component_id: Component ID (None for the project totals row)
+
+        Returns:
+            Rollup row or None
+        """
+        return (
+            db.query(ProjectCostRollup)
+            .filter(self._scope(workspace_id, project_id, project_component_id))
+            .first()
+        )
+
+    def add_costs(
+        self, db: Session, *, workspace_id: int, project_id: int,
+        project_component_id: Optional[int], deltas: Dict[str, Decimal]
+    ) -> bool:
+        """
+        Atomically add cost deltas to one rollup row (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            project_id: Project ID
+            project_component_id: Component ID (None for the project totals row)
+            deltas: {cost column: amount to add}
+
+        Returns:
+            True if the row exists and was updated, False if it does not exist
+
+        Note:
+            Uses a single UPDATE ... SET col = col + delta, so concurrent
+            postings never overwrite each other's totals.
+        """
+        values = {
+            column: getattr(ProjectCostRollup, column) + delta
+            for column, delta in deltas.items()
+        }
+        values['updated_at'] = datetime.utcnow()
+        result = db.execute(
+            update(ProjectCostRollup)
+            .where(self._scope(workspace_id, project_id, project_component_id))
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    def delete_by_project(self, db: Session, *, workspace_id: int, project_id: int) -> int:
+        """
+        Delete all rollup rows of a project (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            project_id: Project ID
+
+        Returns:
+            Number of rows deleted
+        """
+        result = db.execute(
+            delete(ProjectCostRollup)
+            .where(
+                ProjectCostRollup.workspace_id == workspace_id,
+                ProjectCostRollup.project_id == project_id
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def get_cost_tree(self, db: Session, *, workspace_id: int, project_id: int) -> List[Dict[str, Any]]:
+        """
+        Get project totals and every component's totals in one query (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            project_id: Project ID
+
+        Returns:
+            One row per component (a single row with component None if the
+            project has no components). Project columns are prefixed with
+            'project_', component rollup columns with 'component_'.
+            Empty list if the project does not exist or has no project rollup row.
+        """
+        project_rollup = aliased(ProjectCostRollup)
+        component_rollup = aliased(ProjectCostRollup)
+
+        rows = (
+            db.query(
+                Project.id.label('project_id'),
+                Project.name.label('project_name'),
+                Project.budget.label('project_budget'),
+                project_rollup.updated_at.label('project_updated_at'),
+                *[getattr(project_rollup, c).label(f'project_{c}') for c in COST_COLUMNS],
+                ProjectComponent.id.label('component_id'),
+                ProjectComponent.name.label('component_name'),
+                ProjectComponent.budget.label('component_budget'),
+                *[getattr(component_rollup, c).label(f'component_{c}') for c in COST_COLUMNS],
+            )
+            .join(
+                project_rollup,
+                and_(
+                    project_rollup.workspace_id == Project.workspace_id,
+                    project_rollup.project_id == Project.id,
+                    project_rollup.project_component_id.is_(None)
+                )
+            )
+            .outerjoin(
+                ProjectComponent,
+                and_(
+                    ProjectComponent.project_id == Project.id,
+                    ProjectComponent.workspace_id == Project.workspace_id
+                )
+            )
+            .outerjoin(
+                component_rollup,
+                and_(
+                    component_rollup.workspace_id == Project.workspace_id,
+                    component_rollup.project_id == Project.id,
+                    component_rollup.project_component_id == ProjectComponent.id
+                )
+            )
+            .filter(Project.workspace_id == workspace_id, Project.id == project_id)
+            .order_by(ProjectComponent.id)
+            .all()
+        )
+        return [dict(row._mapping) for row in rows]
+
+
+project_cost_rollup_dao = ProjectCostRollupDAO(ProjectCostRollup)
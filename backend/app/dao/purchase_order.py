@@ -1,8 +1,12 @@
 """Purchase order DAO. SECURITY: All queries MUST filter by workspace_id."""
-from typing import List, Optional
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import Numeric, cast, desc, func, literal, select, union_all
 from app.dao.base import BaseDAO
+from app.models.account_invoice import AccountInvoice
+from app.models.order import Order
+from app.models.order_item import OrderItem
 from app.models.purchase_order import PurchaseOrder
 from app.models.purchase_order_item import PurchaseOrderItem
 from app.schemas.purchase_order import PurchaseOrderCreate, PurchaseOrderUpdate, PurchaseOrderItemCreate, PurchaseOrderItemUpdate
@@ -30,6 +34,12 @@ class PurchaseOrderDAO(BaseDAO[PurchaseOrder, PurchaseOrderCreate, PurchaseOrder
                 pass
         return f"{prefix}001"
 
+    def get_next_numbers(self, db: Session, *, workspace_id: int, count: int) -> List[str]:
+        """Reserve `count` consecutive PO numbers (same sequence as get_next_number)."""
+        first = self.get_next_number(db, workspace_id=workspace_id)
+        prefix, start = first.rsplit('-', 1)
+        return [f"{prefix}-{int(start) + offset:03d}" for offset in range(count)]
+
 
 class PurchaseOrderItemDAO(BaseDAO[PurchaseOrderItem, PurchaseOrderItemCreate, PurchaseOrderItemUpdate]):
     def get_by_order(self, db: Session, *, purchase_order_id: int, workspace_id: int) -> List[PurchaseOrderItem]:
@@ -38,6 +48,78 @@ class PurchaseOrderItemDAO(BaseDAO[PurchaseOrderItem, PurchaseOrderItemCreate, P
     def get_by_id_and_workspace(self, db: Session, *, id: int, workspace_id: int) -> Optional[PurchaseOrderItem]:
         return db.query(PurchaseOrderItem).filter(PurchaseOrderItem.id == id, PurchaseOrderItem.workspace_id == workspace_id).first()
 
+    def get_last_purchases(
+        self, db: Session, *, workspace_id: int, item_ids: Iterable[int]
+    ) -> Dict[int, Tuple[int, Decimal]]:
+        """
+        Get the latest priced purchase of many items in one query (SECURITY-CRITICAL)
+
+        Purchases are purchase order lines (dated by their order) and items
+        of orders billed on a payable account invoice (dated by the invoice).
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            item_ids: Items to look up
+
+        Returns:
+            Dict of item_id -> (account_id, unit_price) (items never bought
+            are absent)
+        """
+        item_ids = list(item_ids)
+        if not item_ids:
+            return {}
+        purchases = union_all(
+            select(
+                PurchaseOrderItem.item_id.label('item_id'),
+                PurchaseOrder.account_id.label('account_id'),
+                cast(PurchaseOrderItem.unit_price, Numeric(15, 2)).label('unit_price'),
+                PurchaseOrder.created_at.label('purchased_at'),
+                literal(1).label('source'),
+                PurchaseOrderItem.id.label('row_id')
+            ).join(
+                PurchaseOrder, PurchaseOrder.id == PurchaseOrderItem.purchase_order_id
+            ).where(
+                PurchaseOrderItem.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                PurchaseOrderItem.item_id.in_(item_ids),
+                PurchaseOrderItem.unit_price > 0
+            ),
+            select(
+                OrderItem.item_id.label('item_id'),
+                AccountInvoice.account_id.label('account_id'),
+                cast(OrderItem.unit_cost, Numeric(15, 2)).label('unit_price'),
+                AccountInvoice.invoice_date.label('purchased_at'),  # date sorts with timestamps
+                literal(0).label('source'),
+                OrderItem.id.label('row_id')
+            ).join(
+                Order, Order.id == OrderItem.order_id
+            ).join(
+                AccountInvoice, AccountInvoice.order_id == Order.id
+            ).where(
+                OrderItem.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                AccountInvoice.workspace_id == workspace_id,
+                AccountInvoice.invoice_type == 'payable',
+                OrderItem.item_id.in_(item_ids),
+                OrderItem.is_deleted == False,
+                OrderItem.unit_cost > 0
+            )
+        ).subquery()
+        ranked = select(
+            purchases,
+            func.row_number().over(
+                partition_by=purchases.c.item_id,
+                order_by=(purchases.c.purchased_at.desc(), purchases.c.source.desc(), purchases.c.row_id.desc())
+            ).label('row_rank')
+        ).subquery()
+        rows = db.execute(
+            select(ranked.c.item_id, ranked.c.account_id, ranked.c.unit_price)
+            .where(ranked.c.row_rank == 1)
+        )
+        return {
+            item_id: (account_id, Decimal(str(unit_price)))
+            for item_id, account_id, unit_price in rows
+        }
+
 
 purchase_order_dao = PurchaseOrderDAO(PurchaseOrder)
 purchase_order_item_dao = PurchaseOrderItemDAO(PurchaseOrderItem)
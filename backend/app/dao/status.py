@@ -1,4 +1,6 @@
 """DAO operations"""
+from typing import List, Tuple
+from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
 from app.models.status import Status
 from app.schemas.status import StatusCreate, StatusUpdate
@@ -6,7 +8,25 @@ from app.schemas.status import StatusCreate, StatusUpdate
 
 class DAOStatus(BaseDAO[Status, StatusCreate, StatusUpdate]):
     """DAO operations for Status model"""
-    pass
+
+    def get_reference_rows(self, db: Session, *, workspace_id: int) -> List[Tuple[int, str]]:
+        """
+        Get (id, name) of all statuses in workspace (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+
+        Returns:
+            List of (id, name) tuples ordered by ID, for the reference-data cache
+        """
+        return [
+            tuple(row)
+            for row in db.query(Status.id, Status.name)
+            .filter(Status.workspace_id == workspace_id)
+            .order_by(Status.id)
+            .all()
+        ]
 
 
 status_dao = DAOStatus(Status)
@@ -0,0 +1,146 @@
+"""Stock Reservation DAO operations"""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.dao.base import BaseDAO
+from app.models.inventory import Inventory
+from app.models.enums import InventoryTypeEnum
+from app.models.stock_reservation import StockReservation
+from app.models.storage_item import StorageItem
+from app.schemas.stock_reservation import StockReservationCreate, StockReservationUpdate
+
+
+class StockReservationDAO(BaseDAO[StockReservation, StockReservationCreate, StockReservationUpdate]):
+    """
+    DAO operations for StockReservation model.
+    All methods enforce workspace isolation for security.
+    """
+
+    def get_by_batch(
+        self, db: Session, *, batch_id: int, workspace_id: int, status: Optional[str] = None
+    ) -> List[StockReservation]:
+        """
+        Get reservations of a batch (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            batch_id: Production batch ID
+            workspace_id: Workspace ID to filter by
+            status: Only reservations in this status (optional)
+
+        Returns:
+            List of stock reservations
+        """
+        query = db.query(StockReservation).filter(
+            StockReservation.workspace_id == workspace_id,  # SECURITY: workspace isolation
+            StockReservation.batch_id == batch_id
+        )
+        if status is not None:
+            query = query.filter(StockReservation.status == status)
+        return query.order_by(StockReservation.id).all()
+
+    def get_reserved_quantities(
+        self, db: Session, *, workspace_id: int,
+        factory_ids: Optional[Iterable[int]] = None,
+        item_ids: Optional[Iterable[int]] = None
+    ) -> Dict[Tuple[int, int], int]:
+        """
+        Get active reserved quantities per factory/item in one grouped query (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            factory_ids: Only these factories (optional, default all)
+            item_ids: Only these items (optional, default all)
+
+        Returns:
+            Dict of (factory_id, item_id) -> reserved quantity
+        """
+        query = db.query(
+            StockReservation.factory_id, StockReservation.item_id, func.sum(StockReservation.quantity)
+        ).filter(
+            StockReservation.workspace_id == workspace_id,  # SECURITY: workspace isolation
+            StockReservation.status == 'active'
+        )
+        if factory_ids is not None:
+            query = query.filter(StockReservation.factory_id.in_(list(factory_ids)))
+        if item_ids is not None:
+            query = query.filter(StockReservation.item_id.in_(list(item_ids)))
+        rows = query.group_by(StockReservation.factory_id, StockReservation.item_id).all()
+        return {(factory_id, item_id): int(qty or 0) for factory_id, item_id, qty in rows}
+
+    def lock_stock(
+        self, db: Session, *, workspace_id: int, factory_id: int, item_ids: Iterable[int]
+    ) -> None:
+        """
+        Lock the stock rows of items in a factory until the transaction ends (SECURITY-CRITICAL)
+
+        Serializes concurrent reservations of the same stock: a second
+        transaction waits here until the first commits, then sees its
+        reservations. Rows are locked in ID order to avoid deadlocks.
+        (No-op on SQLite, which serializes writers anyway.)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            factory_id: Factory ID
+            item_ids: Items to lock
+        """
+        item_ids = list(item_ids)
+        if not item_ids:
+            return
+        (
+            db.query(StorageItem.id)
+            .filter(
+                StorageItem.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                StorageItem.factory_id == factory_id,
+                StorageItem.item_id.in_(item_ids)
+            )
+            .order_by(StorageItem.id)
+            .with_for_update()
+            .all()
+        )
+        (
+            db.query(Inventory.id)
+            .filter(
+                Inventory.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                Inventory.factory_id == factory_id,
+                Inventory.item_id.in_(item_ids),
+                Inventory.inventory_type == InventoryTypeEnum.STORAGE
+            )
+            .order_by(Inventory.id)
+            .with_for_update()
+            .all()
+        )
+
+    def resolve_batch(
+        self, db: Session, *, batch_id: int, workspace_id: int, status: str
+    ) -> int:
+        """
+        Move all active reservations of a batch to 'consumed' or 'released' (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            batch_id: Production batch ID
+            workspace_id: Workspace ID to filter by
+            status: New status
+
+        Returns:
+            Number of reservations updated
+        """
+        return (
+            db.query(StockReservation)
+            .filter(
+                StockReservation.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                StockReservation.batch_id == batch_id,
+                StockReservation.status == 'active'
+            )
+            .update(
+                {'status': status, 'resolved_at': datetime.utcnow()},
+                synchronize_session=False
+            )
+        )
+
+
+stock_reservation_dao = StockReservationDAO(StockReservation)
@@ -1,8 +1,19 @@
 """DAO operations"""
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Numeric, and_, case, cast, func, literal, or_, select, union_all
 from sqlalchemy.orm import Session
 from app.dao.base import BaseDAO
+from app.models.factory import Factory
+from app.models.factory_section import FactorySection
+from app.models.item import Item
+from app.models.machine import Machine
+from app.models.machine_item import MachineItem
+from app.models.machine_item_ledger import MachineItemLedger
+from app.models.purchase_order import PurchaseOrder
+from app.models.purchase_order_item import PurchaseOrderItem
 from app.models.storage_item import StorageItem
+from app.models.storage_item_ledger import StorageItemLedger
 from app.schemas.storage_item import StorageItemCreate, StorageItemUpdate
 
 
@@ -36,16 +47,16 @@ class DAOStorageItem(BaseDAO[StorageItem, StorageItemCreate, StorageItemUpdate])
             .all()
         )
 
-    def get_by_factory_and_part(
-        self, db: Session, *, factory_id: int, part_id: int, workspace_id: int
+    def get_by_factory_and_item(
+        self, db: Session, *, factory_id: int, item_id: int, workspace_id: int
     ) -> Optional[StorageItem]:
         """
-        Get storage item by factory and part ID (SECURITY-CRITICAL: workspace-filtered)
+        Get storage item by factory and item ID (SECURITY-CRITICAL: workspace-filtered)
 
         Args:
             db: Database session
             factory_id: Factory ID
-            part_id: Part ID
+            item_id: Item ID
             workspace_id: Workspace ID to filter by
 
         Returns:
@@ -56,10 +67,212 @@ class DAOStorageItem(BaseDAO[StorageItem, StorageItemCreate, StorageItemUpdate])
             .filter(
                 StorageItem.workspace_id == workspace_id,  # SECURITY: workspace isolation
                 StorageItem.factory_id == factory_id,
-                StorageItem.part_id == part_id
+                StorageItem.item_id == item_id
             )
             .first()
         )
 
+    def get_quantities(
+        self, db: Session, *, workspace_id: int,
+        factory_ids: Iterable[int], item_ids: Iterable[int]
+    ) -> Dict[Tuple[int, int], int]:
+        """
+        Get stored quantities for many factory/item pairs in one query (SECURITY-CRITICAL)
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            factory_ids: Factories to include
+            item_ids: Items to include
+
+        Returns:
+            Dict of (factory_id, item_id) -> qty (pairs without stock are absent)
+        """
+        factory_ids, item_ids = list(factory_ids), list(item_ids)
+        if not factory_ids or not item_ids:
+            return {}
+        rows = (
+            db.query(StorageItem.factory_id, StorageItem.item_id, func.sum(StorageItem.qty))
+            .filter(
+                StorageItem.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                StorageItem.factory_id.in_(factory_ids),
+                StorageItem.item_id.in_(item_ids)
+            )
+            .group_by(StorageItem.factory_id, StorageItem.item_id)
+            .all()
+        )
+        return {(factory_id, item_id): int(qty or 0) for factory_id, item_id, qty in rows}
+
+    def get_replenishment_rows(
+        self, db: Session, *, workspace_id: int, window_start: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Get stock, demand and consumption of every factory/item pair in one query (SECURITY-CRITICAL)
+
+        A UNION ALL of four sources keyed by (factory_id, item_id), summed per key:
+        - on_hand: storage_items quantity
+        - machine_shortfall: req_qty - qty of machine_items below their
+          required quantity (non-deleted machines, by their section's factory)
+        - on_order: not yet received quantity of purchase order lines going
+          to a factory's storage or to one of its machines
+        - consumed / consumed_sq: sum of daily 'consumption' quantities (and
+          of their squares) since window_start, from the storage ledger and
+          the machine ledger (by the machine's factory) together
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID to filter by
+            window_start: Earliest ledger performed_at (inclusive)
+
+        Returns:
+            Dicts with factory_id, factory_name, item_id, item_name, item_unit,
+            avg_price (None without storage rows) and the summed columns above,
+            for active items of non-deleted factories with consumption or a
+            machine shortfall, ordered by factory and item
+
+        Note:
+            Reads the live ledgers only; archived years are not included.
+        """
+        def number(value):
+            return cast(value, Numeric)
+
+        zero = number(literal(0))
+
+        def source(factory_id, item_id, on_hand=None, machine_shortfall=None, on_order=None, avg_price=None):
+            values = {
+                'on_hand': on_hand, 'machine_shortfall': machine_shortfall, 'on_order': on_order,
+                'consumed': None, 'consumed_sq': None,
+            }
+            return [
+                factory_id.label('factory_id'),
+                item_id.label('item_id'),
+                *[(zero if value is None else number(value)).label(name) for name, value in values.items()],
+                number(literal(None) if avg_price is None else avg_price).label('avg_price'),
+            ]
+
+        stock = select(
+            *source(StorageItem.factory_id, StorageItem.item_id, on_hand=StorageItem.qty, avg_price=StorageItem.avg_price)
+        ).where(
+            StorageItem.workspace_id == workspace_id  # SECURITY: workspace isolation
+        )
+
+        machine_demand = select(
+            *source(
+                FactorySection.factory_id, MachineItem.item_id,
+                machine_shortfall=MachineItem.req_qty - MachineItem.qty
+            )
+        ).join(
+            Machine, Machine.id == MachineItem.machine_id
+        ).join(
+            FactorySection, FactorySection.id == Machine.factory_section_id
+        ).where(
+            MachineItem.workspace_id == workspace_id,  # SECURITY: workspace isolation
+            Machine.is_deleted == False,
+            MachineItem.req_qty.isnot(None),
+            MachineItem.req_qty > MachineItem.qty
+        )
+
+        destination_machine = Machine.__table__.alias('destination_machine')
+        destination_section = FactorySection.__table__.alias('destination_section')
+        open_orders = select(
+            *source(
+                case(
+                    (PurchaseOrder.destination_type == 'storage', PurchaseOrder.destination_id),
+                    else_=destination_section.c.factory_id
+                ),
+                PurchaseOrderItem.item_id,
+                on_order=PurchaseOrderItem.quantity_ordered - PurchaseOrderItem.quantity_received
+            )
+        ).join(
+            PurchaseOrder, PurchaseOrder.id == PurchaseOrderItem.purchase_order_id
+        ).outerjoin(
+            destination_machine, and_(
+                PurchaseOrder.destination_type == 'machine',
+                destination_machine.c.id == PurchaseOrder.destination_id
+            )
+        ).outerjoin(
+            destination_section, destination_section.c.id == destination_machine.c.factory_section_id
+        ).where(
+            PurchaseOrderItem.workspace_id == workspace_id,  # SECURITY: workspace isolation
+            PurchaseOrder.destination_type.in_(('storage', 'machine')),
+            PurchaseOrderItem.quantity_ordered > PurchaseOrderItem.quantity_received
+        )
+
+        storage_day = func.date(StorageItemLedger.performed_at)
+        machine_day = func.date(MachineItemLedger.performed_at)
+        daily_union = union_all(
+            select(
+                StorageItemLedger.factory_id.label('factory_id'),
+                StorageItemLedger.item_id.label('item_id'),
+                storage_day.label('day'),
+                StorageItemLedger.quantity.label('quantity')
+            ).where(
+                StorageItemLedger.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                StorageItemLedger.transaction_type == 'consumption',
+                StorageItemLedger.performed_at >= window_start
+            ),
+            select(
+                FactorySection.factory_id.label('factory_id'),
+                MachineItemLedger.item_id.label('item_id'),
+                machine_day.label('day'),
+                MachineItemLedger.quantity.label('quantity')
+            ).join(
+                Machine, Machine.id == MachineItemLedger.machine_id
+            ).join(
+                FactorySection, FactorySection.id == Machine.factory_section_id
+            ).where(
+                MachineItemLedger.workspace_id == workspace_id,  # SECURITY: workspace isolation
+                MachineItemLedger.transaction_type == 'consumption',
+                MachineItemLedger.performed_at >= window_start
+            )
+        ).subquery()
+        daily = select(
+            daily_union.c.factory_id,
+            daily_union.c.item_id,
+            number(func.sum(daily_union.c.quantity)).label('quantity')
+        ).group_by(
+            daily_union.c.factory_id, daily_union.c.item_id, daily_union.c.day
+        ).subquery()
+        consumption = select(
+            daily.c.factory_id.label('factory_id'),
+            daily.c.item_id.label('item_id'),
+            zero.label('on_hand'),
+            zero.label('machine_shortfall'),
+            zero.label('on_order'),
+            func.sum(daily.c.quantity).label('consumed'),
+            func.sum(daily.c.quantity * daily.c.quantity).label('consumed_sq'),
+            number(literal(None)).label('avg_price'),
+        ).group_by(daily.c.factory_id, daily.c.item_id)
+
+        sources = union_all(stock, machine_demand, open_orders, consumption).subquery()
+        totals = {
+            column: func.coalesce(func.sum(getattr(sources.c, column)), 0)
+            for column in ('on_hand', 'machine_shortfall', 'on_order', 'consumed', 'consumed_sq')
+        }
+        rows = db.query(
+            sources.c.factory_id,
+            Factory.name.label('factory_name'),
+            sources.c.item_id,
+            Item.name.label('item_name'),
+            Item.unit.label('item_unit'),
+            func.max(sources.c.avg_price).label('avg_price'),
+            *[total.label(column) for column, total in totals.items()]
+        ).join(
+            Factory, Factory.id == sources.c.factory_id
+        ).join(
+            Item, Item.id == sources.c.item_id
+        ).filter(
+            Factory.workspace_id == workspace_id,  # SECURITY: workspace isolation
+            Factory.is_deleted == False,
+            Item.is_active == True
+        ).group_by(
+            sources.c.factory_id, Factory.name, sources.c.item_id, Item.name, Item.unit
+        ).having(
+            or_(totals['consumed'] > 0, totals['machine_shortfall'] > 0)
+        ).order_by(
+            sources.c.factory_id, sources.c.item_id
+        )
+        return [dict(row._mapping) for row in rows]
+
 
 storage_item_dao = DAOStorageItem(StorageItem)
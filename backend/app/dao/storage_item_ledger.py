@@ -5,6 +5,7 @@ from typing import List, Optional
 from datetime import datetime, date
 from decimal import Decimal
 from app.dao.base import BaseDAO
+from app.dao.ledger_archive_period import ledger_archive_period_dao
 from app.models.storage_item_ledger import StorageItemLedger
 from app.schemas.storage_item_ledger import StorageItemLedgerCreate, StorageItemLedgerUpdate
 
@@ -37,7 +38,7 @@ class StorageItemLedgerDAO(BaseDAO[StorageItemLedger, StorageItemLedgerCreate, S
                 StorageItemLedger.factory_id == factory_id,
                 StorageItemLedger.item_id == item_id
             )
-            .order_by(StorageItemLedger.performed_at.desc())
+            .order_by(StorageItemLedger.performed_at.desc(), StorageItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -66,7 +67,7 @@ class StorageItemLedgerDAO(BaseDAO[StorageItemLedger, StorageItemLedgerCreate, S
                 StorageItemLedger.workspace_id == workspace_id,
                 StorageItemLedger.transaction_type == transaction_type
             )
-            .order_by(StorageItemLedger.performed_at.desc())
+            .order_by(StorageItemLedger.performed_at.desc(), StorageItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -92,7 +93,7 @@ class StorageItemLedgerDAO(BaseDAO[StorageItemLedger, StorageItemLedgerCreate, S
                 StorageItemLedger.workspace_id == workspace_id,
                 StorageItemLedger.order_id == order_id
             )
-            .order_by(StorageItemLedger.performed_at)
+            .order_by(StorageItemLedger.performed_at, StorageItemLedger.id)
             .all()
         )
 
@@ -113,7 +114,21 @@ class StorageItemLedgerDAO(BaseDAO[StorageItemLedger, StorageItemLedgerCreate, S
 
         Returns:
             List of ledger entries in date range
+
+        Note:
+            Archived years that overlap the range are UNIONed in transparently.
         """
+        archive_tables = ledger_archive_period_dao.get_archive_tables(
+            db, model=StorageItemLedger, workspace_id=workspace_id,
+            start_date=start_date, end_date=end_date
+        )
+        if archive_tables:
+            return ledger_archive_period_dao.query_with_archives(
+                db, model=StorageItemLedger, archive_tables=archive_tables,
+                filters={'workspace_id': workspace_id},
+                start_date=start_date, end_date=end_date, skip=skip, limit=limit
+            )
+
         return (
             db.query(StorageItemLedger)
             .filter(
@@ -121,7 +136,7 @@ class StorageItemLedgerDAO(BaseDAO[StorageItemLedger, StorageItemLedgerCreate, S
                 StorageItemLedger.performed_at >= start_date,
                 StorageItemLedger.performed_at <= end_date
             )
-            .order_by(StorageItemLedger.performed_at.desc())
+            .order_by(StorageItemLedger.performed_at.desc(), StorageItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -150,7 +165,7 @@ class StorageItemLedgerDAO(BaseDAO[StorageItemLedger, StorageItemLedgerCreate, S
                 StorageItemLedger.workspace_id == workspace_id,
                 StorageItemLedger.performed_by == performed_by
             )
-            .order_by(StorageItemLedger.performed_at.desc())
+            .order_by(StorageItemLedger.performed_at.desc(), StorageItemLedger.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
@@ -178,7 +193,7 @@ class StorageItemLedgerDAO(BaseDAO[StorageItemLedger, StorageItemLedgerCreate, S
                 StorageItemLedger.factory_id == factory_id,
                 StorageItemLedger.item_id == item_id
             )
-            .order_by(StorageItemLedger.performed_at.desc())
+            .order_by(StorageItemLedger.performed_at.desc(), StorageItemLedger.id.desc())
             .first()
         )
 
@@ -208,7 +223,7 @@ class StorageItemLedgerDAO(BaseDAO[StorageItemLedger, StorageItemLedgerCreate, S
                 StorageItemLedger.factory_id == factory_id,
                 StorageItemLedger.item_id == item_id
             )
-            .order_by(StorageItemLedger.performed_at.desc())
+            .order_by(StorageItemLedger.performed_at.desc(), StorageItemLedger.id.desc())
             .first()
         )
 
@@ -1,11 +1,53 @@
 """Workspace DAO"""
-from typing import Optional
+from typing import Dict, Optional
+from datetime import datetime
 from sqlalchemy.orm import Session
+from sqlalchemy import case, func, select, update
 from app.dao.base import BaseDAO
+from app.models.attachment import Attachment
+from app.models.factory import Factory
+from app.models.machine import Machine
+from app.models.order import Order
+from app.models.project import Project
 from app.models.workspace import Workspace
+from app.models.workspace_member import WorkspaceMember
 from app.schemas.workspace import WorkspaceCreate, WorkspaceUpdate
 
 
+# Quota name -> (workspace usage column, subscription plan limit column)
+QUOTA_FIELDS = {
+    'members': ('current_members_count', 'max_members'),
+    'factories': ('current_factories_count', 'max_factories'),
+    'machines': ('current_machines_count', 'max_machines'),
+    'projects': ('current_projects_count', 'max_projects'),
+    'orders_per_month': ('current_orders_this_month', 'max_orders_per_month'),
+    'storage_mb': ('current_storage_mb', 'max_storage_mb'),
+}
+
+# Usage columns maintained by add_usage()
+USAGE_COLUMNS = (
+    'current_members_count',
+    'current_factories_count',
+    'current_machines_count',
+    'current_projects_count',
+    'current_orders_this_month',
+    'current_storage_bytes',
+    'current_storage_mb',
+)
+
+BYTES_PER_MB = 1024 * 1024
+
+
+def month_start(value: datetime) -> datetime:
+    """Midnight of the first day of the month of a datetime."""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _non_negative(expression):
+    """SQL expression clamped at zero."""
+    return case((expression < 0, 0), else_=expression)
+
+
 class WorkspaceDAO(BaseDAO[Workspace, WorkspaceCreate, WorkspaceUpdate]):
     """DAO for workspace operations"""
 
@@ -21,41 +63,128 @@ class WorkspaceDAO(BaseDAO[Workspace, WorkspaceCreate, WorkspaceUpdate]):
             .all()
         )
 
+    def add_usage(
+        self, db: Session, *, workspace_id: int, deltas: Dict[str, int], now: Optional[datetime] = None
+    ) -> bool:
+        """
+        Atomically add deltas to usage counters (SET col = col + delta)
+
+        Args:
+            db: Database session (or connection, when called from flush events)
+            workspace_id: Workspace ID
+            deltas: {usage column: amount to add (negative to subtract)}; use
+                'current_storage_bytes' for storage, current_storage_mb is
+                derived from it in the same statement
+            now: Current time (defaults to utcnow), used for the monthly order reset
+
+        Returns:
+            True if the workspace exists
+
+        Note:
+            One UPDATE, so concurrent writers never lose increments. Counters
+            never go below zero. current_orders_this_month restarts from zero
+            when last_usage_reset_at lies before the current month.
+        """
+        now = now or datetime.utcnow()
+        values = {}
+        for column, delta in deltas.items():
+            if column not in USAGE_COLUMNS:
+                raise ValueError(f"Unknown usage counter: {column}")
+            if not delta:
+                continue
+            counter = getattr(Workspace, column)
+            if column == 'current_orders_this_month':
+                new_month = Workspace.last_usage_reset_at < month_start(now)
+                values[column] = case((new_month, max(delta, 0)), else_=_non_negative(counter + delta))
+                values['last_usage_reset_at'] = case((new_month, now), else_=Workspace.last_usage_reset_at)
+            elif column == 'current_storage_bytes':
+                total = _non_negative(counter + delta)
+                values[column] = total
+                values['current_storage_mb'] = (total + BYTES_PER_MB - 1) // BYTES_PER_MB
+            else:
+                values[column] = _non_negative(counter + delta)
+        if not values:
+            return True
+        result = db.execute(
+            update(Workspace)
+            .where(Workspace.id == workspace_id)
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
     def increment_usage(
         self, db: Session, *, workspace_id: int, field: str, amount: int = 1
-    ) -> Workspace:
+    ) -> bool:
         """
         Increment usage counter for workspace
 
         Args:
             workspace_id: Workspace ID
-            field: Usage field to increment (e.g., 'current_members_count')
+            field: Usage column to increment (e.g., 'current_members_count')
             amount: Amount to increment by (default 1)
         """
-        workspace = self.get(db, id=workspace_id)
-        if workspace:
-            current_value = getattr(workspace, field, 0)
-            setattr(workspace, field, current_value + amount)
-            db.flush()
-        return workspace
+        return self.add_usage(db, workspace_id=workspace_id, deltas={field: amount})
 
     def decrement_usage(
         self, db: Session, *, workspace_id: int, field: str, amount: int = 1
-    ) -> Workspace:
+    ) -> bool:
         """
         Decrement usage counter for workspace
 
         Args:
             workspace_id: Workspace ID
-            field: Usage field to decrement (e.g., 'current_members_count')
+            field: Usage column to decrement (e.g., 'current_members_count')
             amount: Amount to decrement by (default 1)
         """
-        workspace = self.get(db, id=workspace_id)
-        if workspace:
-            current_value = getattr(workspace, field, 0)
-            setattr(workspace, field, max(0, current_value - amount))
-            db.flush()
-        return workspace
+        return self.add_usage(db, workspace_id=workspace_id, deltas={field: -amount})
+
+    def recount_usage(
+        self, db: Session, *, workspace_id: Optional[int] = None, now: Optional[datetime] = None
+    ) -> int:
+        """
+        Recompute usage counters from the source tables
+
+        Corrects drift in the incrementally maintained counters (writes that
+        bypass the ORM, crashes between statements, ...). One UPDATE with
+        correlated subqueries for all workspaces (or one workspace).
+
+        Args:
+            db: Database session
+            workspace_id: Only this workspace (optional, default all)
+            now: Current time (defaults to utcnow)
+
+        Returns:
+            Number of workspaces updated
+        """
+        now = now or datetime.utcnow()
+
+        def count_where(model, *conditions):
+            return (
+                select(func.count(model.id))
+                .where(model.workspace_id == Workspace.id, *conditions)
+                .scalar_subquery()
+            )
+
+        storage_bytes = (
+            select(func.coalesce(func.sum(Attachment.file_size), 0))
+            .where(Attachment.workspace_id == Workspace.id, Attachment.is_deleted == False)
+            .scalar_subquery()
+        )
+        query = update(Workspace).values(
+            current_members_count=count_where(WorkspaceMember, WorkspaceMember.status == 'active'),
+            current_factories_count=count_where(Factory, Factory.is_deleted == False),
+            current_machines_count=count_where(Machine, Machine.is_deleted == False),
+            current_projects_count=count_where(Project, Project.is_deleted == False),
+            current_orders_this_month=count_where(Order, Order.created_at >= month_start(now)),
+            current_storage_bytes=storage_bytes,
+            current_storage_mb=(storage_bytes + BYTES_PER_MB - 1) // BYTES_PER_MB,
+            last_usage_reset_at=now,
+        )
+        if workspace_id is not None:
+            query = query.where(Workspace.id == workspace_id)
+        result = db.execute(query.execution_options(synchronize_session=False))
+        return result.rowcount
 
     def check_limit(
         self, db: Session, *, workspace: Workspace, limit_field: str
@@ -65,15 +194,16 @@ class WorkspaceDAO(BaseDAO[Workspace, WorkspaceCreate, WorkspaceUpdate]):
 
         Args:
             workspace: Workspace instance
-            limit_field: Limit field to check (e.g., 'members', 'storage_mb')
+            limit_field: Quota name (e.g., 'members', 'storage_mb', 'orders_per_month')
 
         Returns:
             Tuple of (has_reached_limit, current_usage, max_limit)
         """
-        current_field = f'current_{limit_field}_count' if not limit_field.endswith('_mb') else f'current_{limit_field}'
-        max_field = f'max_{limit_field}'
+        current_field, max_field = QUOTA_FIELDS[limit_field]
 
         current_usage = getattr(workspace, current_field, 0)
+        if current_field == 'current_orders_this_month' and workspace.last_usage_reset_at < month_start(datetime.utcnow()):
+            current_usage = 0
 
         # Get max from subscription plan
         if workspace.subscription_plan:
@@ -32,6 +32,7 @@ from app.models.project_component_item import ProjectComponentItem
 from app.models.project_component_item_ledger import ProjectComponentItemLedger
 from app.models.project_component_task import ProjectComponentTask
 from app.models.miscellaneous_project_cost import MiscellaneousProjectCost
+from app.models.project_cost_rollup import ProjectCostRollup
 from app.models.app_settings import AppSettings
 from app.models.access_control import AccessControl
 from app.models.attachment import Attachment
@@ -39,6 +40,7 @@ from app.models.order_attachment import OrderAttachment
 from app.models.project_attachment import ProjectAttachment
 from app.models.project_component_attachment import ProjectComponentAttachment
 from app.models.machine_event import MachineEvent
+from app.models.machine_uptime_rollup import MachineUptimeRollup
 from app.models.machine_maintenance_log import MachineMaintenanceLog
 from app.models.vendor import Vendor
 from app.models.account import Account
@@ -46,12 +48,16 @@ from app.models.account_tag import AccountTag
 from app.models.account_tag_assignment import AccountTagAssignment
 from app.models.account_invoice import AccountInvoice
 from app.models.invoice_payment import InvoicePayment
+from app.models.account_period_summary import AccountPeriodSummary
 from app.models.financial_audit_log import FinancialAuditLog
 # Inventory & Products
 from app.models.inventory import Inventory
 from app.models.inventory_ledger import InventoryLedger
 from app.models.product import Product
 from app.models.product_ledger import ProductLedger
+from app.models.ledger_archive_period import LedgerArchivePeriod
+from app.models.ledger_drift import LedgerDrift
+from app.models.ledger_drift_scan_state import LedgerDriftScanState
 # Work Orders
 from app.models.work_order import WorkOrder
 from app.models.work_order_item import WorkOrderItem
@@ -74,5 +80,8 @@ from app.models.sales_delivery_item import SalesDeliveryItem
 from app.models.production_line import ProductionLine
 from app.models.production_formula import ProductionFormula
 from app.models.production_formula_item import ProductionFormulaItem
+from app.models.production_formula_version import ProductionFormulaVersion
 from app.models.production_batch import ProductionBatch
 from app.models.production_batch_item import ProductionBatchItem
+from app.models.stock_reservation import StockReservation
+from app.models.production_batch_rollup import ProductionBatchRollup
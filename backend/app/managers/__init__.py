@@ -17,11 +17,26 @@ from app.managers.order_manager import order_manager, OrderManager
 # UTILITY MANAGERS (Cross-Cutting Operations)
 # ============================================================================
 from app.managers.inventory_manager import inventory_manager, InventoryManager
+from app.managers.ledger_posting_manager import ledger_posting_manager, LedgerPostingManager
+from app.managers.project_cost_manager import project_cost_manager, ProjectCostManager
+from app.managers.account_balance_manager import account_balance_manager, AccountBalanceManager
+from app.managers.account_period_summary_manager import account_period_summary_manager, AccountPeriodSummaryManager
+from app.managers.reference_data_manager import reference_data_manager, ReferenceDataManager
+from app.managers.quota_manager import quota_manager, QuotaManager
+from app.managers.mrp_manager import mrp_manager, MRPManager
+from app.managers.stock_reservation_manager import stock_reservation_manager, StockReservationManager
+from app.managers.production_analytics_manager import production_analytics_manager, ProductionAnalyticsManager
+from app.managers.formula_version_manager import formula_version_manager, FormulaVersionManager
+from app.managers.production_schedule_manager import production_schedule_manager, ProductionScheduleManager
+from app.managers.machine_uptime_manager import machine_uptime_manager, MachineUptimeManager
+from app.managers.maintenance_planning_manager import maintenance_planning_manager, MaintenancePlanningManager
+from app.managers.replenishment_manager import replenishment_manager, ReplenishmentManager
 
 # ============================================================================
 # STANDALONE MANAGERS (Independent Entities)
 # ============================================================================
 from app.managers.item_manager import item_manager, ItemManager
+from app.managers.access_control_manager import access_control_manager, AccessControlManager
 
 __all__ = [
     # Base
@@ -34,8 +49,38 @@ __all__ = [
     # Utility Managers
     "InventoryManager",
     "inventory_manager",
+    "LedgerPostingManager",
+    "ledger_posting_manager",
+    "ProjectCostManager",
+    "project_cost_manager",
+    "AccountBalanceManager",
+    "account_balance_manager",
+    "AccountPeriodSummaryManager",
+    "account_period_summary_manager",
+    "ReferenceDataManager",
+    "reference_data_manager",
+    "QuotaManager",
+    "quota_manager",
+    "MRPManager",
+    "mrp_manager",
+    "StockReservationManager",
+    "stock_reservation_manager",
+    "ProductionAnalyticsManager",
+    "production_analytics_manager",
+    "FormulaVersionManager",
+    "formula_version_manager",
+    "ProductionScheduleManager",
+    "production_schedule_manager",
+    "MachineUptimeManager",
+    "machine_uptime_manager",
+    "MaintenancePlanningManager",
+    "maintenance_planning_manager",
+    "ReplenishmentManager",
+    "replenishment_manager",
 
     # Standalone Managers
     "ItemManager",
     "item_manager",
+    "AccessControlManager",
+    "access_control_manager",
 ]
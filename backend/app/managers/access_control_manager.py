@@ -0,0 +1,253 @@
+"""
+Access Control Manager
+
+Business logic for RBAC permissions with a cached permission matrix per
+(workspace, role).
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+
+from app.managers.base_manager import BaseManager
+from app.models.access_control import AccessControl
+from app.models.enums import AccessControlTypeEnum, RoleEnum
+from app.schemas.access_control import AccessControlCreate, AccessControlUpdate
+from app.dao.access_control import access_control_dao
+
+
+# Matrices are rebuilt after this long, so access-control writes made by
+# other processes (which cannot bump this process's versions) show up
+CACHE_TTL_SECONDS = 300
+
+# (workspace_id, role) matrices kept before the least recently used is dropped
+CACHE_MAX_ENTRIES = 1024
+
+# session.info key holding workspace IDs to invalidate on commit
+PENDING_KEY = 'access_control_invalidations'
+
+
+class PermissionMatrix:
+    """
+    Compiled permissions of one role in one workspace.
+
+    Immutable: allowed (type, target) pairs are a frozenset, so checks are
+    O(1) set lookups and a matrix can be shared between requests.
+    """
+
+    __slots__ = ('workspace_id', 'role', 'version', 'allowed')
+
+    def __init__(
+        self,
+        workspace_id: int,
+        role: str,
+        version: int,
+        allowed: Iterable[Tuple[str, str]]
+    ):
+        self.workspace_id = workspace_id
+        self.role = role
+        self.version = version
+        self.allowed: FrozenSet[Tuple[str, str]] = frozenset(allowed)
+
+    def allows(self, access_type: AccessControlTypeEnum | str, target: str) -> bool:
+        """Whether the role may access `target` (a page, feature or order status)."""
+        return (AccessControlTypeEnum(access_type).value, target) in self.allowed
+
+    def targets(self, access_type: AccessControlTypeEnum | str) -> List[str]:
+        """Allowed targets of one access type, sorted."""
+        access_type = AccessControlTypeEnum(access_type).value
+        return sorted(target for allowed_type, target in self.allowed if allowed_type == access_type)
+
+
+class AccessControlManager(BaseManager[AccessControl]):
+    """
+    STANDALONE MANAGER: Access control rules and permission matrices.
+
+    get_matrix() compiles the rules of a (workspace, role) once with a single
+    query and keeps the result in an LRU cache. Every workspace has a version
+    number; writes through this manager bump it (immediately and again after
+    commit), which makes all cached matrices of that workspace stale.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(AccessControl)
+        self.access_control_dao = access_control_dao
+        # (workspace_id, role) -> (version, loaded_at, PermissionMatrix)
+        self._cache: "OrderedDict[Tuple[int, str], Tuple[int, float, PermissionMatrix]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get_matrix(self, session: Session, workspace_id: int, role: str) -> PermissionMatrix:
+        """
+        Get the compiled permissions of a role (from cache when current).
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            role: Role name ('owner', 'finance', ...)
+
+        Returns:
+            PermissionMatrix
+        """
+        key = (workspace_id, role)
+        with self._lock:
+            version = self._versions.get(workspace_id, 0)
+            cached = self._cache.get(key)
+            if (
+                cached is not None
+                and cached[0] == version
+                and time.monotonic() - cached[1] <= CACHE_TTL_SECONDS
+            ):
+                self._cache.move_to_end(key)
+                return cached[2]
+
+        try:
+            role_enum = RoleEnum(role)
+        except ValueError:
+            # Unknown role: no permissions
+            pairs = []
+        else:
+            pairs = self.access_control_dao.get_permission_pairs(
+                session, workspace_id=workspace_id, role=role_enum
+            )
+        matrix = PermissionMatrix(workspace_id, role, version, pairs)
+
+        with self._lock:
+            # Only cache if no write invalidated the workspace while loading
+            if self._versions.get(workspace_id, 0) == version:
+                self._cache[key] = (version, time.monotonic(), matrix)
+                self._cache.move_to_end(key)
+                while len(self._cache) > CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        return matrix
+
+    def list_access_controls(
+        self,
+        session: Session,
+        workspace_id: int,
+        role: Optional[RoleEnum] = None,
+        access_type: Optional[AccessControlTypeEnum] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[AccessControl]:
+        """
+        List access control rules, optionally filtered by role or type.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            role: Filter by role (optional)
+            access_type: Filter by type (optional)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of access control rules
+        """
+        if role:
+            return self.access_control_dao.get_by_role(
+                session, role=role, workspace_id=workspace_id, skip=skip, limit=limit
+            )
+        if access_type:
+            return self.access_control_dao.get_by_type(
+                session, access_type=access_type, workspace_id=workspace_id, skip=skip, limit=limit
+            )
+        return self.access_control_dao.get_by_workspace(
+            session, workspace_id=workspace_id, skip=skip, limit=limit
+        )
+
+    def get_access_control(self, session: Session, control_id: int, workspace_id: int) -> AccessControl:
+        """
+        Get access control rule by ID.
+
+        Raises:
+            HTTPException: If rule not found
+        """
+        control = self.access_control_dao.get_by_id_and_workspace(
+            session, id=control_id, workspace_id=workspace_id
+        )
+        if not control:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Access control not found"
+            )
+        return control
+
+    def create_access_control(
+        self, session: Session, control_data: AccessControlCreate, workspace_id: int
+    ) -> AccessControl:
+        """
+        Create access control rule and invalidate the workspace's matrices.
+
+        Returns:
+            Created rule
+        """
+        control = self.access_control_dao.create_in_workspace(
+            session, obj_in=control_data, workspace_id=workspace_id
+        )
+        self.invalidate_workspace(session, workspace_id)
+        return control
+
+    def update_access_control(
+        self, session: Session, control_id: int, control_data: AccessControlUpdate, workspace_id: int
+    ) -> AccessControl:
+        """
+        Update access control rule and invalidate the workspace's matrices.
+
+        Raises:
+            HTTPException: If rule not found
+        """
+        control = self.get_access_control(session, control_id, workspace_id)
+        control = self.access_control_dao.update(session, db_obj=control, obj_in=control_data)
+        self.invalidate_workspace(session, workspace_id)
+        return control
+
+    def delete_access_control(self, session: Session, control_id: int, workspace_id: int) -> AccessControl:
+        """
+        Delete access control rule and invalidate the workspace's matrices.
+
+        Raises:
+            HTTPException: If rule not found
+        """
+        control = self.get_access_control(session, control_id, workspace_id)
+        self.access_control_dao.remove(session, id=control.id)
+        self.invalidate_workspace(session, workspace_id)
+        return control
+
+    def invalidate_workspace(self, session: Session, workspace_id: int) -> None:
+        """
+        Make cached matrices of a workspace stale.
+
+        The version is bumped now and once more after the session commits, so
+        a matrix read between flush and commit is not served afterwards.
+        """
+        self._bump(workspace_id)
+        session.info.setdefault(PENDING_KEY, set()).add(workspace_id)
+        if not event.contains(session, 'after_commit', _invalidate_after_commit):
+            event.listen(session, 'after_commit', _invalidate_after_commit)
+
+    def clear_cache(self) -> None:
+        """Drop all cached matrices."""
+        with self._lock:
+            self._cache.clear()
+
+    def _bump(self, workspace_id: int) -> None:
+        """Increase a workspace's version number."""
+        with self._lock:
+            self._versions[workspace_id] = self._versions.get(workspace_id, 0) + 1
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    """Session after_commit hook: bump the workspaces written in the committed transaction."""
+    workspace_ids = session.info.pop(PENDING_KEY, None)
+    for workspace_id in workspace_ids or ():
+        access_control_manager._bump(workspace_id)
+
+
+# Singleton instance
+access_control_manager = AccessControlManager()
@@ -0,0 +1,224 @@
+"""Account Aging Manager - cached accounts receivable/payable aging"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from datetime import date, datetime
+from decimal import Decimal
+from app.managers.base_manager import BaseManager
+from app.models.account_invoice import AccountInvoice
+from app.dao.account_invoice import account_invoice_dao, AGING_BUCKETS
+
+
+# Cached reports are reloaded in full after this long, so writes made by
+# other processes (which cannot invalidate this process's cache) show up
+CACHE_TTL_SECONDS = 300
+
+# (workspace_id, as_of) entries kept before the least recently used is dropped
+CACHE_MAX_ENTRIES = 256
+
+AMOUNT_COLUMNS = tuple(label for label, _, _ in AGING_BUCKETS) + ('total_outstanding',)
+
+ZERO = Decimal('0.00')
+
+# session.info key holding (workspace_id, account_id) pairs to invalidate on commit
+PENDING_KEY = 'account_aging_invalidations'
+
+
+class AccountAgingManager(BaseManager[AccountInvoice]):
+    """
+    STANDALONE MANAGER: Accounts receivable/payable aging with cached balances.
+
+    Outstanding balances per (account, invoice type) are read with one grouped
+    query and cached per (workspace, as_of date). Invoice and payment writes
+    call invalidate_accounts(); only those accounts are re-read on the next
+    report, so a workspace with 100k+ invoices loads its aging dashboard
+    without rescanning every invoice.
+
+    Invalidation happens immediately and again after the writing session
+    commits, so a report read between flush and commit cannot leave stale
+    balances in the cache.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(AccountInvoice)
+        self.account_invoice_dao = account_invoice_dao
+        # (workspace_id, as_of) -> {'loaded_at', 'generated_at', 'rows': {account_id: [row, ...]}, 'stale': set}
+        self._cache: "OrderedDict[Tuple[int, date], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_aging_report(
+        self,
+        session: Session,
+        workspace_id: int,
+        as_of: Optional[date] = None,
+        invoice_type: Optional[str] = None,
+        account_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the aging report of a workspace.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            as_of: Date to age invoices at (defaults to today)
+            invoice_type: Only 'payable' or 'receivable' invoices (optional)
+            account_id: Only this account (optional)
+
+        Returns:
+            Dict matching AgingReportResponse
+        """
+        if as_of is None:
+            as_of = date.today()
+
+        balances, generated_at = self._get_balances(session, workspace_id, as_of)
+
+        accounts = [
+            row
+            for account_rows in balances.values()
+            for row in account_rows
+            if (invoice_type is None or row['invoice_type'] == invoice_type)
+            and (account_id is None or row['account_id'] == account_id)
+        ]
+        accounts.sort(key=lambda row: (-row['total_outstanding'], row['account_name']))
+
+        totals: Dict[str, Dict[str, Any]] = {}
+        for row in accounts:
+            total = totals.setdefault(row['invoice_type'], {
+                'invoice_type': row['invoice_type'],
+                'account_count': 0,
+                'invoice_count': 0,
+                **{column: ZERO for column in AMOUNT_COLUMNS}
+            })
+            total['account_count'] += 1
+            total['invoice_count'] += row['invoice_count']
+            for column in AMOUNT_COLUMNS:
+                total[column] += row[column]
+
+        return {
+            'as_of': as_of,
+            'generated_at': generated_at,
+            'totals': [totals[name] for name in sorted(totals)],
+            'accounts': accounts,
+        }
+
+    def invalidate_accounts(
+        self,
+        session: Session,
+        workspace_id: int,
+        account_ids: Iterable[Optional[int]]
+    ) -> None:
+        """
+        Drop cached balances of accounts whose invoices or payments changed.
+
+        Call from invoice/payment writes. The accounts are dropped now and
+        once more after the session commits.
+
+        Args:
+            session: Session the write happens in
+            workspace_id: Workspace ID
+            account_ids: Accounts touched by the write
+        """
+        keys = {(workspace_id, account_id) for account_id in account_ids if account_id is not None}
+        if not keys:
+            return
+
+        self._drop(keys)
+
+        pending = session.info.setdefault(PENDING_KEY, set())
+        pending.update(keys)
+        if not event.contains(session, 'after_commit', _invalidate_after_commit):
+            event.listen(session, 'after_commit', _invalidate_after_commit)
+
+    def clear_cache(self, workspace_id: Optional[int] = None) -> None:
+        """Drop all cached reports (of one workspace, or all workspaces)."""
+        with self._lock:
+            for key in list(self._cache):
+                if workspace_id is None or key[0] == workspace_id:
+                    del self._cache[key]
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _get_balances(
+        self, session: Session, workspace_id: int, as_of: date
+    ) -> Tuple[Dict[int, List[Dict[str, Any]]], datetime]:
+        """Get cached rows per account, loading the whole workspace or only stale accounts."""
+        key = (workspace_id, as_of)
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and time.monotonic() - entry['loaded_at'] > CACHE_TTL_SECONDS:
+                entry = None
+            if entry is None:
+                entry = {
+                    'loaded_at': time.monotonic(),
+                    'generated_at': datetime.utcnow(),
+                    'rows': {},
+                    'stale': set(),
+                }
+                self._cache[key] = entry
+                while len(self._cache) > CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+                reload_ids = None
+            elif entry['stale']:
+                reload_ids = set(entry['stale'])
+                entry['stale'].clear()
+            else:
+                self._cache.move_to_end(key)
+                return dict(entry['rows']), entry['generated_at']
+
+        # Query outside the lock; accounts invalidated meanwhile are put back
+        # in 'stale' by _drop() and not cached from this (possibly older) read
+        loaded: Dict[int, List[Dict[str, Any]]] = {}
+        for row in self.account_invoice_dao.get_aging_summary(
+            session, workspace_id=workspace_id, as_of=as_of, account_ids=reload_ids
+        ):
+            row['invoice_count'] = int(row['invoice_count'])
+            for column in AMOUNT_COLUMNS:
+                row[column] = Decimal(str(row[column] or 0)).quantize(Decimal('0.01'))
+            if isinstance(row['oldest_due_date'], str):
+                row['oldest_due_date'] = date.fromisoformat(row['oldest_due_date'])
+            loaded.setdefault(row['account_id'], []).append(row)
+
+        with self._lock:
+            for account_id in (reload_ids if reload_ids is not None else loaded):
+                if account_id in entry['stale']:
+                    continue
+                if account_id in loaded:
+                    entry['rows'][account_id] = loaded[account_id]
+                else:
+                    entry['rows'].pop(account_id, None)
+            rows = dict(entry['rows'])
+            rows.update(loaded)
+
+        return rows, entry['generated_at']
+
+    def _drop(self, keys: Iterable[Tuple[int, int]]) -> None:
+        """Remove (workspace_id, account_id) balances from every cached as_of date."""
+        by_workspace: Dict[int, set] = {}
+        for workspace_id, account_id in keys:
+            by_workspace.setdefault(workspace_id, set()).add(account_id)
+
+        with self._lock:
+            for (workspace_id, _), entry in self._cache.items():
+                account_ids = by_workspace.get(workspace_id)
+                if not account_ids:
+                    continue
+                for account_id in account_ids:
+                    entry['rows'].pop(account_id, None)
+                entry['stale'].update(account_ids)
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    """Session after_commit hook: drop the accounts written in the committed transaction."""
+    keys = session.info.pop(PENDING_KEY, None)
+    if keys:
+        account_aging_manager._drop(keys)
+
+
+# Singleton instance
+account_aging_manager = AccountAgingManager()
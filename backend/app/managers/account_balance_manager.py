@@ -0,0 +1,120 @@
+"""Account Balance Manager - denormalized per-account balance counters"""
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy.orm import Session
+from datetime import date
+from decimal import Decimal
+from app.managers.base_manager import BaseManager
+from app.models.account import Account
+from app.models.account_invoice import AccountInvoice
+from app.dao.account import account_dao
+
+
+ZERO = Decimal('0.00')
+
+
+class AccountBalanceManager(BaseManager[Account]):
+    """
+    UTILITY MANAGER: Maintains the balance counters on Account.
+
+    - payable_outstanding / receivable_outstanding: SUM(invoice_amount - paid_amount)
+      over the account's invoices of that type
+    - last_invoice_date / last_payment_date
+
+    Invoice and payment writes pass the invoice balances before and after the
+    change to record_changes(). Deltas are netted per account and applied with
+    one atomic UPDATE per account. rebuild_balances() recomputes the counters
+    from the source tables (backfill, or repair after direct SQL changes).
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(Account)
+        self.account_dao = account_dao
+
+    def invoice_balance(self, invoice: AccountInvoice) -> Dict[str, Any]:
+        """
+        Balance an invoice contributes to its account.
+
+        Returns:
+            {'account_id', 'invoice_type', 'outstanding'} for record_changes()
+        """
+        return {
+            'account_id': invoice.account_id,
+            'invoice_type': invoice.invoice_type,
+            'outstanding': Decimal(str(invoice.invoice_amount or 0)) - Decimal(str(invoice.paid_amount or 0)),
+        }
+
+    def record_changes(
+        self,
+        session: Session,
+        workspace_id: int,
+        before: List[Dict[str, Any]],
+        after: List[Dict[str, Any]],
+        invoice_date: Optional[date] = None,
+        payment_date: Optional[date] = None,
+        refresh_dates: bool = False
+    ) -> None:
+        """
+        Move account balances from the invoices' old to their new contributions.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            before: invoice_balance() of the changed invoices before the write ([] for new invoices)
+            after: invoice_balance() after the write ([] for deleted invoices)
+            invoice_date: Date of a new invoice (moves last_invoice_date forward)
+            payment_date: Date of a new payment (moves last_payment_date forward)
+            refresh_dates: Recompute last invoice/payment dates of every account
+                involved (needed after deletes and date changes)
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        deltas: Dict[int, Dict[str, Decimal]] = {}
+        for sign, balances in ((-1, before), (1, after)):
+            for balance in balances:
+                account = deltas.setdefault(balance['account_id'], {'payable': ZERO, 'receivable': ZERO})
+                account[balance['invoice_type']] += sign * balance['outstanding']
+
+        new_activity_accounts = {balance['account_id'] for balance in after}
+        for account_id, account_deltas in deltas.items():
+            touches_dates = refresh_dates or account_id in new_activity_accounts
+            self.account_dao.apply_balance_changes(
+                session,
+                workspace_id=workspace_id,
+                account_id=account_id,
+                payable_delta=account_deltas['payable'],
+                receivable_delta=account_deltas['receivable'],
+                invoice_date=invoice_date if touches_dates else None,
+                payment_date=payment_date if touches_dates else None,
+                refresh_dates=refresh_dates
+            )
+
+    def rebuild_balances(
+        self,
+        session: Session,
+        workspace_id: int,
+        account_ids: Optional[Iterable[int]] = None
+    ) -> int:
+        """
+        Recompute balance counters from invoices and payments.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            account_ids: Only these accounts (optional, default all)
+
+        Returns:
+            Number of accounts rebuilt
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        return self.account_dao.rebuild_balances(
+            session, workspace_id=workspace_id, account_ids=account_ids
+        )
+
+
+# Singleton instance
+account_balance_manager = AccountBalanceManager()
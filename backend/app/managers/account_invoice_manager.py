@@ -9,6 +9,9 @@ from fastapi import HTTPException, status
 from decimal import Decimal
 
 from app.managers.base_manager import BaseManager
+from app.managers.account_aging_manager import account_aging_manager
+from app.managers.account_balance_manager import account_balance_manager
+from app.managers.account_period_summary_manager import account_period_summary_manager
 from app.models.account_invoice import AccountInvoice
 from app.schemas.account_invoice import AccountInvoiceCreate, AccountInvoiceUpdate
 from app.dao.account_invoice import account_invoice_dao
@@ -92,6 +95,17 @@ class AccountInvoiceManager(BaseManager[AccountInvoice]):
             description=f"{invoice.invoice_type.capitalize()} invoice created for account ID {invoice.account_id}"
         )
 
+        account_balance_manager.record_changes(
+            session, workspace_id,
+            before=[], after=[account_balance_manager.invoice_balance(invoice)],
+            invoice_date=invoice.invoice_date
+        )
+        account_period_summary_manager.record_changes(
+            session, workspace_id,
+            before=[], after=account_period_summary_manager.invoice_entries(session, workspace_id, [invoice])
+        )
+        account_aging_manager.invalidate_accounts(session, workspace_id, [invoice.account_id])
+
         return invoice
 
     def update_invoice(
@@ -144,6 +158,10 @@ class AccountInvoiceManager(BaseManager[AccountInvoice]):
                     detail="Cannot assign invoice to deleted account"
                 )
 
+        old_account_id = invoice.account_id
+        old_invoice_date = invoice.invoice_date
+        old_balance = account_balance_manager.invoice_balance(invoice)
+
         # Capture before state for audit
         before_state = extract_relevant_fields(
             invoice, ['invoice_type', 'invoice_amount', 'invoice_number', 'invoice_date', 'due_date', 'payment_status']
@@ -153,6 +171,16 @@ class AccountInvoiceManager(BaseManager[AccountInvoice]):
         update_dict = invoice_data.model_dump(exclude_unset=True)
         update_dict['updated_by'] = user_id
 
+        # Payments are summarized under their invoice's account/type/factory,
+        # so they move too when one of those changes
+        moves_payments = any(
+            field in update_dict and update_dict[field] != getattr(invoice, field)
+            for field in ('account_id', 'invoice_type', 'order_id')
+        )
+        old_summary = account_period_summary_manager.invoice_entries(
+            session, workspace_id, [invoice], include_payments=moves_payments
+        )
+
         updated_invoice = self.account_invoice_dao.update(session, db_obj=invoice, obj_in=update_dict)
 
         # Capture after state for audit
@@ -174,6 +202,25 @@ class AccountInvoiceManager(BaseManager[AccountInvoice]):
             description=f"Invoice {invoice.invoice_number or invoice.id} updated"
         )
 
+        account_balance_manager.record_changes(
+            session, workspace_id,
+            before=[old_balance], after=[account_balance_manager.invoice_balance(updated_invoice)],
+            refresh_dates=(
+                old_account_id != updated_invoice.account_id
+                or old_invoice_date != updated_invoice.invoice_date
+            )
+        )
+        account_period_summary_manager.record_changes(
+            session, workspace_id,
+            before=old_summary,
+            after=account_period_summary_manager.invoice_entries(
+                session, workspace_id, [updated_invoice], include_payments=moves_payments
+            )
+        )
+        account_aging_manager.invalidate_accounts(
+            session, workspace_id, [old_account_id, updated_invoice.account_id]
+        )
+
         return updated_invoice
 
     def get_invoice(
@@ -304,8 +351,20 @@ class AccountInvoiceManager(BaseManager[AccountInvoice]):
             description=f"Invoice {invoice.invoice_number or invoice.id} deleted"
         )
 
+        old_balance = account_balance_manager.invoice_balance(invoice)
+        old_summary = account_period_summary_manager.invoice_entries(
+            session, workspace_id, [invoice], include_payments=True
+        )
+
         # Delete invoice
         self.account_invoice_dao.remove(session, id=invoice_id)
+        account_balance_manager.record_changes(
+            session, workspace_id, before=[old_balance], after=[], refresh_dates=True
+        )
+        account_period_summary_manager.record_changes(
+            session, workspace_id, before=old_summary, after=[]
+        )
+        account_aging_manager.invalidate_accounts(session, workspace_id, [invoice.account_id])
         return invoice
 
 
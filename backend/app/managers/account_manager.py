@@ -1,5 +1,6 @@
 """Account Manager for account business logic"""
 from typing import List, Optional
+from decimal import Decimal
 from sqlalchemy.orm import Session
 from app.managers.base_manager import BaseManager
 from app.models.account import Account
@@ -203,6 +204,10 @@ class AccountManager(BaseManager[Account]):
         workspace_id: int,
         name: Optional[str] = None,
         tag_code: Optional[str] = None,
+        min_payable_outstanding: Optional[Decimal] = None,
+        min_receivable_outstanding: Optional[Decimal] = None,
+        sort_by: Optional[str] = None,
+        sort_desc: bool = False,
         skip: int = 0,
         limit: int = 100
     ) -> List[Account]:
@@ -214,6 +219,10 @@ class AccountManager(BaseManager[Account]):
             workspace_id: Workspace ID (for multi-tenancy)
             name: Optional search query for account name
             tag_code: Optional tag code to filter (e.g. 'supplier', 'client', 'vendor')
+            min_payable_outstanding: Only accounts we owe at least this much
+            min_receivable_outstanding: Only accounts owing us at least this much
+            sort_by: Optional sort column (name or a balance column)
+            sort_desc: Sort descending
             skip: Number of records to skip
             limit: Maximum number of records to return
 
@@ -225,6 +234,10 @@ class AccountManager(BaseManager[Account]):
             workspace_id=workspace_id,
             name=name,
             tag_code=tag_code,
+            min_payable_outstanding=min_payable_outstanding,
+            min_receivable_outstanding=min_receivable_outstanding,
+            sort_by=sort_by,
+            sort_desc=sort_desc,
             skip=skip,
             limit=limit
         )
@@ -0,0 +1,237 @@
+"""Account Period Summary Manager - materialized monthly invoiced/paid totals"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from datetime import date
+from decimal import Decimal
+from app.managers.base_manager import BaseManager
+from app.models.account_invoice import AccountInvoice
+from app.models.account_period_summary import AccountPeriodSummary
+from app.dao.account_period_summary import account_period_summary_dao, SUMMARY_COLUMNS, KEY_COLUMNS
+from app.dao.invoice_payment import invoice_payment_dao
+from app.dao.order import order_dao
+
+
+ZERO = Decimal('0.00')
+
+
+def _month(value: date) -> date:
+    """First day of the month of a date."""
+    return value.replace(day=1)
+
+
+class AccountPeriodSummaryManager(BaseManager[AccountPeriodSummary]):
+    """
+    UTILITY MANAGER: Maintains monthly invoiced/paid totals (account_period_summaries).
+
+    Invoice and payment writes describe what they contribute to the summary
+    before and after the change (invoice_entries() / payment_entries()) and
+    pass both to record_changes(). Entries are netted per
+    (month, account, invoice type, factory) key and applied with one atomic
+    UPDATE per key, inserting a row for keys seen for the first time.
+    rebuild() recomputes a workspace from the source tables.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(AccountPeriodSummary)
+        self.summary_dao = account_period_summary_dao
+
+    def invoice_entries(
+        self,
+        session: Session,
+        workspace_id: int,
+        invoices: Iterable[AccountInvoice],
+        include_payments: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Summary entries of invoices (invoiced amount and count).
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            invoices: Invoices in their current state
+            include_payments: Also return entries for the invoices' payments
+                (needed when the account, type or order of an invoice changes,
+                since payments are summarized under their invoice's key)
+
+        Returns:
+            Entries for record_changes()
+        """
+        invoices = list(invoices)
+        factory_ids = self._factory_ids(session, workspace_id, invoices)
+        entries = [
+            self._entry(invoice, factory_ids, invoice.invoice_date,
+                        invoiced_amount=invoice.invoice_amount, invoice_count=1)
+            for invoice in invoices
+        ]
+        if include_payments:
+            for invoice in invoices:
+                payments = invoice_payment_dao.get_dates_and_amounts(
+                    session, invoice_id=invoice.id, workspace_id=workspace_id
+                )
+                entries.extend(
+                    self._entry(invoice, factory_ids, payment_date,
+                                paid_amount=payment_amount, payment_count=1)
+                    for payment_date, payment_amount in payments
+                )
+        return entries
+
+    def payment_entries(
+        self,
+        session: Session,
+        workspace_id: int,
+        payments: Iterable[Tuple[AccountInvoice, date, Decimal]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Summary entries of payments (paid amount and count).
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            payments: (invoice, payment_date, payment_amount) per payment
+
+        Returns:
+            Entries for record_changes()
+        """
+        payments = list(payments)
+        factory_ids = self._factory_ids(session, workspace_id, [invoice for invoice, _, _ in payments])
+        return [
+            self._entry(invoice, factory_ids, payment_date, paid_amount=payment_amount, payment_count=1)
+            for invoice, payment_date, payment_amount in payments
+        ]
+
+    def record_changes(
+        self,
+        session: Session,
+        workspace_id: int,
+        before: List[Dict[str, Any]],
+        after: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Move summary totals from the old to the new contributions.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            before: Entries of the changed invoices/payments before the write ([] for new ones)
+            after: Entries after the write ([] for deleted ones)
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        deltas: Dict[Tuple, Dict[str, Any]] = {}
+        for sign, entries in ((-1, before), (1, after)):
+            for entry in entries:
+                key = tuple(entry[column] for column in KEY_COLUMNS)
+                totals = deltas.setdefault(key, {'invoiced_amount': ZERO, 'invoice_count': 0,
+                                                 'paid_amount': ZERO, 'payment_count': 0})
+                for column in SUMMARY_COLUMNS:
+                    totals[column] += sign * entry.get(column, 0)
+
+        for key_values, totals in deltas.items():
+            changed = {column: value for column, value in totals.items() if value}
+            if not changed:
+                continue
+            key = dict(zip(KEY_COLUMNS, key_values))
+            if not self.summary_dao.add_totals(session, workspace_id=workspace_id, key=key, deltas=changed):
+                # First entry for this key
+                self.summary_dao.create(session, obj_in={
+                    'workspace_id': workspace_id,
+                    **key,
+                    **totals
+                })
+
+    def get_summary(
+        self,
+        session: Session,
+        workspace_id: int,
+        start_period: date,
+        end_period: date,
+        group_by: str = 'type',
+        invoice_type: Optional[str] = None,
+        account_id: Optional[int] = None,
+        tag_id: Optional[int] = None,
+        factory_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get monthly invoiced vs paid totals.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            start_period: First month (any day in it)
+            end_period: Last month (any day in it)
+            group_by: 'type', 'account', 'tag' or 'factory'
+            invoice_type / account_id / tag_id / factory_id: Optional filters
+
+        Returns:
+            Dict matching PeriodSummaryResponse
+        """
+        start_period, end_period = _month(start_period), _month(end_period)
+        rows = self.summary_dao.get_summary(
+            session,
+            workspace_id=workspace_id,
+            start_period=start_period,
+            end_period=end_period,
+            group_by=group_by,
+            invoice_type=invoice_type,
+            account_id=account_id,
+            tag_id=tag_id,
+            factory_id=factory_id
+        )
+        for row in rows:
+            if isinstance(row['period'], str):
+                row['period'] = date.fromisoformat(row['period'])
+            for column in ('invoiced_amount', 'paid_amount'):
+                row[column] = Decimal(str(row[column] or 0)).quantize(Decimal('0.01'))
+            for column in ('invoice_count', 'payment_count'):
+                row[column] = int(row[column] or 0)
+
+        return {
+            'start_period': start_period,
+            'end_period': end_period,
+            'group_by': group_by,
+            'rows': rows,
+        }
+
+    def rebuild(self, session: Session, workspace_id: int) -> int:
+        """
+        Recompute the workspace's summary rows from invoices and payments.
+
+        Returns:
+            Number of summary rows written
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        return self.summary_dao.rebuild(session, workspace_id=workspace_id)
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _factory_ids(
+        self, session: Session, workspace_id: int, invoices: List[AccountInvoice]
+    ) -> Dict[int, int]:
+        """Factory of each invoice's order, loaded with one query."""
+        return order_dao.get_factory_ids(
+            session,
+            ids={invoice.order_id for invoice in invoices if invoice.order_id is not None},
+            workspace_id=workspace_id
+        )
+
+    def _entry(
+        self, invoice: AccountInvoice, factory_ids: Dict[int, int], day: date, **totals: Any
+    ) -> Dict[str, Any]:
+        """One summary entry for an invoice's key in the month of `day`."""
+        return {
+            'period': _month(day),
+            'account_id': invoice.account_id,
+            'invoice_type': invoice.invoice_type,
+            'factory_id': factory_ids.get(invoice.order_id),
+            **{column: Decimal(str(value)) if column.endswith('_amount') else value
+               for column, value in totals.items()},
+        }
+
+
+# Singleton instance
+account_period_summary_manager = AccountPeriodSummaryManager()
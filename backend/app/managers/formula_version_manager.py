@@ -0,0 +1,305 @@
+"""Formula Version Manager - immutable, cached compiled recipes per formula version"""
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from fractions import Fraction
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.managers.base_manager import BaseManager
+from app.models.production_formula import ProductionFormula
+from app.models.production_formula_version import ProductionFormulaVersion
+from app.dao.production_formula import production_formula_dao
+from app.dao.production_formula_item import production_formula_item_dao
+from app.dao.production_formula_version import production_formula_version_dao
+
+
+# Compiled recipes kept before the least recently used is dropped. There is
+# no TTL: a snapshot never changes once committed.
+CACHE_MAX_ENTRIES = 1024
+
+# session.info key holding recipes created in the current transaction
+PENDING_KEY = 'formula_version_snapshots'
+
+
+class RecipeLine(NamedTuple):
+    """One formula item of a compiled recipe"""
+    item_id: int
+    item_role: str
+    quantity: int  # Per base run
+    qty_per_output_unit: Fraction
+    tolerance_percentage: Optional[Decimal]
+    is_optional: bool
+
+
+class CompiledRecipe:
+    """
+    Immutable recipe of one formula version.
+
+    Lines keep the formula item order; quantities scale exactly
+    (qty_per_output_unit is a fraction) and are rounded down per line.
+    """
+
+    __slots__ = (
+        'version_id', 'workspace_id', 'formula_id', 'version',
+        'base_output_quantity', 'estimated_duration_minutes', 'lines'
+    )
+
+    def __init__(self, snapshot: ProductionFormulaVersion):
+        self.version_id: int = snapshot.id
+        self.workspace_id: int = snapshot.workspace_id
+        self.formula_id: int = snapshot.formula_id
+        self.version: int = snapshot.version
+        self.base_output_quantity: int = snapshot.base_output_quantity
+        self.estimated_duration_minutes: Optional[int] = snapshot.estimated_duration_minutes
+        self.lines: Tuple[RecipeLine, ...] = tuple(
+            RecipeLine(
+                item_id=line['item_id'],
+                item_role=line['item_role'],
+                quantity=line['quantity'],
+                qty_per_output_unit=Fraction(line['quantity'], snapshot.base_output_quantity),
+                tolerance_percentage=(
+                    Decimal(line['tolerance_percentage'])
+                    if line.get('tolerance_percentage') is not None else None
+                ),
+                is_optional=bool(line.get('is_optional')),
+            )
+            for line in snapshot.recipe
+        )
+
+    def scaled(self, output_quantity: int) -> List[Tuple[RecipeLine, int]]:
+        """(line, expected quantity) of every line for a run making output_quantity."""
+        return [(line, int(line.qty_per_output_unit * output_quantity)) for line in self.lines]
+
+    def expected_duration(self, output_quantity: int) -> Optional[int]:
+        """Expected duration in minutes for a run making output_quantity."""
+        if not self.estimated_duration_minutes:
+            return None
+        return int(Fraction(self.estimated_duration_minutes * output_quantity, self.base_output_quantity))
+
+
+class FormulaVersionManager(BaseManager[ProductionFormulaVersion]):
+    """
+    UTILITY MANAGER: Immutable recipe snapshots of production formulas.
+
+    get_recipe() returns the compiled recipe of a formula's current
+    version: from the in-process cache, else from its snapshot row, else
+    compiled from the formula items and stored as a new snapshot. Snapshots
+    are never updated, so cached recipes never go stale. Editing a formula
+    whose current version has a snapshot first moves it to the next version
+    (release_version()), which leaves started batches on their snapshot.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(ProductionFormulaVersion)
+        self.version_dao = production_formula_version_dao
+        # (workspace_id, formula_id, version) -> CompiledRecipe
+        self._cache: "OrderedDict[Tuple[int, int, int], CompiledRecipe]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_recipe(
+        self,
+        session: Session,
+        workspace_id: int,
+        formula: ProductionFormula,
+        user_id: Optional[int] = None
+    ) -> CompiledRecipe:
+        """
+        Get the compiled recipe of a formula's current version.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            formula: Formula (its current version is used)
+            user_id: User creating the snapshot, if one is created
+
+        Returns:
+            CompiledRecipe
+
+        Raises:
+            ValueError: If the formula has no output items
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        key = (workspace_id, formula.id, formula.version)
+        with self._lock:
+            recipe = self._cache.get(key)
+            if recipe is not None:
+                self._cache.move_to_end(key)
+                return recipe
+
+        pending = session.info.get(PENDING_KEY, {})
+        if key in pending:
+            return pending[key]
+
+        snapshot = self.version_dao.get_by_formula_version(
+            session, formula_id=formula.id, version=formula.version, workspace_id=workspace_id
+        )
+        if snapshot is not None:
+            recipe = CompiledRecipe(snapshot)
+            self._store(key, recipe)
+            return recipe
+
+        recipe = CompiledRecipe(self._create_snapshot(session, workspace_id, formula, user_id))
+        # Cached once the snapshot is committed
+        session.info.setdefault(PENDING_KEY, {})[key] = recipe
+        if not event.contains(session, 'after_commit', _cache_after_commit):
+            event.listen(session, 'after_commit', _cache_after_commit)
+            event.listen(session, 'after_rollback', _discard_after_rollback)
+        return recipe
+
+    def release_version(
+        self,
+        session: Session,
+        workspace_id: int,
+        formula: ProductionFormula,
+        user_id: Optional[int] = None
+    ) -> bool:
+        """
+        Move a formula to its next version if the current one has a snapshot.
+
+        Call before changing anything a recipe is compiled from (items,
+        estimated duration).
+
+        Returns:
+            True if the version was increased
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        key = (workspace_id, formula.id, formula.version)
+        with self._lock:
+            frozen = key in self._cache
+        if not frozen:
+            frozen = key in session.info.get(PENDING_KEY, {}) or self.version_dao.exists(
+                session, formula_id=formula.id, version=formula.version, workspace_id=workspace_id
+            )
+        if not frozen:
+            return False
+        update_data = {'version': formula.version + 1}
+        if user_id is not None:
+            update_data['updated_by'] = user_id
+        production_formula_dao.update(session, db_obj=formula, obj_in=update_data)
+        return True
+
+    def get_versions(
+        self,
+        session: Session,
+        workspace_id: int,
+        formula_id: int
+    ) -> List[dict]:
+        """
+        Get all recipe snapshots of a formula, newest first.
+
+        Raises:
+            ValueError: If the formula is not found
+        """
+        formula = production_formula_dao.get_by_id_and_workspace(
+            session, id=formula_id, workspace_id=workspace_id
+        )
+        if not formula:
+            raise ValueError(f"Production formula {formula_id} not found")
+
+        versions = []
+        for snapshot in self.version_dao.get_by_formula(
+            session, formula_id=formula_id, workspace_id=workspace_id
+        ):
+            recipe = CompiledRecipe(snapshot)
+            versions.append({
+                'id': snapshot.id,
+                'workspace_id': snapshot.workspace_id,
+                'formula_id': snapshot.formula_id,
+                'version': snapshot.version,
+                'base_output_quantity': snapshot.base_output_quantity,
+                'estimated_duration_minutes': snapshot.estimated_duration_minutes,
+                'lines': [
+                    {
+                        **line._asdict(),
+                        'qty_per_output_unit': (
+                            Decimal(line.qty_per_output_unit.numerator)
+                            / Decimal(line.qty_per_output_unit.denominator)
+                        ).quantize(Decimal('0.000001')),
+                    }
+                    for line in recipe.lines
+                ],
+                'created_by': snapshot.created_by,
+                'created_at': snapshot.created_at,
+            })
+        return versions
+
+    def clear_cache(self) -> None:
+        """Drop all cached recipes."""
+        with self._lock:
+            self._cache.clear()
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _create_snapshot(
+        self,
+        session: Session,
+        workspace_id: int,
+        formula: ProductionFormula,
+        user_id: Optional[int]
+    ) -> ProductionFormulaVersion:
+        """Compile the formula's items into a new snapshot row (one query + one insert)."""
+        formula_items = sorted(
+            production_formula_item_dao.get_by_formula(
+                session, formula_id=formula.id, workspace_id=workspace_id
+            ),
+            key=lambda fi: fi.id
+        )
+        base_output_quantity = sum(fi.quantity for fi in formula_items if fi.item_role == 'output')
+        if base_output_quantity <= 0:
+            raise ValueError(
+                f"Formula {formula.id} has no output items defined. "
+                f"Add at least one item with role='output' before starting a batch."
+            )
+
+        recipe = [
+            {
+                'item_id': fi.item_id,
+                'item_role': fi.item_role,
+                'quantity': fi.quantity,
+                'tolerance_percentage': (
+                    str(fi.tolerance_percentage) if fi.tolerance_percentage is not None else None
+                ),
+                'is_optional': bool(fi.is_optional),
+            }
+            for fi in formula_items
+        ]
+        return self.version_dao.create(session, obj_in={
+            'workspace_id': workspace_id,
+            'formula_id': formula.id,
+            'version': formula.version,
+            'base_output_quantity': base_output_quantity,
+            'estimated_duration_minutes': formula.estimated_duration_minutes,
+            'recipe': recipe,
+            'created_by': user_id,
+        })
+
+    def _store(self, key: Tuple[int, int, int], recipe: CompiledRecipe) -> None:
+        """Put a committed recipe into the LRU cache."""
+        with self._lock:
+            self._cache[key] = recipe
+            self._cache.move_to_end(key)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+
+def _cache_after_commit(session: Session) -> None:
+    """Session after_commit hook: cache the recipes snapshotted in the committed transaction."""
+    pending: Dict[Tuple[int, int, int], CompiledRecipe] = session.info.pop(PENDING_KEY, None) or {}
+    for key, recipe in pending.items():
+        formula_version_manager._store(key, recipe)
+
+
+def _discard_after_rollback(session: Session) -> None:
+    """Session after_rollback hook: drop recipes whose snapshot was rolled back."""
+    session.info.pop(PENDING_KEY, None)
+
+
+# Singleton instance
+formula_version_manager = FormulaVersionManager()
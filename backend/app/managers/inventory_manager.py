@@ -1,9 +1,10 @@
 """Inventory Manager - business logic for unified inventory"""
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from app.managers.base_manager import BaseManager
+from app.managers.ledger_posting_manager import ledger_posting_manager
 from app.models.inventory import Inventory
 from app.models.enums import InventoryTypeEnum
 from app.schemas.inventory import InventoryCreate, InventoryUpdate
@@ -19,6 +20,7 @@ class InventoryManager(BaseManager[Inventory]):
         super().__init__(Inventory)
         self.inv_dao = inventory_dao
         self.ledger_dao = inventory_ledger_dao
+        self.posting_manager = ledger_posting_manager
 
     def create_inventory(
         self, session: Session, data: InventoryCreate,
@@ -48,29 +50,28 @@ class InventoryManager(BaseManager[Inventory]):
         inv_dict = data.model_dump()
         inv_dict['workspace_id'] = workspace_id
         inv_dict['created_by'] = user_id
+        inv_dict['qty'] = 0  # Opening qty is posted through the ledger below
 
         record = self.inv_dao.create(session, obj_in=inv_dict)
 
-        # Create initial ledger entry if qty > 0
+        # Post initial ledger entry if qty > 0 (also sets the snapshot qty)
         if data.qty > 0:
-            ledger_dict = {
-                'workspace_id': workspace_id,
-                'inventory_type': data.inventory_type,
-                'factory_id': data.factory_id,
-                'item_id': data.item_id,
-                'transaction_type': 'manual_add',
-                'quantity': data.qty,
-                'unit_cost': data.avg_price,
-                'total_cost': (data.avg_price * data.qty) if data.avg_price else None,
-                'qty_before': 0,
-                'qty_after': data.qty,
-                'avg_price_before': None,
-                'avg_price_after': data.avg_price,
-                'source_type': 'manual',
-                'notes': 'Initial inventory record created',
-                'performed_by': user_id,
-            }
-            self.ledger_dao.create(session, obj_in=ledger_dict)
+            self.posting_manager.post_movements(
+                session,
+                ledger='inventory',
+                movements=[{
+                    'inventory_type': data.inventory_type,
+                    'factory_id': data.factory_id,
+                    'item_id': data.item_id,
+                    'transaction_type': 'manual_add',
+                    'quantity': data.qty,
+                    'unit_cost': data.avg_price,
+                    'source_type': 'manual',
+                    'notes': 'Initial inventory record created',
+                }],
+                workspace_id=workspace_id,
+                user_id=user_id
+            )
 
         return record
 
@@ -93,36 +94,52 @@ class InventoryManager(BaseManager[Inventory]):
                 detail="Cannot update a deleted inventory record"
             )
 
-        old_qty = record.qty
         old_avg = record.avg_price
 
         update_dict = data.model_dump(exclude_unset=True)
         update_dict['updated_by'] = user_id
 
+        # Qty changes (and the avg price set with them) go through the ledger.
+        # The adjustment is relative to the ledger balance, which the posting
+        # applies it to, so the result is new_qty even if the snapshot drifted.
+        new_qty = update_dict.pop('qty', None)
+        old_qty = record.qty
+        if new_qty is not None:
+            old_qty, _ = self.posting_manager.get_balance(
+                session,
+                ledger='inventory',
+                key={
+                    'inventory_type': record.inventory_type,
+                    'factory_id': record.factory_id,
+                    'item_id': record.item_id,
+                },
+                workspace_id=workspace_id
+            )
+        qty_changed = new_qty is not None and new_qty != old_qty
+        if new_qty is not None and not qty_changed:
+            update_dict['qty'] = new_qty  # Ledger already there; realign the snapshot
+        new_avg = update_dict.pop('avg_price', old_avg) if qty_changed else old_avg
+
         updated = self.inv_dao.update(session, db_obj=record, obj_in=update_dict)
 
-        # If qty changed, create ledger entry
-        new_qty = update_dict.get('qty')
-        if new_qty is not None and new_qty != old_qty:
-            new_avg = update_dict.get('avg_price', old_avg)
-            ledger_dict = {
-                'workspace_id': workspace_id,
-                'inventory_type': record.inventory_type,
-                'factory_id': record.factory_id,
-                'item_id': record.item_id,
-                'transaction_type': 'inventory_adjustment',
-                'quantity': abs(new_qty - old_qty),
-                'unit_cost': new_avg,
-                'total_cost': (new_avg * abs(new_qty - old_qty)) if new_avg else None,
-                'qty_before': old_qty,
-                'qty_after': new_qty,
-                'avg_price_before': old_avg,
-                'avg_price_after': new_avg,
-                'source_type': 'adjustment',
-                'notes': f'Quantity adjusted from {old_qty} to {new_qty}',
-                'performed_by': user_id,
-            }
-            self.ledger_dao.create(session, obj_in=ledger_dict)
+        if qty_changed:
+            self.posting_manager.post_movements(
+                session,
+                ledger='inventory',
+                movements=[{
+                    'inventory_type': record.inventory_type,
+                    'factory_id': record.factory_id,
+                    'item_id': record.item_id,
+                    'transaction_type': 'inventory_adjustment',
+                    'quantity': new_qty - old_qty,
+                    'avg_price_after': new_avg,
+                    'source_type': 'adjustment',
+                    'notes': f'Quantity adjusted from {old_qty} to {new_qty}',
+                }],
+                workspace_id=workspace_id,
+                user_id=user_id,
+                allow_negative=True
+            )
 
         return updated
 
@@ -155,5 +172,116 @@ class InventoryManager(BaseManager[Inventory]):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inventory record is already deleted")
         return self.inv_dao.soft_delete(session, db_obj=record, deleted_by=user_id)
 
+    # ==================== STOCK MOVEMENTS ====================
+
+    def deduct_from_storage(
+        self, session: Session, factory_id: int, items: List[Dict[str, Any]],
+        workspace_id: int, user_id: int, order_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Withdraw items from factory storage in one ledger posting.
+
+        Args:
+            session: Database session
+            factory_id: Factory to withdraw from
+            items: [{'item_id': int, 'qty': int}, ...]
+            workspace_id: Workspace ID
+            user_id: User performing the withdrawal
+            order_id: Order the withdrawal belongs to
+
+        Returns:
+            Storage ledger rows written
+
+        Raises:
+            ValueError: If any item has insufficient stock
+        """
+        return self.posting_manager.post_movements(
+            session,
+            ledger='storage',
+            movements=[
+                {
+                    'factory_id': factory_id,
+                    'item_id': item['item_id'],
+                    'transaction_type': 'consumption',
+                    'quantity': item['qty'],
+                    'source_type': 'order',
+                    'source_id': order_id,
+                    'order_id': order_id,
+                }
+                for item in items
+            ],
+            workspace_id=workspace_id,
+            user_id=user_id
+        )
+
+    def transfer_storage_to_machine(
+        self, session: Session, factory_id: int, machine_id: int,
+        items: List[Dict[str, Any]], workspace_id: int, user_id: int,
+        order_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Move items from factory storage onto a machine (STM).
+
+        Posts all transfer_out rows to the storage ledger, then all transfer_in
+        rows to the machine ledger at the storage average cost.
+
+        Args:
+            session: Database session
+            factory_id: Factory storage to transfer from
+            machine_id: Machine to transfer to
+            items: [{'item_id': int, 'qty': int}, ...]
+            workspace_id: Workspace ID
+            user_id: User performing the transfer
+            order_id: Order the transfer belongs to
+
+        Returns:
+            Machine ledger rows written
+
+        Raises:
+            ValueError: If any item has insufficient storage stock
+        """
+        storage_rows = self.posting_manager.post_movements(
+            session,
+            ledger='storage',
+            movements=[
+                {
+                    'factory_id': factory_id,
+                    'item_id': item['item_id'],
+                    'transaction_type': 'transfer_out',
+                    'quantity': item['qty'],
+                    'source_type': 'order',
+                    'source_id': order_id,
+                    'order_id': order_id,
+                    'transfer_destination_type': 'machine',
+                    'transfer_destination_id': machine_id,
+                }
+                for item in items
+            ],
+            workspace_id=workspace_id,
+            user_id=user_id
+        )
+
+        return self.posting_manager.post_movements(
+            session,
+            ledger='machine',
+            movements=[
+                {
+                    'machine_id': machine_id,
+                    'item_id': row['item_id'],
+                    'transaction_type': 'transfer_in',
+                    'quantity': row['quantity'],
+                    'unit_cost': row['unit_cost'],
+                    'source_type': 'order',
+                    'source_id': order_id,
+                    'order_id': order_id,
+                    'transfer_source_type': 'storage',
+                    'transfer_source_id': factory_id,
+                }
+                for row in storage_rows
+            ],
+            workspace_id=workspace_id,
+            user_id=user_id
+        )
+
 
 inventory_manager = InventoryManager()
@@ -3,17 +3,24 @@ Invoice Payment Manager
 
 Business logic for invoice payment operations with auto-status updates.
 """
-from typing import List, Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from decimal import Decimal
 
 from app.managers.base_manager import BaseManager
+from app.managers.account_aging_manager import account_aging_manager
+from app.managers.account_balance_manager import account_balance_manager
+from app.managers.account_period_summary_manager import account_period_summary_manager
 from app.models.invoice_payment import InvoicePayment
-from app.schemas.invoice_payment import InvoicePaymentCreate, InvoicePaymentUpdate
+from app.schemas.invoice_payment import InvoicePaymentCreate, InvoicePaymentUpdate, InvoicePaymentBatchCreate
 from app.dao.invoice_payment import invoice_payment_dao
 from app.dao.account_invoice import account_invoice_dao
-from app.utils.audit_logger import log_financial_audit, create_change_dict, extract_relevant_fields
+from app.utils.audit_logger import (
+    log_financial_audit, log_financial_audits, build_financial_audit,
+    create_change_dict, extract_relevant_fields
+)
 
 
 class InvoicePaymentManager(BaseManager[InvoicePayment]):
@@ -75,6 +82,7 @@ class InvoicePaymentManager(BaseManager[InvoicePayment]):
 
         # Capture invoice status before payment
         old_status = invoice.payment_status
+        old_balance = account_balance_manager.invoice_balance(invoice)
 
         payment = self.invoice_payment_dao.create(session, obj_in=payment_dict)
 
@@ -110,8 +118,177 @@ class InvoicePaymentManager(BaseManager[InvoicePayment]):
                         + (f", status changed to {new_status}" if old_status != new_status else "")
         )
 
+        account_balance_manager.record_changes(
+            session, workspace_id,
+            before=[old_balance], after=[account_balance_manager.invoice_balance(updated_invoice)],
+            payment_date=payment.payment_date
+        )
+        account_period_summary_manager.record_changes(
+            session, workspace_id,
+            before=[],
+            after=account_period_summary_manager.payment_entries(
+                session, workspace_id, [(invoice, payment.payment_date, payment.payment_amount)]
+            )
+        )
+        account_aging_manager.invalidate_accounts(session, workspace_id, [invoice.account_id])
+
         return payment
 
+    def create_batch_payment(
+        self,
+        session: Session,
+        batch_data: InvoicePaymentBatchCreate,
+        workspace_id: int,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """
+        Apply one remittance across many invoices.
+
+        All target invoices are locked and loaded with one query and validated
+        in memory. Payments and audit rows are bulk-inserted and paid_amount /
+        payment_status are updated with one statement. Either every allocation
+        is applied or none is.
+
+        Args:
+            session: Database session
+            batch_data: Remittance details and per-invoice allocations
+            workspace_id: Workspace ID
+            user_id: User recording the payments
+
+        Returns:
+            {'payments': [InvoicePayment], 'invoices': [AccountInvoice], 'total_amount': Decimal}
+
+        Raises:
+            HTTPException: If an invoice is not found, locked for payments,
+                allocated twice, or overpaid, or the total does not match
+        """
+        allocations = batch_data.allocations
+        invoice_ids = [allocation.invoice_id for allocation in allocations]
+
+        duplicates = sorted(i for i, count in Counter(invoice_ids).items() if count > 1)
+        if duplicates:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invoices allocated more than once: {duplicates}"
+            )
+
+        total_amount = sum((allocation.payment_amount for allocation in allocations), Decimal('0'))
+        if batch_data.total_amount is not None and batch_data.total_amount != total_amount:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Allocations ({total_amount}) do not add up to the remittance total ({batch_data.total_amount})"
+            )
+
+        # Lock and load every target invoice in one query
+        invoices = self.account_invoice_dao.get_by_ids_for_update(
+            session, ids=invoice_ids, workspace_id=workspace_id
+        )
+        invoices_by_id = {invoice.id: invoice for invoice in invoices}
+
+        missing = [i for i in invoice_ids if i not in invoices_by_id]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Invoices not found: {missing}"
+            )
+
+        # Validate in memory
+        errors = []
+        for allocation in allocations:
+            invoice = invoices_by_id[allocation.invoice_id]
+            outstanding_amount = invoice.invoice_amount - invoice.paid_amount
+            if not invoice.allow_payments:
+                errors.append(f"Invoice {invoice.id}: payments are locked")
+            elif allocation.payment_amount > outstanding_amount:
+                errors.append(
+                    f"Invoice {invoice.id}: payment amount ({allocation.payment_amount}) "
+                    f"exceeds outstanding amount ({outstanding_amount})"
+                )
+        if errors:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="; ".join(errors)
+            )
+
+        old_statuses = {invoice.id: invoice.payment_status for invoice in invoices}
+        old_balances = [account_balance_manager.invoice_balance(invoice) for invoice in invoices]
+
+        # Bulk insert payments
+        shared = batch_data.model_dump(include={
+            'payment_date', 'payment_method', 'payment_reference', 'bank_name', 'transaction_id'
+        })
+        created = self.invoice_payment_dao.create_many_returning(session, objs_in=[
+            {
+                **shared,
+                'workspace_id': workspace_id,
+                'invoice_id': allocation.invoice_id,
+                'payment_amount': allocation.payment_amount,
+                'notes': allocation.notes if allocation.notes is not None else batch_data.notes,
+                'created_by': user_id,
+            }
+            for allocation in allocations
+        ])
+        # Each invoice has exactly one allocation, so put payments back in request order
+        payments_by_invoice = {payment.invoice_id: payment for payment in created}
+        payments = [payments_by_invoice[allocation.invoice_id] for allocation in allocations]
+
+        # One UPDATE for paid_amount and payment_status of every invoice
+        self.account_invoice_dao.apply_payments(
+            session,
+            invoices=invoices,
+            workspace_id=workspace_id,
+            amounts={allocation.invoice_id: allocation.payment_amount for allocation in allocations}
+        )
+
+        # Bulk insert audit rows (same content as create_payment)
+        audit_rows = []
+        for payment in payments:
+            old_status = old_statuses[payment.invoice_id]
+            new_status = invoices_by_id[payment.invoice_id].payment_status
+            changes = {
+                'after': extract_relevant_fields(payment, ['payment_amount', 'payment_date', 'payment_method']),
+            }
+            if old_status != new_status:
+                changes['invoice_status_changed'] = {'before': old_status, 'after': new_status}
+            audit_rows.append(build_financial_audit(
+                workspace_id=workspace_id,
+                entity_type='payment',
+                entity_id=payment.id,
+                action_type='created',
+                performed_by=user_id,
+                related_entity_type='invoice',
+                related_entity_id=payment.invoice_id,
+                changes=changes,
+                description=f"Payment of ${payment.payment_amount} recorded for invoice ID {payment.invoice_id}"
+                            + (f", status changed to {new_status}" if old_status != new_status else "")
+                            + (f" (batch {batch_data.payment_reference})" if batch_data.payment_reference else "")
+            ))
+        log_financial_audits(session, audit_rows)
+
+        account_balance_manager.record_changes(
+            session, workspace_id,
+            before=old_balances,
+            after=[account_balance_manager.invoice_balance(invoice) for invoice in invoices],
+            payment_date=batch_data.payment_date
+        )
+        account_period_summary_manager.record_changes(
+            session, workspace_id,
+            before=[],
+            after=account_period_summary_manager.payment_entries(session, workspace_id, [
+                (invoices_by_id[payment.invoice_id], payment.payment_date, payment.payment_amount)
+                for payment in payments
+            ])
+        )
+        account_aging_manager.invalidate_accounts(
+            session, workspace_id, {invoice.account_id for invoice in invoices}
+        )
+
+        return {
+            'payments': payments,
+            'invoices': invoices,
+            'total_amount': total_amount,
+        }
+
     def update_payment(
         self,
         session: Session,
@@ -154,9 +331,32 @@ class InvoicePaymentManager(BaseManager[InvoicePayment]):
                 detail="Cannot change payment amount. Delete and re-create payment instead."
             )
 
+        old_payment_date = payment.payment_date
+
         # Update payment (non-amount fields only)
         update_dict = payment_data.model_dump(exclude_unset=True)
         updated_payment = self.invoice_payment_dao.update(session, db_obj=payment, obj_in=update_dict)
+
+        # Moving a payment's date can change the account's last payment date
+        if updated_payment.payment_date != old_payment_date:
+            invoice = self.account_invoice_dao.get_by_id_and_workspace(
+                session, id=updated_payment.invoice_id, workspace_id=workspace_id
+            )
+            if invoice:
+                balance = account_balance_manager.invoice_balance(invoice)
+                account_balance_manager.record_changes(
+                    session, workspace_id, before=[balance], after=[balance], refresh_dates=True
+                )
+                account_period_summary_manager.record_changes(
+                    session, workspace_id,
+                    before=account_period_summary_manager.payment_entries(
+                        session, workspace_id, [(invoice, old_payment_date, updated_payment.payment_amount)]
+                    ),
+                    after=account_period_summary_manager.payment_entries(
+                        session, workspace_id, [(invoice, updated_payment.payment_date, updated_payment.payment_amount)]
+                    )
+                )
+
         return updated_payment
 
     def get_payment(
@@ -268,6 +468,7 @@ class InvoicePaymentManager(BaseManager[InvoicePayment]):
 
         # Capture invoice status before deletion
         old_status = invoice.payment_status
+        old_balance = account_balance_manager.invoice_balance(invoice)
 
         # Audit log before deletion
         log_financial_audit(
@@ -285,6 +486,10 @@ class InvoicePaymentManager(BaseManager[InvoicePayment]):
             description=f"Payment of ${payment.payment_amount} deleted from invoice ID {invoice.id}"
         )
 
+        old_summary = account_period_summary_manager.payment_entries(
+            session, workspace_id, [(invoice, payment.payment_date, payment.payment_amount)]
+        )
+
         # Delete payment
         self.invoice_payment_dao.remove(session, id=payment_id)
 
@@ -304,6 +509,16 @@ class InvoicePaymentManager(BaseManager[InvoicePayment]):
 
         session.flush()
 
+        account_balance_manager.record_changes(
+            session, workspace_id,
+            before=[old_balance], after=[account_balance_manager.invoice_balance(invoice)],
+            refresh_dates=True
+        )
+        account_period_summary_manager.record_changes(
+            session, workspace_id, before=old_summary, after=[]
+        )
+        account_aging_manager.invalidate_accounts(session, workspace_id, [invoice.account_id])
+
         # Capture invoice status after deletion
         new_status = invoice.payment_status
 
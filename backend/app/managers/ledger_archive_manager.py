@@ -0,0 +1,327 @@
+"""Ledger Archive Manager for hot/cold partitioning of the ledger tables"""
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from datetime import datetime
+from decimal import Decimal
+from app.managers.base_manager import BaseManager
+from app.models.ledger_archive_period import LedgerArchivePeriod
+from app.models.storage_item_ledger import StorageItemLedger
+from app.models.machine_item_ledger import MachineItemLedger
+from app.models.damaged_item_ledger import DamagedItemLedger
+from app.models.project_component_item_ledger import ProjectComponentItemLedger
+from app.models.inventory_ledger import InventoryLedger
+from app.dao.ledger_archive_period import ledger_archive_period_dao, OPENING_BALANCE
+from app.schemas.ledger_archive_period import LedgerArchivePeriodCreate
+
+
+# Ledger model -> columns identifying one running balance in that ledger
+ARCHIVABLE_LEDGERS = {
+    StorageItemLedger: ('factory_id', 'item_id'),
+    MachineItemLedger: ('machine_id', 'item_id'),
+    DamagedItemLedger: ('factory_id', 'item_id'),
+    ProjectComponentItemLedger: ('project_component_id', 'item_id'),
+    InventoryLedger: ('inventory_type', 'factory_id', 'item_id'),
+}
+
+# Component cost reports SUM(total_cost) over the whole ledger, so checkpoints
+# in these ledgers carry the archived cost total forward instead of zero.
+CUMULATIVE_COST_LEDGERS = {ProjectComponentItemLedger}
+
+
+class LedgerArchiveManager(BaseManager[LedgerArchivePeriod]):
+    """
+    STANDALONE MANAGER: Moves closed ledger periods to per-year archive tables.
+
+    Archiving a workspace through year N:
+    1. Computes one opening-balance checkpoint per running balance
+       (latest archived qty/value/avg price per factory/machine/component + item)
+    2. Copies rows older than Jan 1 of N+1 into <ledger>_archive_<year> tables
+    3. Deletes the copied rows from the hot table
+    4. Inserts the checkpoints so balances and reconciliation keep working
+       from the hot table alone
+    5. Registers each archived year in ledger_archive_periods so ledger DAOs
+       can UNION the archive back in for date ranges that need it
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(LedgerArchivePeriod)
+        self.period_dao = ledger_archive_period_dao
+
+    def archive_closed_periods(
+        self,
+        session: Session,
+        workspace_id: int,
+        through_year: int,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """
+        Archive all ledger rows up to and including through_year.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            through_year: Last year to archive (must be a closed year)
+            user_id: User performing the archive
+
+        Returns:
+            Dictionary with per-ledger results:
+            {
+                'through_year': int,
+                'ledgers': {
+                    'storage_item_ledger': {'rows_archived': int, 'checkpoints_created': int, 'years': [int]},
+                    ...
+                }
+            }
+
+        Raises:
+            ValueError: If through_year is not a closed year
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        if through_year >= datetime.utcnow().year:
+            raise ValueError(
+                f"Only closed years can be archived. Year {through_year} is still open."
+            )
+
+        cutoff = datetime(through_year + 1, 1, 1)
+        results = {}
+        for model, key_columns in ARCHIVABLE_LEDGERS.items():
+            results[model.__tablename__] = self._archive_ledger(
+                session, model, key_columns, workspace_id, cutoff, user_id
+            )
+
+        return {'through_year': through_year, 'ledgers': results}
+
+    def get_archive_periods(
+        self,
+        session: Session,
+        workspace_id: int,
+        ledger_table: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[LedgerArchivePeriod]:
+        """
+        Get archived periods for a workspace.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            ledger_table: Optional ledger table name filter
+            skip: Pagination offset
+            limit: Pagination limit
+
+        Returns:
+            List of archived periods (newest year first)
+
+        Raises:
+            ValueError: If ledger_table is not an archivable ledger
+        """
+        valid_tables = {model.__tablename__ for model in ARCHIVABLE_LEDGERS}
+        if ledger_table and ledger_table not in valid_tables:
+            raise ValueError(
+                f"Invalid ledger '{ledger_table}'. Must be one of: {', '.join(sorted(valid_tables))}"
+            )
+
+        return self.period_dao.get_by_workspace(
+            session, workspace_id=workspace_id, ledger_table=ledger_table,
+            skip=skip, limit=limit
+        )
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _archive_ledger(
+        self,
+        session: Session,
+        model: Any,
+        key_columns: Tuple[str, ...],
+        workspace_id: int,
+        cutoff: datetime,
+        user_id: int
+    ) -> Dict[str, Any]:
+        """Archive one ledger's rows older than cutoff, year by year."""
+        table = model.__table__
+        in_scope = and_(table.c.workspace_id == workspace_id, table.c.performed_at < cutoff)
+        # Checkpoints from an earlier run are superseded, never archived
+        movable = and_(in_scope, table.c.transaction_type != OPENING_BALANCE)
+
+        first_at, row_count = session.execute(
+            select(func.min(table.c.performed_at), func.count()).select_from(table).where(movable)
+        ).one()
+        if not row_count:
+            return {'rows_archived': 0, 'checkpoints_created': 0, 'years': []}
+
+        last_id = session.execute(
+            select(func.max(table.c.id)).where(in_scope)
+        ).scalar()
+
+        checkpoints = self._build_checkpoints(
+            session, model, key_columns, in_scope, workspace_id, cutoff, user_id
+        )
+        checkpoints_per_year: Dict[int, int] = {}
+        for checkpoint in checkpoints:
+            year = checkpoint['performed_at'].year
+            checkpoints_per_year[year] = checkpoints_per_year.get(year, 0) + 1
+
+        column_names = [column.name for column in table.columns]
+        archived_years = []
+        for year in range(first_at.year, cutoff.year):
+            period_start = datetime(year, 1, 1)
+            period_end = datetime(year + 1, 1, 1)
+            in_year = and_(
+                movable,
+                table.c.performed_at >= period_start,
+                table.c.performed_at < period_end
+            )
+
+            year_count = session.execute(
+                select(func.count()).select_from(table).where(in_year)
+            ).scalar()
+            if not year_count:
+                continue
+
+            archive = self.period_dao.get_or_create_archive_table(
+                session, model=model, period_year=year
+            )
+            session.execute(
+                archive.insert().from_select(
+                    column_names,
+                    select(*[table.c[name] for name in column_names]).where(in_year)
+                )
+            )
+            self._register_period(
+                session, model, archive.name, workspace_id, year,
+                period_start, period_end, year_count,
+                checkpoints_per_year.get(year, 0), user_id
+            )
+            archived_years.append(year)
+
+        # Insert checkpoints before deleting so they take ids above every
+        # archived row (SQLite reuses the max rowid once it is deleted)
+        if checkpoints:
+            session.execute(table.insert(), checkpoints)
+        session.execute(table.delete().where(in_scope, table.c.id <= last_id))
+        session.flush()
+
+        return {
+            'rows_archived': row_count,
+            'checkpoints_created': len(checkpoints),
+            'years': archived_years
+        }
+
+    def _build_checkpoints(
+        self,
+        session: Session,
+        model: Any,
+        key_columns: Tuple[str, ...],
+        in_scope: Any,
+        workspace_id: int,
+        cutoff: datetime,
+        user_id: int
+    ) -> List[Dict[str, Any]]:
+        """Build one opening-balance row per running balance from its latest archived entry."""
+        table = model.__table__
+        keys = [table.c[name] for name in key_columns]
+
+        ranked = (
+            select(
+                table,
+                func.row_number().over(
+                    partition_by=keys,
+                    order_by=(table.c.performed_at.desc(), table.c.id.desc())
+                ).label('row_rank')
+            )
+            .where(in_scope)
+            .subquery()
+        )
+        latest_rows = session.execute(
+            select(ranked).where(ranked.c.row_rank == 1)
+        ).mappings().all()
+
+        cost_totals = {}
+        if model in CUMULATIVE_COST_LEDGERS:
+            totals = session.execute(
+                select(*keys, func.sum(table.c.total_cost)).where(in_scope).group_by(*keys)
+            ).all()
+            cost_totals = {tuple(row[:-1]): row[-1] for row in totals}
+
+        has_value_columns = 'value_after' in table.c
+        checkpoints = []
+        for row in latest_rows:
+            key = tuple(row[name] for name in key_columns)
+            avg_price = row['avg_price_after']
+
+            checkpoint = {name: row[name] for name in key_columns}
+            checkpoint.update({
+                'workspace_id': workspace_id,
+                'transaction_type': OPENING_BALANCE,
+                'quantity': 0,
+                'unit_cost': avg_price if avg_price is not None else Decimal('0.00'),
+                'total_cost': cost_totals.get(key) or Decimal('0.00'),
+                'qty_before': row['qty_after'],
+                'qty_after': row['qty_after'],
+                'avg_price_before': avg_price,
+                'avg_price_after': avg_price,
+                'source_type': 'archive',
+                'notes': f"Opening balance carried forward from archive (entries before {cutoff:%Y-%m-%d})",
+                'performed_by': user_id,
+                'performed_at': row['performed_at'],
+            })
+            if has_value_columns:
+                checkpoint['value_before'] = row['value_after']
+                checkpoint['value_after'] = row['value_after']
+            checkpoints.append(checkpoint)
+
+        return checkpoints
+
+    def _register_period(
+        self,
+        session: Session,
+        model: Any,
+        archive_table: str,
+        workspace_id: int,
+        year: int,
+        period_start: datetime,
+        period_end: datetime,
+        rows_archived: int,
+        checkpoints_created: int,
+        user_id: int
+    ) -> LedgerArchivePeriod:
+        """Create or extend the registry row for an archived ledger year."""
+        period = self.period_dao.get_period(
+            session, workspace_id=workspace_id,
+            ledger_table=model.__tablename__, period_year=year
+        )
+        if period:
+            return self.period_dao.update(
+                session,
+                db_obj=period,
+                obj_in={
+                    'rows_archived': period.rows_archived + rows_archived,
+                    'checkpoints_created': period.checkpoints_created + checkpoints_created,
+                    'archived_by': user_id,
+                    'archived_at': datetime.utcnow(),
+                }
+            )
+
+        return self.period_dao.create(
+            session,
+            obj_in=LedgerArchivePeriodCreate(
+                workspace_id=workspace_id,
+                ledger_table=model.__tablename__,
+                archive_table=archive_table,
+                period_year=year,
+                period_start=period_start,
+                period_end=period_end,
+                rows_archived=rows_archived,
+                checkpoints_created=checkpoints_created,
+                archived_by=user_id,
+            )
+        )
+
+
+# Singleton instance
+ledger_archive_manager = LedgerArchiveManager()
@@ -0,0 +1,421 @@
+"""Ledger Drift Manager - incremental ledger-vs-snapshot drift detection"""
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from datetime import datetime, timedelta
+from app.managers.base_manager import BaseManager
+from app.managers.ledger_posting_manager import LEDGERS
+from app.models.ledger_drift import LedgerDrift
+from app.models.ledger_drift_scan_state import LedgerDriftScanState
+from app.models.enums import InventoryTypeEnum
+from app.dao.ledger_drift import ledger_drift_dao
+from app.dao.ledger_drift_scan_state import ledger_drift_scan_state_dao
+from app.dao.ledger_archive_period import OPENING_BALANCE
+from app.schemas.ledger_drift_scan_state import LedgerDriftScanStateCreate
+
+
+# Ledgers that have a snapshot table to drift from (storage, machine, damaged, inventory)
+DRIFT_LEDGERS = {
+    spec['dao'].model.__tablename__: spec
+    for spec in LEDGERS.values()
+    if spec['snapshot_dao'] is not None
+}
+
+SNAPSHOT_MISMATCH = 'snapshot_mismatch'
+SNAPSHOT_MISSING = 'snapshot_missing'
+CHAIN_BREAK = 'chain_break'
+DRIFT_TYPES = (SNAPSHOT_MISMATCH, SNAPSHOT_MISSING, CHAIN_BREAK)
+
+# Ledger rows read per query while walking past the high-water mark
+SCAN_BATCH_SIZE = 5000
+
+# Rows younger than this are left for the next scan. IDs are handed out at
+# insert but become visible at commit, so a slow transaction can commit a
+# lower ID after a scan already moved the high-water mark past it.
+SCAN_GRACE_SECONDS = 300
+
+# (workspace, ledger) expected-balance maps kept between scans (LRU beyond this)
+CACHE_MAX_ENTRIES = 64
+
+
+class LedgerDriftManager(BaseManager[LedgerDrift]):
+    """
+    STANDALONE MANAGER: Detects drift between the ledgers and their snapshot tables.
+
+    Each scan of a ledger:
+    1. Reads only ledger rows with id above the stored high-water mark,
+       stopping at the first row younger than SCAN_GRACE_SECONDS
+    2. Carries the expected balance per (location, item) in memory, flagging
+       rows whose qty_before does not continue the previous qty_after
+    3. Compares the expected balance of every touched item (plus items with
+       open drifts) against the snapshot table in one query
+    4. Records new drifts, resolves drifts that are back in line (including
+       chain breaks whose ledger row now continues its predecessor), and
+       stores the new high-water mark with run metrics
+
+    A run therefore costs O(new ledger rows) instead of a full recompute.
+    Expected balances are kept for the CACHE_MAX_ENTRIES most recently
+    scanned ledgers; after eviction the chain check restarts from the next
+    row of each item.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(LedgerDrift)
+        self.drift_dao = ledger_drift_dao
+        self.state_dao = ledger_drift_scan_state_dao
+        # (workspace_id, ledger_table) -> {'hwm': int, 'balances': {key: (ledger id, qty_after)}}
+        self._expected_balances: "OrderedDict[Tuple[int, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def scan_workspace(
+        self,
+        session: Session,
+        workspace_id: int,
+        batch_size: int = SCAN_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Scan every snapshot-backed ledger of a workspace for drift.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            batch_size: Ledger rows read per query
+
+        Returns:
+            Dictionary with per-ledger results:
+            {
+                'ledgers': {
+                    'storage_item_ledger': {
+                        'rows_scanned': int, 'keys_checked': int, 'drifts_found': int,
+                        'drifts_resolved': int, 'last_ledger_id': int, 'duration_ms': int
+                    },
+                    ...
+                },
+                'open_drifts': int
+            }
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        results = {}
+        with self._lock:
+            for ledger_table, spec in DRIFT_LEDGERS.items():
+                results[ledger_table] = self._scan_ledger(
+                    session, ledger_table, spec, workspace_id, batch_size
+                )
+
+        open_drifts = sum(
+            len(self.drift_dao.get_open_by_ledger(session, workspace_id=workspace_id, ledger_table=name))
+            for name in DRIFT_LEDGERS
+        )
+        return {'ledgers': results, 'open_drifts': open_drifts}
+
+    def get_drifts(
+        self,
+        session: Session,
+        workspace_id: int,
+        ledger_table: Optional[str] = None,
+        drift_type: Optional[str] = None,
+        include_resolved: bool = False,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[LedgerDrift]:
+        """
+        Get recorded drifts for a workspace.
+
+        Raises:
+            ValueError: If ledger_table or drift_type is invalid
+        """
+        if ledger_table and ledger_table not in DRIFT_LEDGERS:
+            raise ValueError(
+                f"Invalid ledger '{ledger_table}'. Must be one of: {', '.join(DRIFT_LEDGERS)}"
+            )
+        if drift_type and drift_type not in DRIFT_TYPES:
+            raise ValueError(
+                f"Invalid drift type '{drift_type}'. Must be one of: {', '.join(DRIFT_TYPES)}"
+            )
+
+        return self.drift_dao.get_by_workspace(
+            session, workspace_id=workspace_id, ledger_table=ledger_table,
+            drift_type=drift_type, include_resolved=include_resolved,
+            skip=skip, limit=limit
+        )
+
+    def get_scan_metrics(self, session: Session, workspace_id: int) -> List[LedgerDriftScanState]:
+        """Get high-water marks and run metrics of every scanned ledger."""
+        return self.state_dao.get_by_workspace(session, workspace_id=workspace_id)
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _scan_ledger(
+        self,
+        session: Session,
+        ledger_table: str,
+        spec: Dict[str, Any],
+        workspace_id: int,
+        batch_size: int
+    ) -> Dict[str, Any]:
+        """Scan one ledger past its high-water mark and reconcile touched items."""
+        started = time.perf_counter()
+        table = spec['dao'].model.__table__
+        key_columns = spec['keys']
+
+        state = self.state_dao.get_by_ledger(
+            session, workspace_id=workspace_id, ledger_table=ledger_table
+        )
+        if not state:
+            state = self.state_dao.create(
+                session,
+                obj_in=LedgerDriftScanStateCreate(workspace_id=workspace_id, ledger_table=ledger_table)
+            )
+
+        # Expected balances are only reusable if they were built up to the stored
+        # high-water mark (not after a rolled back scan or another worker's scan)
+        cache_key = (workspace_id, ledger_table)
+        cache = self._expected_balances.get(cache_key)
+        if cache is None or cache['hwm'] != state.last_ledger_id:
+            cache = {'hwm': state.last_ledger_id, 'balances': {}}
+            self._expected_balances[cache_key] = cache
+        self._expected_balances.move_to_end(cache_key)
+        while len(self._expected_balances) > CACHE_MAX_ENTRIES:
+            self._expected_balances.popitem(last=False)
+        balances = cache['balances']
+
+        now = datetime.utcnow()
+        new_drifts = []
+        touched = set()
+        rows_scanned = 0
+        last_id = state.last_ledger_id
+        settled_before = now - timedelta(seconds=SCAN_GRACE_SECONDS)
+        columns = [
+            table.c.id, table.c.transaction_type, table.c.qty_before, table.c.qty_after,
+            table.c.performed_at
+        ]
+        columns += [table.c[name] for name in key_columns]
+
+        reached_unsettled = False
+        while not reached_unsettled:
+            rows = session.execute(
+                select(*columns)
+                .where(table.c.workspace_id == workspace_id, table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(batch_size)
+            ).mappings().all()
+
+            for row in rows:
+                if row['performed_at'] > settled_before:
+                    # Lower IDs may still be uncommitted; pick up from here next scan
+                    reached_unsettled = True
+                    break
+                key = tuple(row[name] for name in key_columns)
+                previous = balances.get(key)
+                if (
+                    previous is not None
+                    and row['transaction_type'] != OPENING_BALANCE
+                    and row['qty_before'] != previous[1]
+                ):
+                    new_drifts.append(self._drift_row(
+                        workspace_id, ledger_table, key_columns, key, CHAIN_BREAK,
+                        ledger_entry_id=row['id'], expected_qty=previous[1],
+                        actual_qty=row['qty_before'], now=now
+                    ))
+                balances[key] = (row['id'], row['qty_after'])
+                touched.add(key)
+                last_id = row['id']
+                rows_scanned += 1
+
+            if len(rows) < batch_size:
+                break
+
+        cache['hwm'] = last_id
+
+        # Re-check items with open snapshot drifts so fixed ones get resolved
+        open_drifts = {}
+        chain_breaks = []
+        for drift in self.drift_dao.get_open_by_ledger(
+            session, workspace_id=workspace_id, ledger_table=ledger_table
+        ):
+            if drift.drift_type == CHAIN_BREAK:
+                chain_breaks.append(drift)
+            else:
+                open_drifts[self._drift_key(key_columns, drift)] = drift
+        check_keys = touched | set(open_drifts)
+
+        # Items not seen since this process started: seed from the latest ledger
+        # entry up to the high-water mark (later rows are read by the next scan)
+        unseen = [key for key in check_keys if key not in balances]
+        for entry in spec['dao'].get_latest_by_keys(
+            session, workspace_id=workspace_id, key_columns=key_columns, keys=unseen,
+            max_id=last_id
+        ):
+            key = tuple(getattr(entry, name) for name in key_columns)
+            balances[key] = (entry.id, entry.qty_after)
+
+        snapshots = {
+            tuple(getattr(snapshot, name) for name in key_columns): snapshot
+            for snapshot in spec['snapshot_dao'].get_by_keys(
+                session, workspace_id=workspace_id, key_columns=key_columns, keys=list(check_keys)
+            )
+        }
+
+        drifts_resolved = self._recheck_chain_breaks(
+            session, table, key_columns, workspace_id, chain_breaks, now
+        )
+        for key in check_keys:
+            entry_id, expected_qty = balances.get(key, (None, 0))
+            snapshot = snapshots.get(key)
+            actual_qty = snapshot.qty if snapshot is not None else None
+
+            if snapshot is None:
+                drift_type = SNAPSHOT_MISSING if expected_qty else None
+            else:
+                drift_type = SNAPSHOT_MISMATCH if actual_qty != expected_qty else None
+
+            open_drift = open_drifts.get(key)
+            if open_drift is not None and open_drift.drift_type == drift_type:
+                open_drift.ledger_entry_id = entry_id
+                open_drift.expected_qty = expected_qty
+                open_drift.actual_qty = actual_qty
+                open_drift.discrepancy = (actual_qty or 0) - expected_qty
+                open_drift.last_checked_at = now
+                continue
+            if open_drift is not None:
+                open_drift.is_resolved = True
+                open_drift.resolved_at = now
+                open_drift.last_checked_at = now
+                drifts_resolved += 1
+            if drift_type is not None:
+                new_drifts.append(self._drift_row(
+                    workspace_id, ledger_table, key_columns, key, drift_type,
+                    ledger_entry_id=entry_id, expected_qty=expected_qty,
+                    actual_qty=actual_qty, now=now
+                ))
+
+        self.drift_dao.create_many(session, objs_in=new_drifts)
+
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        self.state_dao.update(
+            session,
+            db_obj=state,
+            obj_in={
+                'last_ledger_id': last_id,
+                'last_run_at': now,
+                'last_run_duration_ms': duration_ms,
+                'last_run_rows_scanned': rows_scanned,
+                'last_run_keys_checked': len(check_keys),
+                'last_run_drifts_found': len(new_drifts),
+                'run_count': state.run_count + 1,
+                'total_rows_scanned': state.total_rows_scanned + rows_scanned,
+                'total_drifts_found': state.total_drifts_found + len(new_drifts),
+            }
+        )
+
+        return {
+            'rows_scanned': rows_scanned,
+            'keys_checked': len(check_keys),
+            'drifts_found': len(new_drifts),
+            'drifts_resolved': drifts_resolved,
+            'last_ledger_id': last_id,
+            'duration_ms': duration_ms,
+        }
+
+    def _recheck_chain_breaks(
+        self,
+        session: Session,
+        table: Any,
+        key_columns: Tuple[str, ...],
+        workspace_id: int,
+        chain_breaks: List[LedgerDrift],
+        now: datetime
+    ) -> int:
+        """
+        Resolve chain breaks whose ledger row now continues the previous row
+        of its item (or no longer exists), in one query. Returns how many.
+        """
+        if not chain_breaks:
+            return 0
+        previous = table.alias('previous')
+        previous_qty_after = (
+            select(previous.c.qty_after)
+            .where(
+                previous.c.workspace_id == table.c.workspace_id,
+                previous.c.id < table.c.id,
+                *[previous.c[name] == table.c[name] for name in key_columns]
+            )
+            .order_by(previous.c.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        entries = {
+            row.id: (row.qty_before, row.previous_qty_after)
+            for row in session.execute(
+                select(table.c.id, table.c.qty_before, previous_qty_after.label('previous_qty_after'))
+                .where(
+                    table.c.workspace_id == workspace_id,
+                    table.c.id.in_({drift.ledger_entry_id for drift in chain_breaks})
+                )
+            )
+        }
+
+        resolved = 0
+        for drift in chain_breaks:
+            drift.last_checked_at = now
+            qty_before, previous_qty = entries.get(drift.ledger_entry_id, (None, None))
+            if previous_qty is None or qty_before == previous_qty:
+                drift.is_resolved = True
+                drift.resolved_at = now
+                resolved += 1
+        return resolved
+
+    def _drift_row(
+        self,
+        workspace_id: int,
+        ledger_table: str,
+        key_columns: Tuple[str, ...],
+        key: Tuple,
+        drift_type: str,
+        ledger_entry_id: Optional[int],
+        expected_qty: int,
+        actual_qty: Optional[int],
+        now: datetime
+    ) -> Dict[str, Any]:
+        """Build a ledger_drifts row for a balance key."""
+        values = dict(zip(key_columns, key))
+        inventory_type = values.get('inventory_type')
+        return {
+            'workspace_id': workspace_id,
+            'ledger_table': ledger_table,
+            'location_id': values.get('machine_id', values.get('factory_id')),
+            'inventory_type': inventory_type.value if inventory_type is not None else None,
+            'item_id': values['item_id'],
+            'drift_type': drift_type,
+            'ledger_entry_id': ledger_entry_id,
+            'expected_qty': expected_qty,
+            'actual_qty': actual_qty,
+            'discrepancy': (actual_qty or 0) - expected_qty,
+            'is_resolved': False,
+            'detected_at': now,
+            'last_checked_at': now,
+            'resolved_at': None,
+        }
+
+    def _drift_key(self, key_columns: Tuple[str, ...], drift: LedgerDrift) -> Tuple:
+        """Rebuild the ledger balance key a drift row was recorded for."""
+        key = []
+        for name in key_columns:
+            if name == 'item_id':
+                key.append(drift.item_id)
+            elif name == 'inventory_type':
+                key.append(InventoryTypeEnum(drift.inventory_type))
+            else:
+                key.append(drift.location_id)
+        return tuple(key)
+
+
+# Singleton instance
+ledger_drift_manager = LedgerDriftManager()
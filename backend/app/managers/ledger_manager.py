@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from datetime import datetime, date
 from decimal import Decimal
 from app.managers.base_manager import BaseManager
+from app.managers.project_cost_manager import project_cost_manager
 from app.models.storage_item_ledger import StorageItemLedger
 from app.models.machine_item_ledger import MachineItemLedger
 from app.models.damaged_item_ledger import DamagedItemLedger
@@ -703,7 +704,7 @@ class LedgerManager(BaseManager[StorageItemLedger]):
         Calculate total cost of all items consumed by a project component.
 
         Business logic:
-        - Sum total_cost from all ledger entries
+        - Read from the component's cost rollup (maintained on each posting)
         - Used for project budgeting and cost tracking
 
         Args:
@@ -714,10 +715,10 @@ class LedgerManager(BaseManager[StorageItemLedger]):
         Returns:
             Total cost (Decimal)
         """
-        return self.project_ledger_dao.calculate_total_cost_for_component(
+        return project_cost_manager.get_component_item_cost(
             session,
-            project_component_id=project_component_id,
-            workspace_id=workspace_id
+            workspace_id=workspace_id,
+            project_component_id=project_component_id
         )
 
     # ============================================================================
@@ -0,0 +1,346 @@
+"""Ledger Posting Manager - bulk posting of inventory movements to the ledgers"""
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from app.dao.storage_item_ledger import storage_item_ledger_dao
+from app.dao.machine_item_ledger import machine_item_ledger_dao
+from app.dao.damaged_item_ledger import damaged_item_ledger_dao
+from app.dao.project_component_item_ledger import project_component_item_ledger_dao
+from app.dao.inventory_ledger import inventory_ledger_dao
+from app.dao.storage_item import storage_item_dao
+from app.dao.machine_item import machine_item_dao
+from app.dao.damaged_item import damaged_item_dao
+from app.dao.inventory import inventory_dao
+from app.managers.project_cost_manager import project_cost_manager
+
+
+# Ledger name -> ledger DAO, columns identifying a running balance, and the
+# snapshot DAO kept in sync with it (None if the ledger has no snapshot table)
+LEDGERS = {
+    'storage': {
+        'dao': storage_item_ledger_dao,
+        'keys': ('factory_id', 'item_id'),
+        'snapshot_dao': storage_item_dao,
+    },
+    'machine': {
+        'dao': machine_item_ledger_dao,
+        'keys': ('machine_id', 'item_id'),
+        'snapshot_dao': machine_item_dao,
+    },
+    'damaged': {
+        'dao': damaged_item_ledger_dao,
+        'keys': ('factory_id', 'item_id'),
+        'snapshot_dao': damaged_item_dao,
+    },
+    'project': {
+        'dao': project_component_item_ledger_dao,
+        'keys': ('project_component_id', 'item_id'),
+        'snapshot_dao': None,
+    },
+    'inventory': {
+        'dao': inventory_ledger_dao,
+        'keys': ('inventory_type', 'factory_id', 'item_id'),
+        'snapshot_dao': inventory_dao,
+    },
+}
+
+# Transaction types that add to / remove from the running balance.
+# 'inventory_adjustment' takes a signed quantity (negative reduces stock).
+INBOUND_TRANSACTIONS = {'purchase_order', 'manual_add', 'transfer_in', 'production_output'}
+OUTBOUND_TRANSACTIONS = {'transfer_out', 'consumption', 'damaged'}
+ADJUSTMENT_TRANSACTIONS = {'inventory_adjustment'}
+
+# Optional movement fields copied onto the ledger row when the ledger has the column
+ATTRIBUTION_FIELDS = (
+    'source_type', 'source_id', 'order_id', 'invoice_id',
+    'transfer_source_type', 'transfer_source_id',
+    'transfer_destination_type', 'transfer_destination_id',
+    'notes', 'performed_at',
+)
+
+CENT = Decimal('0.01')
+
+
+def _money(value: Any) -> Optional[Decimal]:
+    """Convert to a 2-dp Decimal (ledger cost columns are Numeric(15, 2))."""
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+class LedgerPostingManager:
+    """
+    UTILITY MANAGER: Posts batches of inventory movements to a ledger.
+
+    Instead of one BaseDAO.create() + flush per ledger row, a posting:
+    1. Prefetches the current balance of every (location, item) in the batch
+       with one latest-entry query (falling back to the snapshot table for
+       items that have no ledger history yet)
+    2. Computes qty/value/avg price before and after for each movement in
+       memory, carrying running balances across movements of the same item
+    3. Writes all ledger rows with a single executemany INSERT
+    4. Updates the snapshot table (storage_items, machine_items, damaged_items,
+       inventory) once per touched item, or for the project ledger, the
+       project cost rollups once per touched component
+
+    Movement dicts contain the ledger's key columns (e.g. factory_id + item_id),
+    transaction_type, quantity, optional unit_cost (inbound only; defaults to
+    the current average price), optional avg_price_after (explicit revaluation)
+    and any of ATTRIBUTION_FIELDS.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def post_movements(
+        self,
+        session: Session,
+        ledger: str,
+        movements: List[Dict[str, Any]],
+        workspace_id: int,
+        user_id: Optional[int],
+        update_snapshots: bool = True,
+        allow_negative: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Post a batch of movements to one ledger.
+
+        Args:
+            session: Database session
+            ledger: Ledger name ('storage', 'machine', 'damaged', 'project', 'inventory')
+            movements: Movement dicts (see class docstring), posted in order
+            workspace_id: Workspace ID
+            user_id: User performing the movements
+            update_snapshots: Also sync the ledger's snapshot table
+            allow_negative: Allow balances to go below zero
+
+        Returns:
+            The ledger rows written, in movement order (dicts incl. qty/avg before/after)
+
+        Raises:
+            ValueError: If the ledger or a transaction type is unknown, a quantity
+                        is invalid, or stock is insufficient
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        if ledger not in LEDGERS:
+            raise ValueError(
+                f"Invalid ledger '{ledger}'. Must be one of: {', '.join(LEDGERS)}"
+            )
+        if not movements:
+            return []
+
+        spec = LEDGERS[ledger]
+        ledger_dao = spec['dao']
+        key_columns = spec['keys']
+        table = ledger_dao.model.__table__
+        has_value_columns = 'value_after' in table.c
+
+        balances, snapshots = self._prefetch_balances(session, spec, movements, workspace_id)
+
+        now = datetime.utcnow()
+        rows = []
+        for movement in movements:
+            key = tuple(movement[name] for name in key_columns)
+            delta = self._signed_quantity(movement)
+            qty_before, avg_before = balances[key]
+            qty_after = qty_before + delta
+
+            if qty_after < 0 and not allow_negative:
+                raise ValueError(
+                    f"Insufficient stock for item {movement['item_id']}: "
+                    f"available {qty_before}, requested {abs(delta)}"
+                )
+
+            if delta > 0 and movement.get('unit_cost') is not None:
+                unit_cost = _money(movement['unit_cost'])
+                if qty_before > 0 and avg_before is not None and qty_after > 0:
+                    avg_after = _money(
+                        (qty_before * avg_before + delta * unit_cost) / qty_after
+                    )
+                else:
+                    avg_after = unit_cost
+            else:
+                # Outbound and uncosted inbound movements move stock at average cost
+                unit_cost = avg_before if avg_before is not None else Decimal('0.00')
+                avg_after = avg_before
+
+            if movement.get('avg_price_after') is not None:
+                avg_after = _money(movement['avg_price_after'])
+
+            row = {name: movement[name] for name in key_columns}
+            row.update({
+                'workspace_id': workspace_id,
+                'transaction_type': movement['transaction_type'],
+                'quantity': abs(delta),
+                'unit_cost': unit_cost,
+                'total_cost': _money(unit_cost * abs(delta)),
+                'qty_before': qty_before,
+                'qty_after': qty_after,
+                'avg_price_before': avg_before,
+                'avg_price_after': avg_after,
+                'source_type': 'manual',
+                'performed_by': user_id,
+                'performed_at': now,
+            })
+            for field in ATTRIBUTION_FIELDS:
+                if field in table.c and movement.get(field) is not None:
+                    row[field] = movement[field]
+            if has_value_columns:
+                row['value_before'] = _money(qty_before * (avg_before or Decimal('0.00')))
+                row['value_after'] = _money(qty_after * (avg_after or Decimal('0.00')))
+
+            rows.append(row)
+            balances[key] = (qty_after, avg_after)
+
+        # executemany needs the same keys in every row
+        all_fields = set().union(*rows)
+        ledger_dao.create_many(
+            session, objs_in=[{field: row.get(field) for field in all_fields} for row in rows]
+        )
+
+        if ledger == 'project':
+            project_cost_manager.record_costs(
+                session, workspace_id,
+                [{'project_component_id': row['project_component_id'], 'item_cost': row['total_cost']}
+                 for row in rows]
+            )
+
+        if update_snapshots and spec['snapshot_dao'] is not None:
+            touched = {tuple(row[name] for name in key_columns) for row in rows}
+            self._sync_snapshots(
+                session, spec, {key: balances[key] for key in touched},
+                snapshots, workspace_id, user_id
+            )
+
+        session.flush()
+        return rows
+
+    def get_balance(
+        self,
+        session: Session,
+        ledger: str,
+        key: Dict[str, Any],
+        workspace_id: int
+    ) -> Tuple[int, Optional[Decimal]]:
+        """
+        Current running balance of one (location, item), as a posting would see it.
+
+        Args:
+            session: Database session
+            ledger: Ledger name with a snapshot table ('storage', 'machine', 'damaged', 'inventory')
+            key: The ledger's key columns, e.g. {'factory_id': 1, 'item_id': 2}
+            workspace_id: Workspace ID
+
+        Returns:
+            (qty, avg_price) from the latest ledger entry, else the snapshot, else (0, None)
+        """
+        spec = LEDGERS[ledger]
+        balances, _ = self._prefetch_balances(session, spec, [key], workspace_id)
+        return balances[tuple(key[name] for name in spec['keys'])]
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _signed_quantity(self, movement: Dict[str, Any]) -> int:
+        """Quantity change a movement applies to its running balance."""
+        transaction_type = movement['transaction_type']
+        quantity = movement['quantity']
+
+        if transaction_type in ADJUSTMENT_TRANSACTIONS:
+            return quantity
+        if quantity <= 0:
+            raise ValueError(
+                f"Quantity must be positive for {transaction_type} of item {movement['item_id']}"
+            )
+        if transaction_type in INBOUND_TRANSACTIONS:
+            return quantity
+        if transaction_type in OUTBOUND_TRANSACTIONS:
+            return -quantity
+        raise ValueError(f"Unsupported transaction type for posting: '{transaction_type}'")
+
+    def _prefetch_balances(
+        self,
+        session: Session,
+        spec: Dict[str, Any],
+        movements: List[Dict[str, Any]],
+        workspace_id: int
+    ) -> Tuple[Dict[Tuple, Tuple[int, Optional[Decimal]]], Dict[Tuple, Any]]:
+        """
+        Load current balances for every key in the batch.
+
+        Returns:
+            Tuple of ({key: (qty, avg_price)}, {key: snapshot row}). Balances come
+            from the latest ledger entry, or the snapshot if the key has no ledger history.
+        """
+        key_columns = spec['keys']
+        keys = list({tuple(m[name] for name in key_columns) for m in movements})
+
+        balances = {key: (0, None) for key in keys}
+        snapshots = {}
+
+        snapshot_dao = spec['snapshot_dao']
+        if snapshot_dao is not None:
+            for snapshot in snapshot_dao.get_by_keys(
+                session, workspace_id=workspace_id, key_columns=key_columns, keys=keys
+            ):
+                key = tuple(getattr(snapshot, name) for name in key_columns)
+                snapshots[key] = snapshot
+                balances[key] = (snapshot.qty, _money(getattr(snapshot, 'avg_price', None)))
+
+        # The ledger is the source of truth wherever it has history
+        for entry in spec['dao'].get_latest_by_keys(
+            session, workspace_id=workspace_id, key_columns=key_columns, keys=keys
+        ):
+            key = tuple(getattr(entry, name) for name in key_columns)
+            balances[key] = (entry.qty_after, entry.avg_price_after)
+
+        return balances, snapshots
+
+    def _sync_snapshots(
+        self,
+        session: Session,
+        spec: Dict[str, Any],
+        balances: Dict[Tuple, Tuple[int, Optional[Decimal]]],
+        snapshots: Dict[Tuple, Any],
+        workspace_id: int,
+        user_id: Optional[int]
+    ) -> None:
+        """Set snapshot qty/avg_price to the posted balances, creating missing rows and reviving soft-deleted ones."""
+        snapshot_dao = spec['snapshot_dao']
+        key_columns = spec['keys']
+        model = snapshot_dao.model
+        has_avg_price = hasattr(model, 'avg_price')
+        # storage_items / damaged_items store avg_price as Float
+        as_float = has_avg_price and model.__table__.c.avg_price.type.python_type is float
+
+        new_rows = []
+        for key, (qty, avg_price) in balances.items():
+            if has_avg_price and avg_price is not None and as_float:
+                avg_price = float(avg_price)
+            snapshot = snapshots.get(key)
+            if snapshot is not None:
+                if getattr(snapshot, 'is_deleted', False):
+                    # Stock posted to a soft-deleted row makes it visible again
+                    # (the unique key leaves no room for a second row)
+                    snapshot.is_deleted = False
+                    snapshot.deleted_at = None
+                    snapshot.deleted_by = None
+                snapshot.qty = qty
+                if has_avg_price:
+                    snapshot.avg_price = avg_price
+                continue
+
+            row = dict(zip(key_columns, key))
+            row.update({'workspace_id': workspace_id, 'qty': qty})
+            if has_avg_price:
+                row['avg_price'] = avg_price
+            if hasattr(model, 'created_by'):
+                row['created_by'] = user_id
+            new_rows.append(row)
+
+        snapshot_dao.create_many(session, objs_in=new_rows)
+
+
+# Singleton instance
+ledger_posting_manager = LedgerPostingManager()
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from app.managers.base_manager import BaseManager
+from app.managers.maintenance_planning_manager import maintenance_planning_manager
 from app.models.machine_maintenance_log import MachineMaintenanceLog
 from app.models.enums import MaintenanceTypeEnum
 from app.schemas.machine_maintenance_log import MachineMaintenanceLogCreate, MachineMaintenanceLogUpdate
@@ -15,7 +16,11 @@ from app.dao.machine import machine_dao
 
 
 class MachineMaintenanceLogManager(BaseManager[MachineMaintenanceLog]):
-    """Manager for machine maintenance log business logic."""
+    """
+    Manager for machine maintenance log business logic.
+
+    Log changes mark the machine for a maintenance due-list refresh.
+    """
 
     def __init__(self):
         super().__init__(MachineMaintenanceLog)
@@ -48,7 +53,9 @@ class MachineMaintenanceLogManager(BaseManager[MachineMaintenanceLog]):
         log_dict['workspace_id'] = workspace_id
         log_dict['created_by'] = user_id
 
-        return self.log_dao.create(session, obj_in=log_dict)
+        log = self.log_dao.create(session, obj_in=log_dict)
+        maintenance_planning_manager.invalidate_machines(session, workspace_id, [log.machine_id])
+        return log
 
     def update_log(
         self,
@@ -76,7 +83,9 @@ class MachineMaintenanceLogManager(BaseManager[MachineMaintenanceLog]):
         update_dict = log_data.model_dump(exclude_unset=True)
         update_dict['updated_by'] = user_id
 
-        return self.log_dao.update(session, db_obj=log, obj_in=update_dict)
+        updated_log = self.log_dao.update(session, db_obj=log, obj_in=update_dict)
+        maintenance_planning_manager.invalidate_machines(session, workspace_id, [log.machine_id])
+        return updated_log
 
     def get_log(
         self, session: Session, log_id: int, workspace_id: int
@@ -143,7 +152,13 @@ class MachineMaintenanceLogManager(BaseManager[MachineMaintenanceLog]):
                 detail="Maintenance log is already deleted"
             )
 
-        return self.log_dao.soft_delete(session, db_obj=log, deleted_by=user_id)
+        deleted_log = self.log_dao.soft_delete(session, db_obj=log, deleted_by=user_id)
+        maintenance_planning_manager.invalidate_machines(session, workspace_id, [log.machine_id])
+        return deleted_log
+
+    def get_due_list(self, session: Session, workspace_id: int, days: int = 7) -> dict:
+        """Get machines due for maintenance within the next `days` days (and overdue)."""
+        return maintenance_planning_manager.get_due_list(session, workspace_id, days=days)
 
 
 # Singleton instance
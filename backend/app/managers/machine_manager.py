@@ -8,6 +8,8 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
 from app.managers.base_manager import BaseManager
+from app.managers.machine_uptime_manager import machine_uptime_manager
+from app.managers.maintenance_planning_manager import maintenance_planning_manager
 from app.models.machine import Machine
 from app.models.machine_event import MachineEvent
 from app.models.enums import MachineEventTypeEnum
@@ -25,7 +27,10 @@ class MachineManager(BaseManager[Machine]):
     Handles:
     - Machine CRUD with workspace isolation and factory section validation
     - Machine event creation with automatic is_running synchronization
+      and daily uptime rollup maintenance
     - Soft delete with validation
+
+    Machine changes mark the machine for a maintenance due-list refresh.
     """
 
     def __init__(self):
@@ -83,6 +88,8 @@ class MachineManager(BaseManager[Machine]):
         machine_dict['is_running'] = False
 
         machine = self.machine_dao.create(session, obj_in=machine_dict)
+        if machine.next_maintenance_schedule is not None:
+            maintenance_planning_manager.invalidate_machines(session, workspace_id, [machine.id])
         return machine
 
     def update_machine(
@@ -142,6 +149,7 @@ class MachineManager(BaseManager[Machine]):
         update_dict['updated_by'] = user_id
 
         updated_machine = self.machine_dao.update(session, db_obj=machine, obj_in=update_dict)
+        maintenance_planning_manager.invalidate_machines(session, workspace_id, [machine_id])
         return updated_machine
 
     def get_machine(
@@ -228,6 +236,7 @@ class MachineManager(BaseManager[Machine]):
             )
 
         deleted_machine = self.machine_dao.soft_delete(session, db_obj=machine, deleted_by=user_id)
+        maintenance_planning_manager.invalidate_machines(session, workspace_id, [machine_id])
         return deleted_machine
 
     # ==================== MACHINE EVENTS ====================
@@ -243,6 +252,8 @@ class MachineManager(BaseManager[Machine]):
         Create a machine event and synchronize machine.is_running.
 
         Business rule: RUNNING -> is_running=True, all others -> is_running=False.
+        The interval closed by the event is added to the machine's daily
+        uptime rollup.
         """
         # Validate machine exists and belongs to workspace
         machine = self.machine_dao.get_by_id_and_workspace(
@@ -276,6 +287,7 @@ class MachineManager(BaseManager[Machine]):
         event_dict['created_by'] = user_id
 
         event = self.machine_event_dao.create(session, obj_in=event_dict)
+        machine_uptime_manager.record_event(session, workspace_id, latest_event, event)
 
         # Synchronize machine.is_running based on event type
         new_is_running = (event_data.event_type == MachineEventTypeEnum.RUNNING)
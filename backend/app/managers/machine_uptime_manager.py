@@ -0,0 +1,395 @@
+"""Machine Uptime Manager - state intervals, uptime and reliability from machine events"""
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from sqlalchemy.orm import Session
+from app.managers.base_manager import BaseManager
+from app.models.enums import MachineEventTypeEnum
+from app.models.machine_event import MachineEvent
+from app.models.machine_uptime_rollup import MachineUptimeRollup
+from app.dao.machine import machine_dao
+from app.dao.machine_uptime_rollup import (
+    machine_uptime_rollup_dao, STATE_COLUMNS, DOWN_STATES, ROLLUP_COLUMNS
+)
+
+
+TWO_PLACES = Decimal('0.01')
+SECONDS_PER_HOUR = 3600
+
+# (machine_id, event_type, started_at) as read by MachineUptimeRollupDAO
+EventRow = Tuple[int, MachineEventTypeEnum, datetime]
+
+
+class StateInterval(NamedTuple):
+    """Time one machine spent in one state"""
+    machine_id: int
+    event_type: MachineEventTypeEnum
+    started_at: datetime
+    ended_at: datetime
+    is_open: bool  # Latest event of the machine (still in this state)
+
+    @property
+    def duration_seconds(self) -> int:
+        return int((self.ended_at - self.started_at).total_seconds())
+
+
+def _decimal(value: Optional[float]) -> Optional[Decimal]:
+    """Round a number (or None) to a 2-place Decimal."""
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(TWO_PLACES)
+
+
+def _midnight(value: datetime) -> datetime:
+    """Start of the day of a datetime."""
+    return datetime.combine(value.date(), time.min)
+
+
+def _split_by_day(start: datetime, end: datetime) -> Iterator[Tuple[date, int]]:
+    """(day, seconds) for every day the interval [start, end) covers."""
+    while start < end:
+        segment_end = min(end, _midnight(start) + timedelta(days=1))
+        yield start.date(), int((segment_end - start).total_seconds())
+        start = segment_end
+
+
+def _transition_column(
+    previous: Optional[MachineEventTypeEnum], current: MachineEventTypeEnum
+) -> Optional[str]:
+    """'failure_count' for an up -> down change, 'repair_count' for down -> up."""
+    if previous is None:
+        return None
+    was_down, is_down = previous in DOWN_STATES, current in DOWN_STATES
+    if is_down and not was_down:
+        return 'failure_count'
+    if was_down and not is_down:
+        return 'repair_count'
+    return None
+
+
+def _closed_interval_totals(previous: EventRow, current: EventRow) -> Dict[date, Dict[str, int]]:
+    """
+    Per-day rollup deltas of the interval one event closes.
+
+    The previous event's state lasts until the current event starts; the
+    state change itself counts on the current event's day.
+    """
+    deltas: Dict[date, Dict[str, int]] = defaultdict(dict)
+    column = STATE_COLUMNS[previous[1]]
+    for day, seconds in _split_by_day(previous[2], current[2]):
+        if seconds:
+            deltas[day][column] = seconds
+    transition = _transition_column(previous[1], current[1])
+    if transition:
+        deltas[current[2].date()][transition] = 1
+    return deltas
+
+
+def _state_intervals(
+    events: Iterable[EventRow], start: datetime, end: datetime, now: datetime
+) -> Iterator[StateInterval]:
+    """
+    Convert event streams into state intervals clipped to [start, min(end, now)).
+
+    Args:
+        events: (machine_id, event_type, started_at) rows ordered by machine and time
+        start: Window start
+        end: Window end
+        now: End of the open interval of each machine's latest event
+    """
+    end = min(end, now)
+    for machine_id, stream in groupby(events, key=lambda event: event[0]):
+        stream = list(stream)
+        for index, (_, event_type, started_at) in enumerate(stream):
+            is_open = index == len(stream) - 1
+            ended_at = now if is_open else stream[index + 1][2]
+            lower, upper = max(started_at, start), min(ended_at, end)
+            if lower < upper:
+                yield StateInterval(machine_id, event_type, lower, upper, is_open)
+
+
+def _empty_totals() -> Dict[str, int]:
+    return dict.fromkeys(ROLLUP_COLUMNS, 0)
+
+
+class MachineUptimeManager(BaseManager[MachineUptimeRollup]):
+    """
+    UTILITY MANAGER: Machine state intervals, uptime and reliability.
+
+    Machine events are state changes, so a machine's events form intervals
+    from one event's started_at to the next in the state of the first.
+    Creating an event closes the previous interval, which record_event()
+    splits at midnight and adds to the machine's daily rollup rows (with
+    the up/down transition). Reports over a window read whole days from
+    the rollup in one query with the machines' current state, add the
+    still-open interval of each machine, and read raw events only for
+    partial days at the window edges.
+
+    - uptime = RUNNING, downtime = OFF + MAINTENANCE (IDLE is neither)
+    - MTBF = uptime / failures (up -> down changes)
+    - MTTR = downtime / repairs (down -> up changes)
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    GROUP_KEYS = {
+        'machine': ('machine_id', 'machine_name'),
+        'section': ('section_id', 'section_name'),
+        'factory': ('factory_id', 'factory_name'),
+    }
+
+    def __init__(self):
+        super().__init__(MachineUptimeRollup)
+        self.rollup_dao = machine_uptime_rollup_dao
+
+    def record_event(
+        self,
+        session: Session,
+        workspace_id: int,
+        previous_event: Optional[MachineEvent],
+        event: MachineEvent
+    ) -> None:
+        """
+        Add the interval closed by a new machine event to the daily rollup.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            previous_event: The machine's latest event before this one (None for the first)
+            event: Event that was just created
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        if previous_event is None:
+            return
+        deltas_by_day = _closed_interval_totals(
+            (previous_event.machine_id, previous_event.event_type, previous_event.started_at),
+            (event.machine_id, event.event_type, event.started_at)
+        )
+        if not deltas_by_day:
+            return
+
+        first_day, last_day = min(deltas_by_day), max(deltas_by_day)
+        new_rows = []
+        for day, deltas in sorted(deltas_by_day.items()):
+            # Only the first and last day can already have a row: the days in
+            # between are covered by this interval alone.
+            if day in (first_day, last_day) and self.rollup_dao.add_totals(
+                session, workspace_id=workspace_id, machine_id=event.machine_id,
+                day=day, deltas=deltas
+            ):
+                continue
+            new_rows.append({
+                'workspace_id': workspace_id,
+                'machine_id': event.machine_id,
+                'day': day,
+                **_empty_totals(),
+                **deltas,
+                'updated_at': datetime.utcnow(),
+            })
+        self.rollup_dao.create_many(session, objs_in=new_rows)
+
+    def get_intervals(
+        self,
+        session: Session,
+        workspace_id: int,
+        machine_id: int,
+        start: datetime,
+        end: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the state intervals of one machine within a window.
+
+        Raises:
+            ValueError: If the machine is not found or the window is empty
+        """
+        start, end = self._normalize_window(start, end)
+        machine = machine_dao.get_by_id_and_workspace(session, id=machine_id, workspace_id=workspace_id)
+        if not machine:
+            raise ValueError(f"Machine {machine_id} not found")
+
+        events = self.rollup_dao.get_event_streams(
+            session, workspace_id=workspace_id, start=start, end=end, machine_ids=[machine_id]
+        )
+        return [
+            {**interval._asdict(), 'duration_seconds': interval.duration_seconds}
+            for interval in _state_intervals(events, start, end, datetime.utcnow())
+        ]
+
+    def get_uptime(
+        self,
+        session: Session,
+        workspace_id: int,
+        start: datetime,
+        end: datetime,
+        group_by: str = 'machine',
+        factory_id: Optional[int] = None,
+        factory_section_id: Optional[int] = None,
+        machine_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get uptime, downtime, MTBF and MTTR per machine, section or factory.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            start: Window start (inclusive)
+            end: Window end (exclusive; time after now is not counted)
+            group_by: 'machine', 'section', 'factory' or 'total'
+            factory_id / factory_section_id / machine_id: Optional filters
+
+        Returns:
+            Dict matching MachineUptimeResponse
+
+        Raises:
+            ValueError: If the window is empty
+        """
+        start, end = self._normalize_window(start, end)
+        now = datetime.utcnow()
+
+        # Whole days come from the rollup, partial days at the edges from events
+        full_start = _midnight(start) if start == _midnight(start) else _midnight(start) + timedelta(days=1)
+        full_end = _midnight(end)
+        if full_start < full_end:
+            edges = [(lower, upper) for lower, upper in ((start, full_start), (full_end, end)) if lower < upper]
+        else:
+            full_start = full_end = start
+            edges = [(start, end)]
+
+        machines = self.rollup_dao.get_fleet_totals(
+            session,
+            workspace_id=workspace_id,
+            start_date=full_start.date(),
+            end_date=full_end.date(),
+            factory_id=factory_id,
+            factory_section_id=factory_section_id,
+            machine_id=machine_id
+        )
+        totals = {row['machine_id']: {column: int(row[column]) for column in ROLLUP_COLUMNS} for row in machines}
+
+        # Open interval of each machine's latest event (not rolled up yet)
+        if full_start < full_end:
+            for row in machines:
+                if row['latest_started_at'] is None:
+                    continue
+                lower = max(row['latest_started_at'], full_start)
+                upper = min(full_end, now)
+                if lower < upper:
+                    totals[row['machine_id']][STATE_COLUMNS[row['latest_event_type']]] += (
+                        int((upper - lower).total_seconds())
+                    )
+
+        machine_ids = list(totals)
+        for edge_start, edge_end in edges:
+            if not machine_ids or edge_start >= now:
+                continue
+            events = self.rollup_dao.get_event_streams(
+                session, workspace_id=workspace_id, start=edge_start, end=edge_end, machine_ids=machine_ids
+            )
+            for interval in _state_intervals(events, edge_start, edge_end, now):
+                totals[interval.machine_id][STATE_COLUMNS[interval.event_type]] += interval.duration_seconds
+            for machine, stream in groupby(events, key=lambda event: event[0]):
+                previous = None
+                for _, event_type, started_at in stream:
+                    column = _transition_column(previous, event_type)
+                    if column and edge_start <= started_at < edge_end:
+                        totals[machine][column] += 1
+                    previous = event_type
+
+        return {
+            'start': start,
+            'end': end,
+            'group_by': group_by,
+            'rows': self._group_rows(machines, totals, group_by),
+        }
+
+    def rebuild(self, session: Session, workspace_id: int) -> int:
+        """
+        Recompute the workspace's rollup rows from its machine events.
+
+        Returns:
+            Number of rollup rows written
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        rollup: Dict[Tuple[int, date], Dict[str, int]] = defaultdict(_empty_totals)
+        previous = None
+        for event in self.rollup_dao.get_workspace_events(session, workspace_id=workspace_id):
+            event = tuple(event)
+            if previous is not None and previous[0] == event[0]:
+                for day, deltas in _closed_interval_totals(previous, event).items():
+                    totals = rollup[(event[0], day)]
+                    for column, delta in deltas.items():
+                        totals[column] += delta
+            previous = event
+
+        updated_at = datetime.utcnow()
+        rows = [
+            {'workspace_id': workspace_id, 'machine_id': machine, 'day': day, **totals, 'updated_at': updated_at}
+            for (machine, day), totals in sorted(rollup.items())
+        ]
+        return self.rollup_dao.rebuild(session, workspace_id=workspace_id, rows=rows)
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _normalize_window(self, start: datetime, end: datetime) -> Tuple[datetime, datetime]:
+        """Convert window bounds to naive UTC (as events are stored) and reject empty windows."""
+        start, end = (
+            value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+            for value in (start, end)
+        )
+        if end <= start:
+            raise ValueError("Window end must be after its start")
+        return start, end
+
+    def _group_rows(
+        self,
+        machines: List[Dict[str, Any]],
+        totals: Dict[int, Dict[str, int]],
+        group_by: str
+    ) -> List[Dict[str, Any]]:
+        """Sum machine totals per group and derive the reported figures."""
+        id_key, name_key = self.GROUP_KEYS.get(group_by, (None, None))
+        groups: Dict[Tuple[Optional[int], Optional[str]], Dict[str, int]] = {}
+        machine_counts: Dict[Tuple[Optional[int], Optional[str]], int] = defaultdict(int)
+        for row in machines:
+            key = (row[id_key], row[name_key]) if id_key else (None, None)
+            group = groups.setdefault(key, _empty_totals())
+            for column, value in totals[row['machine_id']].items():
+                group[column] += value
+            machine_counts[key] += 1
+
+        ordered = sorted(groups.items(), key=lambda item: (item[0][1] or '', item[0][0] or 0))
+        return [
+            self._uptime_row(group_id, group_name, machine_counts[(group_id, group_name)], group)
+            for (group_id, group_name), group in ordered
+        ]
+
+    def _uptime_row(
+        self, group_id: Optional[int], group_name: Optional[str], machine_count: int, totals: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """Derive uptime ratio, MTBF and MTTR from one group's totals."""
+        uptime = totals['running_seconds']
+        downtime = totals['off_seconds'] + totals['maintenance_seconds']
+        observed = uptime + downtime + totals['idle_seconds']
+        failures, repairs = totals['failure_count'], totals['repair_count']
+        return {
+            'group_id': group_id,
+            'group_name': group_name,
+            'machine_count': machine_count,
+            **totals,
+            'uptime_seconds': uptime,
+            'downtime_seconds': downtime,
+            'observed_seconds': observed,
+            'uptime_percentage': _decimal(uptime * 100 / observed) if observed else None,
+            'mtbf_hours': _decimal(uptime / failures / SECONDS_PER_HOUR) if failures else None,
+            'mttr_hours': _decimal(downtime / repairs / SECONDS_PER_HOUR) if repairs else None,
+        }
+
+
+# Singleton instance
+machine_uptime_manager = MachineUptimeManager()
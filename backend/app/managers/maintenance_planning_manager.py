@@ -0,0 +1,378 @@
+"""Maintenance Planning Manager - predicted maintenance due dates kept in a fleet-wide min-heap"""
+import bisect
+import heapq
+import math
+import threading
+import time as clock
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.managers.base_manager import BaseManager
+from app.models.machine_maintenance_log import MachineMaintenanceLog
+from app.dao.machine import machine_dao
+from app.dao.machine_item_ledger import machine_item_ledger_dao
+from app.dao.machine_maintenance_log import machine_maintenance_log_dao
+from app.dao.machine_uptime_rollup import machine_uptime_rollup_dao
+
+
+# Due-lists are rebuilt after this long, so running hours and part
+# consumption recorded since (which do not invalidate machines) show up
+CACHE_TTL_SECONDS = 900
+
+# Workspaces kept before the least recently used is dropped
+CACHE_MAX_ENTRIES = 64
+
+# session.info key holding (workspace_id, machine_id) pairs to refresh on commit
+PENDING_KEY = 'maintenance_plan_invalidations'
+
+# Most recent maintenance intervals averaged per signal
+HISTORY_INTERVALS = 5
+
+# Days the current running-hour and part consumption rates are taken from
+RATE_DAYS = 30
+
+# Usage older than this is not read
+MAX_LOOKBACK_DAYS = 730
+
+TWO_PLACES = Decimal('0.01')
+SECONDS_PER_HOUR = 3600
+
+
+def _decimal(value: Optional[float]) -> Optional[Decimal]:
+    """Round a number (or None) to a 2-place Decimal."""
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(TWO_PLACES)
+
+
+class UsageSeries:
+    """Cumulative daily usage of one machine (running hours or consumed parts)."""
+
+    __slots__ = ('days', 'totals')
+
+    def __init__(self, daily: Iterable[Tuple[date, float]]):
+        self.days: List[date] = []
+        self.totals: List[float] = []
+        total = 0.0
+        for day, amount in daily:
+            total += float(amount)
+            self.days.append(day)
+            self.totals.append(total)
+
+    def before(self, day: date) -> float:
+        """Usage on days before `day`."""
+        index = bisect.bisect_left(self.days, day)
+        return self.totals[index - 1] if index else 0.0
+
+    def between(self, start: date, end: date) -> float:
+        """Usage on days in [start, end)."""
+        return self.before(end) - self.before(start)
+
+    def crossing(self, start: date, amount: float) -> Optional[date]:
+        """First day on which the usage counted from `start` reaches `amount`."""
+        index = bisect.bisect_left(self.totals, self.before(start) + amount)
+        return self.days[index] if index < len(self.days) else None
+
+
+def _usage_signal(
+    series: UsageSeries, dates: List[date], today: date, lookback: date
+) -> Optional[Tuple[float, float, Optional[date]]]:
+    """
+    (average usage between maintenances, usage since the last one, due date).
+
+    Due is the day the usage since the last maintenance reached the
+    average, else today plus the days the current rate needs to reach it.
+    """
+    intervals = [(start, end) for start, end in zip(dates, dates[1:]) if start >= lookback]
+    intervals = intervals[-HISTORY_INTERVALS:]
+    if not intervals:
+        return None
+    baseline = sum(series.between(start, end) for start, end in intervals) / len(intervals)
+    if baseline <= 0:
+        return None
+
+    tomorrow = today + timedelta(days=1)
+    since = series.between(dates[-1], tomorrow)
+    if since >= baseline:
+        return baseline, since, series.crossing(dates[-1], baseline)
+    rate = series.between(tomorrow - timedelta(days=RATE_DAYS), tomorrow) / RATE_DAYS
+    if rate <= 0:
+        return baseline, since, None
+    return baseline, since, today + timedelta(days=math.ceil((baseline - since) / rate))
+
+
+class DueList:
+    """
+    Min-heap of (due_date, machine_id) over one workspace's fleet.
+
+    Machines refreshed after a change get a new heap entry; their old entry
+    stays in the heap and is skipped (it no longer matches the machine's
+    plan) until the heap is compacted.
+    """
+
+    __slots__ = ('as_of', 'built_at', 'lookback', 'heap', 'plans', 'dirty')
+
+    def __init__(self, as_of: date, lookback: date, plans: Iterable[Dict[str, Any]]):
+        self.as_of = as_of
+        self.built_at = clock.monotonic()
+        self.lookback = lookback
+        self.plans: Dict[int, Dict[str, Any]] = {plan['machine_id']: plan for plan in plans}
+        self.heap: List[Tuple[date, int]] = [(plan['due_date'], machine_id) for machine_id, plan in self.plans.items()]
+        heapq.heapify(self.heap)
+        self.dirty: Set[int] = set()
+
+    def replace(self, machine_ids: Iterable[int], plans: Iterable[Dict[str, Any]]) -> None:
+        """Replace the plans of some machines (machines without a new plan drop out)."""
+        for machine_id in machine_ids:
+            self.plans.pop(machine_id, None)
+        for plan in plans:
+            self.plans[plan['machine_id']] = plan
+            heapq.heappush(self.heap, (plan['due_date'], plan['machine_id']))
+        if len(self.heap) > 2 * len(self.plans) + 16:
+            self.heap = [(plan['due_date'], machine_id) for machine_id, plan in self.plans.items()]
+            heapq.heapify(self.heap)
+
+    def due_until(self, cutoff: date) -> Iterator[Dict[str, Any]]:
+        """
+        Plans due on or before cutoff, earliest first.
+
+        Walks the heap from its root with a second heap of frontier nodes, so
+        the k plans returned cost O(k log k) without popping the due-list.
+        """
+        heap = self.heap
+        frontier = [(heap[0], 0)] if heap else []
+        emitted: Set[int] = set()
+        while frontier:
+            (due_date, machine_id), index = heapq.heappop(frontier)
+            if due_date > cutoff:
+                continue  # Its whole subtree is due later
+            plan = self.plans.get(machine_id)
+            if plan is not None and plan['due_date'] == due_date and machine_id not in emitted:
+                emitted.add(machine_id)
+                yield plan
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+
+
+class MaintenancePlanningManager(BaseManager[MachineMaintenanceLog]):
+    """
+    UTILITY MANAGER: Predicted maintenance due dates across the fleet.
+
+    A machine's next maintenance is due at the earliest of three signals,
+    each taken from its most recent maintenance intervals:
+    - calendar: last maintenance + the average days between maintenances
+    - running_hours: when running hours since the last maintenance (daily
+      uptime rollup) reach the average between maintenances
+    - parts: same with parts consumed (machine_item_ledger consumption)
+    A hand-set next_maintenance_schedule later than the last maintenance
+    takes precedence ('scheduled').
+
+    Due dates are kept per workspace in a cached min-heap (DueList).
+    Maintenance log and machine changes mark their machine for refresh
+    after commit; the next request recomputes only those machines.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(MachineMaintenanceLog)
+        # workspace_id -> DueList
+        self._cache: "OrderedDict[int, DueList]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_due_list(self, session: Session, workspace_id: int, days: int = 7) -> Dict[str, Any]:
+        """
+        Get machines due for maintenance within the next `days` days (and overdue).
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            days: Horizon in days from today
+
+        Returns:
+            Dict matching MaintenanceDueListResponse
+        """
+        today = datetime.utcnow().date()
+        with self._lock:
+            due_list = self._cache.get(workspace_id)
+            if due_list is not None and (
+                due_list.as_of != today or clock.monotonic() - due_list.built_at > CACHE_TTL_SECONDS
+            ):
+                due_list = None
+            dirty = set()
+            if due_list is not None:
+                self._cache.move_to_end(workspace_id)
+                dirty, due_list.dirty = due_list.dirty, set()
+
+        if due_list is None:
+            lookback, plans = self._plan(session, workspace_id, today)
+            due_list = DueList(today, lookback, plans)
+            self._store(workspace_id, due_list)
+        elif dirty:
+            _, plans = self._plan(session, workspace_id, today, lookback=due_list.lookback, machine_ids=sorted(dirty))
+            with self._lock:
+                due_list.replace(dirty, plans)
+
+        cutoff = today + timedelta(days=days)
+        with self._lock:
+            items = [
+                {**plan, 'days_until_due': (plan['due_date'] - today).days}
+                for plan in due_list.due_until(cutoff)
+            ]
+            machine_count = len(due_list.plans)
+        return {'as_of': today, 'days': days, 'machine_count': machine_count, 'items': items}
+
+    def invalidate_machines(self, session: Session, workspace_id: int, machine_ids: Iterable[int]) -> None:
+        """
+        Refresh the due dates of some machines once the session commits.
+
+        Call after changing a machine's maintenance logs or its schedule.
+        """
+        session.info.setdefault(PENDING_KEY, set()).update(
+            (workspace_id, machine_id) for machine_id in machine_ids
+        )
+        if not event.contains(session, 'after_commit', _invalidate_after_commit):
+            event.listen(session, 'after_commit', _invalidate_after_commit)
+            event.listen(session, 'after_rollback', _discard_after_rollback)
+
+    def clear_cache(self) -> None:
+        """Drop all cached due-lists."""
+        with self._lock:
+            self._cache.clear()
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _plan(
+        self,
+        session: Session,
+        workspace_id: int,
+        today: date,
+        lookback: Optional[date] = None,
+        machine_ids: Optional[Sequence[int]] = None
+    ) -> Tuple[date, List[Dict[str, Any]]]:
+        """
+        Compute the plans of a workspace's machines (or some of them).
+
+        Four queries: machines, maintenance dates, daily running time and
+        daily part consumption from the lookback day on. Without a lookback
+        it is the earliest day the averaged intervals need (at least
+        RATE_DAYS, at most MAX_LOOKBACK_DAYS back).
+
+        Returns:
+            (lookback, plans of machines that have a due date)
+        """
+        machines = machine_dao.get_planning_rows(session, workspace_id=workspace_id, machine_ids=machine_ids)
+        history: Dict[int, List[date]] = defaultdict(list)
+        for machine_id, maintenance_date in machine_maintenance_log_dao.get_history_dates(
+            session, workspace_id=workspace_id, machine_ids=machine_ids
+        ):
+            history[machine_id].append(maintenance_date)
+
+        if lookback is None:
+            lookback = today - timedelta(days=RATE_DAYS)
+            for dates in history.values():
+                lookback = min(lookback, dates[max(len(dates) - HISTORY_INTERVALS - 1, 0)])
+            lookback = max(lookback, today - timedelta(days=MAX_LOOKBACK_DAYS))
+
+        running: Dict[int, List[Tuple[date, float]]] = defaultdict(list)
+        for machine_id, day, seconds in machine_uptime_rollup_dao.get_daily_running(
+            session, workspace_id=workspace_id, start_date=lookback, machine_ids=machine_ids
+        ):
+            running[machine_id].append((day, seconds / SECONDS_PER_HOUR))
+        parts: Dict[int, List[Tuple[date, float]]] = defaultdict(list)
+        for machine_id, day, quantity in machine_item_ledger_dao.get_daily_consumption(
+            session, workspace_id=workspace_id,
+            start_date=datetime.combine(lookback, time.min), machine_ids=machine_ids
+        ):
+            parts[machine_id].append((date.fromisoformat(day) if isinstance(day, str) else day, quantity))
+
+        plans = []
+        for machine_id, name, section_id, scheduled in machines:
+            plan = self._machine_plan(
+                history.get(machine_id, []), UsageSeries(running.get(machine_id, ())),
+                UsageSeries(parts.get(machine_id, ())), scheduled, today, lookback
+            )
+            if plan is not None:
+                plans.append({'machine_id': machine_id, 'machine_name': name, 'factory_section_id': section_id, **plan})
+        return lookback, plans
+
+    def _machine_plan(
+        self,
+        dates: List[date],
+        running: UsageSeries,
+        parts: UsageSeries,
+        scheduled: Optional[date],
+        today: date,
+        lookback: date
+    ) -> Optional[Dict[str, Any]]:
+        """Signals and due date of one machine (None without any signal)."""
+        plan: Dict[str, Any] = {'last_maintenance_date': dates[-1] if dates else None, 'scheduled_date': scheduled}
+        signals: Dict[str, date] = {}
+
+        if len(dates) >= 2:
+            gaps = [(end - start).days for start, end in zip(dates, dates[1:])][-HISTORY_INTERVALS:]
+            avg_gap = sum(gaps) / len(gaps)
+            signals['calendar'] = dates[-1] + timedelta(days=round(avg_gap))
+            plan.update(calendar_due_date=signals['calendar'], avg_interval_days=_decimal(avg_gap))
+
+            usage = _usage_signal(running, dates, today, lookback)
+            if usage is not None:
+                baseline, since, due_date = usage
+                plan.update(
+                    running_hours_due_date=due_date,
+                    running_hours_since=_decimal(since),
+                    avg_running_hours_between=_decimal(baseline)
+                )
+                if due_date is not None:
+                    signals['running_hours'] = due_date
+
+            usage = _usage_signal(parts, dates, today, lookback)
+            if usage is not None:
+                baseline, since, due_date = usage
+                plan.update(
+                    parts_due_date=due_date,
+                    parts_consumed_since=int(since),
+                    avg_parts_between=_decimal(baseline)
+                )
+                if due_date is not None:
+                    signals['parts'] = due_date
+
+        if scheduled is not None and (not dates or scheduled > dates[-1]):
+            plan.update(due_date=scheduled, basis='scheduled')
+        elif signals:
+            basis = min(signals, key=lambda name: signals[name])
+            plan.update(due_date=signals[basis], basis=basis)
+        else:
+            return None
+        return plan
+
+    def _store(self, workspace_id: int, due_list: DueList) -> None:
+        """Put a due-list into the LRU cache."""
+        with self._lock:
+            self._cache[workspace_id] = due_list
+            self._cache.move_to_end(workspace_id)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    """Session after_commit hook: mark the machines changed in the committed transaction for refresh."""
+    pending = session.info.pop(PENDING_KEY, None) or ()
+    with maintenance_planning_manager._lock:
+        for workspace_id, machine_id in pending:
+            due_list = maintenance_planning_manager._cache.get(workspace_id)
+            if due_list is not None:
+                due_list.dirty.add(machine_id)
+
+
+def _discard_after_rollback(session: Session) -> None:
+    """Session after_rollback hook: nothing changed, nothing to refresh."""
+    session.info.pop(PENDING_KEY, None)
+
+
+# Singleton instance
+maintenance_planning_manager = MaintenancePlanningManager()
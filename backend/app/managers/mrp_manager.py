@@ -0,0 +1,423 @@
+"""MRP Manager - cached formula dependency graph and multi-level requirement explosion"""
+import math
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from app.managers.base_manager import BaseManager
+from app.models.production_formula import ProductionFormula
+from app.models.production_formula_item import ProductionFormulaItem
+from app.dao.inventory import inventory_dao
+from app.dao.production_batch import production_batch_dao
+from app.dao.production_formula_item import production_formula_item_dao
+from app.dao.production_line import production_line_dao
+from app.dao.storage_item import storage_item_dao
+
+
+# Graphs are rebuilt after this long, so formula edits made by other
+# processes (which cannot bump this process's versions) show up
+CACHE_TTL_SECONDS = 600
+
+# Workspaces kept before the least recently used is dropped
+CACHE_MAX_ENTRIES = 256
+
+# session.info key holding workspace IDs to invalidate on commit
+PENDING_KEY = 'mrp_graph_invalidations'
+
+
+class FormulaGraph:
+    """
+    Immutable formula dependency graph of one workspace.
+
+    Nodes are items; an item that is the output of an active formula has
+    edges to that formula's (non-optional) inputs. When several formulas
+    make the same item, the default formula wins, then the highest version,
+    then the lowest ID. Items get a low-level code (longest path from any
+    top item of a plan) so each item is netted once, after all of its
+    parents. Items on or below a cycle have no level.
+    """
+
+    __slots__ = ('workspace_id', 'version', 'inputs', 'outputs', 'producers', 'edges', 'cycles')
+
+    def __init__(
+        self,
+        workspace_id: int,
+        version: int,
+        rows: Iterable[Tuple[int, bool, int, int, str, int, bool]]
+    ):
+        self.workspace_id = workspace_id
+        self.version = version
+        inputs: Dict[int, Dict[int, int]] = defaultdict(dict)
+        outputs: Dict[int, Dict[int, int]] = defaultdict(dict)
+        rank: Dict[int, Tuple[bool, int, int]] = {}
+        for formula_id, is_default, version_no, item_id, item_role, quantity, is_optional in rows:
+            rank[formula_id] = (not is_default, -(version_no or 0), formula_id)
+            if item_role == 'input' and not is_optional:
+                inputs[formula_id][item_id] = inputs[formula_id].get(item_id, 0) + (quantity or 0)
+            elif item_role == 'output':
+                outputs[formula_id][item_id] = outputs[formula_id].get(item_id, 0) + (quantity or 0)
+
+        # formula_id -> {item_id: quantity per base run}
+        self.inputs: Dict[int, Dict[int, int]] = dict(inputs)
+        self.outputs: Dict[int, Dict[int, int]] = {
+            formula_id: items for formula_id, items in outputs.items() if sum(items.values()) > 0
+        }
+
+        # item_id -> formula_id that makes it
+        self.producers: Dict[int, int] = {}
+        for formula_id in sorted(self.outputs, key=rank.__getitem__):
+            for item_id, quantity in self.outputs[formula_id].items():
+                if quantity > 0:
+                    self.producers.setdefault(item_id, formula_id)
+
+        # item_id -> input items of its producing formula
+        self.edges: Dict[int, Tuple[int, ...]] = {
+            item_id: tuple(self.inputs.get(formula_id, ()))
+            for item_id, formula_id in self.producers.items()
+        }
+        self.cycles: Tuple[Tuple[int, ...], ...] = _find_cycles(self.edges)
+
+    def base_output(self, formula_id: int) -> int:
+        """Total output quantity of one base run of a formula (0 if unknown)"""
+        return sum(self.outputs.get(formula_id, {}).values())
+
+    def components(self, formula_id: int) -> Dict[int, int]:
+        """Required input quantities of one base run of a formula"""
+        return self.inputs.get(formula_id, {})
+
+    def reachable_items(self, formula_ids: Iterable[int]) -> Set[int]:
+        """All items needed, at any level, to run the given formulas"""
+        seen: Set[int] = set()
+        stack = [item_id for formula_id in formula_ids for item_id in self.components(formula_id)]
+        while stack:
+            item_id = stack.pop()
+            if item_id in seen:
+                continue
+            seen.add(item_id)
+            producer = self.producers.get(item_id)
+            if producer is not None:
+                stack.extend(self.components(producer))
+        return seen
+
+    def low_level_codes(self, item_ids: Set[int]) -> Dict[int, int]:
+        """
+        Low-level codes within a set of items closed under their inputs
+        (e.g. reachable_items()); items on or below a cycle are left out.
+        """
+        return _low_level_codes({
+            item_id: self.edges[item_id] for item_id in item_ids if item_id in self.edges
+        }, item_ids)
+
+    def cycles_through(self, item_ids: Set[int]) -> List[Tuple[int, ...]]:
+        """Cycles of the graph that pass through any of the given items"""
+        return [cycle for cycle in self.cycles if item_ids.intersection(cycle)]
+
+
+class MRPManager(BaseManager[ProductionFormula]):
+    """
+    UTILITY MANAGER: Material requirements planning over production formulas.
+
+    get_graph() builds the workspace's formula dependency graph from one
+    query and keeps it in an LRU cache; writes to formulas and formula items
+    are caught with ORM mapper events and bump the workspace's version (once
+    at flush and again after commit).
+
+    plan() explodes planned batches level by level: requirements of all
+    factories are aggregated per (factory, item) with exact fractions, each
+    item is netted once against storage + STORAGE inventory (two grouped
+    queries for the whole run), and net requirements of producible items are
+    exploded through their producing formula. What remains is the shortage.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(ProductionFormula)
+        # workspace_id -> (version, loaded_at, FormulaGraph)
+        self._cache: "OrderedDict[int, Tuple[int, float, FormulaGraph]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get_graph(self, session: Session, workspace_id: int) -> FormulaGraph:
+        """
+        Get a workspace's formula dependency graph (from cache when current).
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+
+        Returns:
+            FormulaGraph snapshot
+        """
+        with self._lock:
+            version = self._versions.get(workspace_id, 0)
+            cached = self._cache.get(workspace_id)
+            if (
+                cached is not None
+                and cached[0] == version
+                and time.monotonic() - cached[1] <= CACHE_TTL_SECONDS
+            ):
+                self._cache.move_to_end(workspace_id)
+                return cached[2]
+
+        graph = FormulaGraph(
+            workspace_id,
+            version,
+            production_formula_item_dao.get_graph_rows(session, workspace_id=workspace_id)
+        )
+
+        with self._lock:
+            # Only cache if no write invalidated the workspace while loading
+            if self._versions.get(workspace_id, 0) == version:
+                self._cache[workspace_id] = (version, time.monotonic(), graph)
+                self._cache.move_to_end(workspace_id)
+                while len(self._cache) > CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        return graph
+
+    def plan(
+        self,
+        session: Session,
+        workspace_id: int,
+        batches: List[dict],
+        include_draft_batches: bool = False
+    ) -> dict:
+        """
+        Explode planned batches into netted requirements and shortages per factory.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            batches: Planned batches (formula_id or item_id, factory_id or
+                production_line_id, optional output quantity)
+            include_draft_batches: Also plan the workspace's draft batches
+
+        Returns:
+            Dict with 'factories' (requirements and shortages per factory)
+            and 'cycles' (item cycles found in the formula graph)
+
+        Raises:
+            ValueError: If a formula, item or line is unknown, or the
+                explosion runs into a formula cycle
+        """
+        graph = self.get_graph(session, workspace_id)
+
+        # (factory_id, formula_id, output quantity) per batch
+        runs: List[Tuple[int, int, Fraction]] = []
+        for batch in batches:
+            runs.append(self._resolve_batch(session, workspace_id, graph, batch))
+        if include_draft_batches:
+            for batch_id, formula_id, factory_id, quantity in production_batch_dao.get_planned_rows(
+                session, workspace_id=workspace_id
+            ):
+                if graph.base_output(formula_id) == 0:
+                    continue  # Inactive formula or no outputs
+                runs.append((factory_id, formula_id, Fraction(quantity or graph.base_output(formula_id))))
+
+        # Gross requirements of the planned runs' inputs
+        gross: Dict[Tuple[int, int], Fraction] = defaultdict(Fraction)
+        for factory_id, formula_id, quantity in runs:
+            self._explode(graph, gross, factory_id, formula_id, quantity / graph.base_output(formula_id))
+
+        factory_ids = {factory_id for factory_id, _, _ in runs}
+        item_ids = graph.reachable_items({formula_id for _, formula_id, _ in runs})
+        # Levels cover only what this plan reaches, so a cycle elsewhere in
+        # the workspace does not block it
+        levels = graph.low_level_codes(item_ids)
+        if len(levels) < len(item_ids):
+            cycles = graph.cycles_through(item_ids)
+            path = ' -> '.join(str(item_id) for item_id in cycles[0]) if cycles else 'unknown'
+            raise ValueError(
+                f"The planned formulas run into a formula cycle (items {path}); "
+                f"fix the formulas before planning"
+            )
+
+        available = storage_item_dao.get_quantities(
+            session, workspace_id=workspace_id, factory_ids=factory_ids, item_ids=item_ids
+        )
+        for key, quantity in inventory_dao.get_quantities(
+            session, workspace_id=workspace_id, factory_ids=factory_ids, item_ids=item_ids
+        ).items():
+            available[key] = available.get(key, 0) + quantity
+
+        # Net level by level: every parent of an item has a lower level, so
+        # its gross requirement is complete when the item's level is reached
+        requirements: Dict[int, List[dict]] = defaultdict(list)
+        by_level: Dict[int, List[int]] = defaultdict(list)
+        for item_id in item_ids:
+            by_level[levels[item_id]].append(item_id)
+        for level in sorted(by_level):
+            for item_id in sorted(by_level[level]):
+                producer = graph.producers.get(item_id)
+                for factory_id in sorted(factory_ids):
+                    required = gross.get((factory_id, item_id))
+                    if not required:
+                        continue
+                    gross_quantity = math.ceil(required)
+                    on_hand = max(available.get((factory_id, item_id), 0), 0)
+                    net_quantity = max(gross_quantity - on_hand, 0)
+                    planned_quantity = 0
+                    if net_quantity and producer is not None:
+                        planned_quantity = net_quantity
+                        self._explode(
+                            graph, gross, factory_id, producer,
+                            Fraction(net_quantity, graph.outputs[producer][item_id])
+                        )
+                    requirements[factory_id].append({
+                        'item_id': item_id,
+                        'level': level,
+                        'gross_quantity': gross_quantity,
+                        'available_quantity': on_hand,
+                        'net_quantity': net_quantity,
+                        'producing_formula_id': producer,
+                        'planned_production_quantity': planned_quantity,
+                        'shortage_quantity': net_quantity - planned_quantity,
+                    })
+
+        return {
+            'factories': [
+                {
+                    'factory_id': factory_id,
+                    'requirements': requirements[factory_id],
+                    'shortages': [r for r in requirements[factory_id] if r['shortage_quantity'] > 0],
+                }
+                for factory_id in sorted(factory_ids)
+            ],
+            'cycles': [list(cycle) for cycle in graph.cycles],
+        }
+
+    def invalidate_workspace(self, session: Optional[Session], workspace_id: int) -> None:
+        """
+        Make a workspace's cached formula graph stale.
+
+        The version is bumped now and, when a session is given, once more
+        after it commits.
+        """
+        self._bump(workspace_id)
+        if session is None:
+            return
+        session.info.setdefault(PENDING_KEY, set()).add(workspace_id)
+        if not event.contains(session, 'after_commit', _invalidate_after_commit):
+            event.listen(session, 'after_commit', _invalidate_after_commit)
+
+    def clear_cache(self) -> None:
+        """Drop all cached formula graphs."""
+        with self._lock:
+            self._cache.clear()
+
+    def _bump(self, workspace_id: int) -> None:
+        """Increase a workspace's version number."""
+        with self._lock:
+            self._versions[workspace_id] = self._versions.get(workspace_id, 0) + 1
+
+    def _resolve_batch(
+        self, session: Session, workspace_id: int, graph: FormulaGraph, batch: dict
+    ) -> Tuple[int, int, Fraction]:
+        """Turn a planned batch into (factory_id, formula_id, output quantity)."""
+        formula_id = batch.get('formula_id')
+        if formula_id is None:
+            formula_id = graph.producers.get(batch['item_id'])
+            if formula_id is None:
+                raise ValueError(f"No active formula produces item {batch['item_id']}")
+        elif graph.base_output(formula_id) == 0:
+            raise ValueError(f"Formula {formula_id} not found, inactive or without output items")
+
+        factory_id = batch.get('factory_id')
+        if factory_id is None:
+            line = production_line_dao.get_by_id_and_workspace(
+                session, id=batch['production_line_id'], workspace_id=workspace_id
+            )
+            if not line:
+                raise ValueError(f"Production line {batch['production_line_id']} not found")
+            factory_id = line.factory_id
+
+        quantity = batch.get('quantity')
+        if quantity is None:
+            quantity = graph.base_output(formula_id)
+        elif batch.get('formula_id') is None:
+            # Quantity of the requested item: scale to the formula's total output
+            quantity = Fraction(quantity * graph.base_output(formula_id), graph.outputs[formula_id][batch['item_id']])
+        return factory_id, formula_id, Fraction(quantity)
+
+    @staticmethod
+    def _explode(
+        graph: FormulaGraph,
+        gross: Dict[Tuple[int, int], Fraction],
+        factory_id: int,
+        formula_id: int,
+        runs: Fraction
+    ) -> None:
+        """Add the inputs of `runs` base runs of a formula to the gross requirements."""
+        for item_id, quantity in graph.components(formula_id).items():
+            gross[(factory_id, item_id)] += quantity * runs
+
+
+def _low_level_codes(edges: Dict[int, Tuple[int, ...]], item_ids: Iterable[int] = ()) -> Dict[int, int]:
+    """Longest-path level of every item (Kahn's algorithm); items on or below cycles are left out."""
+    indegree: Dict[int, int] = defaultdict(int)
+    for item_id in item_ids:
+        indegree.setdefault(item_id, 0)
+    for parent, children in edges.items():
+        indegree.setdefault(parent, 0)
+        for child in children:
+            indegree[child] += 1
+    levels = {item_id: 0 for item_id, degree in indegree.items() if degree == 0}
+    queue = list(levels)
+    while queue:
+        parent = queue.pop()
+        for child in edges.get(parent, ()):
+            levels[child] = max(levels.get(child, 0), levels[parent] + 1)
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                queue.append(child)
+    return {item_id: level for item_id, level in levels.items() if indegree[item_id] == 0}
+
+
+def _find_cycles(edges: Dict[int, Tuple[int, ...]]) -> Tuple[Tuple[int, ...], ...]:
+    """One item path per back edge found by an iterative depth-first search."""
+    WHITE, GREY, BLACK = 0, 1, 2
+    color: Dict[int, int] = defaultdict(int)
+    cycles: List[Tuple[int, ...]] = []
+    for root in sorted(edges):
+        if color[root] != WHITE:
+            continue
+        path: List[int] = [root]
+        stack = [iter(edges.get(root, ()))]
+        color[root] = GREY
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                color[path.pop()] = BLACK
+                stack.pop()
+            elif color[child] == GREY:
+                cycles.append(tuple(path[path.index(child):]) + (child,))
+            elif color[child] == WHITE:
+                color[child] = GREY
+                path.append(child)
+                stack.append(iter(edges.get(child, ())))
+    return tuple(cycles)
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    """Session after_commit hook: bump the workspaces written in the committed transaction."""
+    workspace_ids = session.info.pop(PENDING_KEY, None)
+    for workspace_id in workspace_ids or ():
+        mrp_manager._bump(workspace_id)
+
+
+def _invalidate_on_write(mapper, connection, target) -> None:
+    """Mapper after_insert/update/delete hook for formulas and formula items."""
+    if target.workspace_id is not None:
+        mrp_manager.invalidate_workspace(object_session(target), target.workspace_id)
+
+
+for _model in (ProductionFormula, ProductionFormulaItem):
+    for _event_name in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(_model, _event_name, _invalidate_on_write)
+
+
+# Singleton instance
+mrp_manager = MRPManager()
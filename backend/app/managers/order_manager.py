@@ -5,9 +5,14 @@ from app.managers.base_manager import BaseManager
 from app.models.order import Order
 from app.dao.order import order_dao
 from app.dao.order_item import order_item_dao
+from app.managers.reference_data_manager import reference_data_manager
 from app.schemas.order import OrderCreate, OrderUpdate
 from app.schemas.order_item import OrderItemCreate
 
+# Statuses (by name, see seed_default_statuses) used for orders without a (known) workflow
+DEFAULT_WITHDRAWN_STATUS = 'Budget Approved'
+DEFAULT_COMPLETED_STATUS = 'Completed'
+
 class OrderManager(BaseManager[Order]):
     """
     AGGREGATE MANAGER: Manages Order aggregate root.
@@ -16,6 +21,7 @@ class OrderManager(BaseManager[Order]):
 
     Business rules:
     - Order MUST have at least one item
+    - Status changes MUST follow the order's workflow (cached workflow graph)
 
     Does NOT commit transactions - that's the service layer's responsibility.
     """
@@ -77,22 +83,28 @@ class OrderManager(BaseManager[Order]):
         session: Session,
         order_id: int,
         new_status_id: int,
-        user_id: int
+        user_id: int,
+        allow_skip: bool = False
     ) -> Order:
         """
         Advance order to a new status.
 
+        The transition is validated against the cached workflow graph of the
+        order's type: the next status in the sequence, or an allowed revert.
+        Orders without a (known) workflow only need an existing status.
+
         Args:
             session: Database session
             order_id: Order ID
             new_status_id: New status ID
             user_id: ID of user making the change
+            allow_skip: Also allow jumping forward over intermediate statuses
 
         Returns:
             Updated order (not yet committed)
 
         Raises:
-            ValueError: If order not found
+            ValueError: If order or status not found, or the transition is not allowed
 
         Note:
             This method does NOT commit. The service layer must commit.
@@ -101,6 +113,23 @@ class OrderManager(BaseManager[Order]):
         if not order:
             raise ValueError(f"Order {order_id} not found")
 
+        if new_status_id == order.current_status_id:
+            return order
+
+        reference = reference_data_manager.get(session, order.workspace_id)
+        if new_status_id not in reference.statuses:
+            raise ValueError(f"Status {new_status_id} not found")
+
+        workflow = reference.workflows.get(order.order_type) if order.order_type else None
+        if workflow is not None and not workflow.can_transition(
+            order.current_status_id, new_status_id, allow_skip=allow_skip
+        ):
+            raise ValueError(
+                f"Order {order_id} cannot move from "
+                f"'{reference.statuses.get(order.current_status_id, order.current_status_id)}' to "
+                f"'{reference.statuses[new_status_id]}' in workflow {workflow.type}"
+            )
+
         # Update order status
         order = self.order_dao.update(
             session,
@@ -110,6 +139,52 @@ class OrderManager(BaseManager[Order]):
 
         return order
 
+    def get_next_status_id(self, session: Session, order: Order) -> int:
+        """
+        Get the status after the order's current one in its workflow.
+
+        Orders without a (known) workflow fall back to the workspace's
+        DEFAULT_WITHDRAWN_STATUS.
+
+        Raises:
+            ValueError: If the order is at the last status of its workflow,
+                or the fallback status does not exist
+        """
+        workflow = reference_data_manager.get_workflow(session, order.workspace_id, order.order_type)
+        if workflow is None:
+            return self._get_default_status_id(session, order, DEFAULT_WITHDRAWN_STATUS)
+        next_status_id = workflow.next_status_id(order.current_status_id)
+        if next_status_id is None:
+            raise ValueError(f"Order {order.id} has no next status in workflow {workflow.type}")
+        return next_status_id
+
+    def get_final_status_id(self, session: Session, order: Order) -> int:
+        """
+        Get the last status of the order's workflow.
+
+        Orders without a (known) workflow fall back to the workspace's
+        DEFAULT_COMPLETED_STATUS.
+
+        Raises:
+            ValueError: If the workflow has no statuses, or the fallback
+                status does not exist
+        """
+        workflow = reference_data_manager.get_workflow(session, order.workspace_id, order.order_type)
+        if workflow is None:
+            return self._get_default_status_id(session, order, DEFAULT_COMPLETED_STATUS)
+        if workflow.final_status_id is None:
+            raise ValueError(f"Workflow {workflow.type} has no statuses")
+        return workflow.final_status_id
+
+    def _get_default_status_id(self, session: Session, order: Order, name: str) -> int:
+        """ID of a fallback status by name in the order's workspace, ValueError if missing."""
+        status_id = reference_data_manager.get(session, order.workspace_id).status_id(name)
+        if status_id is None:
+            raise ValueError(
+                f"Order {order.id} has no workflow and status '{name}' does not exist in its workspace"
+            )
+        return status_id
+
     def get_order_with_items(
         self,
         session: Session,
@@ -0,0 +1,238 @@
+"""Production Analytics Manager - OEE-style aggregates over materialized batch rollups"""
+from typing import Any, Dict, Iterable, Optional
+from sqlalchemy.orm import Session
+from datetime import date, timedelta
+from decimal import Decimal
+import math
+from app.managers.base_manager import BaseManager
+from app.models.production_batch import ProductionBatch
+from app.models.production_batch_item import ProductionBatchItem
+from app.models.production_batch_rollup import ProductionBatchRollup
+from app.dao.production_batch_rollup import (
+    production_batch_rollup_dao, ROLLUP_COLUMNS, KEY_COLUMNS, VARIANCE_BUCKETS
+)
+
+
+TWO_PLACES = Decimal('0.01')
+FOUR_PLACES = Decimal('0.0001')
+
+
+def _decimal(value: Any, places: Decimal = TWO_PLACES) -> Optional[Decimal]:
+    """Round a number (or None) to a Decimal."""
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(places)
+
+
+def _period_start(value: date, period: str) -> date:
+    """First day of the day/week (Monday)/month of a date."""
+    if period == 'week':
+        return value - timedelta(days=value.weekday())
+    if period == 'month':
+        return value.replace(day=1)
+    return value
+
+
+class ProductionAnalyticsManager(BaseManager[ProductionBatchRollup]):
+    """
+    UTILITY MANAGER: Maintains daily production rollups and reports OEE-style aggregates.
+
+    Completing a batch adds its output, duration, input/waste quantities,
+    efficiency and variance bucket to the rollup row of its
+    (date, line, formula, shift) key with one atomic UPDATE (inserting the
+    row for a new key). Reports group the rollup by week/month and by line,
+    formula or shift in SQL and rank/compare groups with window functions.
+    rebuild() recomputes a workspace from completed batches.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(ProductionBatchRollup)
+        self.rollup_dao = production_batch_rollup_dao
+
+    def record_batch(
+        self,
+        session: Session,
+        workspace_id: int,
+        batch: ProductionBatch,
+        batch_items: Iterable[ProductionBatchItem]
+    ) -> None:
+        """
+        Add a completed batch to its daily rollup row.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            batch: Batch that was just completed
+            batch_items: The batch's items (actual quantities set)
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        key = {column: getattr(batch, column) for column in KEY_COLUMNS}
+        totals = self._batch_totals(batch, batch_items)
+        deltas = {column: value for column, value in totals.items() if value}
+        if not self.rollup_dao.add_totals(session, workspace_id=workspace_id, key=key, deltas=deltas):
+            # First batch for this key
+            self.rollup_dao.create(session, obj_in={
+                'workspace_id': workspace_id,
+                **key,
+                **totals
+            })
+
+    def get_analytics(
+        self,
+        session: Session,
+        workspace_id: int,
+        start_date: date,
+        end_date: date,
+        period: str = 'month',
+        group_by: str = 'line',
+        production_line_id: Optional[int] = None,
+        formula_id: Optional[int] = None,
+        shift: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get OEE-style aggregates per period and group.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            start_date: First batch date (widened to the start of its period)
+            end_date: Last batch date (inclusive)
+            period: 'day', 'week' or 'month'
+            group_by: 'line', 'formula', 'shift' or 'total'
+            production_line_id / formula_id / shift: Optional filters
+
+        Returns:
+            Dict matching ProductionAnalyticsResponse
+        """
+        start_date = _period_start(start_date, period)
+        rows = self.rollup_dao.get_analytics(
+            session,
+            workspace_id=workspace_id,
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
+            group_by=group_by,
+            production_line_id=production_line_id,
+            formula_id=formula_id,
+            shift=shift
+        )
+        return {
+            'start_date': start_date,
+            'end_date': end_date,
+            'period': period,
+            'group_by': group_by,
+            'rows': [self._analytics_row(row) for row in rows],
+        }
+
+    def rebuild(self, session: Session, workspace_id: int) -> int:
+        """
+        Recompute the workspace's rollup rows from completed batches.
+
+        Returns:
+            Number of rollup rows written
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        return self.rollup_dao.rebuild(session, workspace_id=workspace_id)
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _batch_totals(
+        self, batch: ProductionBatch, batch_items: Iterable[ProductionBatchItem]
+    ) -> Dict[str, Any]:
+        """Rollup contribution of one completed batch (mirrors rollup_dao.rebuild)."""
+        input_quantity = waste_quantity = 0
+        for item in batch_items:
+            quantity = item.actual_quantity if item.actual_quantity is not None else (item.expected_quantity or 0)
+            if item.item_role == 'input':
+                input_quantity += quantity
+            elif item.item_role == 'waste':
+                waste_quantity += quantity
+
+        actual_output = batch.actual_output_quantity or 0
+        timed = batch.actual_duration_minutes is not None
+        efficiency = batch.efficiency_percentage
+        totals = {
+            'batch_count': 1,
+            'expected_output_quantity': batch.expected_output_quantity or 0,
+            'actual_output_quantity': actual_output,
+            'timed_output_quantity': actual_output if timed else 0,
+            'duration_minutes': batch.actual_duration_minutes or 0,
+            'input_quantity': input_quantity,
+            'waste_quantity': waste_quantity,
+            'efficiency_sum': Decimal(str(efficiency)) if efficiency is not None else Decimal('0.00'),
+            'efficiency_sq_sum': Decimal(str(efficiency)) ** 2 if efficiency is not None else Decimal('0.0000'),
+            'efficiency_count': 1 if efficiency is not None else 0,
+        }
+        variance = batch.output_variance_percentage
+        for column, lower, upper in VARIANCE_BUCKETS:
+            in_bucket = (
+                variance is not None
+                and (lower is None or variance >= lower)
+                and (upper is None or variance < upper)
+            )
+            totals[column] = 1 if in_bucket else 0
+        return totals
+
+    def _analytics_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Derive the reported ratios from one grouped rollup row."""
+        period = row['period']
+        if isinstance(period, str):
+            period = date.fromisoformat(period)
+        totals = {column: row[column] or 0 for column in ROLLUP_COLUMNS}
+        actual_output = int(totals['actual_output_quantity'])
+        expected_output = int(totals['expected_output_quantity'])
+        waste = int(totals['waste_quantity'])
+        duration = int(totals['duration_minutes'])
+        efficiency_count = int(totals['efficiency_count'])
+
+        avg_efficiency = stddev = None
+        if efficiency_count:
+            mean = float(totals['efficiency_sum']) / efficiency_count
+            variance = max(float(totals['efficiency_sq_sum']) / efficiency_count - mean * mean, 0.0)
+            avg_efficiency, stddev = mean, math.sqrt(variance)
+        previous = row.get('previous_avg_efficiency')
+
+        return {
+            'period': period,
+            'group_id': row['group_id'],
+            'group_name': row['group_name'],
+            'batch_count': int(totals['batch_count']),
+            'expected_output_quantity': expected_output,
+            'actual_output_quantity': actual_output,
+            'input_quantity': int(totals['input_quantity']),
+            'waste_quantity': waste,
+            'avg_efficiency': _decimal(avg_efficiency),
+            'efficiency_stddev': _decimal(stddev),
+            'efficiency_rank': row['efficiency_rank'] if avg_efficiency is not None else None,
+            'efficiency_change': (
+                _decimal(avg_efficiency - float(previous))
+                if avg_efficiency is not None and previous is not None else None
+            ),
+            'variance_distribution': {
+                'lt_neg10': int(totals['variance_lt_neg10']),
+                'neg10_neg5': int(totals['variance_neg10_neg5']),
+                'neg5_0': int(totals['variance_neg5_0']),
+                'pos0_5': int(totals['variance_0_5']),
+                'pos5_10': int(totals['variance_5_10']),
+                'gte_10': int(totals['variance_gte_10']),
+            },
+            'throughput_per_hour': (
+                _decimal(int(totals['timed_output_quantity']) * 60 / duration) if duration else None
+            ),
+            'scrap_ratio': (
+                _decimal(waste / (actual_output + waste), FOUR_PLACES) if actual_output + waste else None
+            ),
+            'yield_rate': (
+                _decimal(actual_output / expected_output, FOUR_PLACES) if expected_output else None
+            ),
+        }
+
+
+# Singleton instance
+production_analytics_manager = ProductionAnalyticsManager()
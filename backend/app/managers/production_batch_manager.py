@@ -1,21 +1,39 @@
 """Production Batch Manager for business logic"""
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from decimal import Decimal
+from fractions import Fraction
 from sqlalchemy.orm import Session
 from app.managers.base_manager import BaseManager
+from app.managers.formula_version_manager import formula_version_manager
+from app.managers.ledger_posting_manager import ledger_posting_manager
+from app.managers.production_analytics_manager import production_analytics_manager
+from app.managers.stock_reservation_manager import stock_reservation_manager
+from app.models.enums import InventoryTypeEnum
 from app.models.production_batch import ProductionBatch
 from app.models.production_batch_item import ProductionBatchItem
+from app.models.stock_reservation import StockReservation
 from app.dao.production_batch import production_batch_dao
 from app.dao.production_batch_item import production_batch_item_dao
 from app.dao.production_line import production_line_dao
 from app.dao.production_formula import production_formula_dao
 from app.dao.production_formula_item import production_formula_item_dao
 from app.dao.item import item_dao
+from app.dao.storage_item import storage_item_dao
 from app.schemas.production_batch import ProductionBatchCreate, ProductionBatchUpdate
 from app.schemas.production_batch_item import ProductionBatchItemCreate, ProductionBatchItemUpdate
 
 
+# Batch item destination_location_type -> inventory type outputs are posted to
+DESTINATION_INVENTORY_TYPES = {
+    'storage': InventoryTypeEnum.STORAGE,
+    'inventory': InventoryTypeEnum.STORAGE,
+    'damaged': InventoryTypeEnum.DAMAGED,
+    'waste': InventoryTypeEnum.WASTE,
+    'scrap': InventoryTypeEnum.SCRAP,
+}
+
+
 class ProductionBatchManager(BaseManager[ProductionBatch]):
     """
     STANDALONE MANAGER: Production batch business logic.
@@ -23,6 +41,10 @@ class ProductionBatchManager(BaseManager[ProductionBatch]):
     Manages: ProductionBatch and ProductionBatchItem entities
     Operations: CRUD, batch workflow (start, complete, cancel), variance calculation
 
+    Starting a formula batch reserves its inputs (StockReservationManager);
+    completing posts the stock movements to the ledgers and consumes the
+    reservations, cancelling releases them.
+
     Does NOT commit transactions - that's the service layer's responsibility.
     """
 
@@ -207,16 +229,21 @@ class ProductionBatchManager(BaseManager[ProductionBatch]):
         Start a production batch (draft → in_progress).
 
         If formula is attached:
-        - Calculates expected values based on formula and target_output_quantity
-        - Creates batch items from formula items with expected quantities
-        - Sets expected_duration_minutes from formula
+        - Pins the batch to the formula's current version snapshot
+          (formula_version_id), so later formula edits don't change it
+        - Calculates expected values from the snapshot and target_output_quantity
+        - Creates batch items from the snapshot's lines (one bulk insert)
+        - Sets expected_duration_minutes from the snapshot
+        - Reserves the (non-optional) inputs in the line's factory; fails
+          if any input lacks available stock
 
         If no formula (simple mode):
         - Just transitions status to in_progress
 
         Args:
-            target_output_quantity: How much to produce. If None, uses the sum
-                                   of formula's product items as base quantity.
+            target_output_quantity: How much to produce. If None, uses the batch's
+                                   expected output quantity, else the sum of the
+                                   formula's product items as base quantity.
         """
         batch = self.batch_dao.get_by_id_and_workspace(
             session, id=batch_id, workspace_id=workspace_id
@@ -243,41 +270,49 @@ class ProductionBatchManager(BaseManager[ProductionBatch]):
             if not formula:
                 raise ValueError(f"Formula {batch.formula_id} no longer exists")
 
-            # Get base output quantity from formula's output items
-            output_items = self.formula_item_dao.get_by_formula_and_role(
-                session, formula_id=formula.id, item_role='output', workspace_id=workspace_id
-            )
-            if not output_items:
-                raise ValueError(
-                    f"Formula {formula.id} has no output items defined. "
-                    f"Add at least one item with role='output' before starting a batch."
-                )
-            base_output_qty = sum(item.quantity for item in output_items)
-
-            # Calculate multiplier
-            output_qty = target_output_quantity or base_output_qty
-            multiplier = output_qty / base_output_qty
-
-            update_data['expected_output_quantity'] = output_qty
-            if formula.estimated_duration_minutes:
-                update_data['expected_duration_minutes'] = int(
-                    formula.estimated_duration_minutes * multiplier
-                )
+            # Immutable recipe of the formula's current version (usually cached)
+            recipe = formula_version_manager.get_recipe(session, workspace_id, formula, user_id)
 
-            # Create batch items from formula items
-            formula_items = self.formula_item_dao.get_by_formula(
-                session, formula_id=formula.id, workspace_id=workspace_id
+            # Same quantity the availability check and MRP use for a draft batch
+            output_qty = (
+                target_output_quantity
+                or batch.expected_output_quantity
+                or recipe.base_output_quantity
             )
-            for fi in formula_items:
-                expected_qty = int(fi.quantity * multiplier)
-                batch_item_dict = {
+            update_data['formula_version_id'] = recipe.version_id
+            update_data['expected_output_quantity'] = output_qty
+            expected_duration = recipe.expected_duration(output_qty)
+            if expected_duration:
+                update_data['expected_duration_minutes'] = expected_duration
+
+            # Create batch items from the recipe in one bulk insert
+            reservations = {}
+            batch_items = []
+            for line, expected_qty in recipe.scaled(output_qty):
+                if line.item_role == 'input' and not line.is_optional:
+                    reservations[line.item_id] = reservations.get(line.item_id, 0) + expected_qty
+                batch_items.append({
                     'workspace_id': workspace_id,
                     'batch_id': batch.id,
-                    'item_id': fi.item_id,
-                    'item_role': fi.item_role,
+                    'item_id': line.item_id,
+                    'item_role': line.item_role,
                     'expected_quantity': expected_qty,
-                }
-                self.batch_item_dao.create(session, obj_in=batch_item_dict)
+                })
+            self.batch_item_dao.create_many(session, objs_in=batch_items)
+
+            line = production_line_dao.get_by_id_and_workspace(
+                session, id=batch.production_line_id, workspace_id=workspace_id
+            )
+            if not line:
+                raise ValueError(f"Production line {batch.production_line_id} not found")
+            stock_reservation_manager.reserve(
+                session,
+                workspace_id=workspace_id,
+                batch_id=batch.id,
+                factory_id=line.factory_id,
+                requirements=reservations,
+                user_id=user_id
+            )
         else:
             # Simple mode: set target output if provided
             if target_output_quantity:
@@ -300,6 +335,13 @@ class ProductionBatchManager(BaseManager[ProductionBatch]):
 
         Calculates variance between expected and actual values.
         Also calculates variance for each batch item that has actual_quantity set.
+
+        Posts the batch's stock movements (see _post_batch_ledgers): inputs
+        are consumed from the line's factory storage, outputs, byproducts and
+        waste are added to inventory, and the input cost is rolled up into
+        the output unit cost. Consumes the batch's stock reservations and
+        adds the batch to the production analytics rollup.
+        The statement count does not depend on the number of batch items.
         """
         batch = self.batch_dao.get_by_id_and_workspace(
             session, id=batch_id, workspace_id=workspace_id
@@ -338,10 +380,26 @@ class ProductionBatchManager(BaseManager[ProductionBatch]):
                 str(round((actual_out / expected_out) * 100, 2))
             )
 
+        line = production_line_dao.get_by_id_and_workspace(
+            session, id=batch.production_line_id, workspace_id=workspace_id
+        )
+        if not line:
+            raise ValueError(f"Production line {batch.production_line_id} not found")
+
         updated_batch = self.batch_dao.update(session, db_obj=batch, obj_in=update_data)
 
+        batch_items = self.batch_item_dao.get_by_batch(
+            session, batch_id=batch_id, workspace_id=workspace_id
+        )
+
         # Calculate variance for batch items
-        self._calculate_batch_item_variances(session, batch_id, workspace_id)
+        self._calculate_batch_item_variances(session, batch_items)
+
+        self._post_batch_ledgers(session, updated_batch, line.factory_id, batch_items, workspace_id, user_id)
+
+        stock_reservation_manager.consume(session, workspace_id, batch_id)
+
+        production_analytics_manager.record_batch(session, workspace_id, updated_batch, batch_items)
 
         return updated_batch
 
@@ -355,6 +413,8 @@ class ProductionBatchManager(BaseManager[ProductionBatch]):
     ) -> ProductionBatch:
         """
         Cancel a production batch (draft or in_progress → cancelled).
+
+        Releases the batch's stock reservations.
         """
         batch = self.batch_dao.get_by_id_and_workspace(
             session, id=batch_id, workspace_id=workspace_id
@@ -373,6 +433,8 @@ class ProductionBatchManager(BaseManager[ProductionBatch]):
         if notes is not None:
             update_data['notes'] = notes
 
+        stock_reservation_manager.release(session, workspace_id, batch_id)
+
         return self.batch_dao.update(session, db_obj=batch, obj_in=update_data)
 
     # ─── Batch Item CRUD ────────────────────────────────────────────
@@ -494,26 +556,174 @@ class ProductionBatchManager(BaseManager[ProductionBatch]):
             session, batch_id=batch_id, workspace_id=workspace_id
         )
 
-    # ─── Helpers ────────────────────────────────────────────────────
+    # ─── Reservations & Availability ────────────────────────────────
 
-    def _calculate_batch_item_variances(
+    def get_batch_reservations(
         self,
         session: Session,
         batch_id: int,
         workspace_id: int
-    ) -> None:
-        """Calculate variance for all batch items that have both expected and actual quantities."""
-        batch_items = self.batch_item_dao.get_by_batch(
-            session, batch_id=batch_id, workspace_id=workspace_id
+    ) -> List[StockReservation]:
+        """Get the stock reservations of a batch."""
+        batch = self.batch_dao.get_by_id_and_workspace(
+            session, id=batch_id, workspace_id=workspace_id
         )
+        if not batch:
+            raise ValueError(f"Production batch {batch_id} not found")
+        return stock_reservation_manager.get_batch_reservations(session, workspace_id, batch_id)
+
+    def check_availability(
+        self,
+        session: Session,
+        workspace_id: int,
+        candidates: List[dict],
+        cumulative: bool = False
+    ) -> List[dict]:
+        """Check whether candidate batches can be produced from available stock."""
+        return stock_reservation_manager.check_availability(
+            session, workspace_id, candidates, cumulative=cumulative
+        )
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _calculate_batch_item_variances(
+        self,
+        session: Session,
+        batch_items: List[ProductionBatchItem]
+    ) -> None:
+        """
+        Calculate variance for all batch items that have both expected and actual quantities.
+
+        Sets the values on the loaded items and flushes once, so the changed
+        rows go out as one batched UPDATE instead of one flush per item.
+        """
+        changed = False
         for bi in batch_items:
             if bi.expected_quantity is not None and bi.actual_quantity is not None and bi.expected_quantity > 0:
                 variance = bi.actual_quantity - bi.expected_quantity
-                variance_pct = Decimal(str(round((variance / bi.expected_quantity) * 100, 2)))
-                self.batch_item_dao.update(
-                    session, db_obj=bi,
-                    obj_in={'variance_quantity': variance, 'variance_percentage': variance_pct}
+                bi.variance_quantity = variance
+                bi.variance_percentage = Decimal(str(round((variance / bi.expected_quantity) * 100, 2)))
+                changed = True
+        if changed:
+            session.flush()
+
+    def _post_batch_ledgers(
+        self,
+        session: Session,
+        batch: ProductionBatch,
+        factory_id: int,
+        batch_items: List[ProductionBatchItem],
+        workspace_id: int,
+        user_id: int
+    ) -> None:
+        """
+        Post a completed batch's stock movements with the bulk ledger poster.
+
+        Quantities are actual_quantity, else expected_quantity (outputs
+        scaled by the batch's actual/expected output when only the batch
+        total was logged). Items go to/from the line's factory unless the
+        batch item names a storage/inventory location.
+
+        - Inputs: 'consumption' from storage, with any remainder taken from
+          STORAGE inventory (so intermediates produced by earlier batches
+          can be consumed)
+        - Outputs: 'production_output' to STORAGE inventory at the rolled-up
+          unit cost = total input cost / total output quantity
+        - Byproducts / waste: 'production_output' to STORAGE / WASTE
+          inventory at the current average cost
+
+        At most three postings (storage consumption, inventory consumption,
+        inventory output), each one prefetch + one INSERT + one snapshot sync.
+        """
+        attribution = {
+            'source_type': 'production_batch',
+            'source_id': batch.id,
+            'notes': f"Production batch {batch.batch_number}",
+        }
+        output_ratio = None
+        if batch.actual_output_quantity and batch.expected_output_quantity:
+            output_ratio = Fraction(batch.actual_output_quantity, batch.expected_output_quantity)
+
+        inputs: Dict[Tuple[int, int], int] = {}
+        outputs: List[Tuple[InventoryTypeEnum, int, int, int, bool]] = []
+        for bi in batch_items:
+            quantity = bi.actual_quantity
+            if quantity is None and bi.expected_quantity is not None:
+                quantity = bi.expected_quantity
+                if bi.item_role == 'output' and output_ratio is not None:
+                    quantity = round(quantity * output_ratio)
+            if not quantity or quantity <= 0:
+                continue
+
+            if bi.item_role == 'input':
+                source_factory_id = factory_id
+                if bi.source_location_type in ('storage', 'inventory') and bi.source_location_id:
+                    source_factory_id = bi.source_location_id
+                key = (source_factory_id, bi.item_id)
+                inputs[key] = inputs.get(key, 0) + quantity
+            else:
+                inventory_type = DESTINATION_INVENTORY_TYPES.get(
+                    bi.destination_location_type,
+                    InventoryTypeEnum.WASTE if bi.item_role == 'waste' else InventoryTypeEnum.STORAGE
                 )
+                destination_factory_id = factory_id
+                if bi.destination_location_type in DESTINATION_INVENTORY_TYPES and bi.destination_location_id:
+                    destination_factory_id = bi.destination_location_id
+                outputs.append((inventory_type, destination_factory_id, bi.item_id, quantity, bi.item_role == 'output'))
+
+        # Inputs: storage first, the rest from STORAGE inventory
+        in_storage = storage_item_dao.get_quantities(
+            session, workspace_id=workspace_id,
+            factory_ids={f for f, _ in inputs}, item_ids={i for _, i in inputs}
+        )
+        storage_movements, inventory_movements = [], []
+        for (source_factory_id, item_id), quantity in inputs.items():
+            from_storage = min(quantity, max(in_storage.get((source_factory_id, item_id), 0), 0))
+            if from_storage:
+                storage_movements.append({
+                    'factory_id': source_factory_id, 'item_id': item_id,
+                    'transaction_type': 'consumption', 'quantity': from_storage, **attribution,
+                })
+            if quantity > from_storage:
+                inventory_movements.append({
+                    'inventory_type': InventoryTypeEnum.STORAGE,
+                    'factory_id': source_factory_id, 'item_id': item_id,
+                    'transaction_type': 'consumption', 'quantity': quantity - from_storage, **attribution,
+                })
+
+        consumed = ledger_posting_manager.post_movements(
+            session, ledger='storage', movements=storage_movements,
+            workspace_id=workspace_id, user_id=user_id
+        )
+        consumed += ledger_posting_manager.post_movements(
+            session, ledger='inventory', movements=inventory_movements,
+            workspace_id=workspace_id, user_id=user_id
+        )
+
+        # Cost roll-up (unknown when no consumed input had an average price)
+        unit_cost = None
+        total_output = sum(quantity for _, _, _, quantity, is_output in outputs if is_output)
+        if total_output and any(row['avg_price_before'] is not None for row in consumed):
+            unit_cost = sum((row['total_cost'] or Decimal('0.00') for row in consumed), Decimal('0.00')) / total_output
+
+        ledger_posting_manager.post_movements(
+            session,
+            ledger='inventory',
+            movements=[
+                {
+                    'inventory_type': inventory_type,
+                    'factory_id': destination_factory_id,
+                    'item_id': item_id,
+                    'transaction_type': 'production_output',
+                    'quantity': quantity,
+                    'unit_cost': unit_cost if is_output else None,
+                    **attribution,
+                }
+                for inventory_type, destination_factory_id, item_id, quantity, is_output in outputs
+            ],
+            workspace_id=workspace_id,
+            user_id=user_id
+        )
 
 
 # Singleton instance
@@ -2,6 +2,7 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.managers.base_manager import BaseManager
+from app.managers.formula_version_manager import formula_version_manager
 from app.models.production_formula import ProductionFormula
 from app.models.production_formula_item import ProductionFormulaItem
 from app.dao.production_formula import production_formula_dao
@@ -18,6 +19,10 @@ class ProductionFormulaManager(BaseManager[ProductionFormula]):
     Manages: ProductionFormula and ProductionFormulaItem entities
     Operations: CRUD with validation, default formula management
 
+    Recipe edits (items, estimated duration) of a formula whose current
+    version was already used to start a batch move the formula to a new
+    version first (see FormulaVersionManager.release_version).
+
     Does NOT commit transactions - that's the service layer's responsibility.
     """
 
@@ -92,6 +97,12 @@ class ProductionFormulaManager(BaseManager[ProductionFormula]):
         if update_dict.get('is_default') is True:
             self._clear_other_defaults(session, workspace_id, exclude_id=formula_id)
 
+        if (
+            'estimated_duration_minutes' in update_dict
+            and update_dict['estimated_duration_minutes'] != formula.estimated_duration_minutes
+        ):
+            formula_version_manager.release_version(session, workspace_id, formula, user_id)
+
         update_dict['updated_by'] = user_id
         return self.formula_dao.update(session, db_obj=formula, obj_in=update_dict)
 
@@ -181,6 +192,8 @@ class ProductionFormulaManager(BaseManager[ProductionFormula]):
                 f"Invalid item_role '{item_data.item_role}'. Must be one of: {', '.join(self.VALID_ITEM_ROLES)}"
             )
 
+        formula_version_manager.release_version(session, workspace_id, formula)
+
         item_dict = item_data.model_dump()
         item_dict['workspace_id'] = workspace_id
 
@@ -208,6 +221,8 @@ class ProductionFormulaManager(BaseManager[ProductionFormula]):
                 f"Invalid item_role '{update_dict['item_role']}'. Must be one of: {', '.join(self.VALID_ITEM_ROLES)}"
             )
 
+        self._release_formula_version(session, formula_item, workspace_id)
+
         return self.formula_item_dao.update(session, db_obj=formula_item, obj_in=update_dict)
 
     def remove_formula_item(
@@ -223,6 +238,8 @@ class ProductionFormulaManager(BaseManager[ProductionFormula]):
         if not formula_item:
             raise ValueError(f"Formula item {formula_item_id} not found")
 
+        self._release_formula_version(session, formula_item, workspace_id)
+
         return self.formula_item_dao.remove(session, id=formula_item_id)
 
     def get_formula_items(
@@ -283,6 +300,19 @@ class ProductionFormulaManager(BaseManager[ProductionFormula]):
 
     # ─── Helpers ────────────────────────────────────────────────────
 
+    def _release_formula_version(
+        self,
+        session: Session,
+        formula_item: ProductionFormulaItem,
+        workspace_id: int
+    ) -> None:
+        """Move the item's formula to a new version if its current recipe is snapshotted."""
+        formula = self.formula_dao.get_by_id_and_workspace(
+            session, id=formula_item.formula_id, workspace_id=workspace_id
+        )
+        if formula:
+            formula_version_manager.release_version(session, workspace_id, formula)
+
     def _clear_other_defaults(
         self,
         session: Session,
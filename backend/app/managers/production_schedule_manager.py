@@ -0,0 +1,515 @@
+"""Production Schedule Manager - finite-capacity scheduling of draft batches on lines and shifts"""
+import bisect
+import math
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from datetime import date, timedelta
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+from sqlalchemy.orm import Session
+from app.managers.base_manager import BaseManager
+from app.managers.mrp_manager import mrp_manager
+from app.models.production_batch import ProductionBatch
+from app.dao.production_batch import production_batch_dao
+from app.dao.production_line import production_line_dao
+from app.schemas.production_schedule import DEFAULT_SHIFTS
+
+
+# A cached schedule is used for incremental rescheduling for this long;
+# after that (or for other parameters) the schedule is rebuilt
+CACHE_TTL_SECONDS = 300
+
+# Workspaces kept before the least recently used is dropped
+CACHE_MAX_ENTRIES = 64
+
+# (slot index, minutes used in the slot); slot = day * shifts per day + shift
+Position = Tuple[int, int]
+
+
+class Job(NamedTuple):
+    """A draft batch to schedule"""
+    batch_id: int
+    factory_id: int
+    production_line_id: int
+    batch_date: date
+    shift: Optional[str]
+    release_slot: int  # First slot the batch may start in
+    duration: int  # Minutes
+
+    @property
+    def key(self) -> Tuple[int, int, int]:
+        """Scheduling priority: earliest release, then longest first, then oldest."""
+        return (self.release_slot, -self.duration, self.batch_id)
+
+
+class Placement(NamedTuple):
+    """Where a job was scheduled"""
+    production_line_id: int
+    start: Position
+    end: Position
+
+
+class LineCalendar:
+    """
+    Working time of one production line over the horizon.
+
+    Every day has the same shifts; days on which the line's machine is due
+    for maintenance have no capacity.
+    """
+
+    __slots__ = ('line_id', 'factory_id', 'capacities', 'blocked_days', 'total_slots')
+
+    def __init__(self, line_id: int, factory_id: int, capacities: Tuple[int, ...],
+                 blocked_days: Set[int], horizon_days: int):
+        self.line_id = line_id
+        self.factory_id = factory_id
+        self.capacities = capacities
+        self.blocked_days = blocked_days
+        self.total_slots = horizon_days * len(capacities)
+
+    def capacity_minutes(self) -> int:
+        """Working minutes over the horizon."""
+        days = self.total_slots // len(self.capacities) - len(self.blocked_days)
+        return days * sum(self.capacities)
+
+    def fit(self, cursor: Position, release_slot: int, duration: int) -> Optional[Tuple[Position, Position]]:
+        """
+        Earliest (start, end) of a job after the line's cursor, or None if
+        it does not end within the horizon. Jobs run through consecutive
+        working slots (a long job continues in the next shift).
+        """
+        per_day = len(self.capacities)
+        slot, used = cursor
+        if slot < release_slot:
+            slot, used = release_slot, 0
+        # First slot with free time
+        while slot < self.total_slots and (
+            slot // per_day in self.blocked_days or used >= self.capacities[slot % per_day]
+        ):
+            slot, used = slot + 1, 0
+        if slot >= self.total_slots:
+            return None
+        start = (slot, used)
+
+        remaining = duration
+        while remaining > 0:
+            if slot >= self.total_slots:
+                return None
+            if slot // per_day in self.blocked_days:
+                slot, used = slot + 1, 0
+                continue
+            take = min(self.capacities[slot % per_day] - used, remaining)
+            remaining -= take
+            used += take
+            if remaining > 0:
+                slot, used = slot + 1, 0
+        return start, (slot, used)
+
+
+class ScheduleState:
+    """One computed schedule of a workspace, kept for incremental rescheduling"""
+
+    __slots__ = ('params', 'built_at', 'calendars', 'factory_lines', 'unavailable',
+                 'maintenance', 'jobs', 'orders', 'placements')
+
+    def __init__(self, params: dict):
+        self.params = params
+        self.built_at = time.monotonic()
+        self.calendars: Dict[int, LineCalendar] = {}
+        self.factory_lines: Dict[int, List[int]] = defaultdict(list)
+        self.unavailable: Dict[int, Tuple[int, str]] = {}  # line_id -> (factory_id, reason)
+        self.maintenance: Dict[int, List[date]] = {}  # line_id -> maintenance dates in horizon
+        self.jobs: Dict[int, Job] = {}
+        # factory_id -> job keys in priority order, and aligned placements
+        # (a Placement, or the reason the job could not be placed)
+        self.orders: Dict[int, List[Tuple[int, int, int]]] = defaultdict(list)
+        self.placements: Dict[int, List[Union[Placement, str]]] = defaultdict(list)
+
+    def copy(self) -> 'ScheduleState':
+        """Copy whose job/order/placement containers can be changed independently."""
+        clone = ScheduleState(self.params)
+        clone.calendars = self.calendars
+        clone.factory_lines = self.factory_lines
+        clone.unavailable = self.unavailable
+        clone.maintenance = self.maintenance
+        clone.jobs = dict(self.jobs)
+        clone.orders = defaultdict(list, self.orders)
+        clone.placements = defaultdict(list, self.placements)
+        return clone
+
+
+class ProductionScheduleManager(BaseManager[ProductionBatch]):
+    """
+    UTILITY MANAGER: Finite-capacity scheduling of draft batches.
+
+    Each working day is split into shifts; a line offers its shift minutes
+    except on its machine's maintenance date, and lines whose machine is
+    stopped (is_running=False) or deleted are not used. Draft batches are
+    taken in priority order (earliest batch_date, then longest, then
+    oldest) and each goes to the line of its factory where it finishes
+    first, right after the work already planned on that line (greedy list
+    scheduling, O(batches x lines per factory) with two queries in total).
+    A batch needs expected_duration_minutes, else the formula's estimate
+    scaled to its expected output, else the default duration.
+
+    The last schedule of a workspace is cached; reschedule_batch() reloads
+    one changed batch and re-places only the batches of its factory that
+    come after it in priority order.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(ProductionBatch)
+        self.batch_dao = production_batch_dao
+        # workspace_id -> ScheduleState
+        self._cache: "OrderedDict[int, ScheduleState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def build_schedule(
+        self,
+        session: Session,
+        workspace_id: int,
+        start_date: date,
+        horizon_days: int,
+        shifts: List[dict],
+        factory_id: Optional[int] = None,
+        default_duration_minutes: int = 60,
+        apply: bool = False
+    ) -> dict:
+        """
+        Schedule all draft batches of the workspace (or one factory).
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            start_date: First day of the horizon
+            horizon_days: Number of days to schedule
+            shifts: [{'name', 'minutes'}] of every day, in order
+            factory_id: Only this factory (optional)
+            default_duration_minutes: Duration of batches without one
+            apply: Write line, batch_date and shift of scheduled batches
+
+        Returns:
+            Dict matching ScheduleResponse
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        params = {
+            'start_date': start_date,
+            'horizon_days': horizon_days,
+            'shifts': tuple((shift['name'], shift['minutes']) for shift in shifts),
+            'factory_id': factory_id,
+            'default_duration_minutes': default_duration_minutes,
+        }
+        state = self._build_state(session, workspace_id, params)
+        for factory in list(state.orders):
+            self._place_from(state, factory, 0)
+
+        changed = self._apply(session, state, dict(state.jobs)) if apply else []
+        self._store(workspace_id, state)
+        return self._response(state, changed_batch_ids=changed, applied=apply)
+
+    def reschedule_batch(
+        self,
+        session: Session,
+        workspace_id: int,
+        batch_id: int,
+        apply: bool = False
+    ) -> dict:
+        """
+        Update the workspace's last schedule after one batch changed.
+
+        The batch is reloaded (it may have a new line, date, duration or
+        status); batches of the affected factories that come before it in
+        priority order keep their placement, the rest are placed again.
+        Without a current cached schedule, a full schedule is built with
+        default parameters.
+
+        Returns:
+            Dict matching ScheduleResponse; changed_batch_ids lists batches
+            whose placement changed
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        with self._lock:
+            cached = self._cache.get(workspace_id)
+            if cached is not None and time.monotonic() - cached.built_at > CACHE_TTL_SECONDS:
+                cached = None
+
+        if cached is None:
+            return self.build_schedule(
+                session, workspace_id,
+                start_date=date.today(),
+                horizon_days=14,
+                shifts=[shift.model_dump() for shift in DEFAULT_SHIFTS],
+                apply=apply
+            )
+
+        state = cached.copy()
+        old_job = state.jobs.pop(batch_id, None)
+        rows = self.batch_dao.get_schedule_rows(
+            session, workspace_id=workspace_id, factory_id=state.params['factory_id'], batch_ids=[batch_id]
+        )
+        new_job = self._jobs(session, workspace_id, state.params, rows)[0] if rows else None
+        if old_job is None and new_job is None:
+            raise ValueError(f"Production batch {batch_id} not found or not a draft")
+
+        before = {
+            key[2]: placement
+            for factory in {job.factory_id for job in (old_job, new_job) if job}
+            for key, placement in zip(state.orders[factory], state.placements[factory])
+        }
+
+        # Earliest changed position per affected factory
+        restart: Dict[int, int] = {}
+        if old_job is not None:
+            orders = list(state.orders[old_job.factory_id])
+            index = bisect.bisect_left(orders, old_job.key)
+            del orders[index]
+            state.orders[old_job.factory_id] = orders
+            restart[old_job.factory_id] = index
+        if new_job is not None:
+            state.jobs[batch_id] = new_job
+            orders = list(state.orders[new_job.factory_id])
+            index = bisect.bisect_left(orders, new_job.key)
+            orders.insert(index, new_job.key)
+            state.orders[new_job.factory_id] = orders
+            restart[new_job.factory_id] = min(index, restart.get(new_job.factory_id, index))
+
+        for factory, index in restart.items():
+            self._place_from(state, factory, index)
+
+        changed = sorted(
+            key[2]
+            for factory in restart
+            for key, placement in zip(state.orders[factory], state.placements[factory])
+            if before.get(key[2]) != placement
+        )
+        if old_job is not None and new_job is None:
+            changed.append(batch_id)
+        if apply:
+            self._apply(session, state, {job_id: state.jobs[job_id] for job_id in changed if job_id in state.jobs})
+        self._store(workspace_id, state)
+        return self._response(state, changed_batch_ids=changed, applied=apply)
+
+    def clear_cache(self) -> None:
+        """Drop all cached schedules."""
+        with self._lock:
+            self._cache.clear()
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _build_state(self, session: Session, workspace_id: int, params: dict) -> ScheduleState:
+        """Load lines and draft batches (two queries) into a fresh state."""
+        state = ScheduleState(params)
+        start_date, horizon_days = params['start_date'], params['horizon_days']
+        capacities = tuple(minutes for _, minutes in params['shifts'])
+        factory_ids = [params['factory_id']] if params['factory_id'] is not None else None
+
+        for line_id, line_factory_id, machine_id, is_running, maintenance_date, machine_deleted in (
+            production_line_dao.get_schedule_rows(session, workspace_id=workspace_id, factory_ids=factory_ids)
+        ):
+            state.factory_lines[line_factory_id].append(line_id)
+            if machine_id is not None and machine_deleted:
+                state.unavailable[line_id] = (line_factory_id, 'machine_deleted')
+                continue
+            if machine_id is not None and not is_running:
+                state.unavailable[line_id] = (line_factory_id, 'machine_stopped')
+                continue
+            blocked: Set[int] = set()
+            if maintenance_date is not None and 0 <= (maintenance_date - start_date).days < horizon_days:
+                blocked.add((maintenance_date - start_date).days)
+                state.maintenance[line_id] = [maintenance_date]
+            state.calendars[line_id] = LineCalendar(
+                line_id, line_factory_id, capacities, blocked, horizon_days
+            )
+
+        rows = self.batch_dao.get_schedule_rows(
+            session, workspace_id=workspace_id, factory_id=params['factory_id']
+        )
+        for job in self._jobs(session, workspace_id, params, rows):
+            state.jobs[job.batch_id] = job
+            state.orders[job.factory_id].append(job.key)
+        for orders in state.orders.values():
+            orders.sort()
+        return state
+
+    def _jobs(self, session: Session, workspace_id: int, params: dict, rows: List[Tuple]) -> List[Job]:
+        """Turn scheduling rows into jobs (durations scaled with the cached formula graph)."""
+        graph = None
+        per_day = len(params['shifts'])
+        shift_index = {name: index for index, (name, _) in enumerate(params['shifts'])}
+        jobs = []
+        for (batch_id, line_id, factory_id, formula_id, batch_date, shift,
+             expected_output, expected_duration, formula_duration) in rows:
+            duration = expected_duration
+            if duration is None and formula_duration:
+                duration = formula_duration
+                if formula_id is not None and expected_output:
+                    if graph is None:
+                        graph = mrp_manager.get_graph(session, workspace_id)
+                    base_output = graph.base_output(formula_id)
+                    if base_output:
+                        duration = math.ceil(formula_duration * expected_output / base_output)
+            if duration is None:
+                duration = params['default_duration_minutes']
+            # Not before the batch's planned day (and shift, if it is one of ours)
+            release_day = (batch_date - params['start_date']).days if batch_date else -1
+            release_slot = release_day * per_day + shift_index.get(shift, 0) if release_day >= 0 else 0
+            jobs.append(Job(
+                batch_id=batch_id,
+                factory_id=factory_id,
+                production_line_id=line_id,
+                batch_date=batch_date,
+                shift=shift,
+                release_slot=release_slot,
+                duration=duration,
+            ))
+        return jobs
+
+    def _place_from(self, state: ScheduleState, factory_id: int, index: int) -> None:
+        """Keep a factory's placements before index and greedily place the rest."""
+        lines = [line_id for line_id in state.factory_lines.get(factory_id, ()) if line_id in state.calendars]
+        cursors: Dict[int, Position] = {line_id: (0, 0) for line_id in lines}
+        placements = list(state.placements[factory_id][:index])
+        for placement in placements:
+            if isinstance(placement, Placement):
+                cursors[placement.production_line_id] = max(
+                    cursors[placement.production_line_id], placement.end
+                )
+
+        for key in state.orders[factory_id][index:]:
+            job = state.jobs[key[2]]
+            if not lines:
+                placements.append('no_available_line')
+                continue
+            best = None
+            for line_id in lines:
+                fit = state.calendars[line_id].fit(cursors[line_id], job.release_slot, job.duration)
+                if fit is None:
+                    continue
+                # Earliest finish, then earliest start, then the batch's current line
+                rank = (fit[1], fit[0], line_id != job.production_line_id, line_id)
+                if best is None or rank < best[0]:
+                    best = (rank, line_id, fit)
+            if best is None:
+                placements.append('exceeds_horizon')
+                continue
+            _, line_id, (start, end) = best
+            cursors[line_id] = end
+            placements.append(Placement(line_id, start, end))
+        state.placements[factory_id] = placements
+
+    def _apply(self, session: Session, state: ScheduleState, jobs: Dict[int, Job]) -> List[int]:
+        """Write line, date and shift of scheduled jobs whose values differ; returns their IDs."""
+        placed = {
+            key[2]: placement
+            for factory in state.orders
+            for key, placement in zip(state.orders[factory], state.placements[factory])
+            if isinstance(placement, Placement)
+        }
+        assignments = []
+        for batch_id, job in jobs.items():
+            placement = placed.get(batch_id)
+            if placement is None:
+                continue
+            batch_date, shift, _ = self._position(state, placement.start)
+            if (placement.production_line_id, batch_date, shift) != (job.production_line_id, job.batch_date, job.shift):
+                assignments.append({
+                    'id': batch_id,
+                    'production_line_id': placement.production_line_id,
+                    'batch_date': batch_date,
+                    'shift': shift,
+                })
+        self.batch_dao.set_schedule(session, assignments=assignments)
+
+        # The written values are now the batches' current ones
+        for assignment in assignments:
+            state.jobs[assignment['id']] = state.jobs[assignment['id']]._replace(
+                production_line_id=assignment['production_line_id'],
+                batch_date=assignment['batch_date'],
+                shift=assignment['shift'],
+            )
+        return sorted(assignment['id'] for assignment in assignments)
+
+    def _position(self, state: ScheduleState, position: Position) -> Tuple[date, str, int]:
+        """(date, shift name, minute in shift) of a schedule position."""
+        slot, used = position
+        shifts = state.params['shifts']
+        day, shift_index = divmod(slot, len(shifts))
+        return state.params['start_date'] + timedelta(days=day), shifts[shift_index][0], used
+
+    def _response(self, state: ScheduleState, changed_batch_ids: List[int], applied: bool) -> dict:
+        """Build the ScheduleResponse dict of a state."""
+        scheduled, unscheduled = [], []
+        load: Dict[int, int] = defaultdict(int)
+        for factory_id in sorted(state.orders):
+            for key, placement in zip(state.orders[factory_id], state.placements[factory_id]):
+                job = state.jobs[key[2]]
+                if not isinstance(placement, Placement):
+                    unscheduled.append({
+                        'batch_id': job.batch_id,
+                        'factory_id': factory_id,
+                        'duration_minutes': job.duration,
+                        'reason': placement,
+                    })
+                    continue
+                load[placement.production_line_id] += job.duration
+                start_date, start_shift, start_minute = self._position(state, placement.start)
+                end_date, end_shift, end_minute = self._position(state, placement.end)
+                scheduled.append({
+                    'batch_id': job.batch_id,
+                    'factory_id': factory_id,
+                    'production_line_id': placement.production_line_id,
+                    'previous_production_line_id': job.production_line_id,
+                    'batch_date': start_date,
+                    'shift': start_shift,
+                    'start_minute': start_minute,
+                    'end_date': end_date,
+                    'end_shift': end_shift,
+                    'end_minute': end_minute,
+                    'duration_minutes': job.duration,
+                })
+        scheduled.sort(key=lambda row: (row['batch_date'], row['production_line_id'], row['batch_id']))
+
+        lines = []
+        for factory_id in sorted(state.factory_lines):
+            for line_id in state.factory_lines[factory_id]:
+                calendar = state.calendars.get(line_id)
+                capacity = calendar.capacity_minutes() if calendar else 0
+                lines.append({
+                    'production_line_id': line_id,
+                    'factory_id': factory_id,
+                    'available': calendar is not None,
+                    'unavailable_reason': state.unavailable.get(line_id, (None, None))[1],
+                    'maintenance_dates': state.maintenance.get(line_id, []),
+                    'capacity_minutes': capacity,
+                    'scheduled_minutes': load.get(line_id, 0),
+                    'utilization': round(load.get(line_id, 0) / capacity, 4) if capacity else 0.0,
+                })
+
+        return {
+            'start_date': state.params['start_date'],
+            'horizon_days': state.params['horizon_days'],
+            'shifts': [{'name': name, 'minutes': minutes} for name, minutes in state.params['shifts']],
+            'scheduled': scheduled,
+            'unscheduled': unscheduled,
+            'lines': lines,
+            'changed_batch_ids': changed_batch_ids,
+            'applied': applied,
+        }
+
+    def _store(self, workspace_id: int, state: ScheduleState) -> None:
+        """Keep a workspace's latest schedule."""
+        with self._lock:
+            self._cache[workspace_id] = state
+            self._cache.move_to_end(workspace_id)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+
+# Singleton instance
+production_schedule_manager = ProductionScheduleManager()
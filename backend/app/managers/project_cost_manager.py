@@ -0,0 +1,340 @@
+"""Project Cost Manager - incrementally maintained project cost rollups"""
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_
+from decimal import Decimal, ROUND_HALF_UP
+from app.managers.base_manager import BaseManager
+from app.models.project_cost_rollup import ProjectCostRollup
+from app.models.project_component import ProjectComponent
+from app.models.project_component_item_ledger import ProjectComponentItemLedger
+from app.models.miscellaneous_project_cost import MiscellaneousProjectCost
+from app.models.work_order import WorkOrder
+from app.models.enums import WorkTypeEnum
+from app.dao.project import project_dao
+from app.dao.project_component import project_component_dao
+from app.dao.project_cost_rollup import project_cost_rollup_dao, COST_COLUMNS
+
+
+CENT = Decimal('0.01')
+ZERO = Decimal('0.00')
+
+
+def _money(value: Any) -> Decimal:
+    """Convert to a 2-dp Decimal (rollup columns are Numeric(15, 2))."""
+    if value is None:
+        return ZERO
+    return Decimal(str(value)).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+class ProjectCostManager(BaseManager[ProjectCostRollup]):
+    """
+    UTILITY MANAGER: Maintains cost rollups per project and project component.
+
+    Cost sources call record_costs() with the changes they just flushed:
+    - LedgerPostingManager for project component item ledger postings
+    - MiscellaneousProjectCostService for misc cost create/update/delete
+    - WorkOrderManager for work order cost changes on project components
+
+    Changes are netted per rollup row, then applied with one atomic UPDATE
+    per touched component and one per project. A project without rollup
+    rows yet (new project, or data from before rollups existed) is rebuilt
+    from the source tables with grouped queries instead.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(ProjectCostRollup)
+        self.rollup_dao = project_cost_rollup_dao
+
+    def record_costs(
+        self,
+        session: Session,
+        workspace_id: int,
+        changes: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Add cost deltas to components and their projects (negative to remove).
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            changes: [{'project_component_id': int | None, 'project_id': int | None,
+                       'item_cost' | 'misc_cost' | 'work_order_cost' | 'maintenance_cost': delta}, ...]
+                     project_id is only used for costs without a component.
+
+        Note:
+            Call after the source changes are flushed - a rebuild reads them back.
+            This method does NOT commit. Service layer must commit.
+        """
+        costed = []
+        for change in changes:
+            deltas = {column: _money(change.get(column)) for column in COST_COLUMNS}
+            if any(deltas.values()):
+                costed.append((change, deltas))
+
+        # Resolve all components to their projects with one query
+        component_projects = project_component_dao.get_project_ids(
+            session,
+            ids=(change['project_component_id'] for change, _ in costed
+                 if change.get('project_component_id') is not None),
+            workspace_id=workspace_id
+        )
+
+        # Net the deltas per rollup row
+        per_project: Dict[int, Dict[Optional[int], Dict[str, Decimal]]] = {}
+        for change, deltas in costed:
+            component_id = change.get('project_component_id')
+            project_id = change.get('project_id')
+            if component_id is not None:
+                project_id = component_projects.get(component_id)
+            if project_id is None:
+                continue
+
+            rows = per_project.setdefault(project_id, {})
+            targets = (None,) if component_id is None else (None, component_id)
+            for target in targets:
+                row = rows.setdefault(target, {column: ZERO for column in COST_COLUMNS})
+                for column, delta in deltas.items():
+                    row[column] += delta
+
+        for project_id, rows in per_project.items():
+            if not self.rollup_dao.add_costs(
+                session, workspace_id=workspace_id, project_id=project_id,
+                project_component_id=None, deltas=self._nonzero(rows[None])
+            ):
+                # No rollups for this project yet: build them from the source
+                # tables, which already include the changes being recorded
+                self.rebuild_project(session, workspace_id, project_id)
+                continue
+
+            for component_id, deltas in rows.items():
+                if component_id is None or not self._nonzero(deltas):
+                    continue
+                if not self.rollup_dao.add_costs(
+                    session, workspace_id=workspace_id, project_id=project_id,
+                    project_component_id=component_id, deltas=self._nonzero(deltas)
+                ):
+                    # First cost for this component
+                    self.rollup_dao.create(session, obj_in={
+                        'workspace_id': workspace_id,
+                        'project_id': project_id,
+                        'project_component_id': component_id,
+                        **deltas
+                    })
+
+    def work_order_cost(self, work_order: WorkOrder) -> Dict[str, Any]:
+        """
+        Cost change a work order contributes to the rollups.
+
+        Only non-deleted work orders on a project component count. MAINTENANCE
+        work orders are booked as maintenance cost, all others as work order cost.
+
+        Returns:
+            A record_costs() change dict (empty if the work order adds no cost)
+        """
+        if work_order.is_deleted or work_order.project_component_id is None or not work_order.cost:
+            return {}
+        return {
+            'project_component_id': work_order.project_component_id,
+            self._work_order_column(work_order.work_type): _money(work_order.cost),
+        }
+
+    def record_work_order_change(
+        self,
+        session: Session,
+        workspace_id: int,
+        before: Dict[str, Any],
+        after: Dict[str, Any]
+    ) -> None:
+        """
+        Move a work order's cost in the rollups from its old to its new contribution.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            before: work_order_cost() before the change ({} for a new work order)
+            after: work_order_cost() after the change ({} for a deleted work order)
+        """
+        removed = {
+            key: -value if key in COST_COLUMNS else value
+            for key, value in before.items()
+        }
+        self.record_costs(session, workspace_id, [removed, after])
+
+    def rebuild_project(self, session: Session, workspace_id: int, project_id: int) -> List[Dict[str, Any]]:
+        """
+        Recompute all rollup rows of a project from the source tables.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            project_id: Project ID
+
+        Returns:
+            The rollup rows written (project row first)
+
+        Note:
+            This method does NOT commit. Service layer must commit.
+        """
+        totals: Dict[Optional[int], Dict[str, Decimal]] = {}
+
+        def add(component_id: Optional[int], column: str, amount: Any) -> None:
+            row = totals.setdefault(component_id, {c: ZERO for c in COST_COLUMNS})
+            row[column] += _money(amount)
+
+        in_project = and_(
+            ProjectComponent.workspace_id == workspace_id,
+            ProjectComponent.project_id == project_id
+        )
+
+        for component_id, amount in (
+            session.query(ProjectComponentItemLedger.project_component_id, func.sum(ProjectComponentItemLedger.total_cost))
+            .join(ProjectComponent, ProjectComponent.id == ProjectComponentItemLedger.project_component_id)
+            .filter(ProjectComponentItemLedger.workspace_id == workspace_id, in_project)
+            .group_by(ProjectComponentItemLedger.project_component_id)
+            .all()
+        ):
+            add(component_id, 'item_cost', amount)
+
+        # A misc cost belongs to its component's project, or to project_id if it has no component
+        for component_id, amount in (
+            session.query(MiscellaneousProjectCost.project_component_id, func.sum(MiscellaneousProjectCost.amount))
+            .outerjoin(ProjectComponent, ProjectComponent.id == MiscellaneousProjectCost.project_component_id)
+            .filter(
+                MiscellaneousProjectCost.workspace_id == workspace_id,
+                or_(
+                    in_project,
+                    and_(
+                        MiscellaneousProjectCost.project_component_id.is_(None),
+                        MiscellaneousProjectCost.project_id == project_id
+                    )
+                )
+            )
+            .group_by(MiscellaneousProjectCost.project_component_id)
+            .all()
+        ):
+            add(component_id, 'misc_cost', amount)
+
+        for component_id, work_type, amount in (
+            session.query(WorkOrder.project_component_id, WorkOrder.work_type, func.sum(WorkOrder.cost))
+            .join(ProjectComponent, ProjectComponent.id == WorkOrder.project_component_id)
+            .filter(
+                WorkOrder.workspace_id == workspace_id,
+                WorkOrder.is_deleted == False,
+                WorkOrder.cost.isnot(None),
+                in_project
+            )
+            .group_by(WorkOrder.project_component_id, WorkOrder.work_type)
+            .all()
+        ):
+            add(component_id, self._work_order_column(work_type), amount)
+
+        project_totals = {column: ZERO for column in COST_COLUMNS}
+        for component_totals in totals.values():
+            for column in COST_COLUMNS:
+                project_totals[column] += component_totals[column]
+
+        rows = [{'workspace_id': workspace_id, 'project_id': project_id,
+                 'project_component_id': None, **project_totals}]
+        rows += [
+            {'workspace_id': workspace_id, 'project_id': project_id,
+             'project_component_id': component_id, **component_totals}
+            for component_id, component_totals in totals.items()
+            if component_id is not None
+        ]
+
+        self.rollup_dao.delete_by_project(session, workspace_id=workspace_id, project_id=project_id)
+        self.rollup_dao.create_many(session, objs_in=rows)
+        session.flush()
+        return rows
+
+    def get_cost_summary(self, session: Session, workspace_id: int, project_id: int) -> Dict[str, Any]:
+        """
+        Get the cost tree of a project (project totals + every component).
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            project_id: Project ID
+
+        Returns:
+            Dict matching ProjectCostSummaryResponse
+
+        Raises:
+            ValueError: If project not found
+        """
+        rows = self.rollup_dao.get_cost_tree(session, workspace_id=workspace_id, project_id=project_id)
+        if not rows:
+            project = project_dao.get_by_id_and_workspace(session, id=project_id, workspace_id=workspace_id)
+            if not project:
+                raise ValueError(f"Project with ID {project_id} not found")
+            self.rebuild_project(session, workspace_id, project_id)
+            rows = self.rollup_dao.get_cost_tree(session, workspace_id=workspace_id, project_id=project_id)
+
+        first = rows[0]
+        summary = {column: _money(first[f'project_{column}']) for column in COST_COLUMNS}
+        summary['total_cost'] = sum(summary.values(), ZERO)
+
+        components = []
+        for row in rows:
+            if row['component_id'] is None:
+                continue
+            component = {column: _money(row[f'component_{column}']) for column in COST_COLUMNS}
+            component['total_cost'] = sum(component.values(), ZERO)
+            component.update({
+                'project_component_id': row['component_id'],
+                'name': row['component_name'],
+                'budget': row['component_budget'],
+            })
+            components.append(component)
+
+        summary.update({
+            'project_id': first['project_id'],
+            'name': first['project_name'],
+            'budget': first['project_budget'],
+            'unassigned_cost': summary['total_cost'] - sum((c['total_cost'] for c in components), ZERO),
+            'components': components,
+            'updated_at': first['project_updated_at'],
+        })
+        return summary
+
+    def get_component_item_cost(
+        self, session: Session, workspace_id: int, project_component_id: int
+    ) -> Decimal:
+        """
+        Get the total item cost of a component from its rollup row.
+
+        Returns:
+            Total item cost (0 if the component does not exist)
+        """
+        component = project_component_dao.get_by_id_and_workspace(
+            session, id=project_component_id, workspace_id=workspace_id
+        )
+        if not component:
+            return ZERO
+
+        if not self.rollup_dao.get_rollup(
+            session, workspace_id=workspace_id, project_id=component.project_id
+        ):
+            self.rebuild_project(session, workspace_id, component.project_id)
+
+        rollup = self.rollup_dao.get_rollup(
+            session, workspace_id=workspace_id, project_id=component.project_id,
+            project_component_id=project_component_id
+        )
+        return _money(rollup.item_cost) if rollup else ZERO
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _work_order_column(self, work_type: WorkTypeEnum) -> str:
+        """Rollup column a work order's cost is booked in."""
+        return 'maintenance_cost' if work_type == WorkTypeEnum.MAINTENANCE else 'work_order_cost'
+
+    def _nonzero(self, deltas: Dict[str, Decimal]) -> Dict[str, Decimal]:
+        """Drop zero deltas (an UPDATE with nothing to add still touches the row)."""
+        return {column: delta for column, delta in deltas.items() if delta}
+
+
+# Singleton instance
+project_cost_manager = ProjectCostManager()
@@ -1,19 +1,26 @@
 """Purchase Order Manager - business logic for purchase orders"""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from decimal import Decimal
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException, status
 
 from app.managers.base_manager import BaseManager
+from app.managers.replenishment_manager import replenishment_manager
 from app.models.purchase_order import PurchaseOrder
 from app.models.purchase_order_item import PurchaseOrderItem
 from app.schemas.purchase_order import (
     PurchaseOrderCreate, PurchaseOrderUpdate,
     PurchaseOrderItemCreate, PurchaseOrderItemUpdate,
+    PurchaseOrderGenerate, PurchaseOrderShortage,
 )
+from app.dao.item import item_dao
 from app.dao.purchase_order import purchase_order_dao, purchase_order_item_dao
 
 
+TWO_PLACES = Decimal('0.01')
+
+
 class PurchaseOrderManager(BaseManager[PurchaseOrder]):
     """Manager for purchase order business logic."""
 
@@ -58,8 +65,126 @@ class PurchaseOrderManager(BaseManager[PurchaseOrder]):
         po.total_amount = subtotal
         session.flush()
 
+        replenishment_manager.invalidate_workspace(session, workspace_id)
         return po
 
+    def generate_purchase_orders(
+        self, session: Session, data: PurchaseOrderGenerate,
+        workspace_id: int, user_id: int
+    ) -> Dict[str, Any]:
+        """
+        Create purchase orders for many shortages at once.
+
+        Shortages are grouped into one order per supplier account and
+        destination. The supplier and unit price of a line default to the
+        latest purchase of its item (purchase order lines and payable
+        invoiced orders), looked up for all items in one query. Items never
+        bought go to default_account_id at price 0, or are returned as
+        unassigned without one. Repeated items of one order are merged.
+
+        Five statements regardless of size: items (also loaded for the
+        lines' item names), last purchases, next PO number, and one
+        INSERT ... RETURNING each for the orders and their lines.
+
+        Returns:
+            {'purchase_orders': [(PurchaseOrder, [PurchaseOrderItem])],
+             'unassigned': [PurchaseOrderShortage], 'line_count': int, 'total_amount': Decimal}
+
+        Raises:
+            HTTPException: If an item is not found
+        """
+        item_ids = {shortage.item_id for shortage in data.shortages}
+        items_by_id = {
+            item.id: item for item in item_dao.get_by_ids_in_workspace(session, workspace_id=workspace_id, ids=item_ids)
+        }
+        missing = sorted(item_ids - items_by_id.keys())
+        if missing:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Items not found: {missing}")
+
+        last_purchases = self.item_dao.get_last_purchases(session, workspace_id=workspace_id, item_ids=item_ids)
+
+        # (account_id, destination_type, destination_id) -> item_id -> line
+        groups: Dict[Tuple[int, str, int], Dict[int, Dict[str, Any]]] = {}
+        unassigned: List[PurchaseOrderShortage] = []
+        for shortage in data.shortages:
+            last = last_purchases.get(shortage.item_id)
+            account_id = shortage.account_id or (last[0] if last else data.default_account_id)
+            if account_id is None:
+                unassigned.append(shortage)
+                continue
+            if shortage.unit_price is not None:
+                unit_price = shortage.unit_price
+            else:
+                unit_price = last[1] if last else Decimal('0')
+
+            lines = groups.setdefault((account_id, shortage.destination_type, shortage.destination_id), {})
+            line = lines.get(shortage.item_id)
+            if line is None:
+                lines[shortage.item_id] = {
+                    'item_id': shortage.item_id,
+                    'quantity_ordered': shortage.quantity,
+                    'unit_price': unit_price,
+                }
+            else:
+                line['quantity_ordered'] += shortage.quantity
+                if shortage.unit_price is not None:
+                    line['unit_price'] = shortage.unit_price
+
+        if not groups:
+            return {'purchase_orders': [], 'unassigned': unassigned, 'line_count': 0, 'total_amount': Decimal('0')}
+
+        po_numbers = self.po_dao.get_next_numbers(session, workspace_id=workspace_id, count=len(groups))
+        order_rows = []
+        for po_number, ((account_id, destination_type, destination_id), lines) in zip(po_numbers, groups.items()):
+            for line in lines.values():
+                line['line_subtotal'] = (line['quantity_ordered'] * line['unit_price']).quantize(TWO_PLACES)
+            subtotal = sum((line['line_subtotal'] for line in lines.values()), Decimal('0'))
+            order_rows.append({
+                'workspace_id': workspace_id,
+                'po_number': po_number,
+                'account_id': account_id,
+                'destination_type': destination_type,
+                'destination_id': destination_id,
+                'subtotal': subtotal,
+                'total_amount': subtotal,
+                'current_status_id': data.current_status_id,
+                'order_workflow_id': data.order_workflow_id,
+                'description': data.description,
+                'internal_note': data.internal_note,
+                'created_by': user_id,
+            })
+
+        # RETURNING order is not guaranteed; PO numbers are unique
+        orders_by_number = {
+            po.po_number: po for po in self.po_dao.create_many_returning(session, objs_in=order_rows)
+        }
+        orders = [orders_by_number[po_number] for po_number in po_numbers]
+        item_rows = [
+            {
+                **line,
+                'workspace_id': workspace_id,
+                'purchase_order_id': po.id,
+                'line_number': line_number,
+                'quantity_received': Decimal('0'),
+            }
+            for po, lines in zip(orders, groups.values())
+            for line_number, line in enumerate(lines.values(), start=1)
+        ]
+        items_by_order: Dict[int, List[PurchaseOrderItem]] = {po.id: [] for po in orders}
+        for item in self.item_dao.create_many_returning(session, objs_in=item_rows):
+            set_committed_value(item, 'item', items_by_id[item.item_id])  # No lazy load per line
+            items_by_order[item.purchase_order_id].append(item)
+
+        replenishment_manager.invalidate_workspace(session, workspace_id)
+        return {
+            'purchase_orders': [
+                (po, sorted(items_by_order[po.id], key=lambda item: item.line_number)) for po in orders
+            ],
+            'unassigned': unassigned,
+            'line_count': len(item_rows),
+            'total_amount': sum((po.total_amount for po in orders), Decimal('0')),
+        }
+
     def update_purchase_order(
         self, session: Session, po_id: int, data: PurchaseOrderUpdate,
         workspace_id: int, user_id: int
@@ -0,0 +1,175 @@
+"""Quota Manager - subscription usage counters and limit checks"""
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.core.exceptions import QuotaExceededError
+from app.managers.base_manager import BaseManager
+from app.models.attachment import Attachment
+from app.models.factory import Factory
+from app.models.machine import Machine
+from app.models.order import Order
+from app.models.project import Project
+from app.models.workspace import Workspace
+from app.models.workspace_member import WorkspaceMember
+from app.dao.workspace import workspace_dao, month_start, QUOTA_FIELDS
+
+
+def _value(target: Any, attribute: str, old: bool) -> Any:
+    """Current value of an attribute, or its value before the pending change when `old`."""
+    if old:
+        history = inspect(target).attrs[attribute].history
+        if history.deleted:
+            return history.deleted[0]
+    return getattr(target, attribute)
+
+
+def _not_deleted(target: Any, old: bool) -> int:
+    """1 for rows counted while not soft-deleted"""
+    return 0 if _value(target, 'is_deleted', old) else 1
+
+
+def _active_member(target: Any, old: bool) -> int:
+    """1 for active workspace members"""
+    return 1 if _value(target, 'status', old) == 'active' else 0
+
+
+def _order_this_month(target: Any, old: bool) -> int:
+    """1 for orders created in the current month"""
+    created_at = _value(target, 'created_at', old)
+    return 1 if created_at is None or created_at >= month_start(datetime.utcnow()) else 0
+
+
+def _stored_bytes(target: Any, old: bool) -> int:
+    """File size of attachments that are not soft-deleted"""
+    if _value(target, 'is_deleted', old):
+        return 0
+    return int(_value(target, 'file_size', old) or 0)
+
+
+# Model -> (workspace usage column, contribution of one row, attributes it depends on)
+COUNTED_MODELS: Dict[type, Tuple[str, Callable[[Any, bool], int], Tuple[str, ...]]] = {
+    WorkspaceMember: ('current_members_count', _active_member, ('status',)),
+    Factory: ('current_factories_count', _not_deleted, ('is_deleted',)),
+    Machine: ('current_machines_count', _not_deleted, ('is_deleted',)),
+    Project: ('current_projects_count', _not_deleted, ('is_deleted',)),
+    Order: ('current_orders_this_month', _order_this_month, ('created_at',)),
+    Attachment: ('current_storage_bytes', _stored_bytes, ('is_deleted', 'file_size')),
+}
+
+
+class QuotaManager(BaseManager[Workspace]):
+    """
+    UTILITY MANAGER: Subscription usage counters and quota checks.
+
+    The workspace's current_* counters are maintained incrementally: ORM
+    mapper events on members, factories, machines, projects, orders and
+    attachments issue one atomic UPDATE ... SET counter = counter + delta in
+    the writing transaction (soft deletes and restores included). Quota
+    checks then read two integers instead of counting rows, and recount()
+    (run nightly) corrects drift from writes that bypass the ORM.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(Workspace)
+        self.workspace_dao = workspace_dao
+
+    def get_quota(self, workspace: Workspace, quota: str) -> Tuple[int, int]:
+        """
+        Get current usage and plan limit of a quota.
+
+        Args:
+            workspace: Workspace (with its subscription plan)
+            quota: Quota name ('members', 'factories', 'machines', 'projects',
+                'orders_per_month', 'storage_mb')
+
+        Returns:
+            Tuple of (current_usage, max_limit); max_limit -1 means unlimited
+        """
+        current_field, max_field = QUOTA_FIELDS[quota]
+        current_usage = getattr(workspace, current_field)
+        if quota == 'orders_per_month' and workspace.last_usage_reset_at < month_start(datetime.utcnow()):
+            # Counter still holds a previous month
+            current_usage = 0
+        plan = workspace.subscription_plan
+        max_limit = getattr(plan, max_field) if plan else -1
+        return current_usage, max_limit
+
+    def ensure_quota(self, workspace: Workspace, quota: str, amount: int = 1) -> None:
+        """
+        Reject a create that would exceed the workspace's plan limit.
+
+        Args:
+            workspace: Workspace (with its subscription plan)
+            quota: Quota name (see get_quota)
+            amount: Units the create adds (MB for storage_mb)
+
+        Raises:
+            QuotaExceededError: If usage + amount exceeds the limit
+        """
+        current_usage, max_limit = self.get_quota(workspace, quota)
+        if max_limit != -1 and current_usage + amount > max_limit:
+            raise QuotaExceededError(
+                f"Workspace has reached its {quota.replace('_', ' ')} limit ({max_limit}). "
+                f"Upgrade subscription to add more.",
+                errors=[{'quota': quota, 'current': current_usage, 'limit': max_limit}]
+            )
+
+    def recount(self, session: Session, workspace_id: Optional[int] = None) -> int:
+        """
+        Recompute usage counters from the source tables.
+
+        Returns:
+            Number of workspaces updated
+
+        Note:
+            This method does NOT commit. Caller must commit.
+        """
+        return self.workspace_dao.recount_usage(session, workspace_id=workspace_id)
+
+
+def _count_change(connection, target: Any, before: int, after: int) -> None:
+    """Apply one row's change in contribution to its workspace counter."""
+    if before == after or target.workspace_id is None:
+        return
+    column, _, _ = COUNTED_MODELS[type(target)]
+    workspace_dao.add_usage(connection, workspace_id=target.workspace_id, deltas={column: after - before})
+
+
+def _after_insert(mapper, connection, target) -> None:
+    """Mapper after_insert hook for counted models."""
+    _, contribution, _ = COUNTED_MODELS[type(target)]
+    _count_change(connection, target, 0, contribution(target, False))
+
+
+def _after_update(mapper, connection, target) -> None:
+    """Mapper after_update hook for counted models (soft delete, restore, status, file size)."""
+    _, contribution, _ = COUNTED_MODELS[type(target)]
+    _count_change(connection, target, contribution(target, True), contribution(target, False))
+
+
+def _after_delete(mapper, connection, target) -> None:
+    """Mapper after_delete hook for counted models."""
+    _, contribution, _ = COUNTED_MODELS[type(target)]
+    _count_change(connection, target, contribution(target, True), 0)
+
+
+def _keep_old_value(target, value, oldvalue, initiator):
+    """Attribute set hook; registered with active_history so the old value is loaded for _value()."""
+    return value
+
+
+for _model, (_, _, _attributes) in COUNTED_MODELS.items():
+    event.listen(_model, 'after_insert', _after_insert)
+    event.listen(_model, 'after_update', _after_update)
+    event.listen(_model, 'after_delete', _after_delete)
+    for _attribute in _attributes:
+        # Without active history, changing an expired attribute (e.g. after
+        # commit) would not record the value it replaces
+        event.listen(getattr(_model, _attribute), 'set', _keep_old_value, active_history=True, retval=True)
+
+
+# Singleton instance
+quota_manager = QuotaManager()
@@ -0,0 +1,265 @@
+"""Reference Data Manager - cached per-workspace statuses, workflows, departments and settings"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from app.managers.base_manager import BaseManager
+from app.models.app_settings import AppSettings
+from app.models.department import Department
+from app.models.order_workflow import OrderWorkflow
+from app.models.status import Status
+from app.dao.app_settings import app_settings_dao
+from app.dao.department import department_dao
+from app.dao.order_workflow import order_workflow_dao
+from app.dao.status import status_dao
+
+
+# Reference data is reloaded after this long, so writes made by other
+# processes (which cannot bump this process's versions) show up
+CACHE_TTL_SECONDS = 600
+
+# Workspaces kept before the least recently used is dropped
+CACHE_MAX_ENTRIES = 512
+
+# session.info key holding workspace IDs to invalidate on commit
+PENDING_KEY = 'reference_data_invalidations'
+
+# Models whose writes invalidate the workspace's reference data
+REFERENCE_MODELS = (Status, OrderWorkflow, Department, AppSettings)
+
+
+class WorkflowGraph:
+    """
+    Compiled order workflow: status sequence plus allowed reverts.
+
+    Edges are sequence[i] -> sequence[i + 1] (advance) and the entries of
+    allowed_reverts_json ({from_status_id: [to_status_id, ...]}, a single ID
+    is accepted as well).
+    """
+
+    __slots__ = ('type', 'sequence', 'positions', 'reverts')
+
+    def __init__(self, workflow_type: str, status_sequence: Iterable[int], allowed_reverts: Any = None):
+        self.type = workflow_type
+        self.sequence: Tuple[int, ...] = tuple(int(status_id) for status_id in status_sequence or ())
+        self.positions: Dict[int, int] = {}
+        for position, status_id in enumerate(self.sequence):
+            self.positions.setdefault(status_id, position)
+        self.reverts: Dict[int, FrozenSet[int]] = _parse_reverts(allowed_reverts)
+
+    @property
+    def first_status_id(self) -> Optional[int]:
+        """First status of the workflow"""
+        return self.sequence[0] if self.sequence else None
+
+    @property
+    def final_status_id(self) -> Optional[int]:
+        """Last status of the workflow"""
+        return self.sequence[-1] if self.sequence else None
+
+    def next_status_id(self, current_status_id: int) -> Optional[int]:
+        """Status after `current_status_id`, None if it is last or not in the workflow"""
+        position = self.positions.get(current_status_id)
+        if position is None or position + 1 >= len(self.sequence):
+            return None
+        return self.sequence[position + 1]
+
+    def can_transition(self, from_status_id: int, to_status_id: int, allow_skip: bool = False) -> bool:
+        """
+        Whether an order may move between two statuses.
+
+        Args:
+            from_status_id: Current status
+            to_status_id: Target status
+            allow_skip: Also allow jumping forward over intermediate statuses
+        """
+        if to_status_id in self.reverts.get(from_status_id, ()):
+            return True
+        from_position = self.positions.get(from_status_id)
+        to_position = self.positions.get(to_status_id)
+        if from_position is None or to_position is None:
+            return False
+        if allow_skip:
+            return to_position > from_position
+        return to_position == from_position + 1
+
+
+class ReferenceData:
+    """
+    Immutable snapshot of one workspace's reference data.
+
+    Holds plain values (no ORM objects), so it can be shared between
+    sessions and threads.
+    """
+
+    __slots__ = ('workspace_id', 'version', 'statuses', 'status_ids', 'workflows', 'departments', 'settings')
+
+    def __init__(
+        self,
+        workspace_id: int,
+        version: int,
+        statuses: Iterable[Tuple[int, str]],
+        workflows: Iterable[Tuple[str, List[int], Any]],
+        departments: Iterable[Tuple[int, str]],
+        settings: Iterable[Tuple[str, bool]]
+    ):
+        self.workspace_id = workspace_id
+        self.version = version
+        self.statuses: Dict[int, str] = dict(statuses)
+        self.status_ids: Dict[str, int] = {}
+        for status_id, name in self.statuses.items():
+            self.status_ids.setdefault(name.lower(), status_id)
+        self.workflows: Dict[str, WorkflowGraph] = {
+            workflow_type: WorkflowGraph(workflow_type, sequence, reverts)
+            for workflow_type, sequence, reverts in workflows
+        }
+        self.departments: Dict[int, str] = dict(departments)
+        self.settings: Dict[str, bool] = {name: bool(enabled) for name, enabled in settings}
+
+    def status_id(self, name: str) -> Optional[int]:
+        """ID of a status by name (case-insensitive)"""
+        return self.status_ids.get(name.lower())
+
+    def setting_enabled(self, name: str, default: bool = False) -> bool:
+        """Whether an app setting is enabled"""
+        return self.settings.get(name, default)
+
+
+class ReferenceDataManager(BaseManager[Status]):
+    """
+    UTILITY MANAGER: Cached per-workspace reference data.
+
+    Statuses, order workflows, active departments and app settings are small
+    and rarely change but are read on every order transition. get() loads a
+    workspace's set (one column-only query per table) into an immutable
+    ReferenceData snapshot kept in an LRU cache.
+
+    Every workspace has a version number. Inserts, updates and deletes of the
+    reference models are caught with ORM mapper events and bump it (once at
+    flush and again after commit), so no write path has to remember to
+    invalidate.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(Status)
+        # workspace_id -> (version, loaded_at, ReferenceData)
+        self._cache: "OrderedDict[int, Tuple[int, float, ReferenceData]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session: Session, workspace_id: int) -> ReferenceData:
+        """
+        Get a workspace's reference data (from cache when current).
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+
+        Returns:
+            ReferenceData snapshot
+        """
+        with self._lock:
+            version = self._versions.get(workspace_id, 0)
+            cached = self._cache.get(workspace_id)
+            if (
+                cached is not None
+                and cached[0] == version
+                and time.monotonic() - cached[1] <= CACHE_TTL_SECONDS
+            ):
+                self._cache.move_to_end(workspace_id)
+                return cached[2]
+
+        data = ReferenceData(
+            workspace_id,
+            version,
+            statuses=status_dao.get_reference_rows(session, workspace_id=workspace_id),
+            workflows=order_workflow_dao.get_reference_rows(session, workspace_id=workspace_id),
+            departments=department_dao.get_reference_rows(session, workspace_id=workspace_id),
+            settings=app_settings_dao.get_reference_rows(session, workspace_id=workspace_id)
+        )
+
+        with self._lock:
+            # Only cache if no write invalidated the workspace while loading
+            if self._versions.get(workspace_id, 0) == version:
+                self._cache[workspace_id] = (version, time.monotonic(), data)
+                self._cache.move_to_end(workspace_id)
+                while len(self._cache) > CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        return data
+
+    def get_workflow(self, session: Session, workspace_id: int, workflow_type: Optional[str]) -> Optional[WorkflowGraph]:
+        """
+        Get the compiled graph of a workflow type.
+
+        Returns:
+            WorkflowGraph or None if the type is empty or unknown
+        """
+        if not workflow_type:
+            return None
+        return self.get(session, workspace_id).workflows.get(workflow_type)
+
+    def invalidate_workspace(self, session: Optional[Session], workspace_id: int) -> None:
+        """
+        Make a workspace's cached reference data stale.
+
+        The version is bumped now and, when a session is given, once more
+        after it commits, so data read between flush and commit is not served
+        afterwards.
+        """
+        self._bump(workspace_id)
+        if session is None:
+            return
+        session.info.setdefault(PENDING_KEY, set()).add(workspace_id)
+        if not event.contains(session, 'after_commit', _invalidate_after_commit):
+            event.listen(session, 'after_commit', _invalidate_after_commit)
+
+    def clear_cache(self) -> None:
+        """Drop all cached reference data."""
+        with self._lock:
+            self._cache.clear()
+
+    def _bump(self, workspace_id: int) -> None:
+        """Increase a workspace's version number."""
+        with self._lock:
+            self._versions[workspace_id] = self._versions.get(workspace_id, 0) + 1
+
+
+def _parse_reverts(allowed_reverts: Any) -> Dict[int, FrozenSet[int]]:
+    """Parse allowed_reverts_json into {from_status_id: frozenset(to_status_ids)}, skipping bad entries."""
+    reverts: Dict[int, FrozenSet[int]] = {}
+    if not isinstance(allowed_reverts, dict):
+        return reverts
+    for from_status, targets in allowed_reverts.items():
+        if not isinstance(targets, (list, tuple)):
+            targets = [targets]
+        try:
+            reverts[int(from_status)] = frozenset(int(target) for target in targets)
+        except (TypeError, ValueError):
+            continue
+    return reverts
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    """Session after_commit hook: bump the workspaces written in the committed transaction."""
+    workspace_ids = session.info.pop(PENDING_KEY, None)
+    for workspace_id in workspace_ids or ():
+        reference_data_manager._bump(workspace_id)
+
+
+def _invalidate_on_write(mapper, connection, target) -> None:
+    """Mapper after_insert/update/delete hook for the reference models."""
+    if target.workspace_id is not None:
+        reference_data_manager.invalidate_workspace(object_session(target), target.workspace_id)
+
+
+for _model in REFERENCE_MODELS:
+    for _event_name in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(_model, _event_name, _invalidate_on_write)
+
+
+# Singleton instance
+reference_data_manager = ReferenceDataManager()
@@ -0,0 +1,277 @@
+"""Replenishment Manager - reorder points, shortages and suggested purchase orders for spare parts"""
+import math
+import threading
+import time as clock
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.managers.base_manager import BaseManager
+from app.models.storage_item import StorageItem
+from app.dao.storage_item import storage_item_dao
+
+
+# Plans are recomputed after this long, so stock movements since show up
+CACHE_TTL_SECONDS = 300
+
+# (workspace, parameters) plans kept before the least recently used is dropped
+CACHE_MAX_ENTRIES = 64
+
+# session.info key holding workspace IDs whose plans are dropped on commit
+PENDING_KEY = 'replenishment_invalidations'
+
+TWO_PLACES = Decimal('0.01')
+
+# Cache key: (workspace_id, as_of, window_days, lead_time_days, service_level, cover_days)
+PlanKey = Tuple[int, date, int, int, float, int]
+
+
+def _decimal(value: Optional[float]) -> Optional[Decimal]:
+    """Round a number (or None) to a 2-place Decimal."""
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(TWO_PLACES)
+
+
+class ReplenishmentManager(BaseManager[StorageItem]):
+    """
+    UTILITY MANAGER: Spare-parts reorder points and minimum-stock alerts.
+
+    Per (factory, item), from one aggregated query per workspace
+    (DAOStorageItem.get_replenishment_rows):
+    - daily_rate / daily_std_dev: mean and standard deviation of daily
+      consumption (storage and machine ledgers) over the window, days
+      without consumption counting as 0
+    - safety_stock = z * daily_std_dev * sqrt(lead_time_days), with z the
+      normal quantile of the service level
+    - reorder_point = daily_rate * lead_time_days + safety_stock
+    - available = on_hand + on_order - machine_shortfall, where the
+      shortfall is what machines lack to reach their req_qty
+    An item is short when available is at or below its reorder point (below
+    zero for items without consumption); the suggested quantity brings it up
+    to reorder_point + cover_days of consumption. Suggested purchase orders
+    group the shortages per factory storage.
+
+    Plans are cached per workspace and parameters for CACHE_TTL_SECONDS;
+    invalidate_workspace drops them once a session commits.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(StorageItem)
+        self._cache: "OrderedDict[PlanKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_replenishment(
+        self,
+        session: Session,
+        workspace_id: int,
+        window_days: int = 90,
+        lead_time_days: int = 14,
+        service_level: float = 0.95,
+        cover_days: int = 30,
+        factory_id: Optional[int] = None,
+        refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get the shortage list and suggested purchase orders of a workspace.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            window_days: Days of consumption the rates are taken from
+            lead_time_days: Days between ordering and receiving
+            service_level: Probability of not running out during the lead time (0.5-0.999)
+            cover_days: Days of consumption ordered on top of the reorder point
+            factory_id: Restrict the result to one factory (optional)
+            refresh: Recompute instead of using a cached plan
+
+        Returns:
+            Dict matching ReplenishmentResponse
+        """
+        if not 0.5 <= service_level < 1:
+            raise ValueError("Service level must be between 0.5 and 1")
+
+        today = datetime.utcnow().date()
+        key = (workspace_id, today, window_days, lead_time_days, service_level, cover_days)
+        plan = None if refresh else self._cached(key)
+        if plan is None:
+            plan = self._plan(session, workspace_id, today, window_days, lead_time_days, service_level, cover_days)
+            self._store(key, plan)
+
+        if factory_id is None:
+            return plan
+        shortages = [line for line in plan['shortages'] if line['factory_id'] == factory_id]
+        return {
+            **plan,
+            'item_count': plan['item_counts'].get(factory_id, 0),
+            'shortage_count': len(shortages),
+            'shortages': shortages,
+            'suggested_purchase_orders': [
+                order for order in plan['suggested_purchase_orders'] if order['destination_id'] == factory_id
+            ],
+        }
+
+    def invalidate_workspace(self, session: Session, workspace_id: int) -> None:
+        """
+        Drop a workspace's cached plans once the session commits.
+
+        Call after changes that move its stock position (e.g. new purchase orders).
+        """
+        session.info.setdefault(PENDING_KEY, set()).add(workspace_id)
+        if not event.contains(session, 'after_commit', _invalidate_after_commit):
+            event.listen(session, 'after_commit', _invalidate_after_commit)
+            event.listen(session, 'after_rollback', _discard_after_rollback)
+
+    def clear_cache(self) -> None:
+        """Drop all cached plans."""
+        with self._lock:
+            self._cache.clear()
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _plan(
+        self,
+        session: Session,
+        workspace_id: int,
+        today: date,
+        window_days: int,
+        lead_time_days: int,
+        service_level: float,
+        cover_days: int
+    ) -> Dict[str, Any]:
+        """Compute the plan of a workspace from one aggregated query."""
+        window_start = datetime.combine(today - timedelta(days=window_days - 1), time.min)
+        rows = storage_item_dao.get_replenishment_rows(session, workspace_id=workspace_id, window_start=window_start)
+        z = NormalDist().inv_cdf(service_level)
+
+        item_counts: Dict[int, int] = {}
+        shortages: List[Dict[str, Any]] = []
+        orders: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            item_counts[row['factory_id']] = item_counts.get(row['factory_id'], 0) + 1
+            line = self._line(row, window_days, lead_time_days, z, cover_days)
+            if not line['is_short']:
+                continue
+            shortages.append(line)
+
+            order = orders.get(line['factory_id'])
+            if order is None:
+                order = orders[line['factory_id']] = {
+                    'destination_type': 'storage',
+                    'destination_id': line['factory_id'],
+                    'factory_name': line['factory_name'],
+                    'estimated_total': Decimal('0'),
+                    'items': [],
+                }
+            price = line['estimated_unit_price']
+            subtotal = (price * line['suggested_qty']).quantize(TWO_PLACES) if price is not None else None
+            order['items'].append({
+                'item_id': line['item_id'],
+                'item_name': line['item_name'],
+                'item_unit': line['item_unit'],
+                'quantity': line['suggested_qty'],
+                'estimated_unit_price': price,
+                'estimated_subtotal': subtotal,
+            })
+            if subtotal is not None:
+                order['estimated_total'] += subtotal
+
+        return {
+            'as_of': today,
+            'window_days': window_days,
+            'lead_time_days': lead_time_days,
+            'service_level': Decimal(str(service_level)),
+            'cover_days': cover_days,
+            'item_count': len(rows),
+            'item_counts': item_counts,
+            'shortage_count': len(shortages),
+            'shortages': shortages,
+            'suggested_purchase_orders': list(orders.values()),
+        }
+
+    def _line(
+        self, row: Dict[str, Any], window_days: int, lead_time_days: int, z: float, cover_days: int
+    ) -> Dict[str, Any]:
+        """Reorder parameters and stock position of one factory/item pair."""
+        consumed = float(row['consumed'])
+        rate = consumed / window_days
+        variance = max(float(row['consumed_sq']) / window_days - rate * rate, 0.0)
+        std_dev = math.sqrt(variance)
+
+        safety_stock = math.ceil(z * std_dev * math.sqrt(lead_time_days))
+        reorder_point = math.ceil(rate * lead_time_days) + safety_stock
+
+        on_hand = int(row['on_hand'])
+        on_order = int(row['on_order'])
+        machine_shortfall = int(row['machine_shortfall'])
+        available = on_hand + on_order - machine_shortfall
+        is_short = available <= reorder_point if rate > 0 else available < 0
+        suggested_qty = (
+            max(math.ceil(reorder_point + rate * cover_days - available), 1) if is_short else 0
+        )
+
+        return {
+            'factory_id': row['factory_id'],
+            'factory_name': row['factory_name'],
+            'item_id': row['item_id'],
+            'item_name': row['item_name'],
+            'item_unit': row['item_unit'],
+            'on_hand': on_hand,
+            'on_order': on_order,
+            'machine_shortfall': machine_shortfall,
+            'available': available,
+            'consumed': int(consumed),
+            'daily_rate': _decimal(rate),
+            'daily_std_dev': _decimal(std_dev),
+            'days_of_cover': _decimal(max(available, 0) / rate) if rate > 0 else None,
+            'safety_stock': safety_stock,
+            'reorder_point': reorder_point,
+            'is_short': is_short,
+            'suggested_qty': suggested_qty,
+            'estimated_unit_price': _decimal(row['avg_price']),
+        }
+
+    def _cached(self, key: PlanKey) -> Optional[Dict[str, Any]]:
+        """A cached plan younger than CACHE_TTL_SECONDS, or None."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            built_at, plan = entry
+            if clock.monotonic() - built_at > CACHE_TTL_SECONDS:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return plan
+
+    def _store(self, key: PlanKey, plan: Dict[str, Any]) -> None:
+        """Put a plan into the LRU cache."""
+        with self._lock:
+            self._cache[key] = (clock.monotonic(), plan)
+            self._cache.move_to_end(key)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    """Session after_commit hook: drop the plans of workspaces changed in the committed transaction."""
+    pending = session.info.pop(PENDING_KEY, None) or ()
+    if not pending:
+        return
+    with replenishment_manager._lock:
+        for key in [key for key in replenishment_manager._cache if key[0] in pending]:
+            del replenishment_manager._cache[key]
+
+
+def _discard_after_rollback(session: Session) -> None:
+    """Session after_rollback hook: nothing changed, nothing to drop."""
+    session.info.pop(PENDING_KEY, None)
+
+
+# Singleton instance
+replenishment_manager = ReplenishmentManager()
@@ -2,6 +2,8 @@
 from typing import List
 from sqlalchemy.orm import Session
 from app.managers.base_manager import BaseManager
+from app.managers.ledger_posting_manager import ledger_posting_manager
+from app.models.enums import InventoryTypeEnum
 from app.models.sales_order import SalesOrder
 from app.dao.sales_order import sales_order_dao
 from app.dao.sales_order_item import sales_order_item_dao
@@ -33,6 +35,7 @@ class SalesManager(BaseManager[SalesOrder]):
         self.sales_delivery_item_dao = sales_delivery_item_dao
         self.inventory_ledger_dao = inventory_ledger_dao
         self.inventory_dao = inventory_dao
+        self.posting_manager = ledger_posting_manager
 
     def create_sales_order_with_items(
         self,
@@ -174,6 +177,9 @@ class SalesManager(BaseManager[SalesOrder]):
 
         Returns:
             Updated sales order
+
+        Raises:
+            ValueError: If delivery not found or stock is insufficient
         """
         # Get delivery
         delivery = self.sales_delivery_dao.get_by_id_and_workspace(
@@ -201,44 +207,36 @@ class SalesManager(BaseManager[SalesOrder]):
         )
         self.sales_delivery_dao.update(session, db_obj=delivery, obj_in=delivery_update)
 
-        # Process each delivery item
+        # Update sales order item quantities delivered
         for delivery_item in delivery_items:
-            # Update sales order item quantity delivered
             order_item = self.sales_order_item_dao.get(session, id=delivery_item.sales_order_item_id)
             order_item.quantity_delivered += delivery_item.quantity_delivered
-            session.flush()
+        session.flush()
 
-            # Create inventory ledger entry (transfer_out)
-            from app.schemas.inventory_ledger import InventoryLedgerCreate
-            ledger_entry = InventoryLedgerCreate(
-                workspace_id=workspace_id,
-                factory_id=sales_order.factory_id,
-                item_id=delivery_item.item_id,
-                transaction_type='transfer_out',
-                quantity=delivery_item.quantity_delivered,
-                unit_cost=0,  # TODO: Get actual cost from inventory
-                total_cost=0,
-                qty_before=0,  # TODO: Get from inventory snapshot
-                qty_after=0,
-                source_type='sales_delivery',
-                source_id=delivery_id,
-                transfer_destination_type='customer',
-                transfer_destination_id=sales_order.account_id,
-                notes=f"Delivery {delivery.delivery_number} for SO-{sales_order.sales_order_number}",
-                performed_by=user_id
-            )
-            self.inventory_ledger_dao.create(session, obj_in=ledger_entry)
-
-            # Update inventory snapshot (deduct quantity)
-            inventory = self.inventory_dao.get_by_factory_and_item(
-                session,
-                factory_id=sales_order.factory_id,
-                item_id=delivery_item.item_id,
-                workspace_id=workspace_id
-            )
-            if inventory:
-                inventory.qty -= delivery_item.quantity_delivered
-                session.flush()
+        # Post all inventory ledger entries (transfer_out) in one bulk write;
+        # cost, qty before/after and the inventory snapshot come from the posting
+        self.posting_manager.post_movements(
+            session,
+            ledger='inventory',
+            movements=[
+                {
+                    'inventory_type': InventoryTypeEnum.STORAGE,
+                    'factory_id': sales_order.factory_id,
+                    'item_id': delivery_item.item_id,
+                    'transaction_type': 'transfer_out',
+                    'quantity': delivery_item.quantity_delivered,
+                    'source_type': 'sales_delivery',
+                    'source_id': delivery_id,
+                    'transfer_destination_type': 'customer',
+                    'transfer_destination_id': sales_order.account_id,
+                    'notes': f"Delivery {delivery.delivery_number} for SO-{sales_order.sales_order_number}",
+                }
+                for delivery_item in delivery_items
+                if delivery_item.quantity_delivered > 0
+            ],
+            workspace_id=workspace_id,
+            user_id=user_id
+        )
 
         # Check if sales order is fully delivered
         all_items = self.sales_order_item_dao.get_by_sales_order(
@@ -0,0 +1,391 @@
+"""Stock Reservation Manager - reservations for production batches and availability index"""
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.managers.base_manager import BaseManager
+from app.managers.mrp_manager import mrp_manager
+from app.models.stock_reservation import StockReservation
+from app.dao.inventory import inventory_dao
+from app.dao.production_batch import production_batch_dao
+from app.dao.production_line import production_line_dao
+from app.dao.stock_reservation import stock_reservation_dao
+from app.dao.storage_item import storage_item_dao
+
+
+# Reserved totals are reloaded after this long, so reservations made by
+# other processes (which only update their own index) show up
+CACHE_TTL_SECONDS = 60
+
+# Workspaces kept before the least recently used is dropped
+CACHE_MAX_ENTRIES = 512
+
+# session.info key holding reserved-quantity deltas to apply on commit
+PENDING_KEY = 'stock_reservation_deltas'
+
+
+class StockReservationManager(BaseManager[StockReservation]):
+    """
+    UTILITY MANAGER: Stock reservations and availability per (factory, item).
+
+    Available stock = storage items + STORAGE inventory - active reservations.
+
+    reserve() checks and reserves all inputs of a batch at once: lock the
+    stock rows, one grouped query each for on-hand and reserved quantities,
+    then one bulk INSERT. consume()/release() resolve a batch's reservations
+    with one UPDATE.
+
+    Active reserved totals are kept in an in-memory index per workspace
+    (loaded with one grouped query). Writes made through this manager are
+    applied to it as deltas after their transaction commits (and dropped on
+    rollback); the TTL picks up reservations written by other processes.
+    The index serves availability reads only - reserve() always re-reads
+    the database under lock.
+
+    Does NOT commit transactions - that's the service layer's responsibility.
+    """
+
+    def __init__(self):
+        super().__init__(StockReservation)
+        self.reservation_dao = stock_reservation_dao
+        # workspace_id -> (version, loaded_at, {(factory_id, item_id): reserved})
+        self._cache: "OrderedDict[int, Tuple[int, float, Dict[Tuple[int, int], int]]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    # ─── Reservations ───────────────────────────────────────────────
+
+    def reserve(
+        self,
+        session: Session,
+        workspace_id: int,
+        batch_id: int,
+        factory_id: int,
+        requirements: Dict[int, int],
+        user_id: Optional[int] = None
+    ) -> int:
+        """
+        Check and reserve input stock for a batch.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            batch_id: Production batch ID
+            factory_id: Factory the stock is taken from
+            requirements: item_id -> quantity to reserve
+            user_id: User starting the batch
+
+        Returns:
+            Number of reservations created
+
+        Raises:
+            ValueError: If any input lacks available stock (nothing is reserved)
+
+        Note:
+            This method does NOT commit. Caller must commit.
+        """
+        requirements = {item_id: qty for item_id, qty in requirements.items() if qty > 0}
+        if not requirements:
+            return 0
+        item_ids = sorted(requirements)
+
+        self.reservation_dao.lock_stock(
+            session, workspace_id=workspace_id, factory_id=factory_id, item_ids=item_ids
+        )
+        on_hand = self._on_hand(session, workspace_id, [factory_id], item_ids)
+        reserved = self.reservation_dao.get_reserved_quantities(
+            session, workspace_id=workspace_id, factory_ids=[factory_id], item_ids=item_ids
+        )
+
+        shortages = []
+        for item_id in item_ids:
+            key = (factory_id, item_id)
+            available = on_hand.get(key, 0) - reserved.get(key, 0)
+            if requirements[item_id] > available:
+                shortages.append(
+                    f"item {item_id}: need {requirements[item_id]}, available {max(available, 0)}"
+                )
+        if shortages:
+            raise ValueError(
+                f"Insufficient stock in factory {factory_id} for batch {batch_id} ({'; '.join(shortages)})"
+            )
+
+        count = self.reservation_dao.create_many(session, objs_in=[
+            {
+                'workspace_id': workspace_id,
+                'factory_id': factory_id,
+                'item_id': item_id,
+                'batch_id': batch_id,
+                'quantity': requirements[item_id],
+                'status': 'active',
+                'created_by': user_id,
+            }
+            for item_id in item_ids
+        ])
+        self._record_deltas(session, workspace_id, {
+            (factory_id, item_id): requirements[item_id] for item_id in item_ids
+        })
+        return count
+
+    def consume(self, session: Session, workspace_id: int, batch_id: int) -> int:
+        """
+        Mark a batch's active reservations as consumed (batch completed).
+
+        Returns:
+            Number of reservations consumed
+
+        Note:
+            This method does NOT commit. Caller must commit.
+        """
+        return self._resolve(session, workspace_id, batch_id, 'consumed')
+
+    def release(self, session: Session, workspace_id: int, batch_id: int) -> int:
+        """
+        Release a batch's active reservations (batch cancelled).
+
+        Returns:
+            Number of reservations released
+
+        Note:
+            This method does NOT commit. Caller must commit.
+        """
+        return self._resolve(session, workspace_id, batch_id, 'released')
+
+    def get_batch_reservations(
+        self, session: Session, workspace_id: int, batch_id: int
+    ) -> List[StockReservation]:
+        """Get all reservations of a batch."""
+        return self.reservation_dao.get_by_batch(
+            session, batch_id=batch_id, workspace_id=workspace_id
+        )
+
+    # ─── Availability ───────────────────────────────────────────────
+
+    def get_reserved(self, session: Session, workspace_id: int) -> Dict[Tuple[int, int], int]:
+        """
+        Get active reserved totals of a workspace (from the in-memory index when current).
+
+        Returns:
+            Dict of (factory_id, item_id) -> reserved quantity (do not modify)
+        """
+        with self._lock:
+            version = self._versions.get(workspace_id, 0)
+            cached = self._cache.get(workspace_id)
+            if (
+                cached is not None
+                and cached[0] == version
+                and time.monotonic() - cached[1] <= CACHE_TTL_SECONDS
+            ):
+                self._cache.move_to_end(workspace_id)
+                return cached[2]
+
+        reserved = self.reservation_dao.get_reserved_quantities(session, workspace_id=workspace_id)
+
+        with self._lock:
+            # Only cache if no commit changed the workspace while loading
+            if self._versions.get(workspace_id, 0) == version:
+                self._cache[workspace_id] = (version, time.monotonic(), reserved)
+                self._cache.move_to_end(workspace_id)
+                while len(self._cache) > CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+        return reserved
+
+    def check_availability(
+        self,
+        session: Session,
+        workspace_id: int,
+        candidates: List[dict],
+        cumulative: bool = False
+    ) -> List[dict]:
+        """
+        Check whether many candidate batches can be produced from available stock.
+
+        Inputs come from the cached formula graph, on-hand stock from two
+        grouped queries for all candidates, and reservations from the
+        in-memory index.
+
+        Args:
+            session: Database session
+            workspace_id: Workspace ID
+            candidates: Draft batches ({'batch_id'}) or formula runs
+                ({'formula_id', 'factory_id' or 'production_line_id', 'quantity'})
+            cumulative: Candidates that fit use up stock for later candidates
+
+        Returns:
+            One result dict per candidate, in order
+
+        Raises:
+            ValueError: If a batch, formula or line is unknown
+        """
+        graph = mrp_manager.get_graph(session, workspace_id)
+        resolved = [self._resolve_candidate(session, workspace_id, graph, c) for c in candidates]
+
+        needs: List[Dict[int, int]] = []
+        for _, formula_id, _, output_quantity in resolved:
+            base_output = graph.base_output(formula_id)
+            needs.append({
+                item_id: int(Fraction(quantity * output_quantity, base_output))
+                for item_id, quantity in graph.components(formula_id).items()
+            })
+
+        factory_ids = {factory_id for _, _, factory_id, _ in resolved}
+        item_ids = {item_id for need in needs for item_id in need}
+        on_hand = self._on_hand(session, workspace_id, factory_ids, item_ids)
+        reserved = dict(self.get_reserved(session, workspace_id))
+
+        results = []
+        for (batch_id, formula_id, factory_id, output_quantity), need in zip(resolved, needs):
+            lines = []
+            for item_id in sorted(need):
+                key = (factory_id, item_id)
+                available = max(on_hand.get(key, 0) - reserved.get(key, 0), 0)
+                lines.append({
+                    'item_id': item_id,
+                    'required_quantity': need[item_id],
+                    'on_hand_quantity': on_hand.get(key, 0),
+                    'reserved_quantity': reserved.get(key, 0),
+                    'available_quantity': available,
+                    'shortage_quantity': max(need[item_id] - available, 0),
+                })
+            can_produce = all(line['shortage_quantity'] == 0 for line in lines)
+            if cumulative and can_produce:
+                for item_id, quantity in need.items():
+                    reserved[(factory_id, item_id)] = reserved.get((factory_id, item_id), 0) + quantity
+            results.append({
+                'batch_id': batch_id,
+                'formula_id': formula_id,
+                'factory_id': factory_id,
+                'output_quantity': output_quantity,
+                'can_produce': can_produce,
+                'lines': lines,
+            })
+        return results
+
+    # ─── Cache ──────────────────────────────────────────────────────
+
+    def invalidate_workspace(self, workspace_id: int) -> None:
+        """Make a workspace's reserved index stale."""
+        with self._lock:
+            self._versions[workspace_id] = self._versions.get(workspace_id, 0) + 1
+
+    def clear_cache(self) -> None:
+        """Drop all cached reserved indexes."""
+        with self._lock:
+            self._cache.clear()
+
+    def _apply_deltas(self, workspace_id: int, deltas: Dict[Tuple[int, int], int]) -> None:
+        """Apply committed reservation changes to a workspace's cached index."""
+        with self._lock:
+            version = self._versions.get(workspace_id, 0) + 1
+            self._versions[workspace_id] = version
+            cached = self._cache.get(workspace_id)
+            if cached is None or cached[0] != version - 1:
+                return
+            # Copy on write: readers may hold the previous dict
+            reserved = dict(cached[2])
+            for key, delta in deltas.items():
+                quantity = reserved.get(key, 0) + delta
+                if quantity > 0:
+                    reserved[key] = quantity
+                else:
+                    reserved.pop(key, None)
+            self._cache[workspace_id] = (version, cached[1], reserved)
+
+    # ─── Helpers ────────────────────────────────────────────────────
+
+    def _resolve(self, session: Session, workspace_id: int, batch_id: int, status: str) -> int:
+        """Move a batch's active reservations to `status`."""
+        active = self.reservation_dao.get_by_batch(
+            session, batch_id=batch_id, workspace_id=workspace_id, status='active'
+        )
+        if not active:
+            return 0
+        count = self.reservation_dao.resolve_batch(
+            session, batch_id=batch_id, workspace_id=workspace_id, status=status
+        )
+        deltas: Dict[Tuple[int, int], int] = defaultdict(int)
+        for reservation in active:
+            deltas[(reservation.factory_id, reservation.item_id)] -= reservation.quantity
+        self._record_deltas(session, workspace_id, deltas)
+        return count
+
+    def _on_hand(
+        self, session: Session, workspace_id: int, factory_ids: Iterable[int], item_ids: Iterable[int]
+    ) -> Dict[Tuple[int, int], int]:
+        """Storage items + STORAGE inventory per (factory_id, item_id)."""
+        factory_ids, item_ids = list(factory_ids), list(item_ids)
+        on_hand = storage_item_dao.get_quantities(
+            session, workspace_id=workspace_id, factory_ids=factory_ids, item_ids=item_ids
+        )
+        for key, quantity in inventory_dao.get_quantities(
+            session, workspace_id=workspace_id, factory_ids=factory_ids, item_ids=item_ids
+        ).items():
+            on_hand[key] = on_hand.get(key, 0) + quantity
+        return on_hand
+
+    def _resolve_candidate(
+        self, session: Session, workspace_id: int, graph, candidate: dict
+    ) -> Tuple[Optional[int], int, int, int]:
+        """Turn a candidate into (batch_id, formula_id, factory_id, output quantity)."""
+        batch_id = candidate.get('batch_id')
+        formula_id = candidate.get('formula_id')
+        factory_id = candidate.get('factory_id')
+        production_line_id = candidate.get('production_line_id')
+        quantity = candidate.get('quantity')
+
+        if batch_id is not None:
+            batch = production_batch_dao.get_by_id_and_workspace(
+                session, id=batch_id, workspace_id=workspace_id
+            )
+            if not batch:
+                raise ValueError(f"Production batch {batch_id} not found")
+            if batch.status != 'draft' or batch.formula_id is None:
+                raise ValueError(f"Batch {batch_id} must be a draft batch with a formula")
+            formula_id = batch.formula_id
+            production_line_id = batch.production_line_id
+            factory_id = None
+            quantity = quantity or batch.expected_output_quantity
+
+        if graph.base_output(formula_id) == 0:
+            raise ValueError(f"Formula {formula_id} not found, inactive or without output items")
+
+        if factory_id is None:
+            line = production_line_dao.get_by_id_and_workspace(
+                session, id=production_line_id, workspace_id=workspace_id
+            )
+            if not line:
+                raise ValueError(f"Production line {production_line_id} not found")
+            factory_id = line.factory_id
+
+        return batch_id, formula_id, factory_id, quantity or graph.base_output(formula_id)
+
+    def _record_deltas(
+        self, session: Session, workspace_id: int, deltas: Dict[Tuple[int, int], int]
+    ) -> None:
+        """Queue reserved-quantity changes to apply to the index when the session commits."""
+        pending = session.info.setdefault(PENDING_KEY, {})
+        workspace_deltas = pending.setdefault(workspace_id, defaultdict(int))
+        for key, delta in deltas.items():
+            workspace_deltas[key] += delta
+        if not event.contains(session, 'after_commit', _apply_after_commit):
+            event.listen(session, 'after_commit', _apply_after_commit)
+            event.listen(session, 'after_rollback', _discard_after_rollback)
+
+
+def _apply_after_commit(session: Session) -> None:
+    """Session after_commit hook: apply the committed transaction's deltas."""
+    pending = session.info.pop(PENDING_KEY, None)
+    for workspace_id, deltas in (pending or {}).items():
+        stock_reservation_manager._apply_deltas(workspace_id, deltas)
+
+
+def _discard_after_rollback(session: Session) -> None:
+    """Session after_rollback hook: drop deltas of the rolled back transaction."""
+    session.info.pop(PENDING_KEY, None)
+
+
+# Singleton instance
+stock_reservation_manager = StockReservationManager()
@@ -16,6 +16,7 @@ from app.dao.work_order import work_order_dao
 from app.dao.work_order_item import work_order_item_dao
 from app.dao.factory import factory_dao
 from app.managers.machine_maintenance_log_manager import machine_maintenance_log_manager
+from app.managers.project_cost_manager import project_cost_manager
 
 
 class WorkOrderManager(BaseManager[WorkOrder]):
@@ -47,7 +48,11 @@ class WorkOrderManager(BaseManager[WorkOrder]):
         wo_dict['work_order_number'] = wo_number
         wo_dict['created_by'] = user_id
 
-        return self.wo_dao.create(session, obj_in=wo_dict)
+        record = self.wo_dao.create(session, obj_in=wo_dict)
+        project_cost_manager.record_work_order_change(
+            session, workspace_id, before={}, after=project_cost_manager.work_order_cost(record)
+        )
+        return record
 
     def update_work_order(
         self, session: Session, wo_id: int, data: WorkOrderUpdate,
@@ -112,7 +117,12 @@ class WorkOrderManager(BaseManager[WorkOrder]):
                 workspace_id=record.workspace_id, user_id=user_id
             )
 
-        return self.wo_dao.update(session, db_obj=record, obj_in=update_dict)
+        cost_before = project_cost_manager.work_order_cost(record)
+        updated = self.wo_dao.update(session, db_obj=record, obj_in=update_dict)
+        project_cost_manager.record_work_order_change(
+            session, workspace_id, before=cost_before, after=project_cost_manager.work_order_cost(updated)
+        )
+        return updated
 
     def get_work_order(self, session: Session, wo_id: int, workspace_id: int) -> WorkOrder:
         record = self.wo_dao.get_by_id_and_workspace(session, id=wo_id, workspace_id=workspace_id)
@@ -142,7 +152,10 @@ class WorkOrderManager(BaseManager[WorkOrder]):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Work order with ID {wo_id} not found")
         if record.is_deleted:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Work order is already deleted")
-        return self.wo_dao.soft_delete(session, db_obj=record, deleted_by=user_id)
+        cost_before = project_cost_manager.work_order_cost(record)
+        deleted = self.wo_dao.soft_delete(session, db_obj=record, deleted_by=user_id)
+        project_cost_manager.record_work_order_change(session, workspace_id, before=cost_before, after={})
+        return deleted
 
     # ─── Work Order Items ───────────────────────────────────────
     def add_item(
@@ -7,6 +7,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 from app.managers.base_manager import BaseManager
+from app.managers.quota_manager import quota_manager
 from app.models.workspace import Workspace
 from app.models.workspace_member import WorkspaceMember
 from app.models.workspace_invitation import WorkspaceInvitation
@@ -195,16 +196,12 @@ class WorkspaceManager(BaseManager[Workspace]):
         if not workspace:
             raise ValueError("Workspace not found")
 
-        plan = self.subscription_dao.get(session, id=workspace.subscription_plan_id)
-        if plan and plan.max_members:
-            current_member_count = self.member_dao.count_active_members(
-                session, workspace_id=workspace_id
+        current_member_count, max_members = quota_manager.get_quota(workspace, 'members')
+        if max_members != -1 and current_member_count >= max_members:
+            raise ValueError(
+                f"Workspace has reached maximum member limit ({max_members}). "
+                f"Upgrade subscription to add more members."
             )
-            if current_member_count >= plan.max_members:
-                raise ValueError(
-                    f"Workspace has reached maximum member limit ({plan.max_members}). "
-                    f"Upgrade subscription to add more members."
-                )
 
         # Create member
         member_in = WorkspaceMemberCreate(
@@ -350,18 +347,15 @@ class WorkspaceManager(BaseManager[Workspace]):
         if not workspace:
             raise ValueError("Workspace not found")
 
-        plan = self.subscription_dao.get(session, id=workspace.subscription_plan_id)
-        if plan and plan.max_members:
-            current_member_count = self.member_dao.count_active_members(
-                session, workspace_id=workspace_id
-            )
+        current_member_count, max_members = quota_manager.get_quota(workspace, 'members')
+        if max_members != -1:
             # Count pending invitations as well
             pending_invitations = self.invitation_dao.count_pending_invitations(
                 session, workspace_id=workspace_id
             )
-            if (current_member_count + pending_invitations) >= plan.max_members:
+            if (current_member_count + pending_invitations) >= max_members:
                 raise ValueError(
-                    f"Workspace has reached maximum member limit ({plan.max_members}). "
+                    f"Workspace has reached maximum member limit ({max_members}). "
                     f"Upgrade subscription to add more members."
                 )
 
@@ -28,13 +28,19 @@ from app.models.machine_item_ledger import MachineItemLedger
 from app.models.damaged_item_ledger import DamagedItemLedger
 from app.models.inventory_ledger import InventoryLedger
 from app.models.project_component_item_ledger import ProjectComponentItemLedger
+from app.models.ledger_archive_period import LedgerArchivePeriod
+from app.models.ledger_drift import LedgerDrift
+from app.models.ledger_drift_scan_state import LedgerDriftScanState
 
 # Production Module
 from app.models.production_line import ProductionLine
 from app.models.production_formula import ProductionFormula
 from app.models.production_formula_item import ProductionFormulaItem
+from app.models.production_formula_version import ProductionFormulaVersion
 from app.models.production_batch import ProductionBatch
 from app.models.production_batch_item import ProductionBatchItem
+from app.models.stock_reservation import StockReservation
+from app.models.production_batch_rollup import ProductionBatchRollup
 
 # Orders (Legacy - being migrated)
 from app.models.order import Order
@@ -67,6 +73,7 @@ from app.models.factory_section import FactorySection
 from app.models.department import Department
 from app.models.machine import Machine
 from app.models.machine_event import MachineEvent
+from app.models.machine_uptime_rollup import MachineUptimeRollup
 
 # Projects
 from app.models.project import Project
@@ -74,6 +81,7 @@ from app.models.project_component import ProjectComponent
 from app.models.project_component_item import ProjectComponentItem
 from app.models.project_component_task import ProjectComponentTask
 from app.models.miscellaneous_project_cost import MiscellaneousProjectCost
+from app.models.project_cost_rollup import ProjectCostRollup
 
 # Attachments
 from app.models.attachment import Attachment
@@ -87,6 +95,7 @@ from app.models.account_tag import AccountTag
 from app.models.account_tag_assignment import AccountTagAssignment
 from app.models.account_invoice import AccountInvoice
 from app.models.invoice_payment import InvoicePayment
+from app.models.account_period_summary import AccountPeriodSummary
 
 # Vendors & Settings (Vendor deprecated - use Account)
 from app.models.vendor import Vendor
@@ -117,12 +126,18 @@ __all__ = [
     "DamagedItemLedger",
     "InventoryLedger",
     "ProjectComponentItemLedger",
+    "LedgerArchivePeriod",
+    "LedgerDrift",
+    "LedgerDriftScanState",
     # Production Module
     "ProductionLine",
     "ProductionFormula",
     "ProductionFormulaItem",
+    "ProductionFormulaVersion",
     "ProductionBatch",
     "ProductionBatchItem",
+    "StockReservation",
+    "ProductionBatchRollup",
     # Orders (Legacy - being migrated)
     "Order",
     "OrderItem",
@@ -150,12 +165,14 @@ __all__ = [
     "Department",
     "Machine",
     "MachineEvent",
+    "MachineUptimeRollup",
     # Projects
     "Project",
     "ProjectComponent",
     "ProjectComponentItem",
     "ProjectComponentTask",
     "MiscellaneousProjectCost",
+    "ProjectCostRollup",
     # Attachments
     "Attachment",
     "OrderAttachment",
@@ -167,6 +184,7 @@ __all__ = [
     "AccountTagAssignment",
     "AccountInvoice",
     "InvoicePayment",
+    "AccountPeriodSummary",
     # Vendors & Settings
     "Vendor",
     "AppSettings",
@@ -1,5 +1,5 @@
 """Access control model"""
-from sqlalchemy import Column, Integer, String, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Enum, ForeignKey, Index
 from app.db.base_class import Base
 from app.models.enums import AccessControlTypeEnum, RoleEnum
 
@@ -8,6 +8,10 @@ class AccessControl(Base):
     """Access control model for RBAC"""
 
     __tablename__ = "access_control"
+    __table_args__ = (
+        # permission matrix compilation (get_permission_pairs / get_by_role)
+        Index('ix_access_control_ws_role', 'workspace_id', 'role'),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=True, index=True)
@@ -1,5 +1,5 @@
 """Account model - unified entity for suppliers, clients, utilities, payroll, etc."""
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Numeric
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Numeric, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
@@ -13,6 +13,11 @@ class Account(Base):
     """
 
     __tablename__ = "accounts"
+    __table_args__ = (
+        # account list sorted / filtered by balance
+        Index('ix_accounts_ws_payable_outstanding', 'workspace_id', 'payable_outstanding'),
+        Index('ix_accounts_ws_receivable_outstanding', 'workspace_id', 'receivable_outstanding'),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -49,6 +54,12 @@ class Account(Base):
     bank_account_number = Column(String(100), nullable=True)
     bank_swift_code = Column(String(50), nullable=True)
 
+    # Balances (maintained by AccountBalanceManager on invoice and payment writes)
+    payable_outstanding = Column(Numeric(15, 2), nullable=False, default=0, server_default='0')  # We owe them
+    receivable_outstanding = Column(Numeric(15, 2), nullable=False, default=0, server_default='0')  # They owe us
+    last_invoice_date = Column(Date, nullable=True)
+    last_payment_date = Column(Date, nullable=True)
+
     # Admin Controls
     allow_invoices = Column(Boolean, nullable=False, default=True)  # Admin can disable invoice creation
     invoices_disabled_reason = Column(Text, nullable=True)  # Why invoices are disabled
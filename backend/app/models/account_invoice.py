@@ -1,5 +1,5 @@
 """Account invoice model - financial layer for tracking payables and receivables"""
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Numeric, Date
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Numeric, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
@@ -12,6 +12,10 @@ class AccountInvoice(Base):
     """
 
     __tablename__ = "account_invoices"
+    __table_args__ = (
+        # aging report / get_unpaid_invoices / get_overdue_invoices
+        Index('ix_account_invoices_ws_status_due', 'workspace_id', 'payment_status', 'due_date'),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
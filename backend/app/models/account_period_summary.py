@@ -0,0 +1,46 @@
+"""Account period summary model - materialized monthly invoiced/paid totals"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Date, Index
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class AccountPeriodSummary(Base):
+    """
+    Monthly invoiced and paid totals per account, invoice type and factory.
+
+    - invoiced_amount / invoice_count: invoices by invoice_date month
+    - paid_amount / payment_count: payments by payment_date month (cash flow),
+      attributed to the paid invoice's account, type and factory
+
+    factory_id is the factory of the invoice's order (NULL for invoices
+    without an order). Tags are not part of the key: reports join the
+    current tag assignments, so re-tagging an account needs no rewrite.
+
+    Maintained incrementally by AccountPeriodSummaryManager on every invoice
+    and payment write. Reports always SUM rows per key, so a key can span
+    more than one row without changing any total.
+    """
+
+    __tablename__ = "account_period_summaries"
+    __table_args__ = (
+        # period report (workspace + month range)
+        Index('ix_account_period_summaries_ws_period', 'workspace_id', 'period'),
+        # incremental updates (one row per key)
+        Index('ix_account_period_summaries_ws_account_period',
+              'workspace_id', 'account_id', 'period', 'invoice_type', 'factory_id'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+    period = Column(Date, nullable=False)  # First day of the month
+    account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False)
+    invoice_type = Column(String(20), nullable=False)  # 'payable' or 'receivable'
+    factory_id = Column(Integer, ForeignKey("factories.id", ondelete="SET NULL"), nullable=True)
+
+    # === TOTALS ===
+    invoiced_amount = Column(Numeric(15, 2), nullable=False, default=0)
+    invoice_count = Column(Integer, nullable=False, default=0)
+    paid_amount = Column(Numeric(15, 2), nullable=False, default=0)
+    payment_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -1,8 +1,10 @@
 """Financial audit log model - comprehensive tracking of all financial operations"""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Index, LargeBinary
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from datetime import datetime
 from app.db.base_class import Base
+from app.utils.audit_diff import unpack_changes
 
 
 class FinancialAuditLog(Base):
@@ -13,6 +15,21 @@ class FinancialAuditLog(Base):
     """
 
     __tablename__ = "financial_audit_logs"
+    # Composite indexes for FinancialAuditLogDAO.search(): workspace filter
+    # first, then equality columns, then (performed_at, id) so the keyset
+    # ORDER BY performed_at DESC, id DESC is a backward index scan.
+    __table_args__ = (
+        # search without entity/user filter, get_by_date_range, get_recent_logs
+        Index('ix_financial_audit_logs_ws_at', 'workspace_id', 'performed_at', 'id'),
+        # search by entity, get_by_entity
+        Index('ix_financial_audit_logs_ws_entity_at', 'workspace_id', 'entity_type', 'entity_id', 'performed_at', 'id'),
+        # search by related entity
+        Index('ix_financial_audit_logs_ws_related_at', 'workspace_id', 'related_entity_type', 'related_entity_id', 'performed_at', 'id'),
+        # search by user, get_by_user
+        Index('ix_financial_audit_logs_ws_performer_at', 'workspace_id', 'performed_by', 'performed_at', 'id'),
+        # search by action type, get_by_action_type
+        Index('ix_financial_audit_logs_ws_action_at', 'workspace_id', 'action_type', 'performed_at', 'id'),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -29,8 +46,9 @@ class FinancialAuditLog(Base):
     related_entity_type = Column(String(50), nullable=True)
     related_entity_id = Column(Integer, nullable=True, index=True)
 
-    # Change details (JSON for flexibility)
-    changes = Column(JSON, nullable=True)  # {"before": {...}, "after": {...}}
+    # Change details
+    changes_diff = Column(LargeBinary, nullable=True)  # Field-level diff, see app/utils/audit_diff.py
+    changes = Column(JSON, nullable=True)  # Legacy full {"before": {...}, "after": {...}} (rows not yet compacted)
 
     # Metadata
     description = Column(Text, nullable=True)  # Human-readable description
@@ -39,7 +57,16 @@ class FinancialAuditLog(Base):
 
     # Who and when
     performed_by = Column(Integer, ForeignKey("profiles.id"), nullable=False)
-    performed_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
+    # Set in Python as well so every row stores the same datetime format
+    # (keyset cursors compare performed_at for equality)
+    performed_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now(), index=True)
 
     # Relationships
     user = relationship("Profile", foreign_keys=[performed_by], backref="financial_audit_logs")
+
+    @property
+    def decoded_changes(self) -> dict | None:
+        """Changes dict, rebuilt from changes_diff (decoded only when accessed)."""
+        if self.changes_diff is not None:
+            return unpack_changes(self.changes_diff)
+        return self.changes
@@ -1,5 +1,5 @@
 """Unified inventory ledger model - tracks all inventory movements for STORAGE, DAMAGED, WASTE, SCRAP"""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
@@ -13,6 +13,19 @@ class InventoryLedger(Base):
     """
 
     __tablename__ = "inventory_ledger"
+    # Composite indexes shaped like the DAO queries: workspace filter first,
+    # then equality columns, then performed_at (+ id) so ORDER BY performed_at
+    # DESC is served by a backward index scan instead of a sort.
+    __table_args__ = (
+        # balance / latest entry / history
+        Index('ix_inventory_ledger_ws_type_factory_item_at', 'workspace_id', 'inventory_type', 'factory_id', 'item_id', 'performed_at', 'id'),
+        # get_by_transaction_type
+        Index('ix_inventory_ledger_ws_type_at', 'workspace_id', 'transaction_type', 'performed_at'),
+        # get_by_date_range
+        Index('ix_inventory_ledger_ws_at', 'workspace_id', 'performed_at'),
+        # get_by_performer
+        Index('ix_inventory_ledger_ws_performer_at', 'workspace_id', 'performed_by', 'performed_at'),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
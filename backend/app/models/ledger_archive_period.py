@@ -0,0 +1,43 @@
+"""Ledger archive period model - registry of ledger rows moved to cold storage"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class LedgerArchivePeriod(Base):
+    """
+    Registry of closed ledger periods moved out of the hot ledger tables.
+
+    One row per (workspace, ledger table, year). Archived rows live in a
+    per-year archive table (e.g. storage_item_ledger_archive_2024) and the
+    hot table keeps an 'opening_balance' checkpoint row per item instead.
+    Ledger DAOs read this registry to decide whether a date-range query
+    must UNION the archive tables.
+    """
+
+    __tablename__ = "ledger_archive_periods"
+    __table_args__ = (
+        UniqueConstraint('workspace_id', 'ledger_table', 'period_year', name='uq_ledger_archive_period'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # === WHAT WAS ARCHIVED ===
+    ledger_table = Column(String(100), nullable=False, index=True)   # e.g. 'storage_item_ledger'
+    archive_table = Column(String(100), nullable=False)              # e.g. 'storage_item_ledger_archive_2024'
+    period_year = Column(Integer, nullable=False)
+    period_start = Column(DateTime, nullable=False)  # Inclusive
+    period_end = Column(DateTime, nullable=False)    # Exclusive
+
+    # === STATISTICS ===
+    rows_archived = Column(Integer, nullable=False, default=0)
+    checkpoints_created = Column(Integer, nullable=False, default=0)
+
+    # === AUDIT ===
+    archived_by = Column(Integer, ForeignKey("profiles.id", ondelete="SET NULL"), nullable=True)
+    archived_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # === RELATIONSHIPS ===
+    archiver = relationship("Profile", foreign_keys=[archived_by])
@@ -0,0 +1,47 @@
+"""Ledger drift model - discrepancies between ledger balances and snapshot tables"""
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class LedgerDrift(Base):
+    """
+    A discrepancy found by the background ledger drift scanner.
+
+    drift_type:
+    - 'snapshot_mismatch': snapshot qty differs from the ledger's running balance
+    - 'snapshot_missing': ledger has a balance but no snapshot row exists
+    - 'chain_break': a ledger row's qty_before does not continue the previous qty_after
+
+    Snapshot drifts are resolved automatically once a later scan finds the
+    snapshot back in line with the ledger; chain breaks once their ledger row
+    continues the previous row again (or is gone, e.g. archived).
+    """
+
+    __tablename__ = "ledger_drifts"
+    __table_args__ = (
+        # Open drifts for one ledger (re-checked on every scan)
+        Index('ix_ledger_drifts_ws_ledger_resolved', 'workspace_id', 'ledger_table', 'is_resolved'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # === WHERE ===
+    ledger_table = Column(String(100), nullable=False)   # e.g. 'storage_item_ledger'
+    location_id = Column(Integer, nullable=False)        # factory_id, or machine_id for machine_item_ledger
+    inventory_type = Column(String(50), nullable=True)   # Only for inventory_ledger
+    item_id = Column(Integer, ForeignKey("items.id"), nullable=False, index=True)
+
+    # === WHAT ===
+    drift_type = Column(String(50), nullable=False)
+    ledger_entry_id = Column(Integer, nullable=True)     # Ledger row the expected balance comes from
+    expected_qty = Column(Integer, nullable=False)       # Ledger running balance
+    actual_qty = Column(Integer, nullable=True)          # Snapshot qty (or qty_before for chain_break)
+    discrepancy = Column(Integer, nullable=False)        # actual - expected
+
+    # === STATUS ===
+    is_resolved = Column(Boolean, nullable=False, default=False)
+    detected_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_checked_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    resolved_at = Column(DateTime, nullable=True)
@@ -0,0 +1,37 @@
+"""Ledger drift scan state model - high-water mark and metrics of the drift scanner"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from app.db.base_class import Base
+
+
+class LedgerDriftScanState(Base):
+    """
+    Progress and metrics of the ledger drift scanner.
+
+    One row per (workspace, ledger table). last_ledger_id is the high-water
+    mark: each scan only reads ledger rows with a higher id, so a run costs
+    O(new rows) instead of a full balance recompute.
+    """
+
+    __tablename__ = "ledger_drift_scan_states"
+    __table_args__ = (
+        UniqueConstraint('workspace_id', 'ledger_table', name='uq_ledger_drift_scan_state'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+    ledger_table = Column(String(100), nullable=False)
+
+    # === HIGH-WATER MARK ===
+    last_ledger_id = Column(Integer, nullable=False, default=0)
+
+    # === LAST RUN METRICS ===
+    last_run_at = Column(DateTime, nullable=True)
+    last_run_duration_ms = Column(Integer, nullable=False, default=0)
+    last_run_rows_scanned = Column(Integer, nullable=False, default=0)
+    last_run_keys_checked = Column(Integer, nullable=False, default=0)
+    last_run_drifts_found = Column(Integer, nullable=False, default=0)
+
+    # === CUMULATIVE METRICS ===
+    run_count = Column(Integer, nullable=False, default=0)
+    total_rows_scanned = Column(Integer, nullable=False, default=0)
+    total_drifts_found = Column(Integer, nullable=False, default=0)
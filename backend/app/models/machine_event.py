@@ -1,5 +1,5 @@
 """Machine event model"""
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
@@ -10,6 +10,10 @@ class MachineEvent(Base):
     """Machine event model for tracking machine status changes"""
 
     __tablename__ = "machine_events"
+    __table_args__ = (
+        # per-machine event streams (latest state, state intervals)
+        Index('ix_machine_events_ws_machine_started', 'workspace_id', 'machine_id', 'started_at'),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -0,0 +1,49 @@
+"""Machine uptime rollup model - materialized daily machine state durations"""
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Date, Index
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class MachineUptimeRollup(Base):
+    """
+    Daily time per state of one machine, from its closed event intervals.
+
+    An interval runs from one machine event's started_at to the next
+    event's started_at in the state of the first event; it is split at
+    midnight so every day gets its own seconds. The interval of a
+    machine's latest event is still open and is not rolled up.
+
+    - *_seconds: time spent RUNNING / IDLE / OFF / MAINTENANCE that day
+      (uptime = running, downtime = off + maintenance)
+    - failure_count: events that day taking the machine from RUNNING or
+      IDLE to OFF or MAINTENANCE
+    - repair_count: events that day taking it from OFF or MAINTENANCE back
+      to RUNNING or IDLE
+
+    Maintained incrementally by MachineUptimeManager when a machine event
+    is created. Reports always SUM rows per key, so a key can span more
+    than one row without changing a total.
+    """
+
+    __tablename__ = "machine_uptime_rollups"
+    __table_args__ = (
+        # fleet reports (workspace + date range)
+        Index('ix_machine_uptime_rollups_ws_day', 'workspace_id', 'day'),
+        # incremental updates and per-machine reports
+        Index('ix_machine_uptime_rollups_ws_machine_day', 'workspace_id', 'machine_id', 'day'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+    machine_id = Column(Integer, ForeignKey("machines.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+
+    # === TOTALS ===
+    running_seconds = Column(Integer, nullable=False, default=0)
+    idle_seconds = Column(Integer, nullable=False, default=0)
+    off_seconds = Column(Integer, nullable=False, default=0)
+    maintenance_seconds = Column(Integer, nullable=False, default=0)
+    failure_count = Column(Integer, nullable=False, default=0)
+    repair_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
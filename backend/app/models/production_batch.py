@@ -26,6 +26,8 @@ class ProductionBatch(Base):
     production_line_id = Column(Integer, ForeignKey("production_lines.id", ondelete="RESTRICT"), nullable=False, index=True)
     formula_id = Column(Integer, ForeignKey("production_formulas.id", ondelete="SET NULL"), nullable=True, index=True)
     # formula_id nullable: Can produce with or without formula (simple mode)
+    formula_version_id = Column(Integer, ForeignKey("production_formula_versions.id", ondelete="SET NULL"), nullable=True, index=True)
+    # Recipe snapshot the batch was started with (set by start_batch)
 
     # Batch metadata
     batch_date = Column(Date, nullable=False, index=True)  # When production happened
@@ -0,0 +1,64 @@
+"""Production batch rollup model - materialized daily production efficiency totals"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Date, Index
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class ProductionBatchRollup(Base):
+    """
+    Daily totals of completed production batches per line, formula and shift.
+
+    Analytics group these rows by week/month and by line, formula or shift,
+    so reports read a few rows per day instead of every batch and batch item.
+
+    - efficiency_*: sum, sum of squares and count of efficiency_percentage
+      (average and standard deviation without storing every batch)
+    - variance_*: number of batches per output_variance_percentage bucket
+      (<-10, -10..-5, -5..0, 0..5, 5..10, >=10; lower bound inclusive)
+    - timed_output_quantity / duration_minutes: output and time of batches
+      that logged actual_duration_minutes (throughput per hour)
+    - input_quantity / waste_quantity: input- and waste-role batch items
+      (actual quantity, else expected)
+
+    Maintained incrementally by ProductionAnalyticsManager when a batch
+    completes (completed batches are immutable). Reports always SUM rows
+    per key, so a key can span more than one row without changing a total.
+    """
+
+    __tablename__ = "production_batch_rollups"
+    __table_args__ = (
+        # analytics (workspace + date range)
+        Index('ix_production_batch_rollups_ws_date', 'workspace_id', 'batch_date'),
+        # incremental updates (one row per key)
+        Index('ix_production_batch_rollups_ws_key',
+              'workspace_id', 'batch_date', 'production_line_id', 'formula_id', 'shift'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+    batch_date = Column(Date, nullable=False)
+    production_line_id = Column(Integer, ForeignKey("production_lines.id", ondelete="CASCADE"), nullable=False)
+    formula_id = Column(Integer, ForeignKey("production_formulas.id", ondelete="SET NULL"), nullable=True)
+    shift = Column(String(20), nullable=True)
+
+    # === TOTALS ===
+    batch_count = Column(Integer, nullable=False, default=0)
+    expected_output_quantity = Column(Integer, nullable=False, default=0)
+    actual_output_quantity = Column(Integer, nullable=False, default=0)
+    timed_output_quantity = Column(Integer, nullable=False, default=0)
+    duration_minutes = Column(Integer, nullable=False, default=0)
+    input_quantity = Column(Integer, nullable=False, default=0)
+    waste_quantity = Column(Integer, nullable=False, default=0)
+
+    efficiency_sum = Column(Numeric(15, 2), nullable=False, default=0)
+    efficiency_sq_sum = Column(Numeric(20, 4), nullable=False, default=0)
+    efficiency_count = Column(Integer, nullable=False, default=0)
+
+    variance_lt_neg10 = Column(Integer, nullable=False, default=0)
+    variance_neg10_neg5 = Column(Integer, nullable=False, default=0)
+    variance_neg5_0 = Column(Integer, nullable=False, default=0)
+    variance_0_5 = Column(Integer, nullable=False, default=0)
+    variance_5_10 = Column(Integer, nullable=False, default=0)
+    variance_gte_10 = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,41 @@
+"""Production Formula Version model - immutable compiled recipe snapshots"""
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, JSON, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class ProductionFormulaVersion(Base):
+    """
+    Production Formula Version model - the recipe of a formula at one version.
+
+    Written once, the first time a batch is started with (formula_id, version),
+    and never updated. Batches reference the snapshot they were started
+    with, so later edits to the formula do not change them: editing the
+    items of a formula whose current version has a snapshot moves the
+    formula to the next version.
+
+    recipe holds one entry per formula item:
+    {item_id, item_role, quantity, tolerance_percentage, is_optional}
+    where quantity is per base run (base_output_quantity of output).
+    """
+
+    __tablename__ = "production_formula_versions"
+    __table_args__ = (
+        UniqueConstraint('formula_id', 'version', name='uq_production_formula_versions_formula_version'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+    formula_id = Column(Integer, ForeignKey("production_formulas.id", ondelete="CASCADE"), nullable=False, index=True)
+    version = Column(Integer, nullable=False)
+
+    base_output_quantity = Column(Integer, nullable=False)  # Sum of output items per base run
+    estimated_duration_minutes = Column(Integer, nullable=True)  # Per base run
+    recipe = Column(JSON, nullable=False)
+
+    created_by = Column(Integer, ForeignKey("profiles.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    formula = relationship("ProductionFormula", backref="versions")
@@ -1,5 +1,5 @@
 """Project component item ledger model - tracks all project item consumption"""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Numeric, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base_class import Base
@@ -12,6 +12,25 @@ class ProjectComponentItemLedger(Base):
     """
 
     __tablename__ = "project_component_item_ledger"
+    # Composite indexes shaped like the DAO queries: workspace filter first,
+    # then equality columns, then performed_at (+ id) so ORDER BY performed_at
+    # DESC is served by a backward index scan instead of a sort.
+    __table_args__ = (
+        # balance / latest entry / history
+        Index('ix_project_component_item_ledger_ws_component_item_at', 'workspace_id', 'project_component_id', 'item_id', 'performed_at', 'id'),
+        # get_by_component, total cost
+        Index('ix_project_component_item_ledger_ws_component_at', 'workspace_id', 'project_component_id', 'performed_at'),
+        # get_consumption_entries
+        Index('ix_project_component_item_ledger_ws_component_type_at', 'workspace_id', 'project_component_id', 'transaction_type', 'performed_at'),
+        # get_by_transaction_type
+        Index('ix_project_component_item_ledger_ws_type_at', 'workspace_id', 'transaction_type', 'performed_at'),
+        # get_by_order
+        Index('ix_project_component_item_ledger_ws_order_at', 'workspace_id', 'order_id', 'performed_at'),
+        # get_by_date_range
+        Index('ix_project_component_item_ledger_ws_at', 'workspace_id', 'performed_at'),
+        # get_by_performer
+        Index('ix_project_component_item_ledger_ws_performer_at', 'workspace_id', 'performed_by', 'performed_at'),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -21,7 +40,8 @@ class ProjectComponentItemLedger(Base):
     # === TRANSACTION DETAILS ===
     transaction_type = Column(String(50), nullable=False, index=True)
     # Valid values: 'purchase_order', 'manual_add', 'transfer_in', 'transfer_out',
-    #               'consumption', 'damaged', 'inventory_adjustment', 'cost_adjustment'
+    #               'consumption', 'damaged', 'inventory_adjustment', 'cost_adjustment',
+    #               'opening_balance' (archive checkpoint, quantity = 0)
 
     quantity = Column(Integer, nullable=False)
     # Always positive, direction determined by transaction_type
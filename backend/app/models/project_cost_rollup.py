@@ -0,0 +1,39 @@
+"""Project cost rollup model - materialized cost totals per project and component"""
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Numeric, Index
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class ProjectCostRollup(Base):
+    """
+    Running cost totals for a project and each of its components.
+
+    One row per component (project_component_id set) plus one project row
+    (project_component_id NULL) holding the totals of the whole project,
+    including costs booked on the project without a component.
+
+    Maintained incrementally whenever a cost source changes:
+    - item_cost: project component item ledger postings (SUM of total_cost)
+    - misc_cost: miscellaneous project costs
+    - work_order_cost: non-maintenance work orders on project components
+    - maintenance_cost: MAINTENANCE work orders on project components
+    """
+
+    __tablename__ = "project_cost_rollups"
+    __table_args__ = (
+        Index('ix_project_cost_rollups_ws_project_component',
+              'workspace_id', 'project_id', 'project_component_id'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    project_component_id = Column(Integer, ForeignKey("project_components.id"), nullable=True)  # NULL = project totals
+
+    # === COST TOTALS ===
+    item_cost = Column(Numeric(15, 2), nullable=False, default=0)
+    misc_cost = Column(Numeric(15, 2), nullable=False, default=0)
+    work_order_cost = Column(Numeric(15, 2), nullable=False, default=0)
+    maintenance_cost = Column(Numeric(15, 2), nullable=False, default=0)
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,40 @@
+"""Stock Reservation model - stock held for in-progress production batches"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from datetime import datetime
+from app.db.base_class import Base
+
+
+class StockReservation(Base):
+    """
+    Stock reservation - input stock held by a production batch.
+
+    Created for every (non-optional) input when a batch starts, so two
+    batches cannot plan against the same raw material. Available stock of
+    an item in a factory is storage items + STORAGE inventory minus its
+    active reservations.
+
+    Lifecycle (status):
+    - 'active': held by an in-progress batch
+    - 'consumed': the batch completed and used the stock
+    - 'released': the batch was cancelled
+    """
+
+    __tablename__ = "stock_reservations"
+    __table_args__ = (
+        # availability (sum of active reservations per factory/item)
+        Index('ix_stock_reservations_ws_factory_item_status',
+              'workspace_id', 'factory_id', 'item_id', 'status'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    workspace_id = Column(Integer, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True)
+    factory_id = Column(Integer, ForeignKey("factories.id", ondelete="CASCADE"), nullable=False)
+    item_id = Column(Integer, ForeignKey("items.id", ondelete="RESTRICT"), nullable=False)
+    batch_id = Column(Integer, ForeignKey("production_batches.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    quantity = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False, default='active')  # 'active', 'consumed', 'released'
+
+    created_by = Column(Integer, ForeignKey("profiles.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    resolved_at = Column(DateTime, nullable=True)  # When consumed or released
@@ -1,5 +1,5 @@
 """Workspace model"""
-from sqlalchemy import Column, Integer, String, ForeignKey, JSON
+from sqlalchemy import Column, Integer, BigInteger, String, ForeignKey, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.db.base_class import Base
@@ -32,9 +32,11 @@ class Workspace(Base):
     stripe_customer_id = Column(String(255), nullable=True)
     stripe_subscription_id = Column(String(255), nullable=True)
 
-    # Current usage (updated by triggers/background jobs)
-    current_members_count = Column(Integer, nullable=False, default=1)
+    # Current usage (maintained by QuotaManager on writes, recounted nightly)
+    # The owner's membership row counts as the first member
+    current_members_count = Column(Integer, nullable=False, default=0)
     current_storage_mb = Column(Integer, nullable=False, default=0)
+    current_storage_bytes = Column(BigInteger, nullable=False, default=0, server_default='0')
     current_orders_this_month = Column(Integer, nullable=False, default=0)
     current_factories_count = Column(Integer, nullable=False, default=0)
     current_machines_count = Column(Integer, nullable=False, default=0)
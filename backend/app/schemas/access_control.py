@@ -1,4 +1,5 @@
 """Access control schemas"""
+from typing import List
 from pydantic import BaseModel, ConfigDict
 from app.models.enums import AccessControlTypeEnum, RoleEnum
 
@@ -27,3 +28,11 @@ class AccessControlResponse(AccessControlBase):
     id: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PermissionsResponse(BaseModel):
+    """Compiled permissions of the current user's role in the workspace"""
+    role: str
+    pages: List[str]
+    features: List[str]
+    order_statuses: List[str]
@@ -1,7 +1,8 @@
 """Account schemas"""
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, date
+from decimal import Decimal
 
 
 class AccountBase(BaseModel):
@@ -86,6 +87,12 @@ class AccountInDB(AccountBase):
     deleted_at: Optional[datetime]
     deleted_by: Optional[int]
 
+    # Balances (read-only, maintained from invoices and payments)
+    payable_outstanding: Decimal = Decimal('0.00')
+    receivable_outstanding: Decimal = Decimal('0.00')
+    last_invoice_date: Optional[date] = None
+    last_payment_date: Optional[date] = None
+
 
 class AccountResponse(AccountInDB):
     """Account response schema"""
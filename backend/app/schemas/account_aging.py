@@ -0,0 +1,37 @@
+"""Accounts receivable/payable aging schemas"""
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class AgingBuckets(BaseModel):
+    """Outstanding amount per days-past-due bucket"""
+    days_0_30: Decimal  # Includes invoices not yet due
+    days_31_60: Decimal
+    days_61_90: Decimal
+    days_over_90: Decimal
+    total_outstanding: Decimal
+    invoice_count: int
+
+
+class AccountAgingRow(AgingBuckets):
+    """Aging of one account's payable or receivable invoices"""
+    account_id: int
+    account_name: str
+    invoice_type: str  # 'payable' or 'receivable'
+    oldest_due_date: Optional[date] = None
+
+
+class AgingTotals(AgingBuckets):
+    """Aging totals over all accounts for one invoice type"""
+    invoice_type: str
+    account_count: int
+
+
+class AgingReportResponse(BaseModel):
+    """Aging report: totals per invoice type plus one row per account and type"""
+    as_of: date
+    generated_at: datetime  # When the cached balances were read from the database
+    totals: List[AgingTotals]
+    accounts: List[AccountAgingRow]
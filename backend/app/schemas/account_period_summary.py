@@ -0,0 +1,46 @@
+"""Account period summary schemas"""
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class AccountPeriodSummaryCreate(BaseModel):
+    """Schema for creating a period summary row (used internally by manager)"""
+    workspace_id: int
+    period: date
+    account_id: int
+    invoice_type: str
+    factory_id: Optional[int] = None
+    invoiced_amount: Decimal = Decimal('0.00')
+    invoice_count: int = 0
+    paid_amount: Decimal = Decimal('0.00')
+    payment_count: int = 0
+
+
+class AccountPeriodSummaryUpdate(BaseModel):
+    """Schema for updating a period summary row"""
+    invoiced_amount: Optional[Decimal] = None
+    invoice_count: Optional[int] = None
+    paid_amount: Optional[Decimal] = None
+    payment_count: Optional[int] = None
+
+
+class PeriodSummaryRow(BaseModel):
+    """Invoiced vs paid totals of one month and group"""
+    period: date  # First day of the month
+    invoice_type: str  # 'payable' or 'receivable'
+    group_id: Optional[int] = None  # Account/tag/factory ID (None = untagged / no factory / all)
+    group_name: Optional[str] = None
+    invoiced_amount: Decimal
+    invoice_count: int
+    paid_amount: Decimal
+    payment_count: int
+
+
+class PeriodSummaryResponse(BaseModel):
+    """Monthly invoiced vs paid report"""
+    start_period: date
+    end_period: date
+    group_by: str  # 'type', 'account', 'tag' or 'factory'
+    rows: List[PeriodSummaryRow]
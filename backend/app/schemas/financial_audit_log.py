@@ -1,6 +1,6 @@
 """Financial audit log schemas"""
-from pydantic import BaseModel, ConfigDict
-from typing import Optional, Dict, Any
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
@@ -15,9 +15,20 @@ class FinancialAuditLogResponse(BaseModel):
     action_type: str
     related_entity_type: Optional[str] = None
     related_entity_id: Optional[int] = None
-    changes: Optional[Dict[str, Any]] = None
+    # Rebuilt from the stored diff (FinancialAuditLog.decoded_changes)
+    changes: Optional[Dict[str, Any]] = Field(
+        default=None, validation_alias=AliasChoices('decoded_changes', 'changes')
+    )
     description: Optional[str] = None
     performed_by: int
     performed_at: datetime
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
+
+
+class FinancialAuditLogSearchResponse(BaseModel):
+    """One page of audit log search results"""
+    items: List[FinancialAuditLogResponse]
+    next_cursor: Optional[str] = None  # Pass as `cursor` to get the next page; None on the last page
+    count_estimate: Optional[int] = None  # Matching rows (first page only)
+    count_is_exact: Optional[bool] = None  # False when count_estimate is a lower bound
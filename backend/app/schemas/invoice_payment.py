@@ -1,6 +1,6 @@
 """Invoice payment schemas"""
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, date
 from decimal import Decimal
 
@@ -56,3 +56,45 @@ class InvoicePaymentInDB(InvoicePaymentBase):
 class InvoicePaymentResponse(InvoicePaymentInDB):
     """Invoice payment response schema"""
     pass
+
+
+class InvoicePaymentAllocation(BaseModel):
+    """Part of a batch payment applied to one invoice"""
+    invoice_id: int
+    payment_amount: Decimal = Field(..., gt=0)
+    notes: Optional[str] = None  # Defaults to the batch notes
+
+
+class InvoicePaymentBatchCreate(BaseModel):
+    """Schema for one remittance allocated across many invoices"""
+    payment_date: date
+    payment_method: Optional[str] = Field(None, max_length=50)
+    payment_reference: Optional[str] = Field(None, max_length=100)
+
+    # Bank Details
+    bank_name: Optional[str] = Field(None, max_length=255)
+    transaction_id: Optional[str] = Field(None, max_length=100)
+
+    # Notes
+    notes: Optional[str] = None
+
+    # Remittance total (optional check against the allocations)
+    total_amount: Optional[Decimal] = Field(None, gt=0)
+
+    allocations: List[InvoicePaymentAllocation] = Field(..., min_length=1, max_length=1000)
+
+
+class InvoicePaymentBatchInvoice(BaseModel):
+    """Invoice state after a batch payment"""
+    invoice_id: int
+    paid_amount: Decimal
+    outstanding_amount: Decimal
+    payment_status: str
+
+
+class InvoicePaymentBatchResponse(BaseModel):
+    """Result of a batch payment"""
+    total_amount: Decimal
+    payment_count: int
+    payments: List[InvoicePaymentResponse]
+    invoices: List[InvoicePaymentBatchInvoice]
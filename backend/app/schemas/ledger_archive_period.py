@@ -0,0 +1,42 @@
+"""Ledger archive period schemas"""
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+
+class LedgerArchivePeriodCreate(BaseModel):
+    """Schema for registering an archived ledger period (used internally by manager)"""
+    workspace_id: int
+    ledger_table: str
+    archive_table: str
+    period_year: int
+    period_start: datetime
+    period_end: datetime
+    rows_archived: int = 0
+    checkpoints_created: int = 0
+    archived_by: Optional[int] = None
+
+
+class LedgerArchivePeriodUpdate(BaseModel):
+    """Schema for updating archive statistics"""
+    rows_archived: Optional[int] = None
+    checkpoints_created: Optional[int] = None
+    archived_by: Optional[int] = None
+    archived_at: Optional[datetime] = None
+
+
+class LedgerArchivePeriodResponse(BaseModel):
+    """Ledger archive period response schema"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    workspace_id: int
+    ledger_table: str
+    archive_table: str
+    period_year: int
+    period_start: datetime
+    period_end: datetime
+    rows_archived: int
+    checkpoints_created: int
+    archived_by: Optional[int] = None
+    archived_at: datetime
@@ -0,0 +1,50 @@
+"""Ledger drift schemas"""
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+
+class LedgerDriftCreate(BaseModel):
+    """Schema for recording a ledger drift (used internally by manager)"""
+    workspace_id: int
+    ledger_table: str
+    location_id: int
+    inventory_type: Optional[str] = None
+    item_id: int
+    drift_type: str
+    ledger_entry_id: Optional[int] = None
+    expected_qty: int
+    actual_qty: Optional[int] = None
+    discrepancy: int
+
+
+class LedgerDriftUpdate(BaseModel):
+    """Schema for updating a ledger drift"""
+    ledger_entry_id: Optional[int] = None
+    expected_qty: Optional[int] = None
+    actual_qty: Optional[int] = None
+    discrepancy: Optional[int] = None
+    is_resolved: Optional[bool] = None
+    last_checked_at: Optional[datetime] = None
+    resolved_at: Optional[datetime] = None
+
+
+class LedgerDriftResponse(BaseModel):
+    """Ledger drift response schema"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    workspace_id: int
+    ledger_table: str
+    location_id: int
+    inventory_type: Optional[str] = None
+    item_id: int
+    drift_type: str
+    ledger_entry_id: Optional[int] = None
+    expected_qty: int
+    actual_qty: Optional[int] = None
+    discrepancy: int
+    is_resolved: bool
+    detected_at: datetime
+    last_checked_at: datetime
+    resolved_at: Optional[datetime] = None
@@ -0,0 +1,42 @@
+"""Ledger drift scan state schemas"""
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
+from datetime import datetime
+
+
+class LedgerDriftScanStateCreate(BaseModel):
+    """Schema for creating scanner state (used internally by manager)"""
+    workspace_id: int
+    ledger_table: str
+    last_ledger_id: int = 0
+
+
+class LedgerDriftScanStateUpdate(BaseModel):
+    """Schema for updating scanner state after a run"""
+    last_ledger_id: Optional[int] = None
+    last_run_at: Optional[datetime] = None
+    last_run_duration_ms: Optional[int] = None
+    last_run_rows_scanned: Optional[int] = None
+    last_run_keys_checked: Optional[int] = None
+    last_run_drifts_found: Optional[int] = None
+    run_count: Optional[int] = None
+    total_rows_scanned: Optional[int] = None
+    total_drifts_found: Optional[int] = None
+
+
+class LedgerDriftScanStateResponse(BaseModel):
+    """Ledger drift scanner metrics response schema"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    workspace_id: int
+    ledger_table: str
+    last_ledger_id: int
+    last_run_at: Optional[datetime] = None
+    last_run_duration_ms: int
+    last_run_rows_scanned: int
+    last_run_keys_checked: int
+    last_run_drifts_found: int
+    run_count: int
+    total_rows_scanned: int
+    total_drifts_found: int
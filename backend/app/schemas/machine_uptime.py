@@ -0,0 +1,62 @@
+"""Machine uptime rollup and report schemas"""
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date, datetime
+from decimal import Decimal
+from app.models.enums import MachineEventTypeEnum
+
+
+class MachineUptimeRollupCreate(BaseModel):
+    """Machine uptime rollup creation schema (used internally by manager)"""
+    workspace_id: int
+    machine_id: int
+    day: date
+    running_seconds: int = 0
+    idle_seconds: int = 0
+    off_seconds: int = 0
+    maintenance_seconds: int = 0
+    failure_count: int = 0
+    repair_count: int = 0
+
+
+class MachineUptimeRollupUpdate(BaseModel):
+    """Machine uptime rollup update schema (used internally by manager)"""
+    running_seconds: Optional[int] = None
+    failure_count: Optional[int] = None
+
+
+class MachineStateInterval(BaseModel):
+    """Time a machine spent in one state, clipped to the requested window"""
+    machine_id: int
+    event_type: MachineEventTypeEnum
+    started_at: datetime
+    ended_at: datetime
+    duration_seconds: int
+    is_open: bool  # True while the machine is still in this state
+
+
+class MachineUptimeRow(BaseModel):
+    """Uptime, downtime and reliability of one machine, section, factory or the fleet"""
+    group_id: Optional[int] = None  # Machine/section/factory ID (None = total)
+    group_name: Optional[str] = None
+    machine_count: int
+    running_seconds: int
+    idle_seconds: int
+    off_seconds: int
+    maintenance_seconds: int
+    uptime_seconds: int  # running
+    downtime_seconds: int  # off + maintenance
+    observed_seconds: int  # time covered by events
+    uptime_percentage: Optional[Decimal] = None  # uptime / observed
+    failure_count: int
+    repair_count: int
+    mtbf_hours: Optional[Decimal] = None  # uptime / failures
+    mttr_hours: Optional[Decimal] = None  # downtime / repairs
+
+
+class MachineUptimeResponse(BaseModel):
+    """Machine uptime report over a window"""
+    start: datetime
+    end: datetime
+    group_by: str  # 'machine', 'section', 'factory' or 'total'
+    rows: List[MachineUptimeRow]
@@ -0,0 +1,35 @@
+"""Predictive maintenance due-list schemas"""
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+from decimal import Decimal
+
+
+class MaintenanceDueItem(BaseModel):
+    """Predicted next maintenance of one machine"""
+    machine_id: int
+    machine_name: str
+    factory_section_id: int
+    last_maintenance_date: Optional[date] = None
+    due_date: date
+    days_until_due: int  # Negative when overdue
+    basis: str  # 'scheduled', 'calendar', 'running_hours' or 'parts'
+
+    # Signals (None when there is not enough history)
+    scheduled_date: Optional[date] = None  # Machine.next_maintenance_schedule
+    calendar_due_date: Optional[date] = None
+    avg_interval_days: Optional[Decimal] = None
+    running_hours_due_date: Optional[date] = None
+    running_hours_since: Optional[Decimal] = None
+    avg_running_hours_between: Optional[Decimal] = None
+    parts_due_date: Optional[date] = None
+    parts_consumed_since: Optional[int] = None
+    avg_parts_between: Optional[Decimal] = None
+
+
+class MaintenanceDueListResponse(BaseModel):
+    """Machines due for maintenance within a horizon, earliest first"""
+    as_of: date
+    days: int
+    machine_count: int  # Machines with a predicted due date
+    items: List[MaintenanceDueItem]
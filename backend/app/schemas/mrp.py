@@ -0,0 +1,51 @@
+"""MRP (material requirements planning) schemas"""
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+
+
+class MRPPlannedBatch(BaseModel):
+    """A planned batch: what to make, where, and how much output"""
+    formula_id: Optional[int] = None  # Formula to run
+    item_id: Optional[int] = None  # Or the output item (its producing formula is used)
+    factory_id: Optional[int] = None
+    production_line_id: Optional[int] = None  # Or the line (its factory is used)
+    quantity: Optional[int] = Field(None, ge=1)  # Target output (default: formula base output)
+
+    @model_validator(mode='after')
+    def check_references(self) -> 'MRPPlannedBatch':
+        if self.formula_id is None and self.item_id is None:
+            raise ValueError("Either formula_id or item_id is required")
+        if self.factory_id is None and self.production_line_id is None:
+            raise ValueError("Either factory_id or production_line_id is required")
+        return self
+
+
+class MRPRequest(BaseModel):
+    """MRP run request"""
+    batches: List[MRPPlannedBatch] = Field(default_factory=list)
+    include_draft_batches: bool = False  # Also plan existing draft batches
+
+
+class MRPRequirement(BaseModel):
+    """Netted requirement of one item in one factory"""
+    item_id: int
+    level: int  # Low-level code (0 = direct input of a planned batch)
+    gross_quantity: int
+    available_quantity: int  # Storage items + STORAGE inventory
+    net_quantity: int
+    producing_formula_id: Optional[int] = None  # Formula that makes the item, if any
+    planned_production_quantity: int = 0  # Net quantity exploded through the producing formula
+    shortage_quantity: int = 0  # Net quantity that has to be purchased
+
+
+class MRPFactoryPlan(BaseModel):
+    """MRP result for one factory"""
+    factory_id: int
+    requirements: List[MRPRequirement]
+    shortages: List[MRPRequirement]
+
+
+class MRPResponse(BaseModel):
+    """MRP run result"""
+    factories: List[MRPFactoryPlan]
+    cycles: List[List[int]]  # Item cycles in the formula graph (item IDs)
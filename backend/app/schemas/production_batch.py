@@ -51,6 +51,7 @@ class ProductionBatchInDB(ProductionBatchBase):
     id: int
     workspace_id: int
     batch_number: str
+    formula_version_id: Optional[int] = None
     output_variance_quantity: Optional[int] = None
     output_variance_percentage: Optional[Decimal] = None
     efficiency_percentage: Optional[Decimal] = None
@@ -0,0 +1,75 @@
+"""Production batch rollup and analytics schemas"""
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+from decimal import Decimal
+
+
+class ProductionBatchRollupCreate(BaseModel):
+    """Production batch rollup creation schema (used internally by manager)"""
+    workspace_id: int
+    batch_date: date
+    production_line_id: int
+    formula_id: Optional[int] = None
+    shift: Optional[str] = None
+    batch_count: int = 0
+    expected_output_quantity: int = 0
+    actual_output_quantity: int = 0
+    timed_output_quantity: int = 0
+    duration_minutes: int = 0
+    input_quantity: int = 0
+    waste_quantity: int = 0
+    efficiency_sum: Decimal = Decimal('0.00')
+    efficiency_sq_sum: Decimal = Decimal('0.0000')
+    efficiency_count: int = 0
+    variance_lt_neg10: int = 0
+    variance_neg10_neg5: int = 0
+    variance_neg5_0: int = 0
+    variance_0_5: int = 0
+    variance_5_10: int = 0
+    variance_gte_10: int = 0
+
+
+class ProductionBatchRollupUpdate(BaseModel):
+    """Production batch rollup update schema (used internally by manager)"""
+    batch_count: Optional[int] = None
+    actual_output_quantity: Optional[int] = None
+
+
+class VarianceDistribution(BaseModel):
+    """Number of batches per output variance bucket (%, lower bound inclusive)"""
+    lt_neg10: int = 0
+    neg10_neg5: int = 0
+    neg5_0: int = 0
+    pos0_5: int = 0
+    pos5_10: int = 0
+    gte_10: int = 0
+
+
+class ProductionAnalyticsRow(BaseModel):
+    """OEE-style aggregates of one period and group"""
+    period: date  # First day of the day/week (Monday)/month
+    group_id: Optional[int] = None  # Line/formula ID (None = shift/total grouping or no formula)
+    group_name: Optional[str] = None  # Line/formula name or shift
+    batch_count: int
+    expected_output_quantity: int
+    actual_output_quantity: int
+    input_quantity: int
+    waste_quantity: int
+    avg_efficiency: Optional[Decimal] = None  # Mean efficiency_percentage
+    efficiency_stddev: Optional[Decimal] = None  # Population standard deviation
+    efficiency_rank: Optional[int] = None  # 1 = best group of the period
+    efficiency_change: Optional[Decimal] = None  # vs the same group's previous period
+    variance_distribution: VarianceDistribution
+    throughput_per_hour: Optional[Decimal] = None  # Output per hour of batches with a logged duration
+    scrap_ratio: Optional[Decimal] = None  # waste / (actual output + waste)
+    yield_rate: Optional[Decimal] = None  # actual output / expected output
+
+
+class ProductionAnalyticsResponse(BaseModel):
+    """Production analytics report"""
+    start_date: date
+    end_date: date
+    period: str  # 'day', 'week' or 'month'
+    group_by: str  # 'line', 'formula', 'shift' or 'total'
+    rows: List[ProductionAnalyticsRow]
@@ -0,0 +1,46 @@
+"""Production Formula Version schemas"""
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from decimal import Decimal
+
+
+class ProductionFormulaVersionCreate(BaseModel):
+    """Production formula version creation schema (used internally by manager)"""
+    workspace_id: int
+    formula_id: int
+    version: int
+    base_output_quantity: int
+    estimated_duration_minutes: Optional[int] = None
+    recipe: List[Dict[str, Any]]
+    created_by: Optional[int] = None
+
+
+class ProductionFormulaVersionUpdate(BaseModel):
+    """Production formula versions are immutable (placeholder for BaseDAO typing)"""
+    pass
+
+
+class RecipeLineResponse(BaseModel):
+    """One line of a compiled recipe"""
+    item_id: int
+    item_role: str
+    quantity: int  # Per base run
+    qty_per_output_unit: Decimal  # quantity / base_output_quantity
+    tolerance_percentage: Optional[Decimal] = None
+    is_optional: bool
+
+
+class ProductionFormulaVersionResponse(BaseModel):
+    """Production formula version (recipe snapshot) response schema"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    workspace_id: int
+    formula_id: int
+    version: int
+    base_output_quantity: int
+    estimated_duration_minutes: Optional[int] = None
+    lines: List[RecipeLineResponse]
+    created_by: Optional[int] = None
+    created_at: datetime
@@ -0,0 +1,86 @@
+"""Production schedule schemas"""
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+from datetime import date
+
+
+class ShiftDefinition(BaseModel):
+    """A shift of every working day, in order"""
+    name: str = Field(..., min_length=1, max_length=20)
+    minutes: int = Field(..., gt=0, le=1440)
+
+
+DEFAULT_SHIFTS = [
+    ShiftDefinition(name='morning', minutes=480),
+    ShiftDefinition(name='afternoon', minutes=480),
+    ShiftDefinition(name='night', minutes=480),
+]
+
+
+class ScheduleRequest(BaseModel):
+    """Finite-capacity scheduling of draft batches"""
+    start_date: Optional[date] = None  # Defaults to today
+    horizon_days: int = Field(14, ge=1, le=366)
+    shifts: List[ShiftDefinition] = Field(default_factory=lambda: list(DEFAULT_SHIFTS), min_length=1, max_length=6)
+    factory_id: Optional[int] = None  # Only batches/lines of this factory
+    default_duration_minutes: int = Field(60, gt=0)  # For batches without expected or formula duration
+    apply: bool = False  # Write line, batch_date and shift of scheduled batches
+
+    @model_validator(mode='after')
+    def check_shift_names(self) -> 'ScheduleRequest':
+        names = [shift.name for shift in self.shifts]
+        if len(set(names)) != len(names):
+            raise ValueError("Shift names must be unique")
+        return self
+
+
+class RescheduleRequest(BaseModel):
+    """Incremental rescheduling after one batch changed"""
+    apply: bool = False
+
+
+class ScheduledBatch(BaseModel):
+    """Placement of one batch"""
+    batch_id: int
+    factory_id: int
+    production_line_id: int
+    previous_production_line_id: int
+    batch_date: date
+    shift: str
+    start_minute: int  # Minutes into the start shift
+    end_date: date
+    end_shift: str
+    end_minute: int  # Minutes into the end shift
+    duration_minutes: int
+
+
+class UnscheduledBatch(BaseModel):
+    """A batch that could not be placed"""
+    batch_id: int
+    factory_id: int
+    duration_minutes: int
+    reason: str  # 'no_available_line' or 'exceeds_horizon'
+
+
+class LineLoad(BaseModel):
+    """Capacity and load of one production line over the horizon"""
+    production_line_id: int
+    factory_id: int
+    available: bool
+    unavailable_reason: Optional[str] = None  # 'machine_stopped' or 'machine_deleted'
+    maintenance_dates: List[date] = []
+    capacity_minutes: int
+    scheduled_minutes: int
+    utilization: float  # scheduled / capacity (0..1)
+
+
+class ScheduleResponse(BaseModel):
+    """Production schedule"""
+    start_date: date
+    horizon_days: int
+    shifts: List[ShiftDefinition]
+    scheduled: List[ScheduledBatch]
+    unscheduled: List[UnscheduledBatch]
+    lines: List[LineLoad]
+    changed_batch_ids: List[int] = []  # Batches whose placement changed (reschedule)
+    applied: bool = False
@@ -0,0 +1,52 @@
+"""Project cost rollup schemas"""
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+from pydantic import BaseModel, ConfigDict
+
+
+class ProjectCostRollupCreate(BaseModel):
+    """Schema for creating a cost rollup row (used internally by manager)"""
+    workspace_id: int
+    project_id: int
+    project_component_id: int | None = None
+    item_cost: Decimal = Decimal('0.00')
+    misc_cost: Decimal = Decimal('0.00')
+    work_order_cost: Decimal = Decimal('0.00')
+    maintenance_cost: Decimal = Decimal('0.00')
+
+
+class ProjectCostRollupUpdate(BaseModel):
+    """Schema for updating a cost rollup row"""
+    item_cost: Decimal | None = None
+    misc_cost: Decimal | None = None
+    work_order_cost: Decimal | None = None
+    maintenance_cost: Decimal | None = None
+
+
+class CostBreakdown(BaseModel):
+    """Cost totals by source"""
+    item_cost: Decimal
+    misc_cost: Decimal
+    work_order_cost: Decimal
+    maintenance_cost: Decimal
+    total_cost: Decimal
+
+
+class ComponentCostSummary(CostBreakdown):
+    """Cost totals of one project component"""
+    project_component_id: int
+    name: str
+    budget: float | None = None
+
+
+class ProjectCostSummaryResponse(CostBreakdown):
+    """Cost tree of a project: project totals plus one entry per component"""
+    project_id: int
+    name: str
+    budget: float | None = None
+    unassigned_cost: Decimal  # Costs booked on the project without a component
+    components: List[ComponentCostSummary]
+    updated_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -2,7 +2,7 @@
 from datetime import datetime
 from decimal import Decimal
 from typing import List
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PurchaseOrderItemCreate(BaseModel):
@@ -78,3 +78,33 @@ class PurchaseOrderResponse(BaseModel):
     updated_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PurchaseOrderShortage(BaseModel):
+    item_id: int
+    quantity: Decimal = Field(..., gt=0)
+    destination_type: str = 'storage'
+    destination_id: int  # factory_id, machine_id, project_component_id
+    account_id: int | None = None  # Supplier override (default: last supplier of the item)
+    unit_price: Decimal | None = Field(None, ge=0)  # Price override (default: last purchase price)
+
+
+class PurchaseOrderGenerate(BaseModel):
+    shortages: List[PurchaseOrderShortage] = Field(..., min_length=1, max_length=5000)
+    default_account_id: int | None = None  # Supplier of items never bought before
+    current_status_id: int = 1
+    order_workflow_id: int | None = None
+    description: str | None = None
+    internal_note: str | None = None
+
+
+class GeneratedPurchaseOrder(PurchaseOrderResponse):
+    items: List[PurchaseOrderItemResponse]
+
+
+class PurchaseOrderGenerateResponse(BaseModel):
+    po_count: int
+    line_count: int
+    total_amount: Decimal
+    purchase_orders: List[GeneratedPurchaseOrder]
+    unassigned: List[PurchaseOrderShortage]  # Shortages without a known supplier (no PO created)
@@ -0,0 +1,65 @@
+"""Spare-parts replenishment schemas"""
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+from decimal import Decimal
+
+
+class ReplenishmentLine(BaseModel):
+    """Stock position and reorder parameters of one item in one factory"""
+    factory_id: int
+    factory_name: str
+    item_id: int
+    item_name: str
+    item_unit: str
+
+    # Stock position
+    on_hand: int  # storage_items quantity
+    on_order: int  # Not yet received on open purchase order lines
+    machine_shortfall: int  # Sum of req_qty - qty of machines below their required quantity
+    available: int  # on_hand + on_order - machine_shortfall
+
+    # Consumption over the window (storage and machine ledgers)
+    consumed: int
+    daily_rate: Decimal
+    daily_std_dev: Decimal
+    days_of_cover: Optional[Decimal] = None  # available / daily_rate (None without consumption)
+
+    # Reorder parameters
+    safety_stock: int
+    reorder_point: int
+    is_short: bool  # available at or below the reorder point
+    suggested_qty: int  # Order-up-to quantity (0 unless short)
+    estimated_unit_price: Optional[Decimal] = None  # storage_items avg_price
+
+
+class SuggestedPurchaseOrderLine(BaseModel):
+    """Line of a suggested purchase order"""
+    item_id: int
+    item_name: str
+    item_unit: str
+    quantity: int
+    estimated_unit_price: Optional[Decimal] = None
+    estimated_subtotal: Optional[Decimal] = None
+
+
+class SuggestedPurchaseOrder(BaseModel):
+    """Suggested purchase order to one factory's storage"""
+    destination_type: str = 'storage'
+    destination_id: int  # factory_id
+    factory_name: str
+    estimated_total: Decimal  # Sum of priced lines
+    items: List[SuggestedPurchaseOrderLine]
+
+
+class ReplenishmentResponse(BaseModel):
+    """Shortage list and suggested purchase orders of a workspace"""
+    as_of: date
+    window_days: int
+    lead_time_days: int
+    service_level: Decimal
+    cover_days: int
+    item_count: int  # Factory/item pairs with demand
+    shortage_count: int
+    shortages: List[ReplenishmentLine]
+    suggested_purchase_orders: List[SuggestedPurchaseOrder]
@@ -0,0 +1,86 @@
+"""Stock Reservation schemas"""
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import List, Optional
+from datetime import datetime
+
+
+class StockReservationCreate(BaseModel):
+    """Stock reservation creation schema (used internally by manager)"""
+    workspace_id: int
+    factory_id: int
+    item_id: int
+    batch_id: int
+    quantity: int = Field(..., gt=0)
+    status: str = 'active'
+    created_by: Optional[int] = None
+
+
+class StockReservationUpdate(BaseModel):
+    """Stock reservation update schema (used internally by manager)"""
+    status: Optional[str] = Field(None, pattern=r'^(active|consumed|released)$')
+    resolved_at: Optional[datetime] = None
+
+
+class StockReservationResponse(BaseModel):
+    """Stock reservation response schema"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    workspace_id: int
+    factory_id: int
+    item_id: int
+    batch_id: int
+    quantity: int
+    status: str
+    created_by: Optional[int] = None
+    created_at: datetime
+    resolved_at: Optional[datetime] = None
+
+
+class AvailabilityCandidate(BaseModel):
+    """A batch to check: an existing draft batch, or a formula run on a line/factory"""
+    batch_id: Optional[int] = None  # Draft batch (uses its formula, line and expected output)
+    formula_id: Optional[int] = None
+    factory_id: Optional[int] = None
+    production_line_id: Optional[int] = None  # Or the line (its factory is used)
+    quantity: Optional[int] = Field(None, ge=1)  # Target output (default: formula base output)
+
+    @model_validator(mode='after')
+    def check_references(self) -> 'AvailabilityCandidate':
+        if self.batch_id is None:
+            if self.formula_id is None:
+                raise ValueError("Either batch_id or formula_id is required")
+            if self.factory_id is None and self.production_line_id is None:
+                raise ValueError("Either factory_id or production_line_id is required")
+        return self
+
+
+class AvailabilityRequest(BaseModel):
+    """Availability check for many candidate batches"""
+    candidates: List[AvailabilityCandidate] = Field(..., min_length=1, max_length=500)
+    cumulative: bool = False  # Candidates that fit use up stock for the ones after them
+
+
+class AvailabilityLine(BaseModel):
+    """Availability of one input of a candidate"""
+    item_id: int
+    required_quantity: int
+    on_hand_quantity: int  # Storage items + STORAGE inventory
+    reserved_quantity: int  # Active reservations (and earlier candidates when cumulative)
+    available_quantity: int
+    shortage_quantity: int
+
+
+class CandidateAvailability(BaseModel):
+    """Availability result of one candidate"""
+    batch_id: Optional[int] = None
+    formula_id: int
+    factory_id: int
+    output_quantity: int
+    can_produce: bool
+    lines: List[AvailabilityLine]
+
+
+class AvailabilityResponse(BaseModel):
+    """Availability results, in candidate order"""
+    results: List[CandidateAvailability]
@@ -9,7 +9,7 @@ class StorageItemLedgerBase(BaseModel):
     """Base storage item ledger schema"""
     factory_id: int
     item_id: int
-    transaction_type: str = Field(..., pattern=r'^(purchase_order|manual_add|transfer_in|transfer_out|consumption|damaged|inventory_adjustment|cost_adjustment)$')
+    transaction_type: str = Field(..., pattern=r'^(purchase_order|manual_add|transfer_in|transfer_out|consumption|damaged|inventory_adjustment|cost_adjustment|opening_balance)$')
     quantity: int = Field(..., ge=0)
     unit_cost: Decimal = Field(..., ge=0)
     total_cost: Decimal = Field(..., ge=0)
@@ -0,0 +1,148 @@
+"""Access Control Service for orchestrating RBAC workflows"""
+from typing import List, Optional
+from sqlalchemy.orm import Session
+
+from app.services.base_service import BaseService
+from app.managers.access_control_manager import access_control_manager
+from app.models.access_control import AccessControl
+from app.models.enums import AccessControlTypeEnum, RoleEnum
+from app.schemas.access_control import AccessControlCreate, AccessControlUpdate
+
+
+class AccessControlService(BaseService):
+    """
+    Service for AccessControl workflows.
+
+    Handles:
+    - Transaction boundaries (commit/rollback)
+    - Access control CRUD operations
+    - Permission matrix invalidation (through the manager) on writes
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.access_control_manager = access_control_manager
+
+    def get_access_controls(
+        self,
+        db: Session,
+        workspace_id: int,
+        role: Optional[RoleEnum] = None,
+        access_type: Optional[AccessControlTypeEnum] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[AccessControl]:
+        """
+        Get access control rules in workspace.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+            role: Filter by role (optional)
+            access_type: Filter by type (optional)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of access control rules
+        """
+        return self.access_control_manager.list_access_controls(
+            session=db,
+            workspace_id=workspace_id,
+            role=role,
+            access_type=access_type,
+            skip=skip,
+            limit=limit
+        )
+
+    def get_access_control(self, db: Session, control_id: int, workspace_id: int) -> AccessControl:
+        """
+        Get access control rule by ID.
+
+        Raises:
+            HTTPException: If rule not found
+        """
+        return self.access_control_manager.get_access_control(db, control_id, workspace_id)
+
+    def create_access_control(
+        self, db: Session, control_in: AccessControlCreate, workspace_id: int
+    ) -> AccessControl:
+        """
+        Create access control rule.
+
+        Args:
+            db: Database session
+            control_in: Rule creation data
+            workspace_id: Workspace ID
+
+        Returns:
+            Created rule
+        """
+        try:
+            control = self.access_control_manager.create_access_control(
+                session=db,
+                control_data=control_in,
+                workspace_id=workspace_id
+            )
+
+            # Commit transaction
+            self._commit_transaction(db)
+            db.refresh(control)
+
+            return control
+
+        except Exception as e:
+            self._rollback_transaction(db)
+            raise
+
+    def update_access_control(
+        self, db: Session, control_id: int, control_in: AccessControlUpdate, workspace_id: int
+    ) -> AccessControl:
+        """
+        Update access control rule.
+
+        Raises:
+            HTTPException: If rule not found
+        """
+        try:
+            control = self.access_control_manager.update_access_control(
+                session=db,
+                control_id=control_id,
+                control_data=control_in,
+                workspace_id=workspace_id
+            )
+
+            # Commit transaction
+            self._commit_transaction(db)
+            db.refresh(control)
+
+            return control
+
+        except Exception as e:
+            self._rollback_transaction(db)
+            raise
+
+    def delete_access_control(self, db: Session, control_id: int, workspace_id: int) -> None:
+        """
+        Delete access control rule.
+
+        Raises:
+            HTTPException: If rule not found
+        """
+        try:
+            self.access_control_manager.delete_access_control(
+                session=db,
+                control_id=control_id,
+                workspace_id=workspace_id
+            )
+
+            # Commit transaction
+            self._commit_transaction(db)
+
+        except Exception as e:
+            self._rollback_transaction(db)
+            raise
+
+
+# Singleton instance
+access_control_service = AccessControlService()
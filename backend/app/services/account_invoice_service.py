@@ -1,9 +1,12 @@
 """Account Invoice Service for orchestrating invoice workflows"""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from datetime import date
 from sqlalchemy.orm import Session
 
 from app.services.base_service import BaseService
 from app.managers.account_invoice_manager import account_invoice_manager
+from app.managers.account_aging_manager import account_aging_manager
+from app.managers.account_period_summary_manager import account_period_summary_manager
 from app.models.account_invoice import AccountInvoice
 from app.schemas.account_invoice import AccountInvoiceCreate, AccountInvoiceUpdate
 
@@ -21,6 +24,8 @@ class AccountInvoiceService(BaseService):
     def __init__(self):
         super().__init__()
         self.account_invoice_manager = account_invoice_manager
+        self.account_aging_manager = account_aging_manager
+        self.account_period_summary_manager = account_period_summary_manager
 
     def create_invoice(
         self,
@@ -120,6 +125,98 @@ class AccountInvoiceService(BaseService):
             limit=limit
         )
 
+    def get_aging_report(
+        self,
+        db: Session,
+        workspace_id: int,
+        as_of: Optional[date] = None,
+        invoice_type: Optional[str] = None,
+        account_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the receivable/payable aging report.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+            as_of: Date to age invoices at (defaults to today)
+            invoice_type: Filter by type (optional)
+            account_id: Filter by account (optional)
+
+        Returns:
+            Aging totals per invoice type and buckets per account
+        """
+        return self.account_aging_manager.get_aging_report(
+            session=db,
+            workspace_id=workspace_id,
+            as_of=as_of,
+            invoice_type=invoice_type,
+            account_id=account_id
+        )
+
+    def get_period_summary(
+        self,
+        db: Session,
+        workspace_id: int,
+        start_period: date,
+        end_period: date,
+        group_by: str = 'type',
+        invoice_type: Optional[str] = None,
+        account_id: Optional[int] = None,
+        tag_id: Optional[int] = None,
+        factory_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get monthly invoiced vs paid totals.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+            start_period: First month (any day in it)
+            end_period: Last month (any day in it)
+            group_by: 'type', 'account', 'tag' or 'factory'
+            invoice_type: Filter by type (optional)
+            account_id: Filter by account (optional)
+            tag_id: Filter by account tag (optional)
+            factory_id: Filter by factory (optional)
+
+        Returns:
+            Totals per month, invoice type and group
+        """
+        return self.account_period_summary_manager.get_summary(
+            session=db,
+            workspace_id=workspace_id,
+            start_period=start_period,
+            end_period=end_period,
+            group_by=group_by,
+            invoice_type=invoice_type,
+            account_id=account_id,
+            tag_id=tag_id,
+            factory_id=factory_id
+        )
+
+    def rebuild_period_summaries(self, db: Session, workspace_id: int) -> Dict[str, int]:
+        """
+        Recompute the monthly summary of a workspace from invoices and payments.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+
+        Returns:
+            {'summary_rows': int}
+        """
+        try:
+            rows = self.account_period_summary_manager.rebuild(session=db, workspace_id=workspace_id)
+
+            self._commit_transaction(db)
+
+            return {'summary_rows': rows}
+
+        except Exception as e:
+            self._rollback_transaction(db)
+            raise
+
     def update_invoice(
         self,
         db: Session,
@@ -1,8 +1,10 @@
 """Account Service for orchestrating account workflows"""
-from typing import List, Optional
+from typing import Dict, List, Optional
+from decimal import Decimal
 from sqlalchemy.orm import Session
 from app.services.base_service import BaseService
 from app.managers.account_manager import account_manager
+from app.managers.account_balance_manager import account_balance_manager
 from app.models.account import Account
 from app.models.profile import Profile
 from app.schemas.account import AccountCreate, AccountUpdate, AccountWithTagsResponse
@@ -23,6 +25,7 @@ class AccountService(BaseService):
     def __init__(self):
         super().__init__()
         self.account_manager = account_manager
+        self.account_balance_manager = account_balance_manager
 
     def create_account(
         self,
@@ -154,6 +157,10 @@ class AccountService(BaseService):
             "updated_by": account.updated_by,
             "deleted_at": account.deleted_at,
             "deleted_by": account.deleted_by,
+            "payable_outstanding": account.payable_outstanding,
+            "receivable_outstanding": account.receivable_outstanding,
+            "last_invoice_date": account.last_invoice_date,
+            "last_payment_date": account.last_payment_date,
             "tags": [
                 {
                     "id": tag.id,
@@ -202,6 +209,10 @@ class AccountService(BaseService):
         workspace_id: int,
         search: Optional[str] = None,
         tag_code: Optional[str] = None,
+        min_payable_outstanding: Optional[Decimal] = None,
+        min_receivable_outstanding: Optional[Decimal] = None,
+        sort_by: Optional[str] = None,
+        sort_desc: bool = False,
         skip: int = 0,
         limit: int = 100
     ) -> List[dict]:
@@ -212,6 +223,11 @@ class AccountService(BaseService):
             db: Database session
             workspace_id: Workspace ID
             search: Optional search query for account name
+            tag_code: Optional tag code filter
+            min_payable_outstanding: Only accounts we owe at least this much
+            min_receivable_outstanding: Only accounts owing us at least this much
+            sort_by: Optional sort column (name or a balance column)
+            sort_desc: Sort descending
             skip: Number of records to skip
             limit: Maximum number of records to return
 
@@ -223,6 +239,10 @@ class AccountService(BaseService):
             workspace_id=workspace_id,
             name=search,
             tag_code=tag_code,
+            min_payable_outstanding=min_payable_outstanding,
+            min_receivable_outstanding=min_receivable_outstanding,
+            sort_by=sort_by,
+            sort_desc=sort_desc,
             skip=skip,
             limit=limit
         )
@@ -270,6 +290,10 @@ class AccountService(BaseService):
                 "updated_by": account.updated_by,
                 "deleted_at": account.deleted_at,
                 "deleted_by": account.deleted_by,
+                "payable_outstanding": account.payable_outstanding,
+                "receivable_outstanding": account.receivable_outstanding,
+                "last_invoice_date": account.last_invoice_date,
+                "last_payment_date": account.last_payment_date,
                 "tags": [
                     {
                         "id": tag.id,
@@ -378,6 +402,38 @@ class AccountService(BaseService):
             self._rollback_transaction(db)
             raise
 
+    def rebuild_balances(
+        self,
+        db: Session,
+        workspace_id: int,
+        account_ids: Optional[List[int]] = None
+    ) -> Dict[str, int]:
+        """
+        Recompute account balance counters from invoices and payments.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+            account_ids: Only these accounts (optional, default all)
+
+        Returns:
+            {'accounts_rebuilt': int}
+        """
+        try:
+            rebuilt = self.account_balance_manager.rebuild_balances(
+                session=db,
+                workspace_id=workspace_id,
+                account_ids=account_ids
+            )
+
+            self._commit_transaction(db)
+
+            return {'accounts_rebuilt': rebuilt}
+
+        except Exception as e:
+            self._rollback_transaction(db)
+            raise
+
 
 # Singleton instance
 account_service = AccountService()
@@ -5,7 +5,10 @@ from sqlalchemy.orm import Session
 from app.services.base_service import BaseService
 from app.managers.invoice_payment_manager import invoice_payment_manager
 from app.models.invoice_payment import InvoicePayment
-from app.schemas.invoice_payment import InvoicePaymentCreate, InvoicePaymentUpdate
+from app.schemas.invoice_payment import (
+    InvoicePaymentCreate, InvoicePaymentUpdate, InvoicePaymentBatchCreate,
+    InvoicePaymentBatchResponse, InvoicePaymentResponse
+)
 
 
 class InvoicePaymentService(BaseService):
@@ -63,6 +66,62 @@ class InvoicePaymentService(BaseService):
             self._rollback_transaction(db)
             raise
 
+    def create_batch_payment(
+        self,
+        db: Session,
+        batch_in: InvoicePaymentBatchCreate,
+        workspace_id: int,
+        user_id: int
+    ) -> InvoicePaymentBatchResponse:
+        """
+        Apply one remittance across many invoices in a single transaction.
+
+        Args:
+            db: Database session
+            batch_in: Remittance details and per-invoice allocations
+            workspace_id: Workspace ID
+            user_id: User recording the payments
+
+        Returns:
+            Created payments and the updated invoice balances
+
+        Raises:
+            HTTPException: If an invoice is not found or validation fails
+        """
+        try:
+            result = self.invoice_payment_manager.create_batch_payment(
+                session=db,
+                batch_data=batch_in,
+                workspace_id=workspace_id,
+                user_id=user_id
+            )
+
+            # Build the response before commit expires the loaded rows
+            # (refreshing them afterwards would cost one SELECT per payment)
+            response = InvoicePaymentBatchResponse(
+                total_amount=result['total_amount'],
+                payment_count=len(result['payments']),
+                payments=[InvoicePaymentResponse.model_validate(p) for p in result['payments']],
+                invoices=[
+                    {
+                        'invoice_id': invoice.id,
+                        'paid_amount': invoice.paid_amount,
+                        'outstanding_amount': invoice.invoice_amount - invoice.paid_amount,
+                        'payment_status': invoice.payment_status,
+                    }
+                    for invoice in result['invoices']
+                ]
+            )
+
+            # Commit transaction
+            self._commit_transaction(db)
+
+            return response
+
+        except Exception as e:
+            self._rollback_transaction(db)
+            raise
+
     def get_payment(
         self,
         db: Session,
@@ -5,14 +5,20 @@ from datetime import datetime
 from decimal import Decimal
 from app.services.base_service import BaseService
 from app.managers.ledger_manager import ledger_manager
+from app.managers.ledger_archive_manager import ledger_archive_manager
+from app.managers.ledger_drift_manager import ledger_drift_manager
 from app.models.storage_item_ledger import StorageItemLedger
 from app.models.machine_item_ledger import MachineItemLedger
 from app.models.damaged_item_ledger import DamagedItemLedger
 from app.models.project_component_item_ledger import ProjectComponentItemLedger
 from app.models.inventory_ledger import InventoryLedger
 from app.models.profile import Profile
+from app.models.ledger_archive_period import LedgerArchivePeriod
+from app.models.ledger_drift import LedgerDrift
+from app.models.ledger_drift_scan_state import LedgerDriftScanState
 from app.schemas.response import ActionMessage, success_message, info_message, warning_message
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import NotFoundError, BusinessRuleError
+from app.db.session import SessionLocal
 
 
 class LedgerService(BaseService):
@@ -24,11 +30,15 @@ class LedgerService(BaseService):
     - Ledger query operations
     - Reconciliation with user messages
     - Cross-ledger reporting
+    - Archival of closed ledger periods
+    - Ledger-vs-snapshot drift scanning
     """
 
     def __init__(self):
         super().__init__()
         self.ledger_manager = ledger_manager
+        self.ledger_archive_manager = ledger_archive_manager
+        self.ledger_drift_manager = ledger_drift_manager
 
     # ============================================================================
     # STORAGE LEDGER OPERATIONS
@@ -542,6 +552,187 @@ class LedgerService(BaseService):
             workspace_id=workspace_id
         )
 
+    # ============================================================================
+    # LEDGER ARCHIVAL
+    # ============================================================================
+
+    def archive_closed_periods(
+        self,
+        db: Session,
+        workspace_id: int,
+        through_year: int,
+        current_user: Profile
+    ) -> Tuple[Dict[str, Any], List[ActionMessage]]:
+        """
+        Move closed ledger years to archive tables and return messages.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+            through_year: Last year to archive (must be a closed year)
+            current_user: Current authenticated user
+
+        Returns:
+            Tuple of (archive_result, messages)
+        """
+        messages = []
+
+        try:
+            result = self.ledger_archive_manager.archive_closed_periods(
+                session=db,
+                workspace_id=workspace_id,
+                through_year=through_year,
+                user_id=current_user.id
+            )
+
+            self._commit_transaction(db)
+
+        except ValueError as e:
+            self._rollback_transaction(db)
+            raise BusinessRuleError(str(e))
+        except Exception:
+            self._rollback_transaction(db)
+            raise
+
+        total_rows = sum(ledger['rows_archived'] for ledger in result['ledgers'].values())
+        total_checkpoints = sum(ledger['checkpoints_created'] for ledger in result['ledgers'].values())
+        if total_rows:
+            messages.append(success_message(
+                f"Archived {total_rows} ledger entries through {through_year}. "
+                f"{total_checkpoints} opening balance entries carried forward."
+            ))
+        else:
+            messages.append(info_message(
+                f"No ledger entries on or before {through_year} to archive."
+            ))
+
+        return result, messages
+
+    def get_archive_periods(
+        self,
+        db: Session,
+        workspace_id: int,
+        ledger_table: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[LedgerArchivePeriod]:
+        """Get archived ledger periods for a workspace."""
+        try:
+            return self.ledger_archive_manager.get_archive_periods(
+                session=db,
+                workspace_id=workspace_id,
+                ledger_table=ledger_table,
+                skip=skip,
+                limit=limit
+            )
+        except ValueError as e:
+            raise BusinessRuleError(str(e))
+
+
+    # ============================================================================
+    # DRIFT DETECTION
+    # ============================================================================
+
+    def run_drift_scan(
+        self,
+        db: Session,
+        workspace_id: int
+    ) -> Tuple[Dict[str, Any], List[ActionMessage]]:
+        """
+        Scan new ledger entries for drift against the snapshot tables.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+
+        Returns:
+            Tuple of (scan_result, messages)
+        """
+        messages = []
+
+        try:
+            result = self.ledger_drift_manager.scan_workspace(
+                session=db,
+                workspace_id=workspace_id
+            )
+
+            self._commit_transaction(db)
+
+        except Exception:
+            self._rollback_transaction(db)
+            raise
+
+        rows_scanned = sum(ledger['rows_scanned'] for ledger in result['ledgers'].values())
+        drifts_found = sum(ledger['drifts_found'] for ledger in result['ledgers'].values())
+        drifts_resolved = sum(ledger['drifts_resolved'] for ledger in result['ledgers'].values())
+
+        messages.append(info_message(
+            f"Scanned {rows_scanned} new ledger entries",
+            details={"rows_scanned": rows_scanned}
+        ))
+        if drifts_found:
+            messages.append(warning_message(
+                f"Found {drifts_found} new ledger/snapshot discrepancies",
+                details={"drifts_found": drifts_found}
+            ))
+        if drifts_resolved:
+            messages.append(success_message(
+                f"{drifts_resolved} previously detected discrepancies are resolved"
+            ))
+        if not result['open_drifts']:
+            messages.append(success_message("All scanned snapshots match their ledgers"))
+
+        return result, messages
+
+    def run_drift_scan_job(self, workspace_id: int) -> Dict[str, Any]:
+        """
+        Run a drift scan in its own session (background tasks and scheduled jobs).
+
+        Args:
+            workspace_id: Workspace ID
+
+        Returns:
+            Scan result
+        """
+        db = SessionLocal()
+        try:
+            result, _ = self.run_drift_scan(db, workspace_id)
+            return result
+        finally:
+            db.close()
+
+    def get_drifts(
+        self,
+        db: Session,
+        workspace_id: int,
+        ledger_table: Optional[str] = None,
+        drift_type: Optional[str] = None,
+        include_resolved: bool = False,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[LedgerDrift]:
+        """Get recorded ledger drifts for a workspace."""
+        try:
+            return self.ledger_drift_manager.get_drifts(
+                session=db,
+                workspace_id=workspace_id,
+                ledger_table=ledger_table,
+                drift_type=drift_type,
+                include_resolved=include_resolved,
+                skip=skip,
+                limit=limit
+            )
+        except ValueError as e:
+            raise BusinessRuleError(str(e))
+
+    def get_drift_scan_metrics(
+        self,
+        db: Session,
+        workspace_id: int
+    ) -> List[LedgerDriftScanState]:
+        """Get drift scanner high-water marks and run metrics."""
+        return self.ledger_drift_manager.get_scan_metrics(session=db, workspace_id=workspace_id)
+
 
 # Singleton instance
 ledger_service = LedgerService()
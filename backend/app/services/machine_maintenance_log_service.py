@@ -86,6 +86,12 @@ class MachineMaintenanceLogService(BaseService):
             self._rollback_transaction(db)
             raise
 
+    def get_due_list(
+        self, db: Session, workspace_id: int, days: int = 7
+    ) -> dict:
+        """Get the predictive maintenance due-list."""
+        return self.manager.get_due_list(db, workspace_id, days=days)
+
 
 # Singleton instance
 machine_maintenance_log_service = MachineMaintenanceLogService()
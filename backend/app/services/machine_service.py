@@ -1,14 +1,17 @@
 """Machine Service for orchestrating machine workflows"""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from datetime import datetime
 from sqlalchemy.orm import Session
 
 from app.services.base_service import BaseService
 from app.managers.machine_manager import machine_manager
+from app.managers.machine_uptime_manager import machine_uptime_manager
 from app.models.machine import Machine
 from app.models.machine_event import MachineEvent
 from app.models.enums import MachineEventTypeEnum
 from app.schemas.machine import MachineCreate, MachineUpdate
 from app.schemas.machine_event import MachineEventCreate
+from app.core.exceptions import NotFoundError, BusinessRuleError
 
 
 class MachineService(BaseService):
@@ -22,6 +25,7 @@ class MachineService(BaseService):
     def __init__(self):
         super().__init__()
         self.machine_manager = machine_manager
+        self.uptime_manager = machine_uptime_manager
 
     # ==================== MACHINE CRUD ====================
 
@@ -138,6 +142,59 @@ class MachineService(BaseService):
             workspace_id=workspace_id
         )
 
+    # ==================== UPTIME ====================
+
+    def get_machine_intervals(
+        self, db: Session, machine_id: int, workspace_id: int,
+        start: datetime, end: datetime
+    ) -> List[Dict[str, Any]]:
+        """Get the state intervals of a machine within a window."""
+        try:
+            return self.uptime_manager.get_intervals(
+                session=db, workspace_id=workspace_id, machine_id=machine_id,
+                start=start, end=end
+            )
+        except ValueError as e:
+            error_msg = str(e)
+            if "not found" in error_msg:
+                raise NotFoundError(error_msg)
+            raise BusinessRuleError(error_msg)
+
+    def get_uptime(
+        self, db: Session, workspace_id: int,
+        start: datetime, end: datetime,
+        group_by: str = 'machine',
+        factory_id: Optional[int] = None,
+        factory_section_id: Optional[int] = None,
+        machine_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get uptime, downtime, MTBF and MTTR per machine, section or factory."""
+        try:
+            return self.uptime_manager.get_uptime(
+                session=db, workspace_id=workspace_id,
+                start=start, end=end, group_by=group_by,
+                factory_id=factory_id,
+                factory_section_id=factory_section_id,
+                machine_id=machine_id
+            )
+        except ValueError as e:
+            raise BusinessRuleError(str(e))
+
+    def rebuild_uptime(self, db: Session, workspace_id: int) -> Dict[str, int]:
+        """
+        Recompute the machine uptime rollup of a workspace from its events.
+
+        Returns:
+            {'rollup_rows': int}
+        """
+        try:
+            rows = self.uptime_manager.rebuild(session=db, workspace_id=workspace_id)
+            self._commit_transaction(db)
+            return {'rollup_rows': rows}
+        except Exception:
+            self._rollback_transaction(db)
+            raise
+
 
 # Singleton instance
 machine_service = MachineService()
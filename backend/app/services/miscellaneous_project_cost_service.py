@@ -1,6 +1,7 @@
 """Miscellaneous project cost service for business orchestration"""
 from sqlalchemy.orm import Session
 from app.dao.miscellaneous_project_cost import miscellaneous_project_cost_dao
+from app.managers.project_cost_manager import project_cost_manager
 from app.schemas.miscellaneous_project_cost import MiscellaneousProjectCostCreate, MiscellaneousProjectCostUpdate
 
 
@@ -13,6 +14,7 @@ class MiscellaneousProjectCostService:
             cost_dict = cost_in.model_dump()
             cost_dict['workspace_id'] = workspace_id
             cost = miscellaneous_project_cost_dao.create(db, obj_in=cost_dict)
+            project_cost_manager.record_costs(db, workspace_id, [self._cost_change(cost)])
             db.commit()
             db.refresh(cost)
             return cost
@@ -28,7 +30,9 @@ class MiscellaneousProjectCostService:
             )
             if not cost:
                 return None
+            before = self._cost_change(cost, sign=-1)
             cost = miscellaneous_project_cost_dao.update(db, db_obj=cost, obj_in=cost_in)
+            project_cost_manager.record_costs(db, workspace_id, [before, self._cost_change(cost)])
             db.commit()
             db.refresh(cost)
             return cost
@@ -44,12 +48,22 @@ class MiscellaneousProjectCostService:
             )
             if not cost:
                 return False
+            removed = self._cost_change(cost, sign=-1)
             miscellaneous_project_cost_dao.remove(db, id=cost_id)
+            project_cost_manager.record_costs(db, workspace_id, [removed])
             db.commit()
             return True
         except Exception as e:
             db.rollback()
             raise
 
+    def _cost_change(self, cost, sign: int = 1) -> dict:
+        """Project cost rollup change for adding (or with sign=-1, removing) a cost"""
+        return {
+            'project_id': cost.project_id,
+            'project_component_id': cost.project_component_id,
+            'misc_cost': sign * cost.amount,
+        }
+
 
 miscellaneous_project_cost_service = MiscellaneousProjectCostService()
@@ -9,6 +9,7 @@ from app.models.profile import Profile
 from app.schemas.order import OrderCreate, OrderUpdate
 from app.dao.order import order_dao
 from app.dao.order_item import order_item_dao
+from app.core.exceptions import NotFoundError, BusinessRuleError
 
 class OrderService(BaseService):
     """
@@ -224,18 +225,21 @@ class OrderService(BaseService):
                 for op in order_items
             ]
 
-            # Deduct from storage using inventory manager
+            # Deduct from storage using inventory manager (one bulk ledger posting)
             self.inventory_manager.deduct_from_storage(
                 session=db,
                 factory_id=order.factory_id,
-                items=items_to_deduct
+                items=items_to_deduct,
+                workspace_id=order.workspace_id,
+                user_id=current_user.id,
+                order_id=order_id
             )
 
             # Advance order status using order manager
             order = self.order_manager.advance_order_status(
                 session=db,
                 order_id=order_id,
-                new_status_id=3,  # Approved/Withdrawn status
+                new_status_id=self.order_manager.get_next_status_id(db, order),
                 user_id=current_user.id
             )
 
@@ -245,6 +249,12 @@ class OrderService(BaseService):
 
             return order
 
+        except ValueError as e:
+            self._rollback_transaction(db)
+            error_msg = str(e)
+            if "not found" in error_msg:
+                raise NotFoundError(error_msg)
+            raise BusinessRuleError(error_msg)
         except Exception as e:
             self._rollback_transaction(db)
             raise
@@ -288,20 +298,24 @@ class OrderService(BaseService):
                 for op in order_items
             ]
 
-            # Transfer from storage to machine
+            # Transfer from storage to machine (one bulk posting per ledger)
             self.inventory_manager.transfer_storage_to_machine(
                 session=db,
                 factory_id=order.factory_id,
                 machine_id=order.machine_id,
-                items=items_data
+                items=items_data,
+                workspace_id=order.workspace_id,
+                user_id=current_user.id,
+                order_id=order_id
             )
 
             # Advance order status
             order = self.order_manager.advance_order_status(
                 session=db,
                 order_id=order_id,
-                new_status_id=5,  # Completed status
-                user_id=current_user.id
+                new_status_id=self.order_manager.get_final_status_id(db, order),
+                user_id=current_user.id,
+                allow_skip=True
             )
 
             # Commit transaction
@@ -310,6 +324,12 @@ class OrderService(BaseService):
 
             return order
 
+        except ValueError as e:
+            self._rollback_transaction(db)
+            error_msg = str(e)
+            if "not found" in error_msg:
+                raise NotFoundError(error_msg)
+            raise BusinessRuleError(error_msg)
         except Exception as e:
             self._rollback_transaction(db)
             raise
@@ -1,10 +1,16 @@
 """Production Batch Service for orchestrating production batch workflows"""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from datetime import date
 from sqlalchemy.orm import Session
 from app.services.base_service import BaseService
 from app.managers.production_batch_manager import production_batch_manager
+from app.managers.production_analytics_manager import production_analytics_manager
+from app.managers.production_schedule_manager import production_schedule_manager
 from app.models.production_batch import ProductionBatch
 from app.models.production_batch_item import ProductionBatchItem
+from app.models.stock_reservation import StockReservation
+from app.schemas.production_schedule import RescheduleRequest, ScheduleRequest
+from app.schemas.stock_reservation import AvailabilityRequest
 from app.core.exceptions import NotFoundError, BusinessRuleError
 
 
@@ -16,12 +22,17 @@ class ProductionBatchService(BaseService):
     - Transaction boundaries (commit/rollback)
     - Batch CRUD and workflow operations (start, complete, cancel)
     - Batch item CRUD
+    - Stock reservations and availability checks
+    - Production analytics
+    - Finite-capacity scheduling
     - Error handling and exception translation
     """
 
     def __init__(self):
         super().__init__()
         self.batch_manager = production_batch_manager
+        self.analytics_manager = production_analytics_manager
+        self.schedule_manager = production_schedule_manager
 
     # ─── Batch Operations ───────────────────────────────────────────
 
@@ -342,6 +353,172 @@ class ProductionBatchService(BaseService):
                 raise NotFoundError(error_msg)
             raise BusinessRuleError(error_msg)
 
+    # ─── Reservations & Availability ────────────────────────────────
+
+    def get_batch_reservations(
+        self,
+        db: Session,
+        batch_id: int,
+        workspace_id: int
+    ) -> List[StockReservation]:
+        """Get the stock reservations of a batch."""
+        try:
+            return self.batch_manager.get_batch_reservations(
+                session=db,
+                batch_id=batch_id,
+                workspace_id=workspace_id
+            )
+        except ValueError as e:
+            raise NotFoundError(str(e))
+
+    def check_availability(
+        self,
+        db: Session,
+        availability_in: AvailabilityRequest,
+        workspace_id: int
+    ) -> List[dict]:
+        """Check whether candidate batches can be produced from available stock."""
+        try:
+            return self.batch_manager.check_availability(
+                session=db,
+                workspace_id=workspace_id,
+                candidates=[c.model_dump() for c in availability_in.candidates],
+                cumulative=availability_in.cumulative
+            )
+        except ValueError as e:
+            error_msg = str(e)
+            if "not found" in error_msg:
+                raise NotFoundError(error_msg)
+            raise BusinessRuleError(error_msg)
+
+    # ─── Analytics ──────────────────────────────────────────────────
+
+    def get_analytics(
+        self,
+        db: Session,
+        workspace_id: int,
+        start_date: date,
+        end_date: date,
+        period: str = 'month',
+        group_by: str = 'line',
+        production_line_id: Optional[int] = None,
+        formula_id: Optional[int] = None,
+        shift: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get OEE-style aggregates of completed batches.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+            start_date: First batch date
+            end_date: Last batch date (inclusive)
+            period: 'day', 'week' or 'month'
+            group_by: 'line', 'formula', 'shift' or 'total'
+            production_line_id: Filter by line (optional)
+            formula_id: Filter by formula (optional)
+            shift: Filter by shift (optional)
+
+        Returns:
+            Aggregates per period and group
+        """
+        return self.analytics_manager.get_analytics(
+            session=db,
+            workspace_id=workspace_id,
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
+            group_by=group_by,
+            production_line_id=production_line_id,
+            formula_id=formula_id,
+            shift=shift
+        )
+
+    def rebuild_analytics(self, db: Session, workspace_id: int) -> Dict[str, int]:
+        """
+        Recompute the production rollup of a workspace from completed batches.
+
+        Args:
+            db: Database session
+            workspace_id: Workspace ID
+
+        Returns:
+            {'rollup_rows': int}
+        """
+        try:
+            rows = self.analytics_manager.rebuild(session=db, workspace_id=workspace_id)
+
+            self._commit_transaction(db)
+
+            return {'rollup_rows': rows}
+
+        except Exception as e:
+            self._rollback_transaction(db)
+            raise
+
+    # ─── Scheduling ─────────────────────────────────────────────────
+
+    def build_schedule(
+        self,
+        db: Session,
+        schedule_in: ScheduleRequest,
+        workspace_id: int
+    ) -> Dict[str, Any]:
+        """
+        Schedule draft batches on lines and shifts.
+
+        Commits only when schedule_in.apply is set (batch line/date/shift
+        are written).
+        """
+        try:
+            schedule = self.schedule_manager.build_schedule(
+                session=db,
+                workspace_id=workspace_id,
+                start_date=schedule_in.start_date or date.today(),
+                horizon_days=schedule_in.horizon_days,
+                shifts=[shift.model_dump() for shift in schedule_in.shifts],
+                factory_id=schedule_in.factory_id,
+                default_duration_minutes=schedule_in.default_duration_minutes,
+                apply=schedule_in.apply
+            )
+            if schedule_in.apply:
+                self._commit_transaction(db)
+            return schedule
+
+        except Exception as e:
+            self._rollback_transaction(db)
+            raise
+
+    def reschedule_batch(
+        self,
+        db: Session,
+        batch_id: int,
+        reschedule_in: RescheduleRequest,
+        workspace_id: int
+    ) -> Dict[str, Any]:
+        """
+        Update the last schedule after a batch changed.
+
+        Commits only when reschedule_in.apply is set.
+        """
+        try:
+            schedule = self.schedule_manager.reschedule_batch(
+                session=db,
+                workspace_id=workspace_id,
+                batch_id=batch_id,
+                apply=reschedule_in.apply
+            )
+            if reschedule_in.apply:
+                self._commit_transaction(db)
+            return schedule
+
+        except ValueError as e:
+            self._rollback_transaction(db)
+            raise NotFoundError(str(e))
+        except Exception:
+            self._rollback_transaction(db)
+            raise
+
 
 # Singleton instance
 production_batch_service = ProductionBatchService()
@@ -3,8 +3,11 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 from app.services.base_service import BaseService
 from app.managers.production_formula_manager import production_formula_manager
+from app.managers.mrp_manager import mrp_manager
+from app.managers.formula_version_manager import formula_version_manager
 from app.models.production_formula import ProductionFormula
 from app.models.production_formula_item import ProductionFormulaItem
+from app.schemas.mrp import MRPRequest
 from app.core.exceptions import NotFoundError, BusinessRuleError
 
 
@@ -15,12 +18,16 @@ class ProductionFormulaService(BaseService):
     Handles:
     - Transaction boundaries (commit/rollback)
     - Formula and formula item CRUD
+    - Recipe snapshots (formula versions)
+    - MRP runs (read-only requirement explosion)
     - Error handling and exception translation
     """
 
     def __init__(self):
         super().__init__()
         self.formula_manager = production_formula_manager
+        self.mrp_manager = mrp_manager
+        self.version_manager = formula_version_manager
 
     # ─── Formula Operations ─────────────────────────────────────────
 
@@ -227,6 +234,44 @@ class ProductionFormulaService(BaseService):
                 raise NotFoundError(error_msg)
             raise BusinessRuleError(error_msg)
 
+    def get_formula_versions(
+        self,
+        db: Session,
+        formula_id: int,
+        workspace_id: int
+    ) -> List[dict]:
+        """Get the recipe snapshots of a formula, newest first."""
+        try:
+            return self.version_manager.get_versions(
+                session=db,
+                workspace_id=workspace_id,
+                formula_id=formula_id
+            )
+        except ValueError as e:
+            raise NotFoundError(str(e))
+
+    # ─── MRP ────────────────────────────────────────────────────────
+
+    def run_mrp(
+        self,
+        db: Session,
+        mrp_in: MRPRequest,
+        workspace_id: int
+    ) -> dict:
+        """Explode planned batches into netted requirements and shortages per factory."""
+        try:
+            return self.mrp_manager.plan(
+                session=db,
+                workspace_id=workspace_id,
+                batches=[batch.model_dump() for batch in mrp_in.batches],
+                include_draft_batches=mrp_in.include_draft_batches
+            )
+        except ValueError as e:
+            error_msg = str(e)
+            if "not found" in error_msg:
+                raise NotFoundError(error_msg)
+            raise BusinessRuleError(error_msg)
+
 
 # Singleton instance
 production_formula_service = ProductionFormulaService()
@@ -3,13 +3,15 @@ Project Service
 
 Orchestrates project operations with transaction management.
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from app.services.base_service import BaseService
 from app.managers.project_manager import project_manager
+from app.managers.project_cost_manager import project_cost_manager
 from app.models.project import Project
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.core.exceptions import NotFoundError
 
 
 class ProjectService(BaseService):
@@ -22,6 +24,7 @@ class ProjectService(BaseService):
     def __init__(self):
         super().__init__()
         self.project_manager = project_manager
+        self.project_cost_manager = project_cost_manager
 
     def create_project(
         self,
@@ -183,5 +186,42 @@ class ProjectService(BaseService):
             self._rollback_transaction(db)
             raise
 
+    def get_cost_summary(
+        self,
+        db: Session,
+        project_id: int,
+        workspace_id: int
+    ) -> Dict[str, Any]:
+        """
+        Get the project cost tree (project totals + per-component totals).
+
+        Builds the project's cost rollups on first use.
+
+        Args:
+            db: Database session
+            project_id: Project ID
+            workspace_id: Workspace ID
+
+        Returns:
+            Project cost summary
+
+        Raises:
+            NotFoundError: If project not found
+        """
+        try:
+            summary = self.project_cost_manager.get_cost_summary(
+                session=db,
+                workspace_id=workspace_id,
+                project_id=project_id
+            )
+            self._commit_transaction(db)
+            return summary
+        except ValueError as e:
+            self._rollback_transaction(db)
+            raise NotFoundError(str(e))
+        except Exception as e:
+            self._rollback_transaction(db)
+            raise
+
 
 project_service = ProjectService()
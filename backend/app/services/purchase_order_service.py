@@ -1,14 +1,18 @@
 """Purchase Order Service - transaction orchestration"""
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 
+from app.core.exceptions import BusinessRuleError
 from app.services.base_service import BaseService
 from app.managers.purchase_order_manager import purchase_order_manager
+from app.managers.replenishment_manager import replenishment_manager
 from app.models.purchase_order import PurchaseOrder
 from app.models.purchase_order_item import PurchaseOrderItem
 from app.schemas.purchase_order import (
     PurchaseOrderCreate, PurchaseOrderUpdate,
     PurchaseOrderItemCreate, PurchaseOrderItemUpdate,
+    PurchaseOrderGenerate, PurchaseOrderGenerateResponse,
+    PurchaseOrderResponse, PurchaseOrderItemResponse,
 )
 
 
@@ -45,6 +49,38 @@ class PurchaseOrderService(BaseService):
             self._rollback_transaction(db)
             raise
 
+    def generate_purchase_orders(
+        self, db: Session, generate_in: PurchaseOrderGenerate,
+        workspace_id: int, user_id: int
+    ) -> PurchaseOrderGenerateResponse:
+        """Create purchase orders for many shortages in one transaction."""
+        try:
+            result = self.manager.generate_purchase_orders(
+                db, data=generate_in, workspace_id=workspace_id, user_id=user_id
+            )
+
+            # Build the response before commit expires the inserted rows
+            # (refreshing them afterwards would cost one SELECT per order)
+            response = PurchaseOrderGenerateResponse(
+                po_count=len(result['purchase_orders']),
+                line_count=result['line_count'],
+                total_amount=result['total_amount'],
+                purchase_orders=[
+                    {
+                        **PurchaseOrderResponse.model_validate(po).model_dump(),
+                        'items': [PurchaseOrderItemResponse.model_validate(item) for item in items],
+                    }
+                    for po, items in result['purchase_orders']
+                ],
+                unassigned=result['unassigned']
+            )
+
+            self._commit_transaction(db)
+            return response
+        except Exception:
+            self._rollback_transaction(db)
+            raise
+
     def get_purchase_order(self, db: Session, po_id: int, workspace_id: int) -> PurchaseOrder:
         return self.manager.get_purchase_order(db, po_id, workspace_id)
 
@@ -106,5 +142,23 @@ class PurchaseOrderService(BaseService):
     def get_items(self, db: Session, po_id: int, workspace_id: int) -> List[PurchaseOrderItem]:
         return self.manager.get_items(db, po_id, workspace_id)
 
+    # ─── Replenishment ─────────────────────────────────────────
+    def get_replenishment(
+        self, db: Session, workspace_id: int,
+        window_days: int = 90, lead_time_days: int = 14,
+        service_level: float = 0.95, cover_days: int = 30,
+        factory_id: Optional[int] = None, refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Get spare-part shortages and suggested purchase orders."""
+        try:
+            return replenishment_manager.get_replenishment(
+                db, workspace_id,
+                window_days=window_days, lead_time_days=lead_time_days,
+                service_level=service_level, cover_days=cover_days,
+                factory_id=factory_id, refresh=refresh
+            )
+        except ValueError as e:
+            raise BusinessRuleError(str(e))
+
 
 purchase_order_service = PurchaseOrderService()
@@ -322,6 +322,12 @@ class SalesService(BaseService):
 
             return sales_order, messages
 
+        except ValueError as e:
+            self._rollback_transaction(db)
+            error_msg = str(e)
+            if "not found" in error_msg:
+                raise NotFoundError(error_msg)
+            raise BusinessRuleError(error_msg)
         except Exception as e:
             self._rollback_transaction(db)
             raise
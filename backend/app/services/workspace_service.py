@@ -1,7 +1,7 @@
 """Workspace Service for workspace management operations"""
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 import secrets
 from app.services.base_service import BaseService
 from app.dao.workspace import workspace_dao
@@ -9,6 +9,7 @@ from app.dao.workspace_member import workspace_member_dao
 from app.dao.workspace_invitation import workspace_invitation_dao
 from app.dao.workspace_audit_log import workspace_audit_log_dao
 from app.dao.subscription_plan import subscription_plan_dao
+from app.managers.quota_manager import quota_manager
 from app.schemas.workspace import WorkspaceCreate, WorkspaceUpdate, WorkspaceListItem
 from app.schemas.workspace_member import WorkspaceMemberCreate
 from app.schemas.workspace_invitation import WorkspaceInvitationCreate, InviteUserRequest
@@ -237,11 +238,6 @@ class WorkspaceService(BaseService):
             # Mark invitation as accepted
             workspace_invitation_dao.mark_as_accepted(db, invitation=invitation)
 
-            # Increment member count
-            workspace_dao.increment_usage(
-                db, workspace_id=invitation.workspace_id, field='members'
-            )
-
             # Log action
             workspace_audit_log_dao.log_action(
                 db,
@@ -347,9 +343,6 @@ class WorkspaceService(BaseService):
             db.delete(member)
             db.flush()
 
-            # Decrement member count
-            workspace_dao.decrement_usage(db, workspace_id=workspace_id, field='members')
-
             # Log action
             workspace_audit_log_dao.log_action(
                 db,
@@ -411,5 +404,24 @@ class WorkspaceService(BaseService):
             self._rollback_transaction(db)
             raise
 
+    def recount_usage(self, db: Session, *, workspace_id: Optional[int] = None) -> int:
+        """
+        Recompute subscription usage counters from the source tables
+
+        Args:
+            workspace_id: Only this workspace (optional, default all)
+
+        Returns:
+            Number of workspaces recounted
+        """
+        try:
+            count = quota_manager.recount(db, workspace_id=workspace_id)
+            self._commit_transaction(db)
+            return count
+
+        except Exception as e:
+            self._rollback_transaction(db)
+            raise
+
 
 workspace_service = WorkspaceService()
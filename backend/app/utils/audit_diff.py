@@ -0,0 +1,125 @@
+"""
+Compact encoding of financial audit change sets.
+
+Audit rows used to store the full `changes` dict, typically
+{"before": {...}, "after": {...}} snapshots where most fields are equal.
+pack_changes() keeps only the fields that differ and stores them as compact
+JSON, zlib-compressed when the payload is large enough to benefit.
+unpack_changes() rebuilds the {"before", "after", ...} shape on read.
+
+Encoded form (before compression):
+    {"f": {field: [before, after]}}  fields present on both sides that differ
+    {"b": {...}}                      fields only in "before" (e.g. deleted entity)
+    {"a": {...}}                      fields only in "after" (e.g. created entity)
+    {"x": {...}}                      any other top-level keys, stored verbatim
+"f" is present whenever the original had both "before" and "after", so an
+update that changed nothing still reconstructs as empty before/after dicts.
+
+Packed bytes start with a one-byte tag: b'j' plain JSON, b'z' zlib(JSON).
+"""
+import json
+import zlib
+from typing import Any, Dict, Optional
+
+
+# Payloads at least this long are compressed (when that makes them smaller)
+COMPRESS_MIN_BYTES = 256
+
+PLAIN_TAG = b'j'
+ZLIB_TAG = b'z'
+
+
+def diff_changes(changes: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a changes dict to its field-level diff.
+
+    Args:
+        changes: Dict with optional 'before'/'after' snapshots and other keys
+
+    Returns:
+        Diff in the encoded form described in the module docstring
+    """
+    before = changes.get('before')
+    after = changes.get('after')
+    diff: Dict[str, Any] = {}
+
+    if isinstance(before, dict) and isinstance(after, dict):
+        diff['f'] = {
+            field: [before[field], after[field]]
+            for field in before
+            if field in after and before[field] != after[field]
+        }
+        only_before = {field: value for field, value in before.items() if field not in after}
+        only_after = {field: value for field, value in after.items() if field not in before}
+    else:
+        only_before = before
+        only_after = after
+
+    if only_before:
+        diff['b'] = only_before
+    if only_after:
+        diff['a'] = only_after
+
+    extra = {key: value for key, value in changes.items() if key not in ('before', 'after')}
+    if extra:
+        diff['x'] = extra
+    return diff
+
+
+def expand_diff(diff: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild the changes dict from diff_changes() output.
+
+    Unchanged fields of 'before'/'after' snapshots are not stored, so they
+    are not part of the result.
+    """
+    changes: Dict[str, Any] = {}
+    fields = diff.get('f')
+    before = dict(diff.get('b') or {})
+    after = dict(diff.get('a') or {})
+    if fields is not None:
+        for field, (old, new) in fields.items():
+            before[field] = old
+            after[field] = new
+
+    if before or fields is not None:
+        changes['before'] = before
+    if after or fields is not None:
+        changes['after'] = after
+    changes.update(diff.get('x') or {})
+    return changes
+
+
+def pack_changes(changes: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    """
+    Encode a changes dict for FinancialAuditLog.changes_diff.
+
+    Returns:
+        Packed bytes, or None when there are no changes
+    """
+    if not changes:
+        return None
+    payload = json.dumps(diff_changes(changes), separators=(',', ':'), ensure_ascii=False).encode()
+    if len(payload) >= COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(payload, 9)
+        if len(compressed) < len(payload):
+            return ZLIB_TAG + compressed
+    return PLAIN_TAG + payload
+
+
+def unpack_changes(packed: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """
+    Decode pack_changes() output back into a changes dict.
+
+    Raises:
+        ValueError: If the bytes were not produced by pack_changes()
+    """
+    if not packed:
+        return None
+    packed = bytes(packed)
+    tag, payload = packed[:1], packed[1:]
+    if tag == ZLIB_TAG:
+        payload = zlib.decompress(payload)
+    elif tag != PLAIN_TAG:
+        raise ValueError(f"Unknown audit diff encoding {tag!r}")
+    return expand_diff(json.loads(payload))
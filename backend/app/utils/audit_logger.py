@@ -2,12 +2,29 @@
 Audit logging utility for financial operations.
 
 Provides a simple interface for logging audit events across the financial system.
+
+Events are buffered per transaction in an outbox on the session and written
+with one multi-row insert when the session commits (see
+FINANCIAL_AUDIT_BUFFERED). The insert runs in the session's before_commit
+hook, inside the same transaction as the change being audited: the audit
+rows commit or roll back together with the data, and nothing is left to do
+after commit, when a failure could no longer be undone.
+
+Changes are stored as compact field-level diffs (see app/utils/audit_diff.py)
+and rebuilt only when a row's changes are read.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from decimal import Decimal
 from datetime import datetime, date
+from sqlalchemy import event
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.dao.financial_audit_log import financial_audit_log_dao, FinancialAuditLogCreate
+from app.utils.audit_diff import pack_changes
+
+
+# session.info key of the per-transaction audit outbox
+OUTBOX_KEY = 'financial_audit_outbox'
 
 
 def log_financial_audit(
@@ -26,7 +43,7 @@ def log_financial_audit(
     user_agent: Optional[str] = None
 ) -> None:
     """
-    Log a financial audit event.
+    Log a financial audit event (written at commit, see module docstring).
 
     Args:
         session: Database session
@@ -86,6 +103,50 @@ def log_financial_audit(
             description="Payment of $2000.00 recorded, invoice status changed to partial"
         )
     """
+    log_dict = build_financial_audit(
+        workspace_id=workspace_id,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        action_type=action_type,
+        performed_by=performed_by,
+        changes=changes,
+        description=description,
+        related_entity_type=related_entity_type,
+        related_entity_id=related_entity_id,
+        ip_address=ip_address,
+        user_agent=user_agent
+    )
+
+    if settings.FINANCIAL_AUDIT_BUFFERED:
+        _enqueue(session, [log_dict])
+    else:
+        financial_audit_log_dao.create(session, obj_in=log_dict)
+
+
+def build_financial_audit(
+    *,
+    workspace_id: int,
+    entity_type: str,
+    entity_id: int,
+    action_type: str,
+    performed_by: int,
+    changes: Optional[Dict[str, Any]] = None,
+    description: Optional[str] = None,
+    related_entity_type: Optional[str] = None,
+    related_entity_id: Optional[int] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build a validated financial audit log row without writing it.
+
+    Takes the same arguments as log_financial_audit (except session).
+    Pass the rows to log_financial_audits to write many at once.
+
+    Returns:
+        Dict ready for insert into financial_audit_logs (changes packed
+        into changes_diff)
+    """
     audit_data = FinancialAuditLogCreate(
         entity_type=entity_type,
         entity_id=entity_id,
@@ -99,10 +160,66 @@ def log_financial_audit(
     )
 
     log_dict = audit_data.model_dump()
+    log_dict['changes_diff'] = pack_changes(log_dict.pop('changes'))
     log_dict['workspace_id'] = workspace_id
     log_dict['performed_by'] = performed_by
+    return log_dict
+
+
+def log_financial_audits(session: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Log many financial audit events (written with one multi-row insert).
+
+    Args:
+        session: Database session
+        rows: Rows from build_financial_audit
+
+    Example:
+        log_financial_audits(db, [
+            build_financial_audit(workspace_id=1, entity_type='payment', entity_id=p.id,
+                                  action_type='created', performed_by=user_id)
+            for p in payments
+        ])
+    """
+    if settings.FINANCIAL_AUDIT_BUFFERED:
+        _enqueue(session, rows)
+    else:
+        financial_audit_log_dao.create_batch(session, rows=rows)
+
+
+def flush_financial_audits(session: Session) -> int:
+    """
+    Write the session's buffered audit events now (one multi-row insert).
+
+    Called automatically before commit. Call it directly only if audit rows
+    must be visible to queries in the same transaction.
+
+    Returns:
+        Number of audit rows written
+    """
+    rows = session.info.pop(OUTBOX_KEY, None)
+    if not rows:
+        return 0
+    financial_audit_log_dao.create_batch(session, rows=rows)
+    return len(rows)
+
+
+def _enqueue(session: Session, rows: List[Dict[str, Any]]) -> None:
+    """Add audit rows to the session's outbox, hooking the session on first use."""
+    if not event.contains(session, 'before_commit', _write_outbox):
+        event.listen(session, 'before_commit', _write_outbox)
+        event.listen(session, 'after_rollback', _discard_outbox)
+    session.info.setdefault(OUTBOX_KEY, []).extend(rows)
+
+
+def _write_outbox(session: Session) -> None:
+    """Session before_commit hook: insert the buffered rows inside the committing transaction."""
+    flush_financial_audits(session)
+
 
-    financial_audit_log_dao.create(session, obj_in=log_dict)
+def _discard_outbox(session: Session) -> None:
+    """Session after_rollback hook: drop events of the rolled back transaction."""
+    session.info.pop(OUTBOX_KEY, None)
 
 
 def create_change_dict(before: Optional[Dict[str, Any]] = None, after: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
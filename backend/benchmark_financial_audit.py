@@ -0,0 +1,154 @@
+"""Benchmark payment throughput with buffered vs. immediate audit logging
+
+Records the same payments twice against a scratch SQLite database file:
+once with FINANCIAL_AUDIT_BUFFERED=False (each audit event is inserted and
+flushed as it is logged) and once with the buffered outbox (events written
+with one multi-row insert at commit). Each payment is recorded and then
+deleted again, each in its own transaction through InvoicePaymentService,
+like API requests. Recording logs one audit event; deleting logs two
+(payment deleted + invoice status change), which the outbox writes with
+one insert.
+
+Usage:
+    python benchmark_financial_audit.py                  # 500 payments per mode
+    python benchmark_financial_audit.py --payments 2000
+    python benchmark_financial_audit.py --database-url postgresql://...  # scratch DB, tables are dropped
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import app.db.base  # noqa: F401 - registers all models on Base.metadata
+from app.db.base_class import Base
+from app.core.config import settings
+from app.models.account import Account
+from app.models.account_invoice import AccountInvoice
+from app.models.financial_audit_log import FinancialAuditLog
+from app.schemas.invoice_payment import InvoicePaymentCreate
+from app.services.invoice_payment_service import invoice_payment_service
+
+
+WORKSPACE_ID = 1
+USER_ID = 1
+
+
+def setup_invoices(SessionFactory, count):
+    """Create one account with `count` unpaid invoices and return their ids"""
+    db = SessionFactory()
+    try:
+        account = Account(workspace_id=WORKSPACE_ID, name="Benchmark Supplier")
+        db.add(account)
+        db.flush()
+        invoices = [
+            AccountInvoice(
+                workspace_id=WORKSPACE_ID,
+                account_id=account.id,
+                invoice_type='payable',
+                invoice_amount=Decimal('1000.00'),
+                paid_amount=Decimal('0.00'),
+                invoice_date=date(2026, 1, 1),
+                payment_status='unpaid',
+                allow_payments=True,
+            )
+            for _ in range(count)
+        ]
+        db.add_all(invoices)
+        db.commit()
+        return [invoice.id for invoice in invoices]
+    finally:
+        db.close()
+
+
+def run_mode(engine, SessionFactory, invoice_ids, buffered):
+    """Record and delete one payment per invoice and return timing and statement counts"""
+    settings.FINANCIAL_AUDIT_BUFFERED = buffered
+    statements = {'count': 0}
+
+    def count_statement(*args):
+        statements['count'] += 1
+
+    event.listen(engine, 'before_cursor_execute', count_statement)
+    db = SessionFactory()
+    try:
+        started = time.perf_counter()
+        for invoice_id in invoice_ids:
+            payment = invoice_payment_service.create_payment(
+                db,
+                payment_in=InvoicePaymentCreate(
+                    invoice_id=invoice_id,
+                    payment_amount=Decimal('100.00'),
+                    payment_date=date(2026, 2, 1),
+                    payment_method='bank_transfer',
+                ),
+                workspace_id=WORKSPACE_ID,
+                user_id=USER_ID
+            )
+            invoice_payment_service.delete_payment(
+                db, payment_id=payment.id, workspace_id=WORKSPACE_ID
+            )
+        elapsed = time.perf_counter() - started
+        audit_rows = db.query(FinancialAuditLog).count()
+    finally:
+        db.close()
+        event.remove(engine, 'before_cursor_execute', count_statement)
+
+    return {
+        'elapsed': elapsed,
+        'statements': statements['count'],
+        'audit_rows': audit_rows,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark buffered financial audit logging")
+    parser.add_argument("--payments", type=int, default=500, help="Payments per mode")
+    parser.add_argument("--database-url", default=None,
+                        help="Scratch database URL (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    temp_path = None
+    url = args.database_url
+    if url is None:
+        fd, temp_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        url = f"sqlite:///{temp_path}"
+
+    engine = create_engine(url)
+    SessionFactory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    original = settings.FINANCIAL_AUDIT_BUFFERED
+    try:
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        invoice_ids = setup_invoices(SessionFactory, args.payments * 2)
+
+        results = {
+            'immediate': run_mode(engine, SessionFactory, invoice_ids[:args.payments], buffered=False),
+            'buffered': run_mode(engine, SessionFactory, invoice_ids[args.payments:], buffered=True),
+        }
+    finally:
+        settings.FINANCIAL_AUDIT_BUFFERED = original
+        engine.dispose()
+        if temp_path:
+            os.remove(temp_path)
+
+    print(f"{args.payments} payments recorded and deleted per mode")
+    print(f"{'mode':<10} {'seconds':>9} {'payments/s':>11} {'statements/payment':>19}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<10} {result['elapsed']:>9.2f} "
+            f"{args.payments / result['elapsed']:>11.1f} "
+            f"{result['statements'] / args.payments:>19.1f}"
+        )
+
+    speedup = results['immediate']['elapsed'] / results['buffered']['elapsed']
+    print(f"buffered: {speedup:.2f}x throughput, {results['buffered']['audit_rows']} audit rows in database")
+
+
+if __name__ == "__main__":
+    main()
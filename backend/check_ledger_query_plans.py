@@ -0,0 +1,175 @@
+"""Query-plan regression check for the ledger DAO queries
+
+Runs every ledger DAO lookup against an in-memory SQLite database built from
+the models, captures the SQL it emits and runs EXPLAIN QUERY PLAN on it.
+Each query must be answered from its composite ledger index without a
+temporary B-tree sort for ORDER BY.
+
+Usage:
+    python check_ledger_query_plans.py
+
+Exits with status 1 if any query plan regresses.
+"""
+import sys
+from datetime import datetime
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import app.db.base  # noqa: F401 - registers all models on Base.metadata
+from app.db.base_class import Base
+from app.dao.storage_item_ledger import storage_item_ledger_dao
+from app.dao.machine_item_ledger import machine_item_ledger_dao
+from app.dao.damaged_item_ledger import damaged_item_ledger_dao
+from app.dao.project_component_item_ledger import project_component_item_ledger_dao
+from app.dao.inventory_ledger import inventory_ledger_dao
+
+
+START = datetime(2025, 1, 1)
+END = datetime(2025, 12, 31)
+
+
+def build_checks():
+    """(label, ledger table, expected index, DAO call) for every DAO query shape"""
+    storage, machine = storage_item_ledger_dao, machine_item_ledger_dao
+    damaged, project = damaged_item_ledger_dao, project_component_item_ledger_dao
+    inventory = inventory_ledger_dao
+    return [
+        # Storage ledger
+        ("storage.get_by_factory_and_item", "storage_item_ledger", "ix_storage_item_ledger_ws_factory_item_at",
+         lambda db: storage.get_by_factory_and_item(db, factory_id=1, item_id=1, workspace_id=1)),
+        ("storage.get_latest_entry", "storage_item_ledger", "ix_storage_item_ledger_ws_factory_item_at",
+         lambda db: storage.get_latest_entry(db, factory_id=1, item_id=1, workspace_id=1)),
+        ("storage.calculate_balance", "storage_item_ledger", "ix_storage_item_ledger_ws_factory_item_at",
+         lambda db: storage.calculate_balance(db, factory_id=1, item_id=1, workspace_id=1)),
+        ("storage.get_by_transaction_type", "storage_item_ledger", "ix_storage_item_ledger_ws_type_at",
+         lambda db: storage.get_by_transaction_type(db, transaction_type='consumption', workspace_id=1)),
+        ("storage.get_by_order", "storage_item_ledger", "ix_storage_item_ledger_ws_order_at",
+         lambda db: storage.get_by_order(db, order_id=1, workspace_id=1)),
+        ("storage.get_by_date_range", "storage_item_ledger", "ix_storage_item_ledger_ws_at",
+         lambda db: storage.get_by_date_range(db, workspace_id=1, start_date=START, end_date=END)),
+        ("storage.get_by_performer", "storage_item_ledger", "ix_storage_item_ledger_ws_performer_at",
+         lambda db: storage.get_by_performer(db, performed_by=1, workspace_id=1)),
+
+        # Machine ledger
+        ("machine.get_by_machine_and_item", "machine_item_ledger", "ix_machine_item_ledger_ws_machine_item_at",
+         lambda db: machine.get_by_machine_and_item(db, machine_id=1, item_id=1, workspace_id=1)),
+        ("machine.get_latest_entry", "machine_item_ledger", "ix_machine_item_ledger_ws_machine_item_at",
+         lambda db: machine.get_latest_entry(db, machine_id=1, item_id=1, workspace_id=1)),
+        ("machine.get_by_machine", "machine_item_ledger", "ix_machine_item_ledger_ws_machine_at",
+         lambda db: machine.get_by_machine(db, machine_id=1, workspace_id=1)),
+        ("machine.get_consumption_entries", "machine_item_ledger", "ix_machine_item_ledger_ws_machine_type_at",
+         lambda db: machine.get_consumption_entries(db, machine_id=1, workspace_id=1)),
+        ("machine.get_by_transaction_type", "machine_item_ledger", "ix_machine_item_ledger_ws_type_at",
+         lambda db: machine.get_by_transaction_type(db, transaction_type='consumption', workspace_id=1)),
+        ("machine.get_by_order", "machine_item_ledger", "ix_machine_item_ledger_ws_order_at",
+         lambda db: machine.get_by_order(db, order_id=1, workspace_id=1)),
+        ("machine.get_by_date_range", "machine_item_ledger", "ix_machine_item_ledger_ws_at",
+         lambda db: machine.get_by_date_range(db, workspace_id=1, start_date=START, end_date=END)),
+        ("machine.get_by_performer", "machine_item_ledger", "ix_machine_item_ledger_ws_performer_at",
+         lambda db: machine.get_by_performer(db, performed_by=1, workspace_id=1)),
+
+        # Damaged ledger
+        ("damaged.get_by_factory_and_item", "damaged_item_ledger", "ix_damaged_item_ledger_ws_factory_item_at",
+         lambda db: damaged.get_by_factory_and_item(db, factory_id=1, item_id=1, workspace_id=1)),
+        ("damaged.get_latest_entry", "damaged_item_ledger", "ix_damaged_item_ledger_ws_factory_item_at",
+         lambda db: damaged.get_latest_entry(db, factory_id=1, item_id=1, workspace_id=1)),
+        ("damaged.get_by_transaction_type", "damaged_item_ledger", "ix_damaged_item_ledger_ws_type_at",
+         lambda db: damaged.get_by_transaction_type(db, transaction_type='damaged', workspace_id=1)),
+        ("damaged.get_by_order", "damaged_item_ledger", "ix_damaged_item_ledger_ws_order_at",
+         lambda db: damaged.get_by_order(db, order_id=1, workspace_id=1)),
+        ("damaged.get_by_date_range", "damaged_item_ledger", "ix_damaged_item_ledger_ws_at",
+         lambda db: damaged.get_by_date_range(db, workspace_id=1, start_date=START, end_date=END)),
+        ("damaged.get_by_performer", "damaged_item_ledger", "ix_damaged_item_ledger_ws_performer_at",
+         lambda db: damaged.get_by_performer(db, performed_by=1, workspace_id=1)),
+
+        # Project component ledger
+        ("project.get_by_component_and_item", "project_component_item_ledger",
+         "ix_project_component_item_ledger_ws_component_item_at",
+         lambda db: project.get_by_component_and_item(db, project_component_id=1, item_id=1, workspace_id=1)),
+        ("project.get_latest_entry", "project_component_item_ledger",
+         "ix_project_component_item_ledger_ws_component_item_at",
+         lambda db: project.get_latest_entry(db, project_component_id=1, item_id=1, workspace_id=1)),
+        ("project.get_by_component", "project_component_item_ledger",
+         "ix_project_component_item_ledger_ws_component_at",
+         lambda db: project.get_by_component(db, project_component_id=1, workspace_id=1)),
+        ("project.get_consumption_entries", "project_component_item_ledger",
+         "ix_project_component_item_ledger_ws_component_type_at",
+         lambda db: project.get_consumption_entries(db, project_component_id=1, workspace_id=1)),
+        ("project.get_by_transaction_type", "project_component_item_ledger",
+         "ix_project_component_item_ledger_ws_type_at",
+         lambda db: project.get_by_transaction_type(db, transaction_type='consumption', workspace_id=1)),
+        ("project.get_by_order", "project_component_item_ledger",
+         "ix_project_component_item_ledger_ws_order_at",
+         lambda db: project.get_by_order(db, order_id=1, workspace_id=1)),
+        ("project.get_by_date_range", "project_component_item_ledger",
+         "ix_project_component_item_ledger_ws_at",
+         lambda db: project.get_by_date_range(db, workspace_id=1, start_date=START, end_date=END)),
+        ("project.get_by_performer", "project_component_item_ledger",
+         "ix_project_component_item_ledger_ws_performer_at",
+         lambda db: project.get_by_performer(db, performed_by=1, workspace_id=1)),
+
+        # Inventory ledger
+        ("inventory.get_by_factory_and_item", "inventory_ledger", "ix_inventory_ledger_ws_type_factory_item_at",
+         lambda db: inventory.get_by_factory_and_item(db, factory_id=1, item_id=1, workspace_id=1)),
+        ("inventory.get_latest_entry", "inventory_ledger", "ix_inventory_ledger_ws_type_factory_item_at",
+         lambda db: inventory.get_latest_entry(db, factory_id=1, item_id=1, workspace_id=1)),
+        ("inventory.get_by_transaction_type", "inventory_ledger", "ix_inventory_ledger_ws_type_at",
+         lambda db: inventory.get_by_transaction_type(db, transaction_type='production', workspace_id=1)),
+        ("inventory.get_by_date_range", "inventory_ledger", "ix_inventory_ledger_ws_at",
+         lambda db: inventory.get_by_date_range(db, workspace_id=1, start_date=START, end_date=END)),
+        ("inventory.get_by_performer", "inventory_ledger", "ix_inventory_ledger_ws_performer_at",
+         lambda db: inventory.get_by_performer(db, performed_by=1, workspace_id=1)),
+    ]
+
+
+def main() -> int:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    captured = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    failures = 0
+    print("=" * 60)
+    print("Checking ledger DAO query plans...")
+    print("=" * 60)
+
+    for label, table, expected_index, call in build_checks():
+        db = Session()
+        captured.clear()
+        call(db)
+
+        # The ledger SELECT is the last statement that reads the ledger table
+        # (archive registry lookups run first and are not checked here)
+        statement, parameters = next(
+            (s, p) for s, p in reversed(captured) if f"FROM {table}" in s
+        )
+        with engine.connect() as conn:
+            plan = [
+                row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            ]
+        db.close()
+
+        uses_index = any(f"INDEX {expected_index}" in step for step in plan)
+        sorts = any("TEMP B-TREE" in step for step in plan)
+        ok = uses_index and not sorts
+        failures += 0 if ok else 1
+
+        print(f"{'OK  ' if ok else 'FAIL'} {label:<40} {expected_index}")
+        if not ok:
+            for step in plan:
+                print(f"       {step}")
+
+    print(f"\n{'='*60}")
+    print(f"{failures} query plan regression(s)" if failures else "All ledger queries use their composite index")
+    print(f"{'='*60}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
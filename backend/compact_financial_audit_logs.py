@@ -0,0 +1,79 @@
+"""Compact stored financial audit log changes
+
+Rewrites audit rows that still store the full legacy `changes` JSON
+({"before": {...}, "after": {...}} snapshots) into the compact field-level
+diff in `changes_diff` (see app/utils/audit_diff.py), and clears `changes`.
+Rows are processed in id order and committed per batch, so the tool can be
+interrupted and re-run. Reports the bytes of change payload per audit row
+before and after.
+
+On PostgreSQL, run VACUUM (FULL) financial_audit_logs afterwards to return
+the freed space to the operating system; on SQLite, VACUUM.
+
+Usage:
+    python compact_financial_audit_logs.py                    # compact all rows
+    python compact_financial_audit_logs.py --dry-run          # only measure the saving
+    python compact_financial_audit_logs.py --batch-size 5000
+"""
+import argparse
+import json
+
+from app.db.session import SessionLocal
+from app.dao.financial_audit_log import financial_audit_log_dao
+from app.utils.audit_diff import pack_changes
+
+
+def print_storage(label, storage):
+    """Print change payload bytes per row"""
+    rows = storage['rows'] or 1
+    total = storage['changes_bytes'] + storage['changes_diff_bytes']
+    print(
+        f"{label}: {storage['rows']} rows ({storage['legacy_rows']} uncompacted), "
+        f"{total} bytes of changes, {total / rows:.1f} bytes/row"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact financial audit log changes")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per transaction")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Measure the compacted size without writing")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        before = financial_audit_log_dao.get_changes_storage(db)
+        print_storage("Before", before)
+
+        last_id = 0
+        compacted = 0
+        saved = 0
+        while True:
+            rows = financial_audit_log_dao.get_uncompacted(db, after_id=last_id, limit=args.batch_size)
+            if not rows:
+                break
+            diffs = {log_id: pack_changes(changes) for log_id, changes in rows}
+            for log_id, changes in rows:
+                saved += len(json.dumps(changes)) - len(diffs[log_id] or b'')
+            if not args.dry_run:
+                financial_audit_log_dao.set_compacted(db, diffs=diffs)
+                db.commit()
+            compacted += len(rows)
+            last_id = rows[-1][0]
+            print(f"  {compacted} rows compacted")
+
+        if args.dry_run:
+            rows = before['rows'] or 1
+            total = before['changes_bytes'] + before['changes_diff_bytes'] - saved
+            print(f"After (estimated): {total / rows:.1f} bytes/row")
+        else:
+            print_storage("After", financial_audit_log_dao.get_changes_storage(db))
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Rebuild denormalized account balances
+
+Recomputes payable/receivable outstanding and last invoice/payment dates
+on every account from account_invoices and invoice_payments. Invoice and
+payment writes keep these counters current; run this after bulk imports,
+direct SQL changes, or to verify the counters.
+
+Usage:
+    python rebuild_account_balances.py                 # all workspaces
+    python rebuild_account_balances.py --workspace 3   # one workspace
+"""
+import argparse
+
+from app.db.session import SessionLocal
+from app.models.workspace import Workspace
+from app.services.account_service import account_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild account balance counters")
+    parser.add_argument("--workspace", type=int, default=None,
+                        help="Workspace ID (default: all workspaces)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.workspace is not None:
+            workspace_ids = [args.workspace]
+        else:
+            workspace_ids = [row.id for row in db.query(Workspace.id).order_by(Workspace.id).all()]
+
+        for workspace_id in workspace_ids:
+            try:
+                result = account_service.rebuild_balances(db, workspace_id=workspace_id)
+            except Exception as e:
+                print(f"Workspace {workspace_id}: rebuild failed: {e}")
+                continue
+            print(f"Workspace {workspace_id}: {result['accounts_rebuilt']} accounts rebuilt")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
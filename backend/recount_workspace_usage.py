@@ -0,0 +1,34 @@
+"""Recount workspace subscription usage counters
+
+Recomputes current_members_count, current_factories_count,
+current_machines_count, current_projects_count, current_orders_this_month
+and current_storage_mb on every workspace from the source tables. Writes
+keep these counters current incrementally; schedule this nightly to correct
+drift from bulk imports or direct SQL changes.
+
+Usage:
+    python recount_workspace_usage.py                 # all workspaces
+    python recount_workspace_usage.py --workspace 3   # one workspace
+"""
+import argparse
+
+from app.db.session import SessionLocal
+from app.services.workspace_service import workspace_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recount workspace usage counters")
+    parser.add_argument("--workspace", type=int, default=None,
+                        help="Workspace ID (default: all workspaces)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        count = workspace_service.recount_usage(db, workspace_id=args.workspace)
+        print(f"{count} workspaces recounted")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
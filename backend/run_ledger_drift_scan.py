@@ -0,0 +1,58 @@
+"""Background ledger drift scanner
+
+Scans every workspace's ledgers for drift against the snapshot tables.
+Only ledger entries added since the previous scan are read, so this is
+cheap enough to run from cron or as a long-running worker.
+
+Usage:
+    python run_ledger_drift_scan.py                 # one pass over all workspaces
+    python run_ledger_drift_scan.py --interval 300  # keep scanning every 5 minutes
+"""
+import argparse
+import time
+
+from app.db.session import SessionLocal
+from app.models.workspace import Workspace
+from app.services.ledger_service import ledger_service
+
+
+def scan_all_workspaces():
+    """Run one drift scan per workspace and print a summary line for each"""
+    db = SessionLocal()
+    try:
+        workspace_ids = [row.id for row in db.query(Workspace.id).order_by(Workspace.id).all()]
+    finally:
+        db.close()
+
+    for workspace_id in workspace_ids:
+        try:
+            result = ledger_service.run_drift_scan_job(workspace_id)
+        except Exception as e:
+            print(f"Workspace {workspace_id}: scan failed: {e}")
+            continue
+
+        ledgers = result['ledgers'].values()
+        print(
+            f"Workspace {workspace_id}: "
+            f"{sum(ledger['rows_scanned'] for ledger in ledgers)} rows scanned, "
+            f"{sum(ledger['drifts_found'] for ledger in ledgers)} new drifts, "
+            f"{sum(ledger['drifts_resolved'] for ledger in ledgers)} resolved, "
+            f"{result['open_drifts']} open"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scan ledgers for snapshot drift")
+    parser.add_argument("--interval", type=int, default=0,
+                        help="Seconds between passes (0 = run once)")
+    args = parser.parse_args()
+
+    while True:
+        scan_all_workspaces()
+        if not args.interval:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()